@@ -1,5 +1,19 @@
-from prolothar_queue_mining.inference.queue.queue_miner import QueueMiner
-from prolothar_queue_mining.inference.queue.keith_ahner_hill import KeithAhnerHill
-from prolothar_queue_mining.inference.queue.naive_brute_force import NaiveBruteForce
-from prolothar_queue_mining.inference.queue.cuemin import CueMin
-from prolothar_queue_mining.inference.queue.fcfs_c_one_throughput import FcfsCOneThroughput
\ No newline at end of file
+from prolothar_queue_mining.lazy_import import create_lazy_module_attributes
+
+__all__ = [
+    'ObservationSet',
+    'QueueMiner',
+    'KeithAhnerHill',
+    'NaiveBruteForce',
+    'CueMin',
+    'FcfsCOneThroughput',
+]
+
+__getattr__, __dir__ = create_lazy_module_attributes(__name__, {
+    'ObservationSet': 'prolothar_queue_mining.inference.queue.observation_set',
+    'QueueMiner': 'prolothar_queue_mining.inference.queue.queue_miner',
+    'KeithAhnerHill': 'prolothar_queue_mining.inference.queue.keith_ahner_hill',
+    'NaiveBruteForce': 'prolothar_queue_mining.inference.queue.naive_brute_force',
+    'CueMin': 'prolothar_queue_mining.inference.queue.cuemin',
+    'FcfsCOneThroughput': 'prolothar_queue_mining.inference.queue.fcfs_c_one_throughput',
+})
\ No newline at end of file
@@ -13,8 +13,8 @@ from prolothar_queue_mining.inference.queue.cuemin.search_strategy import Weight
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.waiting_area import WaitingArea
-from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
-from prolothar_queue_mining.model.waiting_area import FastLastComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedLastComeFirstServeWaitingArea
 from prolothar_queue_mining.model.waiting_area import RandomOrderWaitingArea
 from prolothar_queue_mining.model.arrival_process import FixedArrival
 
@@ -22,7 +22,8 @@ from prolothar_queue_mining.inference.queue.waiting_area import PriorityClassWai
 from prolothar_queue_mining.inference.queue.waiting_area import LinearRegressionEstimator
 from prolothar_queue_mining.inference.queue.waiting_area import FlifoWaitingAreaEstimator
 from prolothar_queue_mining.inference.queue.queue_miner import QueueMiner
-from prolothar_queue_mining.inference.queue.utils import count_nr_of_jobs_in_system
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 
 class CueMin(QueueMiner):
     """
@@ -145,36 +146,28 @@ class CueMin(QueueMiner):
         self.__seed = seed_for_distributions
 
     def infer_queue(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> Queue:
-        arrival_process = FixedArrival.create_from_observation(observed_arrivals)
-        departure_time_per_job = dict(observed_departures)
-        _,nr_of_jobs_in_system_over_time = count_nr_of_jobs_in_system(
-            dict(observed_arrivals), departure_time_per_job)
+            self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+            observed_departures: list[tuple[Job, int]]|None = None) -> Queue:
+        observations = to_observation_set(observed_arrivals, observed_departures)
+        arrival_process = FixedArrival.create_from_observation(
+            observations.get_observed_arrivals())
         best_mdl_score = float('inf')
         best_queue = None
         for waiting_area in tqdm(list(self.__generate_waiting_area_candidates(
-                observed_arrivals, observed_departures)), disable=not self.__verbose,
-                desc='D'):
+                observations)), disable=not self.__verbose, desc='D'):
             best_mdl_score, best_queue = self.__search_with_given_waiting_area(
-                waiting_area, observed_arrivals, observed_departures,
-                departure_time_per_job, arrival_process,
-                nr_of_jobs_in_system_over_time,
+                waiting_area, observations, arrival_process,
                 best_mdl_score, best_queue)
         return best_queue
 
     def __search_with_given_waiting_area(
             self, waiting_area: WaitingArea,
-            observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]],
-            departure_time_per_job: dict[Job, int],
+            observations: ObservationSet,
             arrival_process: FixedArrival,
-            nr_of_jobs_in_system_over_time: list[int],
             global_best_mdl_score: float,
             global_best_queue: Queue):
         best_queue, best_mdl_score = self.__search_strategy.search(
-            waiting_area, observed_arrivals, observed_departures,
-            departure_time_per_job, arrival_process, nr_of_jobs_in_system_over_time)
+            waiting_area, observations, arrival_process)
         if best_mdl_score < global_best_mdl_score:
             return best_mdl_score, best_queue
         else:
@@ -199,26 +192,21 @@ class CueMin(QueueMiner):
         """
         return self.__search_strategy.get_recorded_candidates()
 
-    def __generate_waiting_area_candidates(
-            self,
-            observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]):
+    def __generate_waiting_area_candidates(self, observations: ObservationSet):
         if 'FCFS' in self.__waiting_area_candidates:
-            yield FastFirstComeFirstServeWaitingArea()
+            yield TypedFirstComeFirstServeWaitingArea()
         if 'LCFS' in self.__waiting_area_candidates:
-            yield FastLastComeFirstServeWaitingArea()
+            yield TypedLastComeFirstServeWaitingArea()
         if 'SIRO' in self.__waiting_area_candidates:
             yield RandomOrderWaitingArea()
         if 'FLIFO' in self.__waiting_area_candidates:
-            flifo_waiting_area = FlifoWaitingAreaEstimator().infer_waiting_area(
-                observed_arrivals, observed_departures)
+            flifo_waiting_area = FlifoWaitingAreaEstimator().infer_waiting_area(observations)
             if flifo_waiting_area is not None:
                 yield flifo_waiting_area
         if self.__categorical_attribute_names:
             if 'PQ-c' in self.__waiting_area_candidates:
                 priority_class_waiting_area = PriorityClassWaitingAreaEstimator(
-                    self.__categorical_attribute_names).infer_waiting_area(
-                        observed_arrivals, observed_departures)
+                    self.__categorical_attribute_names).infer_waiting_area(observations)
                 if priority_class_waiting_area is not None:
                     yield priority_class_waiting_area
         if 'LR' in self.__waiting_area_candidates \
@@ -227,4 +215,4 @@ class CueMin(QueueMiner):
                 self.__numerical_attribute_names,
                 self.__categorical_attribute_names,
                 seed=self.__seed
-            ).infer_waiting_area(observed_arrivals, observed_departures)
+            ).infer_waiting_area(observations)
@@ -7,6 +7,7 @@ from prolothar_queue_mining.model.environment import Environment
 from prolothar_queue_mining.model.service_time.service_time import ServiceTime
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobArray
 
 class MdlServiceTime(ServiceTime):
     """
@@ -14,7 +15,7 @@ class MdlServiceTime(ServiceTime):
     a fit of data score from an underlying distribution
     """
 
-    def __init__(self, environment: Environment, service_time: ServiceTime, exit_time_per_job: dict[Job, int]):
+    def __init__(self, environment: Environment, service_time: ServiceTime, exit_time_per_job: dict[Job, int]|JobArray):
         """
         creates and intializes this OracleServiceTime instanz
 
@@ -24,7 +25,7 @@ class MdlServiceTime(ServiceTime):
             used to get the current time
         service_time : ServiceTime
             used to compute a fitness score
-        exit_time_per_job : dict[Job, float]
+        exit_time_per_job : dict[Job, float]|JobArray
             used to get the exit time of a job. the service time is computed
             by the difference of exit time and current time
         """
@@ -134,7 +135,7 @@ class MdlServiceTime(ServiceTime):
         return self.__total_length_of_predicted_value_codes
 
     def copy(self) -> ServiceTime:
-        return MdlServiceTime(self.__environment, self.__service_time.copy(), dict(self.__exit_time_per_job))
+        return MdlServiceTime(self.__environment, self.__service_time.copy(), self.__exit_time_per_job.copy())
 
     def compute_probability(self, x: int, job: Job, nr_of_jobs_in_system: int) -> float:
         raise NotImplementedError('should never be used outside model search')
@@ -4,10 +4,10 @@ from tqdm import trange
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.arrival_process import FixedArrival
-from prolothar_queue_mining.model.job import Job
 
 from prolothar_queue_mining.inference.queue.cuemin.search_strategy.search_strategy import SearchStrategy
 from prolothar_queue_mining.inference.queue.nr_of_servers import UpperBoundEstimator
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 class AdaptiveStepSizeSearch(SearchStrategy):
 
@@ -37,11 +37,8 @@ class AdaptiveStepSizeSearch(SearchStrategy):
 
     def search(
             self, waiting_area: WaitingArea,
-            observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]],
-            departure_time_per_job: dict[Job, int],
-            arrival_process: FixedArrival,
-            nr_of_jobs_in_system_over_time: list[int]) -> tuple[Queue, float]:
+            observations: ObservationSet,
+            arrival_process: FixedArrival) -> tuple[Queue, float]:
         if self.verbose:
             print(f'search with waiting area {waiting_area}')
         best_mdl_score = float('inf')
@@ -50,8 +47,7 @@ class AdaptiveStepSizeSearch(SearchStrategy):
         stepsize = 1
         current_candidate_c = 1
         explored_candidates = set()
-        c_upper_bound = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(
-            observed_arrivals, observed_departures)
+        c_upper_bound = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observations)
         iterations_without_improvement = 0
         while current_candidate_c:
             if abs(stepsize) == 1:
@@ -61,8 +57,7 @@ class AdaptiveStepSizeSearch(SearchStrategy):
                 if self.verbose:
                     print(f'explore candidate c={current_candidate_c}')
                 best_queue_for_c, best_mdl_score_for_c = self._find_best_queue_for_c(
-                    observed_arrivals, observed_departures, departure_time_per_job,
-                    nr_of_jobs_in_system_over_time, arrival_process,
+                    observations, arrival_process,
                     waiting_area, current_candidate_c)
                 explored_candidates.add(current_candidate_c)
             if best_mdl_score_for_c < best_mdl_score:
@@ -4,12 +4,12 @@ from tqdm import trange
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.arrival_process import FixedArrival
-from prolothar_queue_mining.model.job import Job
 
 from prolothar_queue_mining.inference.queue.nr_of_servers import LowerBoundEstimator
 from prolothar_queue_mining.inference.queue.nr_of_servers import UpperBoundEstimator
 
 from prolothar_queue_mining.inference.queue.cuemin.search_strategy.search_strategy import SearchStrategy
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 class LinearSearch(SearchStrategy):
 
@@ -40,26 +40,22 @@ class LinearSearch(SearchStrategy):
 
     def search(
             self, waiting_area: WaitingArea,
-            observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]],
-            departure_time_per_job: dict[Job, int],
-            arrival_process: FixedArrival,
-            nr_of_jobs_in_system_over_time: list[int]) -> tuple[Queue, float]:
+            observations: ObservationSet,
+            arrival_process: FixedArrival) -> tuple[Queue, float]:
         iterations_without_improvement = 0
         best_mdl_score = float('inf')
         best_queue = None
         if self.__min_nr_of_servers is None:
-            min_c = LowerBoundEstimator(waiting_area).estimate_nr_of_servers(observed_arrivals, observed_departures)
+            min_c = LowerBoundEstimator(waiting_area).estimate_nr_of_servers(observations)
         else:
             min_c = self.__min_nr_of_servers
         if self.__max_nr_of_servers is None:
-            max_c = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observed_arrivals, observed_departures)
+            max_c = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observations)
         else:
             max_c = self.__max_nr_of_servers
         for nr_of_servers in trange(min_c, max_c + 1, disable=not self.verbose, desc='c', leave=False):
             best_queue_for_c, best_mdl_score_for_c = self._find_best_queue_for_c(
-                observed_arrivals, observed_departures, departure_time_per_job,
-                nr_of_jobs_in_system_over_time, arrival_process,
+                observations, arrival_process,
                 waiting_area, nr_of_servers)
 
             if best_mdl_score_for_c < best_mdl_score:
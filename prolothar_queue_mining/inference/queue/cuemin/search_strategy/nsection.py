@@ -5,11 +5,11 @@ from tqdm import tqdm
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.arrival_process import FixedArrival
-from prolothar_queue_mining.model.job import Job
 
 from prolothar_queue_mining.inference.queue.nr_of_servers import UpperBoundEstimator
 
 from prolothar_queue_mining.inference.queue.cuemin.search_strategy.search_strategy import SearchStrategy
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 class NSectionSearch(SearchStrategy):
 
@@ -38,13 +38,10 @@ class NSectionSearch(SearchStrategy):
 
     def search(
             self, waiting_area: WaitingArea,
-            observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]],
-            departure_time_per_job: dict[Job, int],
-            arrival_process: FixedArrival,
-            nr_of_jobs_in_system_over_time: list[int]) -> tuple[Queue, float]:
+            observations: ObservationSet,
+            arrival_process: FixedArrival) -> tuple[Queue, float]:
         min_c = 1
-        max_c = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observed_arrivals, observed_departures)
+        max_c = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observations)
 
         c_candidates = [min_c, max_c]
         for i in range(1, self.__n - 1):
@@ -54,8 +51,7 @@ class NSectionSearch(SearchStrategy):
         queues_of_candidates = []
         for c in c_candidates:
             min_c_queue, min_c_score = self._find_best_queue_for_c(
-                observed_arrivals, observed_departures, departure_time_per_job,
-                nr_of_jobs_in_system_over_time, arrival_process,
+                observations, arrival_process,
                 waiting_area, c)
             mdl_of_candidates.append(min_c_score)
             queues_of_candidates.append(min_c_queue)
@@ -78,8 +74,7 @@ class NSectionSearch(SearchStrategy):
                 if new_c_for_max_index != c_candidates[index_of_neighbor]:
                     c_candidates[index_of_max] = new_c_for_max_index
                     min_c_queue, min_c_score = self._find_best_queue_for_c(
-                        observed_arrivals, observed_departures, departure_time_per_job,
-                        nr_of_jobs_in_system_over_time, arrival_process,
+                        observations, arrival_process,
                         waiting_area, new_c_for_max_index)
                     mdl_of_candidates[index_of_max] = min_c_score
                     queues_of_candidates[index_of_max] = min_c_queue
@@ -29,6 +29,7 @@ from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.arrival_process import FixedArrival
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobArray
 
 from prolothar_queue_mining.inference.sklearn.job_regression import train_lasso_cv
 from prolothar_queue_mining.inference.sklearn.job_regression import train_gamma_regression_cv
@@ -43,6 +44,8 @@ from prolothar_queue_mining.inference.queue.cuemin.record import Record
 from prolothar_queue_mining.inference.queue.cuemin.mdl_score import compute_length_of_model
 from prolothar_queue_mining.inference.queue.cuemin.mdl_score import compute_lower_bound_implied_by_model
 from prolothar_queue_mining.inference.queue.cuemin.mdl_score import compute_lower_bound_implied_by_model_and_data
+from prolothar_queue_mining.inference.queue.utils import NrOfJobsInSystemStepFunction
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 
 class SearchStrategy(ABC):
@@ -86,41 +89,37 @@ class SearchStrategy(ABC):
     @abstractmethod
     def search(
         self, waiting_area: WaitingArea,
-        observed_arrivals: list[tuple[Job, int]],
-        observed_departures: list[tuple[Job, int]],
-        departure_time_per_job: dict[Job, int],
-        arrival_process: FixedArrival,
-        nr_of_jobs_in_system_over_time: list[int]) -> tuple[Queue, float]:
+        observations: ObservationSet,
+        arrival_process: FixedArrival) -> tuple[Queue, float]:
         """
         returns the best found queue together with its mdl score for the given
         waiting area and observed data
         """
 
     def _find_best_queue_for_c(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]],
-            departure_time_per_job: dict[Job, int],
-            nr_of_jobs_in_system_over_time: list[int],
+            self, observations: ObservationSet,
             arrival_process: FixedArrival,
             waiting_area: WaitingArea,
             nr_of_servers: int) -> tuple[Queue, float]:
         best_mdl_score = float('inf')
         best_queue = None
+        departure_time_per_job = observations.get_departure_time_per_job()
         _, service_times_per_job, _ = infer_waiting_and_service_times(
-            observed_arrivals, observed_departures, waiting_area, nr_of_servers)
+            observations, None, waiting_area, nr_of_servers)
         batches, _, batch_service_times = infer_service_times_batch(
-            observed_arrivals, observed_departures, waiting_area, nr_of_servers)
+            observations, None, waiting_area, nr_of_servers)
         observed_batch_sizes = [len(b) for b in batches]
         no_batching_service_time_histogram = self.__create_histogram(service_times_per_job.values())
         batching_service_time_histogram = self.__create_histogram(batch_service_times)
         batch_size_histogram = self.__create_histogram(observed_batch_sizes)
+        departure_time_array = observations.get_departure_time_array()
         nr_of_jobs = len(departure_time_per_job)
 
         for service_time, batch_size_distribution in tqdm(chain(
                 product(
                     self.__generate_service_time_candidates(
                         departure_time_per_job, service_times_per_job,
-                        nr_of_jobs_in_system_over_time),
+                        observations.get_nr_of_jobs_in_system()),
                     [MdlBatchSizeDistribution(DiscreteDegenerateDistribution(1), observed_batch_sizes)]
                 ),
                 product(
@@ -141,7 +140,7 @@ class SearchStrategy(ABC):
                 continue
             candidate_mdl_score = self.__run_candidate_model(
                 arrival_process, waiting_area, nr_of_servers, service_time,
-                batch_size_distribution, departure_time_per_job)
+                batch_size_distribution, departure_time_array)
 
             if candidate_mdl_score < best_mdl_score:
                 best_queue = Queue(
@@ -162,9 +161,9 @@ class SearchStrategy(ABC):
             self, arrival_process: FixedArrival, waiting_area: WaitingArea,
             nr_of_servers: int, service_time: ServiceTime,
             batch_size_distribution: MdlBatchSizeDistribution,
-            departure_time_per_job: dict[Job, int]) -> float:
+            departure_time_array: JobArray) -> float:
         environment = Environment(verbose=False)
-        mdl_service_time = MdlServiceTime(environment, service_time.copy(), departure_time_per_job)
+        mdl_service_time = MdlServiceTime(environment, service_time.copy(), departure_time_array)
         batch_size_distribution = batch_size_distribution.copy()
         queue = Queue(
             arrival_process.copy(),
@@ -230,7 +229,7 @@ class SearchStrategy(ABC):
             self,
             departure_time_per_job: dict[Job, int],
             service_times_per_job: dict[Job, int],
-            number_of_jobs_in_system_over_time: list[int]):
+            number_of_jobs_in_system_over_time: NrOfJobsInSystemStepFunction):
         yield from self.__generate_service_time_candidates_for_cluster(service_times_per_job)
         max_departure_time = max(departure_time_per_job.values())
         start_of_service_per_job = {
@@ -240,11 +239,10 @@ class SearchStrategy(ABC):
             and departure_time - service_times_per_job[job] < max_departure_time
         }
         x_jobs = [job for job, _ in start_of_service_per_job.items()]
-        x_system_load = np.array([
-            [
-                number_of_jobs_in_system_over_time[start_of_service] + 1
-            ] for _, start_of_service in start_of_service_per_job.items()
-        ])
+        x_system_load = (number_of_jobs_in_system_over_time.load_at(
+            np.fromiter(start_of_service_per_job.values(), dtype=float,
+                        count=len(start_of_service_per_job))
+        ) + 1).reshape(-1, 1)
         y_service_time = np.array([
             service_times_per_job[job] for job,_ in start_of_service_per_job.items()
         ])
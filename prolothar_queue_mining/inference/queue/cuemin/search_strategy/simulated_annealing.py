@@ -7,11 +7,11 @@ from tqdm import tqdm
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.arrival_process import FixedArrival
-from prolothar_queue_mining.model.job import Job
 
 from prolothar_queue_mining.inference.queue.nr_of_servers import UpperBoundEstimator
 
 from prolothar_queue_mining.inference.queue.cuemin.search_strategy.search_strategy import SearchStrategy
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 class SimulatedAnnealing(SearchStrategy, Annealer):
 
@@ -53,10 +53,7 @@ class SimulatedAnnealing(SearchStrategy, Annealer):
     @lru_cache(maxsize=-1)
     def __compute_mdl_for_c(self, c: int) -> float:
         best_queue_for_c, best_mdl_score_for_c = self._find_best_queue_for_c(
-            self.__observed_arrivals,
-            self.__observed_departures,
-            self.__departure_time_per_job,
-            self.__nr_of_jobs_in_system_over_time,
+            self.__observations,
             self.__arrival_process,
             self.__waiting_area, c)
         if best_mdl_score_for_c < self.__best_mdl_score:
@@ -72,18 +69,12 @@ class SimulatedAnnealing(SearchStrategy, Annealer):
 
     def search(
             self, waiting_area: WaitingArea,
-            observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]],
-            departure_time_per_job: dict[Job, int],
-            arrival_process: FixedArrival,
-            nr_of_jobs_in_system_over_time: list[int]) -> tuple[Queue, float]:
-        self.__max_c = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observed_arrivals, observed_departures)
+            observations: ObservationSet,
+            arrival_process: FixedArrival) -> tuple[Queue, float]:
+        self.__max_c = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observations)
         self.__waiting_area = waiting_area
-        self.__observed_arrivals = observed_arrivals
-        self.__observed_departures = observed_departures
-        self.__departure_time_per_job = departure_time_per_job
+        self.__observations = observations
         self.__arrival_process = arrival_process
-        self.__nr_of_jobs_in_system_over_time = nr_of_jobs_in_system_over_time
         self.__best_mdl_score = float('inf')
         self.__visited_states = set()
         try:
@@ -5,11 +5,11 @@ from tqdm import trange
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.arrival_process import FixedArrival
-from prolothar_queue_mining.model.job import Job
 
 from prolothar_queue_mining.inference.queue.nr_of_servers import UpperBoundEstimator
 
 from prolothar_queue_mining.inference.queue.cuemin.search_strategy.search_strategy import SearchStrategy
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 class WeightedSampling(SearchStrategy):
 
@@ -37,17 +37,13 @@ class WeightedSampling(SearchStrategy):
 
     def search(
             self, waiting_area: WaitingArea,
-            observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]],
-            departure_time_per_job: dict[Job, int],
-            arrival_process: FixedArrival,
-            nr_of_jobs_in_system_over_time: list[int]) -> tuple[Queue, float]:
+            observations: ObservationSet,
+            arrival_process: FixedArrival) -> tuple[Queue, float]:
         iterations_without_improvement = 0
         best_queue, best_mdl_score = self._find_best_queue_for_c(
-            observed_arrivals, observed_departures, departure_time_per_job,
-            nr_of_jobs_in_system_over_time, arrival_process,
+            observations, arrival_process,
             waiting_area, 1)
-        max_c = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observed_arrivals, observed_departures)
+        max_c = UpperBoundEstimator(waiting_area).estimate_nr_of_servers(observations)
         candidates = np.array(list(range(2, max_c + 1)))
         candidate_scores = np.array([best_mdl_score] + [best_mdl_score * 2 for _ in range(max_c - 2)])
         candidates_indices = list(range(len(candidate_scores)))
@@ -60,8 +56,7 @@ class WeightedSampling(SearchStrategy):
                 current_c_index = self.__random_generator.choice(candidates_indices, p=candidate_weights)
                 current_c = candidates[current_c_index]
                 best_queue_for_c, best_mdl_score_for_c = self._find_best_queue_for_c(
-                    observed_arrivals, observed_departures, departure_time_per_job,
-                    nr_of_jobs_in_system_over_time, arrival_process,
+                    observations, arrival_process,
                     waiting_area, current_c)
 
                 if current_c_index > 0:
@@ -4,7 +4,8 @@ from prolothar_queue_mining.model.server import Server
 from prolothar_queue_mining.model.service_time import ServiceTimeWithDistribution
 from prolothar_queue_mining.model.distribution import DiscreteDegenerateDistribution
 from prolothar_queue_mining.inference.queue.queue_miner import QueueMiner
-from prolothar_queue_mining.inference.queue.utils import count_nr_of_jobs_in_system
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 
 class FcfsCOneThroughput(QueueMiner):
     """
@@ -14,18 +15,17 @@ class FcfsCOneThroughput(QueueMiner):
     """
 
     def infer_queue(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> Queue:
-        _, nr_of_jobs_in_system = count_nr_of_jobs_in_system(
-            dict(observed_arrivals), dict(observed_departures))
+            self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+            observed_departures: list[tuple[Job, int]]|None = None) -> Queue:
+        observations = to_observation_set(observed_arrivals, observed_departures)
+        nr_of_jobs_in_system = observations.get_nr_of_jobs_in_system()
         return Queue(
             None,
             [
                 Server(ServiceTimeWithDistribution(DiscreteDegenerateDistribution(
                     round(
-                        sum(
-                            1 for n in nr_of_jobs_in_system if n > 0
-                        ) / len(observed_departures)
+                        nr_of_jobs_in_system.compute_busy_time()
+                        / len(observations.get_observed_departures())
                     )
                 )))
             ]
@@ -13,9 +13,9 @@ from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.server import Server
 from prolothar_queue_mining.model.service_time import ServiceTime
 from prolothar_queue_mining.model.service_time import ServiceTimeWithDistribution
-from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
-from prolothar_queue_mining.model.waiting_area import FastLastComeFirstServeWaitingArea
-from prolothar_queue_mining.model.waiting_area import PriorityClassWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedLastComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedPriorityClassWaitingArea
 from prolothar_queue_mining.model.arrival_process import FixedArrival
 from prolothar_queue_mining.model.population import ListPopulation
 from prolothar_queue_mining.model.observer.sojourn_time import SojournTimeRecordingObserver
@@ -27,6 +27,8 @@ from prolothar_queue_mining.inference.queue.times cimport infer_service_times_ba
 from prolothar_queue_mining.inference.queue.queue_miner import QueueMiner
 from prolothar_queue_mining.inference.queue.times cimport infer_waiting_and_service_times
 from prolothar_queue_mining.inference.queue.utils import generate_distribution_candidates
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 
 class Record:
     """
@@ -67,16 +69,17 @@ class NaiveBruteForce(QueueMiner):
         self.__categorical_feature_names = categorical_feature_names
 
     def infer_queue(
-            self, observed_arrivals: List[Tuple[Job, int]],
-            observed_departures: List[Tuple[Job, int]]) -> Queue:
+            self, observed_arrivals: List[Tuple[Job, int]]|ObservationSet,
+            observed_departures: List[Tuple[Job, int]]|None = None) -> Queue:
+        observations = to_observation_set(observed_arrivals, observed_departures)
+        observed_arrivals = observations.get_observed_arrivals()
         cdef list jobs_list = [job for job,_ in observed_arrivals]
         cdef list actual_arrival_times = [arrival_time for _,arrival_time in observed_arrivals]
-        cdef dict departure_time_per_job = {job: departure_time for job, departure_time in observed_departures}
+        cdef dict departure_time_per_job = observations.get_departure_time_per_job()
         cdef list actual_sojourn_times = [
             departure_time_per_job[job] - arrival_time
-            for job, arrival_time in observed_arrivals
-            if job in departure_time_per_job]
-        cdef int max_timestep = observed_departures[-1][1]
+            for job, arrival_time in observations.get_departed_arrivals()]
+        cdef int max_timestep = observations.get_last_departure_time()
         cdef Queue best_queue = None
         cdef Queue queue
         cdef Queue queue_copy
@@ -86,9 +89,9 @@ class NaiveBruteForce(QueueMiner):
                 self.__nr_of_servers_candidates,
                 self.__yield_waiting_area_candidates(jobs_list)):
             _, service_times_per_job, _ = infer_waiting_and_service_times(
-                observed_arrivals, observed_departures, waiting_area, nr_of_servers)
+                observations, None, waiting_area, nr_of_servers)
             batches, _, batch_service_times = infer_service_times_batch(
-                observed_arrivals, observed_departures, waiting_area, nr_of_servers)
+                observations, None, waiting_area, nr_of_servers)
 
             for service_time, batch_size_distribution in chain(
                     product(
@@ -151,13 +154,13 @@ class NaiveBruteForce(QueueMiner):
         return self.__recorded_candidates
 
     def __yield_waiting_area_candidates(self, jobs_list: List[Job]):
-        yield FastFirstComeFirstServeWaitingArea()
-        yield FastLastComeFirstServeWaitingArea()
+        yield TypedFirstComeFirstServeWaitingArea()
+        yield TypedLastComeFirstServeWaitingArea()
         for feature in self.__categorical_feature_names:
             categories = set(job.features[feature] for job in jobs_list)
             for category_order in permutations(categories):
-                yield PriorityClassWaitingArea(feature, category_order, FastFirstComeFirstServeWaitingArea)
-                yield PriorityClassWaitingArea(feature, category_order, FastLastComeFirstServeWaitingArea)
+                yield TypedPriorityClassWaitingArea(feature, category_order, TypedFirstComeFirstServeWaitingArea)
+                yield TypedPriorityClassWaitingArea(feature, category_order, TypedLastComeFirstServeWaitingArea)
 
     def __compute_mean_absolute_error(
             self, actual_departure_times: List[int],
@@ -2,6 +2,7 @@ from typing import List, Tuple
 cimport cython
 
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 from prolothar_queue_mining.inference.queue.nr_of_servers.nr_of_servers_estimator cimport NrOfServersEstimator
 from prolothar_queue_mining.inference.queue.nr_of_servers.utils import create_job_departure_order_list
@@ -25,8 +26,8 @@ cdef class COrder(NrOfServersEstimator):
     """
 
     cpdef int estimate_nr_of_servers(
-            self, list observed_arrivals: List[Tuple[Job, int]],
-            list observed_departures: List[Tuple[Job, int]]):
+            self, observed_arrivals: List[Tuple[Job, int]]|ObservationSet,
+            list observed_departures: List[Tuple[Job, int]]|None = None):
 
         cdef vector[int] departure_order = create_job_departure_order_list(observed_arrivals, observed_departures)
 
@@ -1,6 +1,7 @@
 from typing import List, Tuple
 
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 from prolothar_queue_mining.inference.queue.nr_of_servers.nr_of_servers_estimator import NrOfServersEstimator
 from prolothar_queue_mining.inference.queue.nr_of_servers.utils import create_combined_job_index_list
@@ -23,8 +24,8 @@ class COrderLcfs(NrOfServersEstimator):
     """
 
     def estimate_nr_of_servers(
-            self, observed_arrivals: List[Tuple[Job, int]],
-            observed_departures: List[Tuple[Job, int]]) -> int:
+            self, observed_arrivals: List[Tuple[Job, int]]|ObservationSet,
+            observed_departures: List[Tuple[Job, int]]|None = None) -> int:
         cdef vector[int] combined_order = create_combined_job_index_list(observed_arrivals, observed_departures)
         cdef int nr_of_servers = 0
         cdef unordered_set[int] jobs_in_queue = unordered_set[int]()
@@ -1,5 +1,6 @@
 from prolothar_queue_mining.model.job import Job
 
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 from prolothar_queue_mining.inference.queue.nr_of_servers.nr_of_servers_estimator import NrOfServersEstimator
 from prolothar_queue_mining.inference.queue.nr_of_servers.utils import create_job_departure_order_list
 
@@ -11,6 +12,6 @@ class DummyNrOfServersEstimator(NrOfServersEstimator):
         self.__nr_of_servers = nr_of_servers
 
     def estimate_nr_of_servers(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> int:
+            self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+            observed_departures: list[tuple[Job, int]]|None = None) -> int:
         return self.__nr_of_servers
@@ -3,6 +3,8 @@ from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.environment import Environment
 
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 from prolothar_queue_mining.inference.queue.nr_of_servers.nr_of_servers_estimator import NrOfServersEstimator
 
 class LowerBoundEstimator(NrOfServersEstimator):
@@ -15,15 +17,16 @@ class LowerBoundEstimator(NrOfServersEstimator):
         self.__waiting_area = waiting_area
 
     def estimate_nr_of_servers(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> int:
+            self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+            observed_departures: list[tuple[Job, int]]|None = None) -> int:
+        observations = to_observation_set(observed_arrivals, observed_departures)
         #we need data to make sensible inference
-        if not observed_arrivals or not observed_departures:
+        if not observations.get_arrival_mask().any() or not observations.get_departure_mask().any():
             return 1
 
-        exit_time_per_job = {job: exit_time for job, exit_time in observed_departures}
+        exit_time_per_job = observations.get_departure_time_per_job()
         observed_arrivals = sorted(
-            ((job, time) for job, time in observed_arrivals if job in exit_time_per_job),
+            observations.get_departed_arrivals(),
             key=lambda job_and_time: (
                 job_and_time[1],
                 self.__waiting_area.get_best_case_sort_key_for_synchronized_arrival(
@@ -34,7 +37,8 @@ class LowerBoundEstimator(NrOfServersEstimator):
         #reconstruction of order does only make sense for jobs for which we
         #have observed arrival
         arrived_jobs = set([job for job,_ in observed_arrivals])
-        departed_jobs = [job for job,_ in observed_departures if job in arrived_jobs][::-1]
+        departed_jobs = [
+            job for job,_ in observations.get_observed_departures() if job in arrived_jobs][::-1]
 
         jobs_at_service = set()
         arrived_jobs = set()
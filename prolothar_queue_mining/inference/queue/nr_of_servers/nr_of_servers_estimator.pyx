@@ -1,5 +1,6 @@
 from typing import List, Tuple
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 cdef class NrOfServersEstimator():
     """
@@ -7,18 +8,20 @@ cdef class NrOfServersEstimator():
     """
 
     cpdef int estimate_nr_of_servers(
-        self, list observed_arrivals: List[Tuple[Job, int]],
-        list observed_departures: List[Tuple[Job, int]]):
+        self, observed_arrivals: List[Tuple[Job, int]]|ObservationSet,
+        list observed_departures: List[Tuple[Job, int]]|None = None):
         """
         estimates the number of servers in the queue from observed arrival
         and departure of jobs
 
         Parameters
         ----------
-        observed_arrivals : list[tuple[Job, int]]
-            a list of jobs and corresponding arrival times
-        observed_departures : list[tuple[Job, int]]
-            a list of jobs and corresponding departure times
+        observed_arrivals : list[tuple[Job, int]]|ObservationSet
+            a list of jobs and corresponding arrival times or an ObservationSet
+            with both arrivals and departures
+        observed_departures : list[tuple[Job, int]]|None
+            a list of jobs and corresponding departure times. must be None if
+            observed_arrivals is an ObservationSet
 
         Returns
         -------
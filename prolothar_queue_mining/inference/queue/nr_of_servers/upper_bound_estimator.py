@@ -7,6 +7,8 @@ from prolothar_queue_mining.model.arrival_process import FixedArrival
 from prolothar_queue_mining.model.population import ListPopulation
 from prolothar_queue_mining.model.environment import Environment
 
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 from prolothar_queue_mining.inference.queue.nr_of_servers.nr_of_servers_estimator import NrOfServersEstimator
 
 class UpperBoundEstimator(NrOfServersEstimator):
@@ -21,11 +23,12 @@ class UpperBoundEstimator(NrOfServersEstimator):
         self.__max_upper_bound = max_upper_bound
 
     def estimate_nr_of_servers(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> int:
-        exit_time_per_job = {job: exit_time for job, exit_time in observed_departures}
+            self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+            observed_departures: list[tuple[Job, int]]|None = None) -> int:
+        observations = to_observation_set(observed_arrivals, observed_departures)
+        exit_time_per_job = observations.get_departure_time_per_job()
         observed_arrivals = sorted(
-            ((job, time) for job, time in observed_arrivals if job in exit_time_per_job),
+            observations.get_departed_arrivals(),
             key=lambda job_and_time: (
                 job_and_time[1],
                 self.__waiting_area.get_worst_case_sort_key_for_synchronized_arrival(
@@ -43,12 +46,11 @@ class UpperBoundEstimator(NrOfServersEstimator):
                 [CountingServer(oracle_service_time) for _ in range(self.__max_upper_bound)],
                 waiting_area=self.__waiting_area.copy())
         queue.schedule_next_arrival(environment)
-        environment.run_timesteps(observed_departures[-1][1])
+        environment.run_timesteps(observations.get_last_departure_time())
 
         for i, server in enumerate(queue.get_servers()):
             if server.get_nr_of_served_jobs() == 0:
                 return i
         return UpperBoundEstimator(
             self.__waiting_area,
-            max_upper_bound=self.__max_upper_bound*2).estimate_nr_of_servers(
-                observed_arrivals, observed_departures)
+            max_upper_bound=self.__max_upper_bound*2).estimate_nr_of_servers(observations)
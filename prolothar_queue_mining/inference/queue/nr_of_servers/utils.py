@@ -1,17 +1,22 @@
+import numpy as np
+
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 
 def create_job_departure_order_list(
-    observed_arrivals: list[tuple[Job, float]],
-    observed_departures: list[tuple[Job, float]]) -> list[int]:
+    observed_arrivals: list[tuple[Job, float]]|ObservationSet,
+    observed_departures: list[tuple[Job, float]]|None = None) -> list[int]:
     """
     creates a list of arrival indices ordered by departure time.
 
     Parameters
     ----------
-    observed_arrivals : list[tuple[Job, float]]
-        a list of jobs and corresponding arrival times
-    observed_departures : list[tuple[Job, float]]
-        a list of jobs and corresponding departure times
+    observed_arrivals : list[tuple[Job, float]]|ObservationSet
+        a list of jobs and corresponding arrival times or an ObservationSet
+    observed_departures : list[tuple[Job, float]]|None
+        a list of jobs and corresponding departure times. None if
+        observed_arrivals is an ObservationSet
 
     Returns
     -------
@@ -20,34 +25,29 @@ def create_job_departure_order_list(
         the initial job list is [1,2,3,4,...,nr_of_jobs].
         this list is sorted by the departure time of each job.
     """
-    job_departure_dict = {}
-    for job, departure_time in observed_departures:
-        job_departure_dict[job] = departure_time
-    job_arrival_departure_list = []
-    i = 0
-    last_arrival_time = None
-    for job, arrival_time in observed_arrivals:
-        if job in job_departure_dict:
-            if arrival_time != last_arrival_time:
-                i += 1
-                last_arrival_time = arrival_time
-            job_arrival_departure_list.append((i, arrival_time, job_departure_dict[job]))
-    job_arrival_departure_list.sort(key=lambda x: x[2])
-    return [i for i,_,_ in job_arrival_departure_list]
+    observations = to_observation_set(observed_arrivals, observed_departures)
+    arrival_order = observations.get_arrival_order()
+    departed_job_ids = arrival_order[observations.get_departure_mask()[arrival_order]]
+    arrival_times = observations.get_arrival_times()[departed_job_ids]
+    #jobs with the same arrival time share the same arrival index
+    arrival_indices = np.cumsum(np.diff(arrival_times, prepend=np.nan) != 0)
+    return arrival_indices[np.argsort(
+        observations.get_departure_times()[departed_job_ids], kind='stable')].tolist()
 
 def create_combined_job_index_list(
-    observed_arrivals: list[tuple[Job, float]],
-    observed_departures: list[tuple[Job, float]]) -> list[int]:
+    observed_arrivals: list[tuple[Job, float]]|ObservationSet,
+    observed_departures: list[tuple[Job, float]]|None = None) -> list[int]:
     """
     creates a list of job indices ordered by event time. the resulting list contains each
     job index twice (arrival + departure). job indices increase with arrival time.
 
     Parameters
     ----------
-    observed_arrivals : list[tuple[Job, float]]
-        a list of jobs and corresponding arrival times
-    observed_departures : list[tuple[Job, float]]
-        a list of jobs and corresponding departure times
+    observed_arrivals : list[tuple[Job, float]]|ObservationSet
+        a list of jobs and corresponding arrival times or an ObservationSet
+    observed_departures : list[tuple[Job, float]]|None
+        a list of jobs and corresponding departure times. None if
+        observed_arrivals is an ObservationSet
 
     Returns
     -------
@@ -55,6 +55,16 @@ def create_combined_job_index_list(
         a list of job indices ordered by event time. the resulting list contains each
         job index twice (arrival + departure).
     """
-    job_indices_dict = {x[0]: i+1 for i,x in enumerate(observed_arrivals)}
-    combined_list = sorted(observed_arrivals + observed_departures, key=lambda x: x[1])
-    return [job_indices_dict[job] for job,_ in combined_list]
+    observations = to_observation_set(observed_arrivals, observed_departures)
+    arrival_order = observations.get_arrival_order()
+    departure_order = observations.get_departure_order()
+    departure_order = departure_order[observations.get_arrival_mask()[departure_order]]
+    job_indices = np.zeros(len(observations), dtype=np.int64)
+    job_indices[arrival_order] = np.arange(1, len(arrival_order) + 1)
+    event_job_ids = np.concatenate((arrival_order, departure_order))
+    event_times = np.concatenate((
+        observations.get_arrival_times()[arrival_order],
+        observations.get_departure_times()[departure_order]
+    ))
+    #stable sort: arrivals come before departures at the same time
+    return job_indices[event_job_ids[np.argsort(event_times, kind='stable')]].tolist()
\ No newline at end of file
@@ -0,0 +1,226 @@
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobTable
+from prolothar_queue_mining.model.job import JobArray
+from prolothar_queue_mining.inference.queue.utils import NrOfJobsInSystemStepFunction
+
+class ObservationSet():
+    """
+    immutable columnar representation of observed arrivals and departures at a
+    queue. every job gets a dense integer id. arrival and departure times are
+    stored in NumPy arrays indexed by this id, with NaN for events that have not
+    been observed. sort orders, dictionaries and the list representation used
+    by the simulation are computed once and then shared by all consumers, i.e.
+    the returned lists and dictionaries must not be modified.
+    """
+
+    def __init__(
+            self, observed_arrivals: list[tuple[Job, int]],
+            observed_departures: list[tuple[Job, int]]):
+        """
+        creates a new ObservationSet from the list representation
+
+        Parameters
+        ----------
+        observed_arrivals : list[tuple[Job, int]]
+            a list of jobs together with the observed arrival time
+        observed_departures : list[tuple[Job, int]]
+            a list of jobs together with the observed departure time
+        """
+        self.__arrival_time_per_job = dict(observed_arrivals)
+        self.__departure_time_per_job = dict(observed_departures)
+        job_id_per_job = {job: i for i, job in enumerate(self.__arrival_time_per_job)}
+        for job in self.__departure_time_per_job:
+            job_id_per_job.setdefault(job, len(job_id_per_job))
+        self.__job_id_per_job = job_id_per_job
+        self.__jobs = tuple(job_id_per_job)
+
+        nr_of_jobs = len(self.__jobs)
+        self.__arrival_times = np.full(nr_of_jobs, np.nan)
+        self.__arrival_times[:len(self.__arrival_time_per_job)] = np.fromiter(
+            self.__arrival_time_per_job.values(), dtype=float,
+            count=len(self.__arrival_time_per_job))
+        self.__departure_times = np.full(nr_of_jobs, np.nan)
+        self.__departure_times[
+            np.fromiter(
+                map(job_id_per_job.__getitem__, self.__departure_time_per_job),
+                dtype=np.int64, count=len(self.__departure_time_per_job))
+        ] = np.fromiter(
+            self.__departure_time_per_job.values(), dtype=float,
+            count=len(self.__departure_time_per_job))
+        self.__arrival_mask = ~np.isnan(self.__arrival_times)
+        self.__departure_mask = ~np.isnan(self.__departure_times)
+
+        self.__arrival_order = self.__compute_order(self.__arrival_times, self.__arrival_mask)
+        self.__departure_order = self.__compute_order(
+            self.__departure_times, self.__departure_mask)
+
+        for array in (self.__arrival_times, self.__departure_times,
+                      self.__arrival_mask, self.__departure_mask,
+                      self.__arrival_order, self.__departure_order):
+            array.flags.writeable = False
+
+        self.__observed_arrivals = None
+        self.__observed_departures = None
+        self.__departed_arrivals = None
+        self.__nr_of_jobs_in_system = None
+        self.__job_table = None
+        self.__departure_time_array = None
+
+    def __compute_order(self, times: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        job_ids = np.flatnonzero(mask)
+        return job_ids[np.argsort(times[job_ids], kind='stable')]
+
+    def __len__(self) -> int:
+        return len(self.__jobs)
+
+    def get_jobs(self) -> tuple[Job]:
+        """
+        returns all jobs. the position of a job is its id
+        """
+        return self.__jobs
+
+    def get_job_id(self, job: Job) -> int:
+        return self.__job_id_per_job[job]
+
+    def get_arrival_times(self) -> np.ndarray:
+        """
+        returns a read-only array with the arrival time for each job id.
+        NaN if the arrival of the job has not been observed.
+        """
+        return self.__arrival_times
+
+    def get_departure_times(self) -> np.ndarray:
+        """
+        returns a read-only array with the departure time for each job id.
+        NaN if the departure of the job has not been observed.
+        """
+        return self.__departure_times
+
+    def get_arrival_mask(self) -> np.ndarray:
+        """
+        returns a read-only boolean array that is True for each job id with
+        observed arrival
+        """
+        return self.__arrival_mask
+
+    def get_departure_mask(self) -> np.ndarray:
+        """
+        returns a read-only boolean array that is True for each job id with
+        observed departure
+        """
+        return self.__departure_mask
+
+    def get_arrival_order(self) -> np.ndarray:
+        """
+        returns the ids of all jobs with observed arrival sorted by arrival time.
+        ties keep the order of the input list.
+        """
+        return self.__arrival_order
+
+    def get_departure_order(self) -> np.ndarray:
+        """
+        returns the ids of all jobs with observed departure sorted by departure
+        time. ties keep the order of the input list.
+        """
+        return self.__departure_order
+
+    def get_arrival_time_per_job(self) -> dict[Job, int]:
+        return self.__arrival_time_per_job
+
+    def get_departure_time_per_job(self) -> dict[Job, int]:
+        return self.__departure_time_per_job
+
+    def get_job_table(self) -> JobTable:
+        """
+        returns a JobTable of all jobs. the index of a job in the table equals
+        its id in this observation set.
+        """
+        if self.__job_table is None:
+            self.__job_table = JobTable(self.__jobs)
+        return self.__job_table
+
+    def get_departure_time_array(self) -> JobArray:
+        """
+        returns the observed departure times as an array-backed mapping from
+        job to departure time. can be used instead of get_departure_time_per_job
+        in hot loops, e.g. for an OracleServiceTime.
+        """
+        if self.__departure_time_array is None:
+            self.__departure_time_array = JobArray(
+                self.get_job_table(), self.__departure_times,
+                mask=self.__departure_mask,
+                is_integer=all(isinstance(t, (int, np.integer))
+                               for t in self.__departure_time_per_job.values()))
+        return self.__departure_time_array
+
+    def get_observed_arrivals(self) -> list[tuple[Job, int]]:
+        """
+        returns the list representation of the observed arrivals, ordered by
+        arrival time
+        """
+        if self.__observed_arrivals is None:
+            self.__observed_arrivals = self.__create_event_list(
+                self.__arrival_order, self.__arrival_time_per_job)
+        return self.__observed_arrivals
+
+    def get_observed_departures(self) -> list[tuple[Job, int]]:
+        """
+        returns the list representation of the observed departures, ordered by
+        departure time
+        """
+        if self.__observed_departures is None:
+            self.__observed_departures = self.__create_event_list(
+                self.__departure_order, self.__departure_time_per_job)
+        return self.__observed_departures
+
+    def get_departed_arrivals(self) -> list[tuple[Job, int]]:
+        """
+        returns the observed arrivals of all jobs with observed departure,
+        ordered by arrival time
+        """
+        if self.__departed_arrivals is None:
+            self.__departed_arrivals = self.__create_event_list(
+                self.__arrival_order[self.__departure_mask[self.__arrival_order]],
+                self.__arrival_time_per_job)
+        return self.__departed_arrivals
+
+    def __create_event_list(self, job_ids: np.ndarray, time_per_job: dict[Job, int]) -> list[tuple[Job, int]]:
+        jobs = self.__jobs
+        return [(jobs[i], time_per_job[jobs[i]]) for i in job_ids.tolist()]
+
+    def get_last_departure_time(self) -> int:
+        return self.get_observed_departures()[-1][1]
+
+    def get_nr_of_jobs_in_system(self) -> NrOfJobsInSystemStepFunction:
+        """
+        returns the number of jobs in the system over time
+        """
+        if self.__nr_of_jobs_in_system is None:
+            self.__nr_of_jobs_in_system = NrOfJobsInSystemStepFunction.from_observation(
+                self.__arrival_time_per_job, self.__departure_time_per_job)
+        return self.__nr_of_jobs_in_system
+
+    def __repr__(self):
+        return (
+            f'ObservationSet({int(self.__arrival_mask.sum())} arrivals, '
+            f'{int(self.__departure_mask.sum())} departures)'
+        )
+
+def to_observation_set(
+        observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+        observed_departures: list[tuple[Job, int]]|None = None) -> ObservationSet:
+    """
+    adapter for entry points that accept both the list representation and an
+    ObservationSet. if observed_arrivals is already an ObservationSet, it is
+    returned as it is and observed_departures must be None.
+    """
+    if isinstance(observed_arrivals, ObservationSet):
+        if observed_departures is not None:
+            raise ValueError(
+                'observed_departures must be None if observed_arrivals is an ObservationSet')
+        return observed_arrivals
+    if observed_departures is None:
+        raise ValueError('observed_departures must not be None')
+    return ObservationSet(observed_arrivals, observed_departures)
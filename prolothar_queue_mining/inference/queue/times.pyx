@@ -15,10 +15,12 @@ from prolothar_queue_mining.model.observer.waiting_time import WaitingTimeRecord
 from prolothar_queue_mining.model.observer.sojourn_time import SojournTimeRecordingObserver
 from prolothar_queue_mining.model.exit import ListCollectorExit
 from prolothar_queue_mining.inference.queue.batch import LargestGapBatchMiner
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 
 cpdef tuple infer_waiting_and_service_times(
-    list observed_arrivals: List[Tuple[Job, int]],
-    list observed_departures: List[Tuple[Job, int]],
+    observed_arrivals: List[Tuple[Job, int]]|ObservationSet,
+    list observed_departures: List[Tuple[Job, int]]|None,
     waiting_area: WaitingArea,
     int nr_of_servers,
     bint filter_delayed_jobs = False):
@@ -34,25 +36,27 @@ cpdef tuple infer_waiting_and_service_times(
     neither a waiting time nor a service time.
     - 2: gives the serving order for each server in the queue
 
+    observed_arrivals can also be an ObservationSet. observed_departures must be
+    None in this case.
     """
-    cdef dict exit_time_per_job = {job: exit_time for job, exit_time in observed_departures}
-    cdef dict arrival_time_per_job = {job: arrival_time for job, arrival_time in observed_arrivals}
+    observations = to_observation_set(observed_arrivals, observed_departures)
+    cdef dict exit_time_per_job = observations.get_departure_time_per_job()
+    cdef list departed_arrivals = observations.get_departed_arrivals()
     cdef dict sojourn_time_per_job = {
-        job: exit_time_per_job[job] - arrival_time for job, arrival_time in observed_arrivals
-        if job in exit_time_per_job
+        job: exit_time_per_job[job] - arrival_time for job, arrival_time in departed_arrivals
     }
     cdef Environment environment = Environment()
     cdef Queue queue = Queue(
         FixedArrival(
-            ListPopulation([job for job,_ in observed_arrivals if job in exit_time_per_job]),
-            [arrival_time for job,arrival_time in observed_arrivals if job in exit_time_per_job]
+            ListPopulation([job for job,_ in departed_arrivals]),
+            [arrival_time for _,arrival_time in departed_arrivals]
         ),
-        [ListRecordingServer(OracleServiceTime(environment, exit_time_per_job)) for _ in range(nr_of_servers)],
+        [ListRecordingServer(OracleServiceTime(environment, observations.get_departure_time_array())) for _ in range(nr_of_servers)],
         waiting_area=waiting_area.copy(),
         waiting_time_observer=WaitingTimeRecordingObserver()
     )
     queue.schedule_next_arrival(environment)
-    environment.run_timesteps(observed_departures[-1][1])
+    environment.run_timesteps(observations.get_last_departure_time())
     cdef dict waiting_time_per_job = queue.get_waiting_time_observer().get_waiting_time_per_job_dict()
     service_time_per_job = {
         job: sojourn_time_per_job[job] - waiting_time
@@ -62,8 +66,8 @@ cpdef tuple infer_waiting_and_service_times(
     return waiting_time_per_job, service_time_per_job, [s.get_served_jobs() for s in queue.get_servers()]
 
 cpdef tuple infer_service_times_batch(
-        list observed_arrivals: List[Tuple[Job, int]],
-        list observed_departures: List[Tuple[Job, int]],
+        observed_arrivals: List[Tuple[Job, int]]|ObservationSet,
+        list observed_departures: List[Tuple[Job, int]]|None,
         waiting_area: WaitingArea,
         int nr_of_servers):
     """
@@ -78,17 +82,21 @@ cpdef tuple infer_service_times_batch(
     3) contains the corresponding computed service times
 
     returns tuple[list[list[Job]], tuple[list[list[Job]], list[int]]
+
+    observed_arrivals can also be an ObservationSet. observed_departures must be
+    None in this case.
     """
-    cdef dict exit_time_per_job = {job: exit_time for job, exit_time in observed_departures}
+    observations = to_observation_set(observed_arrivals, observed_departures)
+    cdef list departed_arrivals = observations.get_departed_arrivals()
     # cdef list observed_batches = LargestGapBatchMiner().group_batches(observed_arrivals, observed_departures)
-    cdef list observed_batches = infer_batches(observed_departures)
+    cdef list observed_batches = infer_batches(observations.get_observed_departures())
     cdef Environment environment = Environment()
     cdef Queue queue = Queue(
         FixedArrival(
-            ListPopulation([job for job,_ in observed_arrivals if job in exit_time_per_job]),
-            [arrival_time for job,arrival_time in observed_arrivals if job in exit_time_per_job]
+            ListPopulation([job for job,_ in departed_arrivals]),
+            [arrival_time for _,arrival_time in departed_arrivals]
         ),
-        [Server(OracleServiceTime(environment, exit_time_per_job)) for _ in range(nr_of_servers)],
+        [Server(OracleServiceTime(environment, observations.get_departure_time_array())) for _ in range(nr_of_servers)],
         waiting_area=waiting_area.copy(),
         batch_size_distribution=PseudoDistribution([len(b) for b in observed_batches]),
         waiting_time_observer=WaitingTimeRecordingObserver(),
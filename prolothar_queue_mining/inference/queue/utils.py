@@ -2,13 +2,11 @@ from typing import Iterable
 
 from statistics import quantiles
 
+import numpy as np
+
 from prolothar_queue_mining.model.distribution import ContinuousDistribution
 from prolothar_queue_mining.model.distribution import DiscreteDistribution
 from prolothar_queue_mining.model.distribution import DiscreteDegenerateDistribution
-from prolothar_queue_mining.model.distribution import GeometricDistribution
-from prolothar_queue_mining.model.distribution import NegativeBinomialDistribution
-from prolothar_queue_mining.model.distribution import PoissonDistribution
-from prolothar_queue_mining.model.distribution import C2dDistribution
 from prolothar_queue_mining.model.job import Job
 
 """
@@ -36,6 +34,12 @@ def generate_distribution_candidates(
     Generator[DiscreteDistribution, None, None]
         yields MLE fitted distributions
     """
+    #imported here because scipy.stats and statsmodels are slow to import
+    from prolothar_queue_mining.model.distribution import GeometricDistribution
+    from prolothar_queue_mining.model.distribution import NegativeBinomialDistribution
+    from prolothar_queue_mining.model.distribution import PoissonDistribution
+    from prolothar_queue_mining.model.distribution import C2dDistribution
+
     distribution_fitter_list = []
     # distribution_fitter_list.append(lambda d: d.fit(observations, seed=seed_for_distributions))
     if len(observations) > 2:
@@ -80,36 +84,111 @@ def is_valid_distribution_candidate(fitted_distribution: DiscreteDistribution) -
         return False
     return True
 
+class NrOfJobsInSystemStepFunction():
+    """
+    compact change-point representation of the number of jobs in the system
+    over time. the number of jobs in the system is constant between two
+    consecutive change points and zero before the first change point.
+    """
+    def __init__(self, change_times: np.ndarray, nr_of_jobs: np.ndarray):
+        """
+        creates a new step function
+
+        Parameters
+        ----------
+        change_times : np.ndarray
+            strictly increasing array of timesteps at which the number of jobs
+            in the system changes
+        nr_of_jobs : np.ndarray
+            nr_of_jobs[i] is the number of jobs in the system in the time
+            interval [change_times[i], change_times[i+1])
+        """
+        if len(change_times) != len(nr_of_jobs):
+            raise ValueError(
+                f'change_times ({len(change_times)}) and nr_of_jobs '
+                f'({len(nr_of_jobs)}) must have the same length')
+        self.__change_times = change_times
+        self.__nr_of_jobs = nr_of_jobs
+
+    @staticmethod
+    def from_observation(
+            arrivals: dict[Job, int],
+            departures: dict[Job, int]) -> 'NrOfJobsInSystemStepFunction':
+        """
+        computes the number of jobs in the system from observed arrival and
+        departure times. all events at the same timestep are aggregated,
+        i.e. the number of jobs at timestep t includes all arrivals
+        and excludes all departures up to and including t.
+        """
+        event_times = np.concatenate((
+            np.fromiter(arrivals.values(), dtype=float, count=len(arrivals)),
+            np.fromiter(departures.values(), dtype=float, count=len(departures))
+        ))
+        deltas = np.concatenate((
+            np.ones(len(arrivals), dtype=np.int64),
+            -np.ones(len(departures), dtype=np.int64)
+        ))
+        order = np.argsort(event_times, kind='stable')
+        event_times = event_times[order]
+        nr_of_jobs = np.cumsum(deltas[order])
+        if len(event_times) == 0:
+            return NrOfJobsInSystemStepFunction(event_times, nr_of_jobs)
+        #keep only the last event per timestep
+        last_event_per_time = np.append(
+            np.flatnonzero(np.diff(event_times) != 0), len(event_times) - 1)
+        return NrOfJobsInSystemStepFunction(
+            event_times[last_event_per_time], nr_of_jobs[last_event_per_time])
+
+    def get_change_times(self) -> np.ndarray:
+        return self.__change_times
+
+    def get_nr_of_jobs(self) -> np.ndarray:
+        return self.__nr_of_jobs
+
+    def get_end_time(self) -> float:
+        """
+        returns the last timestep at which the number of jobs changes or 0 if
+        there is no change at all
+        """
+        if len(self.__change_times) == 0:
+            return 0
+        return self.__change_times[-1]
+
+    def load_at(self, t: int|float|np.ndarray) -> int|np.ndarray:
+        """
+        returns the number of jobs in the system at timestep t in O(log n).
+        if t is an array, an array with the number of jobs at each of the given
+        timesteps is returned.
+        """
+        index = np.searchsorted(self.__change_times, t, side='right') - 1
+        if np.ndim(index) == 0:
+            return int(self.__nr_of_jobs[index]) if index >= 0 else 0
+        nr_of_jobs = np.zeros(index.shape, dtype=np.int64)
+        is_after_first_change = index >= 0
+        nr_of_jobs[is_after_first_change] = self.__nr_of_jobs[index[is_after_first_change]]
+        return nr_of_jobs
+
+    def compute_busy_time(self) -> float:
+        """
+        returns the total duration in which at least one job is in the system
+        """
+        durations = np.diff(self.__change_times)
+        return float(durations[self.__nr_of_jobs[:-1] > 0].sum())
+
+    def to_dense(self) -> tuple[list[int], list[int]]:
+        """
+        expands the step function to one entry per integer timestep from 0 up
+        to (excluding) the end time. only use this view for short time horizons,
+        because memory is linear in the covered time span.
+        """
+        x = np.arange(int(np.ceil(self.get_end_time())))
+        return x.tolist(), self.load_at(x).tolist()
+
 def count_nr_of_jobs_in_system(
         arrivals: dict[Job, int], departures: dict[Job, int]) -> tuple[list[int], list[int]]:
-    arrival_list = sorted(arrivals.values(), reverse=True)
-    departure_list = sorted(departures.values(), reverse=True)
-    current_arrival_time = round(arrival_list.pop()) if arrivals else float('inf')
-    current_departure_time = round(departure_list.pop()) if departures else float('inf')
-    current_nr_of_jobs = 0
-    last_nr_of_jobs = 0
-    last_t = 0
-    x = []
-    y = []
-    while current_arrival_time < float('inf') or current_departure_time < float('inf'):
-        if current_arrival_time < current_departure_time:
-            current_nr_of_jobs += 1
-            current_t = current_arrival_time
-            try:
-                current_arrival_time = round(arrival_list.pop())
-            except IndexError:
-                current_arrival_time = float('inf')
-        else:
-            current_nr_of_jobs -= 1
-            current_t = current_departure_time
-            try:
-                current_departure_time = round(departure_list.pop())
-            except IndexError:
-                current_departure_time = float('inf')
-        if current_t != last_t and current_t != float('inf'):
-            for t in range(last_t, current_t):
-                x.append(t)
-                y.append(last_nr_of_jobs)
-            last_nr_of_jobs = current_nr_of_jobs
-            last_t = current_t
-    return x,y
+    """
+    dense view of the number of jobs in the system with one entry per integer
+    timestep. prefer NrOfJobsInSystemStepFunction.from_observation, which does
+    not depend on the length of the observed time span.
+    """
+    return NrOfJobsInSystemStepFunction.from_observation(arrivals, departures).to_dense()
@@ -1,7 +1,21 @@
-from prolothar_queue_mining.inference.queue.waiting_area.waiting_area_estimator import WaitingAreaEstimator
-from prolothar_queue_mining.inference.queue.waiting_area.priority_class_waiting_area_estimator import PriorityClassWaitingAreaEstimator
-from prolothar_queue_mining.inference.queue.waiting_area.pairwise_logistic_regression_cv_estimator import PairwiseLogisticRegressionCvEstimator
-from prolothar_queue_mining.inference.queue.waiting_area.pairwise_random_forest_cv_estimator import PairwiseRandomForestCvEstimator
-from prolothar_queue_mining.inference.queue.waiting_area.linear_regression_estimator import LinearRegressionEstimator
-from prolothar_queue_mining.inference.queue.waiting_area.naive_lifo_or_fifo_estimator import NaiveLifoOrFifoWaitingAreaEstimator
-from prolothar_queue_mining.inference.queue.waiting_area.flifo_estimator import FlifoWaitingAreaEstimator
\ No newline at end of file
+from prolothar_queue_mining.lazy_import import create_lazy_module_attributes
+
+__all__ = [
+    'WaitingAreaEstimator',
+    'PriorityClassWaitingAreaEstimator',
+    'PairwiseLogisticRegressionCvEstimator',
+    'PairwiseRandomForestCvEstimator',
+    'LinearRegressionEstimator',
+    'NaiveLifoOrFifoWaitingAreaEstimator',
+    'FlifoWaitingAreaEstimator',
+]
+
+__getattr__, __dir__ = create_lazy_module_attributes(__name__, {
+    'WaitingAreaEstimator': 'prolothar_queue_mining.inference.queue.waiting_area.waiting_area_estimator',
+    'PriorityClassWaitingAreaEstimator': 'prolothar_queue_mining.inference.queue.waiting_area.priority_class_waiting_area_estimator',
+    'PairwiseLogisticRegressionCvEstimator': 'prolothar_queue_mining.inference.queue.waiting_area.pairwise_logistic_regression_cv_estimator',
+    'PairwiseRandomForestCvEstimator': 'prolothar_queue_mining.inference.queue.waiting_area.pairwise_random_forest_cv_estimator',
+    'LinearRegressionEstimator': 'prolothar_queue_mining.inference.queue.waiting_area.linear_regression_estimator',
+    'NaiveLifoOrFifoWaitingAreaEstimator': 'prolothar_queue_mining.inference.queue.waiting_area.naive_lifo_or_fifo_estimator',
+    'FlifoWaitingAreaEstimator': 'prolothar_queue_mining.inference.queue.waiting_area.flifo_estimator',
+})
\ No newline at end of file
@@ -1,8 +1,8 @@
 import numpy as np
-import tensorflow as tf
-from tensorflow.python.framework.ops import EagerTensor
 
 from prolothar_queue_mining.inference.queue.waiting_area.waiting_area_estimator import WaitingAreaEstimator
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 from prolothar_queue_mining.inference.sklearn.job_to_vector_transformer_utils import create_job_to_vector_transformer_for_linear_model
 
 from prolothar_queue_mining.model.waiting_area import WaitingArea
@@ -13,12 +13,48 @@ from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.environment import Environment
 
 class LinearRegressionEstimator(WaitingAreaEstimator):
+    """
+    learns the weights of a linear regressor, such that the served job has a
+    lower score than all jobs that were waiting at the same time. the weights
+    minimize the ranking hinge loss with mini-batch Adam and early stopping.
+    """
 
     def __init__(
             self, numerical_feature_names: list[str], categorical_feature_names: list[str],
             max_nr_of_epochs: int = 1000, batch_size: int = 64, seed: int = None,
             verbose: bool = False, early_stopping_epsilon: float = 0.00001,
-            early_stopping_patience: int = 50):
+            early_stopping_patience: int = 50, backend: str = 'numpy'):
+        """
+        creates a new LinearRegressionEstimator
+
+        Parameters
+        ----------
+        numerical_feature_names : list[str]
+            numerical job features that are used by the linear regressor
+        categorical_feature_names : list[str]
+            categorical job features that are one-hot encoded for the linear
+            regressor
+        max_nr_of_epochs : int, optional
+            maximal number of training epochs, by default 1000
+        batch_size : int, optional
+            number of (served job, waiting job) pairs per mini-batch, by default 64
+        seed : int, optional
+            seed for the initialization of the weights and the order of the
+            mini-batches, by default None
+        verbose : bool, optional
+            if True, the loss of each epoch is printed, by default False
+        early_stopping_epsilon : float, optional
+            an epoch counts as no improvement if its loss is at least the best
+            loss so far plus this value, by default 0.00001
+        early_stopping_patience : int, optional
+            the training stops after more than this number of consecutive
+            epochs without improvement, by default 50
+        backend : str, optional
+            either "numpy" (default) or "tensorflow". the numpy backend computes
+            the gradients in closed form and does not require TensorFlow.
+        """
+        if backend not in ('numpy', 'tensorflow'):
+            raise ValueError(f'unknown backend: {backend}')
         self.__categorical_feature_names = categorical_feature_names
         self.__numerical_feature_names = numerical_feature_names
         self.__max_nr_of_epochs = max_nr_of_epochs
@@ -27,44 +63,53 @@ class LinearRegressionEstimator(WaitingAreaEstimator):
         self.__verbose = verbose
         self.__early_stopping_epsilon = early_stopping_epsilon
         self.__early_stopping_patience = early_stopping_patience
+        self.__backend = backend
 
     def infer_waiting_area(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> WaitingArea:
-
-        departure_time_per_job = dict(observed_departures)
+            self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+            observed_departures: list[tuple[Job, int]]|None = None) -> WaitingArea:
+        observations = to_observation_set(observed_arrivals, observed_departures)
+        departure_time_per_job = observations.get_departure_time_per_job()
 
         job_to_vector_transformer = create_job_to_vector_transformer_for_linear_model(
             departure_time_per_job.keys(), self.__categorical_feature_names,
             self.__numerical_feature_names)
 
+        observed_arrivals = observations.get_observed_arrivals()
+        job_vectors = job_to_vector_transformer.transform_many(
+            (job for job,_ in observed_arrivals), job_table=observations.get_job_table())
+        #each row is the feature vector of a job followed by its arrival time
+        feature_matrix = np.column_stack((
+            job_vectors.reshape(len(observed_arrivals), -1),
+            np.fromiter((arrival_time for _,arrival_time in observed_arrivals),
+                        dtype=float, count=len(observed_arrivals))
+        ))
         top_element_matrix, remaining_element_matrix = self.__create_feature_matrices(
-            observed_arrivals, observed_departures,
-            {
-                job: np.hstack((job_to_vector_transformer.transform(job), arrival_time))
-                for job, arrival_time in observed_arrivals
-            }
+            observations, feature_matrix,
+            {job: row for row, (job, _) in enumerate(observed_arrivals)}
         )
 
-        number_of_samples = top_element_matrix.shape[0]
-        dataset_iterator = self.__create_dataset_iterator(
-            top_element_matrix, remaining_element_matrix, number_of_samples)
-
-        weights = self.__find_best_weights(number_of_samples, dataset_iterator, top_element_matrix.shape[1])
+        if self.__backend == 'numpy':
+            trainer = _NumpyRankingTrainer(
+                top_element_matrix, remaining_element_matrix,
+                self.__batch_size, self.__seed)
+        else:
+            trainer = _TensorflowRankingTrainer(
+                top_element_matrix, remaining_element_matrix,
+                self.__batch_size, self.__max_nr_of_epochs, self.__seed)
+        weights = self.__find_best_weights(trainer)
 
         return RegressorWaitingArea(job_to_vector_transformer, LinearRegressor(weights))
 
-    def __find_best_weights(self, number_of_samples, dataset_iterator, nr_of_features):
-        weights = tf.Variable(tf.random.normal((1, nr_of_features)), name='weights')
-        optimizer = tf.keras.optimizers.Adam()
+    def __find_best_weights(self, trainer: '_NumpyRankingTrainer|_TensorflowRankingTrainer'):
         best_loss = float('inf')
         best_weights = None
         current_patience = 0
         for epoch in range(self.__max_nr_of_epochs):
-            epoch_loss = self.__iterate_one_epoch(number_of_samples, dataset_iterator, weights, optimizer)
+            epoch_loss = trainer.train_one_epoch()
             if epoch_loss < best_loss:
                 best_loss = epoch_loss
-                best_weights = weights.numpy()
+                best_weights = trainer.get_weights()
             if epoch_loss >= best_loss + self.__early_stopping_epsilon:
                 current_patience += 1
                 if current_patience > self.__early_stopping_patience:
@@ -78,77 +123,172 @@ class LinearRegressionEstimator(WaitingAreaEstimator):
                 print(f'loss of epoch {epoch}: {epoch_loss}')
         return best_weights.flatten()
 
-    def __iterate_one_epoch(self, number_of_samples, dataset_iterator, weights, optimizer) -> float:
+    def __create_feature_matrices(
+            self, observations: ObservationSet, feature_matrix: np.ndarray,
+            row_per_job: dict[Job, int]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        replays the observations and returns two matrices with one row per
+        (served job, waiting job) pair: the feature vectors of the served jobs
+        and the feature vectors of the waiting jobs. during the replay, only the
+        row indices of the pairs are collected, i.e. one array per departure.
+        the matrices are filled at the end with a single gather each.
+        """
+        row_per_job_in_system: dict[Job, int] = {}
+        top_rows = []
+        remaining_rows = []
+
+        environment = Environment()
+        for job, arrival_time in observations.get_observed_arrivals():
+            environment.schedule_event(ArrivalEvent(
+                job, arrival_time, row_per_job_in_system, row_per_job))
+        for job, departure_time in observations.get_observed_departures():
+            environment.schedule_event(DepartureEvent(
+                job, departure_time, row_per_job_in_system, top_rows, remaining_rows))
+        environment.run_timesteps(observations.get_last_departure_time())
+
+        nr_of_pairs_per_departure = np.fromiter(
+            (len(rows) for rows in remaining_rows), dtype=np.int64, count=len(remaining_rows))
+        top_element_rows = np.repeat(
+            np.array(top_rows, dtype=np.int64), nr_of_pairs_per_departure)
+        remaining_element_rows = np.empty(len(top_element_rows), dtype=np.int64)
+        start = 0
+        for rows in remaining_rows:
+            remaining_element_rows[start:start + len(rows)] = rows
+            start += len(rows)
+        return (
+            np.take(feature_matrix, top_element_rows, axis=0),
+            np.take(feature_matrix, remaining_element_rows, axis=0)
+        )
+
+class _NumpyRankingTrainer():
+    """
+    minimizes sum(max(0, w * (top - remaining) + 1)) with mini-batch Adam.
+    the gradient of a batch is the sum of the differences (top - remaining) of
+    all pairs with a positive hinge term. the differences are computed once and
+    the batches are copied into a preallocated matrix.
+    """
+
+    def __init__(
+            self, top_element_matrix: np.ndarray, remaining_element_matrix: np.ndarray,
+            batch_size: int, seed: int|None, learning_rate: float = 0.001,
+            beta_1: float = 0.9, beta_2: float = 0.999, epsilon: float = 1e-7):
+        self.__difference_matrix = top_element_matrix - remaining_element_matrix
+        nr_of_samples, nr_of_features = self.__difference_matrix.shape
+        self.__random_generator = np.random.default_rng(seed)
+        self.__weights = self.__random_generator.standard_normal(nr_of_features)
+        self.__batch_size = max(1, min(batch_size, nr_of_samples))
+        #the last batch is smaller if the batch size does not divide the samples
+        self.__nr_of_batches = max(1, -(-nr_of_samples // self.__batch_size))
+        self.__batch = np.empty((self.__batch_size, nr_of_features))
+        self.__learning_rate = learning_rate
+        self.__beta_1 = beta_1
+        self.__beta_2 = beta_2
+        self.__epsilon = epsilon
+        self.__first_moment = np.zeros(nr_of_features)
+        self.__second_moment = np.zeros(nr_of_features)
+        self.__nr_of_steps = 0
+
+    def train_one_epoch(self) -> float:
+        nr_of_samples = len(self.__difference_matrix)
+        if nr_of_samples == 0:
+            return 0.0
+        permutation = self.__random_generator.permutation(nr_of_samples)
+        batch_losses = np.empty(self.__nr_of_batches)
+        for i in range(self.__nr_of_batches):
+            batch_indices = permutation[i * self.__batch_size:(i + 1) * self.__batch_size]
+            batch = self.__batch[:len(batch_indices)]
+            np.take(self.__difference_matrix, batch_indices, axis=0, out=batch)
+            margins = batch @ self.__weights + 1
+            is_active = margins > 0
+            batch_losses[i] = np.sum(margins, where=is_active)
+            self.__apply_gradient(is_active @ batch)
+        return batch_losses.mean()
+
+    def __apply_gradient(self, gradient: np.ndarray):
+        self.__nr_of_steps += 1
+        self.__first_moment *= self.__beta_1
+        self.__first_moment += (1 - self.__beta_1) * gradient
+        self.__second_moment *= self.__beta_2
+        self.__second_moment += (1 - self.__beta_2) * np.square(gradient)
+        learning_rate = self.__learning_rate * np.sqrt(
+            1 - self.__beta_2**self.__nr_of_steps) / (1 - self.__beta_1**self.__nr_of_steps)
+        self.__weights -= learning_rate * self.__first_moment / (
+            np.sqrt(self.__second_moment) + self.__epsilon)
+
+    def get_weights(self) -> np.ndarray:
+        return self.__weights.copy()
+
+class _TensorflowRankingTrainer():
+    """
+    minimizes the same loss as _NumpyRankingTrainer with TensorFlow, which is
+    only imported when this trainer is used
+    """
+
+    def __init__(
+            self, top_element_matrix: np.ndarray, remaining_element_matrix: np.ndarray,
+            batch_size: int, max_nr_of_epochs: int, seed: int|None):
+        import tensorflow as tf
+        self.__tf = tf
+        self.__nr_of_batches = max(1, -(-len(top_element_matrix) // batch_size))
+        dataset = tf.data.Dataset.from_tensor_slices((
+            tf.constant(top_element_matrix, dtype=tf.float32),
+            tf.constant(remaining_element_matrix, dtype=tf.float32)
+        ))
+        dataset = dataset.shuffle(
+            len(top_element_matrix), seed=seed
+        ).batch(batch_size).repeat(max_nr_of_epochs)
+        self.__dataset_iterator = iter(dataset)
+        self.__weights = tf.Variable(
+            tf.random.normal((1, top_element_matrix.shape[1])), name='weights')
+        self.__optimizer = tf.keras.optimizers.Adam()
+
+    def train_one_epoch(self) -> float:
+        tf = self.__tf
         epoch_loss = []
-        for _ in range(int(number_of_samples/self.__batch_size)):
-            batch_top_elements, batch_remaining_elements = next(dataset_iterator)
+        for _ in range(self.__nr_of_batches):
+            batch_top_elements, batch_remaining_elements = next(self.__dataset_iterator)
             with tf.GradientTape() as tape:
                 output = tf.subtract(
-                        tf.linalg.matmul(weights, tf.transpose(batch_top_elements)),
-                        tf.linalg.matmul(weights, tf.transpose(batch_remaining_elements))
+                        tf.linalg.matmul(self.__weights, tf.transpose(batch_top_elements)),
+                        tf.linalg.matmul(self.__weights, tf.transpose(batch_remaining_elements))
                     )
                 loss = tf.reduce_sum(tf.maximum(0, output + 1))
-            gradients = tape.gradient(loss, [weights])
-            optimizer.apply_gradients(zip(gradients, [weights]))
+            gradients = tape.gradient(loss, [self.__weights])
+            self.__optimizer.apply_gradients(zip(gradients, [self.__weights]))
             epoch_loss.append(loss.numpy())
-        epoch_loss = np.array(epoch_loss).mean()
-        return epoch_loss
-
-    def __create_dataset_iterator(self, top_element_matrix, remaining_element_matrix, number_of_samples):
-        dataset = tf.data.Dataset.from_tensor_slices(( top_element_matrix , remaining_element_matrix ))
-        dataset = dataset.shuffle(
-            number_of_samples, seed=self.__seed
-        ).repeat(self.__max_nr_of_epochs).batch(self.__batch_size)
-        dataset_iterator = iter(dataset)
-        return dataset_iterator
+        return np.array(epoch_loss).mean()
 
-    def __create_feature_matrices(
-            self, observed_arrivals, observed_departures,
-            job_to_vector) -> tuple[EagerTensor, EagerTensor]:
-        jobs_in_system = set()
-        top_element_matrix = []
-        remaining_element_matrix = []
-
-        environment = Environment()
-        for job, arrival_time in observed_arrivals:
-            environment.schedule_event(ArrivalEvent(job, arrival_time, jobs_in_system))
-        for job, departure_time in observed_departures:
-            environment.schedule_event(DepartureEvent(
-                job, departure_time, jobs_in_system, job_to_vector,
-                top_element_matrix, remaining_element_matrix))
-        environment.run_timesteps(observed_departures[-1][1])
-
-        top_element_matrix = tf.constant(np.array(top_element_matrix), dtype=tf.float32)
-        remaining_element_matrix = tf.constant(np.array(remaining_element_matrix), dtype=tf.float32)
-        return top_element_matrix, remaining_element_matrix
+    def get_weights(self) -> np.ndarray:
+        return self.__weights.numpy()
 
 class ArrivalEvent(Event):
 
-    def __init__(self, job: Job, arrival_time: int, jobs_in_system: set[Job]):
+    def __init__(
+            self, job: Job, arrival_time: int, row_per_job_in_system: dict[Job, int],
+            row_per_job: dict[Job, int]):
         super().__init__(arrival_time)
         self.__job = job
-        self.__jobs_in_system = jobs_in_system
+        self.__row_per_job_in_system = row_per_job_in_system
+        self.__row_per_job = row_per_job
 
     def execute(self, environment: Environment):
-        self.__jobs_in_system.add(self.__job)
+        self.__row_per_job_in_system[self.__job] = self.__row_per_job[self.__job]
 
 class DepartureEvent(Event):
 
     def __init__(
-            self, job: Job, departure_time: int,
-            jobs_in_system: set[Job], job_to_vector: dict[Job, np.ndarray],
-            top_element_matrix: list[np.ndarray], remaining_element_matrix: list[np.ndarray]):
+            self, job: Job, departure_time: int, row_per_job_in_system: dict[Job, int],
+            top_rows: list[int], remaining_rows: list[np.ndarray]):
         super().__init__(departure_time)
         self.__job = job
-        self.__job_to_vector = job_to_vector
-        self.__jobs_in_system = jobs_in_system
-        self.__top_element_matrix = top_element_matrix
-        self.__remaining_element_matrix = remaining_element_matrix
+        self.__row_per_job_in_system = row_per_job_in_system
+        self.__top_rows = top_rows
+        self.__remaining_rows = remaining_rows
 
     def execute(self, environment: Environment):
-        if self.__job in self.__jobs_in_system:
-            self.__jobs_in_system.remove(self.__job)
-            top_element_vector = self.__job_to_vector[self.__job]
-            for remaining_job in self.__jobs_in_system:
-                self.__top_element_matrix.append(top_element_vector)
-                self.__remaining_element_matrix.append(self.__job_to_vector[remaining_job])
+        top_row = self.__row_per_job_in_system.pop(self.__job, None)
+        if top_row is not None:
+            self.__top_rows.append(top_row)
+            self.__remaining_rows.append(np.fromiter(
+                self.__row_per_job_in_system.values(), dtype=np.int64,
+                count=len(self.__row_per_job_in_system)))
\ No newline at end of file
@@ -1,19 +1,46 @@
 from typing import Iterable
 from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import SGDClassifier
 
 from prolothar_queue_mining.inference.queue.waiting_area.pairwise_sklearn_cv_estimator import PairwiseSklearnCvEstimator
 from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
 
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.waiting_area.pair_sampler import PairSampler
 from prolothar_queue_mining.model.job.job_to_vector_transformer import MinMaxScaler
 from prolothar_queue_mining.model.job.job_to_vector_transformer import OneHotEncoder
 
 class PairwiseLogisticRegressionCvEstimator(PairwiseSklearnCvEstimator):
 
-    def __init__(self, numerical_feature_names: str, categorical_feature_names: str):
-        super().__init__(
-            numerical_feature_names, categorical_feature_names,
-            LogisticRegression(), {'C': [0.1, 1, 10]})
+    def __init__(
+            self, numerical_feature_names: str, categorical_feature_names: str,
+            pair_sampler: PairSampler|None = None,
+            partial_fit_batch_size: int|None = None):
+        """
+        Parameters
+        ----------
+        numerical_feature_names : str
+        categorical_feature_names : str
+        pair_sampler : PairSampler | None, optional
+            limits the number of training relations per served job, by default
+            None, i.e. all pairs of served job and waiting job are used
+        partial_fit_batch_size : int | None, optional
+            if not None, a logistic regression is trained by SGDClassifier with
+            "partial_fit" on batches of this many training relations, i.e.
+            without grid search over the regularization. by default None, i.e.
+            LogisticRegression is fitted on all relations by GridSearchCV
+        """
+        if partial_fit_batch_size is None:
+            super().__init__(
+                numerical_feature_names, categorical_feature_names,
+                LogisticRegression(), {'C': [0.1, 1, 10]},
+                pair_sampler=pair_sampler)
+        else:
+            super().__init__(
+                numerical_feature_names, categorical_feature_names,
+                SGDClassifier(loss='log_loss'), {},
+                pair_sampler=pair_sampler,
+                partial_fit_batch_size=partial_fit_batch_size)
 
     def _create_job_to_vector_transformer(
             self, numerical_feature_names: list[str], categorical_feature_names: list[str],
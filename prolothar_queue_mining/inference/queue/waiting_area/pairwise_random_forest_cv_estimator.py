@@ -5,10 +5,13 @@ from prolothar_queue_mining.inference.queue.waiting_area.pairwise_sklearn_cv_est
 from prolothar_queue_mining.inference.sklearn.job_to_vector_transformer_utils import create_job_to_vector_transformer_for_random_forest
 
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.waiting_area.pair_sampler import PairSampler
 
 class PairwiseRandomForestCvEstimator(PairwiseSklearnCvEstimator):
 
-    def __init__(self, numerical_feature_names: str, categorical_feature_names: str):
+    def __init__(
+            self, numerical_feature_names: str, categorical_feature_names: str,
+            pair_sampler: PairSampler|None = None):
         super().__init__(
             numerical_feature_names, categorical_feature_names,
             RandomForestClassifier(),
@@ -16,7 +19,8 @@ class PairwiseRandomForestCvEstimator(PairwiseSklearnCvEstimator):
                 'n_estimators': [5, 50, 100],
                 'max_depth': [2, 5, 7, 9],
                 'min_samples_leaf': [1, 10, 50]
-            }
+            },
+            pair_sampler=pair_sampler
         )
 
     def _create_job_to_vector_transformer(
@@ -1,39 +1,78 @@
 from abc import abstractmethod
 from typing import Iterable
 
-from sklearn.base import ClassifierMixin
+from sklearn.base import ClassifierMixin, clone
 from sklearn.model_selection import GridSearchCV
 
 from prolothar_queue_mining.inference.queue.waiting_area.waiting_area_estimator import WaitingAreaEstimator
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
 
 from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.waiting_area import PairwisePriorityClassifierWaitingArea
+from prolothar_queue_mining.model.waiting_area import VectorizedPairwisePriorityClassifierWaitingArea
 from prolothar_queue_mining.model.waiting_area.pairwise_priority_classifier import SklearnPairwisePriorityClassifier
+from prolothar_queue_mining.model.waiting_area.pair_sampler import PairSampler
 from prolothar_queue_mining.model.event import Event
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.job.job_to_vector_transformer import MinMaxScaler
 from prolothar_queue_mining.model.environment import Environment
 
 class PairwiseSklearnCvEstimator(WaitingAreaEstimator):
+    """
+    learns a pairwise priority classifier from the (served job, waiting job)
+    pairs of the observations. by default, the hyperparameters of the classifier
+    are selected by GridSearchCV, which fits the classifier on all training
+    relations at once. the training relations can only be streamed in
+    mini-batches to "partial_fit" if the parameter grid is empty and
+    "partial_fit_batch_size" is given.
+    """
 
     def __init__(
             self, numerical_feature_names: str, categorical_feature_names: str,
-            classifier: ClassifierMixin, parameter_grid: dict[str, list]):
+            classifier: ClassifierMixin, parameter_grid: dict[str, list],
+            pair_sampler: PairSampler|None = None,
+            partial_fit_batch_size: int|None = None):
+        """
+        Parameters
+        ----------
+        numerical_feature_names : str
+        categorical_feature_names : str
+        classifier : ClassifierMixin
+            sklearn classifier for the pairwise priority decision
+        parameter_grid : dict[str, list]
+            hyperparameters for the grid search with cross validation. if
+            empty, the classifier is trained without grid search
+        pair_sampler : PairSampler | None, optional
+            limits the number of training relations per served job, e.g.
+            UniformPairSampler or StratifiedPairSampler. by default None, i.e.
+            all pairs of served job and waiting job are used
+        partial_fit_batch_size : int | None, optional
+            if not None, the classifier is trained with "partial_fit" on batches
+            of this many training relations while the observations are
+            replayed. requires an empty parameter grid and a classifier that
+            supports "partial_fit", e.g. SGDClassifier. by default None
+        """
+        if partial_fit_batch_size is not None and parameter_grid:
+            raise ValueError(
+                'partial_fit_batch_size requires an empty parameter_grid, '
+                'because GridSearchCV fits the classifier on all relations at once')
         self.__categorical_feature_names = categorical_feature_names
         self.__numerical_feature_names = numerical_feature_names
         self.__classifier = classifier
         self.__parameter_grid = parameter_grid
+        self.__pair_sampler = pair_sampler
+        self.__partial_fit_batch_size = partial_fit_batch_size
 
     def infer_waiting_area(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> WaitingArea:
-
-        departure_time_per_job = dict(observed_departures)
+            self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+            observed_departures: list[tuple[Job, int]]|None = None) -> WaitingArea:
+        observations = to_observation_set(observed_arrivals, observed_departures)
+        departure_time_per_job = observations.get_departure_time_per_job()
         max_sojourn_time = max(
             departure_time_per_job[job] - arrival_time
-            for job, arrival_time in observed_arrivals
-            if job in departure_time_per_job
+            for job, arrival_time in observations.get_departed_arrivals()
         )
         scaler_for_arrival_time_difference = MinMaxScaler(
             min_value=-max_sojourn_time, max_value=max_sojourn_time)
@@ -42,27 +81,32 @@ class PairwiseSklearnCvEstimator(WaitingAreaEstimator):
             self.__numerical_feature_names, self.__categorical_feature_names,
             departure_time_per_job.keys())
 
-        grid_search_cv = GridSearchCV(self.__classifier, self.__parameter_grid, cv=5)
+        if self.__parameter_grid:
+            classifier = GridSearchCV(self.__classifier, self.__parameter_grid, cv=5)
+        else:
+            classifier = clone(self.__classifier)
 
         waiting_area = PairwisePriorityClassifierWaitingArea(
             SklearnPairwisePriorityClassifier(
-                grid_search_cv,
+                classifier,
                 job_to_vector_transformer,
-                scaler_for_arrival_time_difference=scaler_for_arrival_time_difference
-            )
+                scaler_for_arrival_time_difference=scaler_for_arrival_time_difference,
+                partial_fit_batch_size=self.__partial_fit_batch_size
+            ),
+            pair_sampler=self.__pair_sampler
         )
 
         environment = Environment()
-        for job, arrival_time in observed_arrivals:
+        for job, arrival_time in observations.get_observed_arrivals():
             environment.schedule_event(ArrivalEvent(job, arrival_time, waiting_area))
-        for job, departure_time in observed_departures:
+        for job, departure_time in observations.get_observed_departures():
             environment.schedule_event(DepartureEvent(job, departure_time, waiting_area))
-        environment.run_timesteps(observed_departures[-1][1])
+        environment.run_timesteps(observations.get_last_departure_time())
 
         waiting_area.learn_classifier()
-        return PairwisePriorityClassifierWaitingArea(
+        return VectorizedPairwisePriorityClassifierWaitingArea(
             SklearnPairwisePriorityClassifier(
-                grid_search_cv.best_estimator_,
+                classifier.best_estimator_ if self.__parameter_grid else classifier,
                 job_to_vector_transformer,
                 scaler_for_arrival_time_difference=scaler_for_arrival_time_difference
             )
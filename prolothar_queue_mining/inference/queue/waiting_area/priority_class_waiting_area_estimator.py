@@ -1,157 +1,251 @@
-from collections import defaultdict
+from bisect import bisect_right, insort
 import numpy as np
 
 from prolothar_queue_mining.inference.queue.waiting_area.waiting_area_estimator import WaitingAreaEstimator
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
 
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.server import Server
 from prolothar_queue_mining.model.service_time import OracleServiceTime
-from prolothar_queue_mining.model.observer.waiting_time import ServeOrderRecorder
+from prolothar_queue_mining.model.observer.waiting_time import CompactServeOrderRecorder
 from prolothar_queue_mining.model.arrival_process import FixedArrival
 from prolothar_queue_mining.model.waiting_area import WaitingArea
-from prolothar_queue_mining.model.waiting_area import PriorityClassWaitingArea
-from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
-from prolothar_queue_mining.model.waiting_area import FastLastComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedPriorityClassWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedLastComeFirstServeWaitingArea
 from prolothar_queue_mining.model.waiting_area import DepartureScheduledWaitingArea
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.environment import Environment
 
+#bounds the memory of the enumeration of (served job, waiting job) pairs
+_MAX_PAIRS_PER_CHUNK = 2**20
+
 class PriorityClassWaitingAreaEstimator(WaitingAreaEstimator):
+    """
+    infers a priority class waiting area. the observed serve order is replayed
+    once. afterwards, for each categorical feature, a matrix counts how often
+    a job of category a has been served while a job of category b was waiting.
+    the matrices are computed with vectorized operations on the category codes
+    of the JobTable of the observations. the feature whose matrix has the lowest
+    conditional entropy defines the priority classes.
+    features that are missing for some jobs are not considered.
+    """
 
     def __init__(self, categorical_feature_names: list[str], epsilon: float = 0.5):
         self.__categorical_feature_names = categorical_feature_names
         self.__epsilon = epsilon
 
     def infer_waiting_area(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> WaitingArea:
-        serve_order_recorder = self.__run_imitative_queue(observed_arrivals, observed_departures)
-        uninformed_counter, attribute_value_partial_order_count = \
-            self.__create_attribute_value_partial_order_count(serve_order_recorder)
-        selected_feature, order_of_categories = self.__select_feature_with_lowest_entropy(
-            uninformed_counter, attribute_value_partial_order_count)
-        #there was no feature with more than one category => no priority class waiting area inferrable
-        if selected_feature is None:
-            return None
-        return PriorityClassWaitingArea(
-            selected_feature, order_of_categories,
-            self.__infer_fifo_or_lifo_subwaiting_area(
-                selected_feature, serve_order_recorder, observed_arrivals)
-        )
+            self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+            observed_departures: list[tuple[Job, int]]|None = None) -> WaitingArea:
+        observations = to_observation_set(observed_arrivals, observed_departures)
+        serve_order_recorder = self.__run_imitative_queue(observations)
+        job_table = observations.get_job_table()
+        served_jobs = serve_order_recorder.get_served_jobs()
+        served_job_indices = np.fromiter(
+            map(job_table.get_index, served_jobs), dtype=np.int64, count=len(served_jobs))
+        entered_jobs = serve_order_recorder.get_entered_jobs()
+        entered_job_indices = np.fromiter(
+            map(job_table.get_index, entered_jobs), dtype=np.int64, count=len(entered_jobs))
+        start_of_waiting, end_of_waiting = serve_order_recorder.get_waiting_intervals()
 
-    def __select_feature_with_lowest_entropy(
-            self, uninformed_counter, attribute_value_partial_order_count) -> tuple[str, list]:
         lowest_entropy = float('inf')
         selected_feature = None
-        best_raw_entropy_matrix = None
-        categories_of_best_feature = None
-        for feature, partial_order_counter in attribute_value_partial_order_count.items():
-            categories = sorted(uninformed_counter[feature].keys())
-            if len(categories) > 1:
-                joint_probabilities = self.__compute_joint_probabilities(partial_order_counter, categories)
-                conditional_probabilities = self.__compute_conditional_probabilities(
-                    partial_order_counter, categories, joint_probabilities)
-                raw_entropy_matrix = -np.multiply(joint_probabilities, np.log(conditional_probabilities))
+        for feature in self.__categorical_feature_names:
+            codes, categories = job_table.get_categorical_feature(feature)
+            if len(codes) == 0 or codes.min() < 0:
+                continue
+            served_codes = codes[served_job_indices]
+            served_categories = np.flatnonzero(
+                np.bincount(served_codes, minlength=len(categories)))
+            if len(served_categories) > 1:
+                partial_order_count = self.__count_partial_orders(
+                    served_codes, codes[entered_job_indices],
+                    start_of_waiting, end_of_waiting, len(categories))
+                served_categories = sorted(
+                    served_categories.tolist(), key=categories.__getitem__)
+                raw_entropy_matrix = self.__compute_raw_entropy_matrix(
+                    partial_order_count[np.ix_(served_categories, served_categories)])
                 informed_entropy = np.sum(raw_entropy_matrix)
                 if informed_entropy < lowest_entropy:
                     selected_feature = feature
                     lowest_entropy = informed_entropy
-                    best_raw_entropy_matrix = raw_entropy_matrix
-                    categories_of_best_feature = categories
-        #we had no features with more than one category
+                    entropy_per_category = np.sum(raw_entropy_matrix, axis=1)
+                    order_of_categories = [
+                        categories[served_categories[i]]
+                        for i in np.argsort(entropy_per_category)
+                    ]
+                    nr_of_same_category_comparisons = int(np.trace(partial_order_count))
+        #there was no feature with more than one category => no priority class waiting area inferrable
         if selected_feature is None:
-            return None, None
-        entropy_per_category = np.sum(best_raw_entropy_matrix, axis=1)
-        order_of_categories = [categories_of_best_feature[i] for i in np.argsort(entropy_per_category)]
-        return selected_feature, order_of_categories
-
-    def __compute_conditional_probabilities(
-            self, partial_order_counter, categories, joint_probabilities) -> np.array:
-        marginal_waiting_probabilities = np.array([
-            sum(
-                partial_order_counter[served_category][waiting_category] + self.__epsilon
-                for served_category in categories
-            )
-            for waiting_category in categories
-        ])
-        marginal_waiting_probabilities = marginal_waiting_probabilities / np.sum(marginal_waiting_probabilities)
-        marginal_waiting_probabilities = np.transpose(
-            np.vstack(
-                [marginal_waiting_probabilities]*(len(marginal_waiting_probabilities)-1)
-            )
+            return None
+        codes = job_table.get_categorical_feature(selected_feature)[0]
+        return TypedPriorityClassWaitingArea(
+            selected_feature, order_of_categories,
+            self.__infer_fifo_or_lifo_subwaiting_area(
+                serve_order_recorder, codes[served_job_indices], codes[entered_job_indices],
+                start_of_waiting, end_of_waiting, nr_of_same_category_comparisons)
         )
-        return np.divide(joint_probabilities, marginal_waiting_probabilities)
 
-    def __compute_joint_probabilities(self, partial_order_counter, categories) -> np.array:
-        joint_probabilities = np.array([
-            [
-                partial_order_counter[category][different_category] + self.__epsilon
-                for category in categories
-                if category != different_category
-            ] for different_category in categories
-        ])
-        return joint_probabilities / np.sum(joint_probabilities)
+    def __count_partial_orders(
+            self, served_codes: np.ndarray, waiting_codes: np.ndarray,
+            start_of_waiting: np.ndarray, end_of_waiting: np.ndarray,
+            nr_of_categories: int) -> np.ndarray:
+        """
+        returns a matrix where entry [a,b] counts how often a job of category a
+        has been served while a job of category b was waiting. the diagonal
+        counts the comparisons between jobs of the same category.
+
+        the (served job, waiting job) pairs are enumerated in chunks of at most
+        _MAX_PAIRS_PER_CHUNK pairs (plus the pairs of one waiting job), and each
+        chunk is counted by one bincount of the combined category codes.
+        """
+        nr_of_pairs = end_of_waiting - start_of_waiting
+        pair_offsets = np.concatenate(([0], np.cumsum(nr_of_pairs)))
+        #the waiting job of the first pair of each chunk
+        chunk_bounds = np.unique(np.concatenate((
+            np.searchsorted(
+                pair_offsets, np.arange(0, pair_offsets[-1], _MAX_PAIRS_PER_CHUNK),
+                side='right') - 1,
+            [len(nr_of_pairs)]
+        )))
+        partial_order_count = np.zeros(nr_of_categories * nr_of_categories, dtype=np.int64)
+        for first, last in zip(chunk_bounds[:-1].tolist(), chunk_bounds[1:].tolist()):
+            nr_of_pairs_per_job = nr_of_pairs[first:last]
+            #the served job of a pair is start_of_waiting + position of the pair
+            #among the pairs of the waiting job
+            served_indices = np.arange(pair_offsets[first], pair_offsets[last]) - np.repeat(
+                pair_offsets[first:last] - start_of_waiting[first:last], nr_of_pairs_per_job)
+            partial_order_count += np.bincount(
+                served_codes[served_indices] * nr_of_categories
+                + np.repeat(waiting_codes[first:last], nr_of_pairs_per_job),
+                minlength=nr_of_categories * nr_of_categories)
+        return partial_order_count.reshape(nr_of_categories, nr_of_categories)
+
+    def __compute_raw_entropy_matrix(self, partial_order_count: np.ndarray) -> np.ndarray:
+        """
+        computes the entropy terms of the conditional probability that a job of
+        category a is served while a job of category b is waiting. the returned
+        matrix has a row for each waiting category b and a column for each
+        different served category a.
+        """
+        nr_of_categories = len(partial_order_count)
+        count_per_waiting_category = partial_order_count.T
+        is_different_category = ~np.eye(nr_of_categories, dtype=bool)
+        joint_probabilities = count_per_waiting_category[is_different_category].reshape(
+            nr_of_categories, nr_of_categories - 1) + self.__epsilon
+        joint_probabilities = joint_probabilities / np.sum(joint_probabilities)
+        marginal_waiting_probabilities = np.sum(
+            count_per_waiting_category * is_different_category, axis=1
+        ) + nr_of_categories * self.__epsilon
+        marginal_waiting_probabilities = marginal_waiting_probabilities / np.sum(
+            marginal_waiting_probabilities)
+        conditional_probabilities = joint_probabilities / marginal_waiting_probabilities[:, None]
+        return -np.multiply(joint_probabilities, np.log(conditional_probabilities))
 
-    def __run_imitative_queue(
-            self, observed_arrivals: list[tuple[Job, int]],
-            observed_departures: list[tuple[Job, int]]) -> ServeOrderRecorder:
-        departure_time_per_job = {job: departure_time for job, departure_time in observed_departures}
+    def __run_imitative_queue(self, observations: ObservationSet) -> CompactServeOrderRecorder:
+        departure_time_per_job = observations.get_departure_time_per_job()
         environment = Environment()
-        oracle_waiting_area = DepartureScheduledWaitingArea(departure_time_per_job)
-        serve_order_recorder = ServeOrderRecorder(oracle_waiting_area, departure_time_per_job)
+        serve_order_recorder = CompactServeOrderRecorder(
+            DepartureScheduledWaitingArea(departure_time_per_job))
         queue = Queue(
-            FixedArrival.create_from_observation(observed_arrivals),
+            FixedArrival.create_from_observation(observations.get_observed_arrivals()),
             [Server(OracleServiceTime(environment, departure_time_per_job))],
-            waiting_area=oracle_waiting_area,
+            waiting_area=serve_order_recorder.get_waiting_area(),
             waiting_time_observer=serve_order_recorder
         )
         queue.schedule_next_arrival(environment)
-        environment.run_timesteps(observed_departures[-1][1])
+        environment.run_timesteps(observations.get_last_departure_time())
         return serve_order_recorder
 
-    def __create_attribute_value_partial_order_count(
-            self, serve_order_recorder: ServeOrderRecorder) -> tuple[dict, dict]:
-        attribute_value_partial_order_count = {
-            feature_name: defaultdict(lambda: defaultdict(int))
-            for feature_name in self.__categorical_feature_names
-        }
-        uninformed_counter = {
-            feature_name: defaultdict(int)
-            for feature_name in self.__categorical_feature_names
-        }
-
-        for categorical_feature in self.__categorical_feature_names:
-            for served_job, waiting_job_list in serve_order_recorder.get_recording():
-                category_of_served_job = served_job.features[categorical_feature]
-                uninformed_counter[categorical_feature][category_of_served_job] += 1
-                partial_order_counter = attribute_value_partial_order_count[
-                    categorical_feature][category_of_served_job]
-                for waiting_job in waiting_job_list:
-                    category_of_waiting_job = waiting_job.features[categorical_feature]
-                    if category_of_waiting_job != category_of_served_job:
-                        partial_order_counter[category_of_waiting_job] += 1
-
-        return uninformed_counter, attribute_value_partial_order_count
-
     def __infer_fifo_or_lifo_subwaiting_area(
-            self, selected_feature: str, serve_order_recorder: ServeOrderRecorder,
-            observed_arrivals: list[tuple[Job, int]]):
-        arrival_per_job = {job: time for job, time in observed_arrivals}
-        nr_of_times_fifo = 0
-        nr_of_times_lifo = 0
-        for served_job, waiting_job_list in serve_order_recorder.get_recording():
-            category_of_served_job = served_job.features[selected_feature]
-            arrival_time_of_served_job = arrival_per_job[served_job]
-            for waiting_job in waiting_job_list:
-                category_of_waiting_job = waiting_job.features[selected_feature]
-                if category_of_waiting_job == category_of_served_job:
-                    arrival_time_of_waiting_job = arrival_per_job[waiting_job]
-                    if arrival_time_of_served_job < arrival_time_of_waiting_job:
-                        nr_of_times_fifo += 1
-                    elif arrival_time_of_served_job > arrival_time_of_waiting_job:
-                        nr_of_times_lifo += 1
-
+            self, serve_order_recorder: CompactServeOrderRecorder,
+            served_codes: np.ndarray, waiting_codes: np.ndarray,
+            start_of_waiting: np.ndarray, end_of_waiting: np.ndarray,
+            nr_of_same_category_comparisons: int):
+        served_arrival_times = serve_order_recorder.get_arrival_times_of_served_jobs()
+        waiting_arrival_times = serve_order_recorder.get_arrival_times_of_entered_jobs()
+        nr_of_times_lifo = _count_same_category_lifo_comparisons(
+            served_codes, served_arrival_times, waiting_codes,
+            waiting_arrival_times, end_of_waiting)
+        nr_of_ties = _count_same_category_ties(
+            served_codes, served_arrival_times, waiting_codes,
+            waiting_arrival_times, start_of_waiting, end_of_waiting)
+        nr_of_times_fifo = nr_of_same_category_comparisons - nr_of_times_lifo - nr_of_ties
         if nr_of_times_fifo >= nr_of_times_lifo:
-            return FastFirstComeFirstServeWaitingArea
+            return TypedFirstComeFirstServeWaitingArea
         else:
-            return FastLastComeFirstServeWaitingArea
+            return TypedLastComeFirstServeWaitingArea
+
+def _count_same_category_lifo_comparisons(
+        served_codes: np.ndarray, served_arrival_times: np.ndarray,
+        waiting_codes: np.ndarray, waiting_arrival_times: np.ndarray,
+        end_of_waiting: np.ndarray) -> int:
+    """
+    counts how often a job has been served while a job of the same category
+    that arrived earlier was waiting. a job that arrived earlier entered the
+    waiting area earlier, i.e. it was waiting at the start of service of the
+    i-th served job iff it left the waiting area after i. the served jobs are
+    swept in the order of their arrival and the end of the waiting intervals of
+    all earlier arrived jobs are kept in a sorted list per category.
+    """
+    end_of_waiting_per_category = [[] for _ in range(max(
+        np.max(served_codes, initial=-1), np.max(waiting_codes, initial=-1)) + 1)]
+    waiting_order = np.argsort(waiting_arrival_times, kind='stable')
+    sorted_waiting_arrival_times = waiting_arrival_times[waiting_order].tolist()
+    sorted_waiting_codes = waiting_codes[waiting_order].tolist()
+    sorted_end_of_waiting = end_of_waiting[waiting_order].tolist()
+    served_order = np.argsort(served_arrival_times, kind='stable')
+    nr_of_waiting_jobs = len(sorted_waiting_arrival_times)
+    nr_of_lifo_comparisons = 0
+    i = 0
+    for served_index, code, arrival_time in zip(
+            served_order.tolist(), served_codes[served_order].tolist(),
+            served_arrival_times[served_order].tolist()):
+        while i < nr_of_waiting_jobs and sorted_waiting_arrival_times[i] < arrival_time:
+            insort(end_of_waiting_per_category[sorted_waiting_codes[i]], sorted_end_of_waiting[i])
+            i += 1
+        end_of_waiting_of_category = end_of_waiting_per_category[code]
+        nr_of_lifo_comparisons += len(end_of_waiting_of_category) - bisect_right(
+            end_of_waiting_of_category, served_index)
+    return nr_of_lifo_comparisons
+
+def _count_same_category_ties(
+        served_codes: np.ndarray, served_arrival_times: np.ndarray,
+        waiting_codes: np.ndarray, waiting_arrival_times: np.ndarray,
+        start_of_waiting: np.ndarray, end_of_waiting: np.ndarray) -> int:
+    """
+    counts how often a job has been served while a job of the same category
+    with the same arrival time was waiting
+    """
+    #group key of (category, arrival time), equal for served and waiting jobs
+    _, group_keys = np.unique(
+        np.concatenate((
+            np.column_stack((served_codes, served_arrival_times)),
+            np.column_stack((waiting_codes, waiting_arrival_times)))),
+        axis=0, return_inverse=True)
+    group_keys = group_keys.ravel()
+    served_group_keys = group_keys[:len(served_codes)]
+    waiting_group_keys = group_keys[len(served_codes):]
+    served_indices = np.arange(len(served_codes))
+    #a job of the group was waiting at the i-th served job iff start <= i < end
+    return int(
+        _count_greater_in_group(waiting_group_keys, end_of_waiting, served_group_keys, served_indices)
+        - _count_greater_in_group(waiting_group_keys, start_of_waiting, served_group_keys, served_indices)
+    )
+
+def _count_greater_in_group(
+        group_keys: np.ndarray, values: np.ndarray,
+        query_group_keys: np.ndarray, query_values: np.ndarray) -> int:
+    """
+    returns the sum over all queries of the number of values in the group of
+    the query that are greater than the query value
+    """
+    #values are less than stride, i.e. the combined keys keep the group order
+    stride = max(np.max(values, initial=0), np.max(query_values, initial=0)) + 2
+    combined_keys = np.sort(group_keys * stride + values)
+    return np.sum(
+        np.searchsorted(combined_keys, (query_group_keys + 1) * stride, side='left')
+        - np.searchsorted(combined_keys, query_group_keys * stride + query_values, side='right')
+    )
\ No newline at end of file
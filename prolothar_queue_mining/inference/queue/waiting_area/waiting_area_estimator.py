@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 
 from prolothar_queue_mining.model.waiting_area import WaitingArea
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 class WaitingAreaEstimator(ABC):
     """
@@ -12,20 +13,22 @@ class WaitingAreaEstimator(ABC):
 
     @abstractmethod
     def infer_waiting_area(
-        self, observed_arrivals: list[tuple[Job, int]],
-        observed_departures: list[tuple[Job, int]]) -> WaitingArea|None:
+        self, observed_arrivals: list[tuple[Job, int]]|ObservationSet,
+        observed_departures: list[tuple[Job, int]]|None = None) -> WaitingArea|None:
         """
         tries to infer structure and parameters of a WaitingArea model from a list
         of observed job arrivals and departues
 
         Parameters
         ----------
-        observed_arrivals : list[tuple[Job, int]]
+        observed_arrivals : list[tuple[Job, int]]|ObservationSet
             a list of jobs together with the observed arrival time, ordered
-            by arrival time (smaller arrival times at the beginning)
-        observed_departures : list[tuple[Job, int]]
+            by arrival time (smaller arrival times at the beginning).
+            alternatively, an ObservationSet with both arrivals and departures.
+        observed_departures : list[tuple[Job, int]]|None
             a list of jobs together with the observed departure time, ordered
-            by departure time (smaller departure times at the beginning)
+            by departure time (smaller departure times at the beginning).
+            must be None if observed_arrivals is an ObservationSet.
 
         Returns
         -------
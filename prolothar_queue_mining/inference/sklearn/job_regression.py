@@ -33,10 +33,7 @@ def train_random_forest_cv(
     model = GridSearchCV(RandomForestRegressor(), param_grid, cv=nr_of_folds)
     job_to_vector_transformer = create_job_to_vector_transformer_for_random_forest(
         y_per_job.keys(), categorical_features, numerical_features)
-    X = np.array([
-        job_to_vector_transformer.transform(job)
-        for job,_ in y_per_job.items()
-    ])
+    X = job_to_vector_transformer.transform_many(y_per_job.keys())
     y = np.array([y for _,y in y_per_job.items()])
 
     model.fit(X, y)
@@ -53,10 +50,7 @@ def train_ridge_regression_cv(
     model = GridSearchCV(Ridge(), param_grid, cv=nr_of_folds)
     job_to_vector_transformer = create_job_to_vector_transformer_for_linear_model(
         y_per_job.keys(), categorical_features, numerical_features)
-    X = np.array([
-        job_to_vector_transformer.transform(job)
-        for job,_ in y_per_job.items()
-    ])
+    X = job_to_vector_transformer.transform_many(y_per_job.keys())
     y = np.array([y for _,y in y_per_job.items()])
 
     model.fit(X, y)
@@ -80,10 +74,7 @@ def train_lasso_cv(
         param_grid, cv=nr_of_folds, n_jobs=nr_of_cpus)
     job_to_vector_transformer = create_job_to_vector_transformer_for_linear_model(
         y_per_job.keys(), categorical_features, numerical_features)
-    X = np.array([
-        job_to_vector_transformer.transform(job)
-        for job,_ in y_per_job.items()
-    ])
+    X = job_to_vector_transformer.transform_many(y_per_job.keys())
     y = np.array([y for _,y in y_per_job.items()])
 
     model.fit(X, y)
@@ -104,10 +95,7 @@ def train_gamma_regression_cv(
     model = GridSearchCV(GammaRegressor(), param_grid, cv=nr_of_folds, n_jobs=nr_of_cpus)
     job_to_vector_transformer = create_job_to_vector_transformer_for_linear_model(
         y_per_job.keys(), categorical_features, numerical_features)
-    X = np.array([
-        job_to_vector_transformer.transform(job)
-        for job,_ in y_per_job.items()
-    ])
+    X = job_to_vector_transformer.transform_many(y_per_job.keys())
     y = np.array([y for _,y in y_per_job.items()])
 
     model.fit(X, y)
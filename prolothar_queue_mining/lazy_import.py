@@ -0,0 +1,44 @@
+"""
+support for packages that re-export classes of their modules without
+importing these modules (and their heavy dependencies like scikit-learn or
+statsmodels) at package import time. see PEP 562.
+"""
+from importlib import import_module
+from typing import Callable
+
+def create_lazy_module_attributes(
+        package_name: str,
+        module_name_per_attribute: dict[str, str]) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    creates the module-level functions __getattr__ and __dir__ of a package
+    that imports the module of an attribute on first access
+
+    Parameters
+    ----------
+    package_name : str
+        name of the package, i.e. __name__ of its __init__ module
+    module_name_per_attribute : dict[str, str]
+        maps the exported attributes to the absolute name of the module that
+        defines them
+
+    Returns
+    -------
+    tuple[Callable[[str], object], Callable[[], list[str]]]
+        __getattr__ and __dir__ of the package
+    """
+    package_globals = import_module(package_name).__dict__
+
+    def __getattr__(name: str):
+        try:
+            module_name = module_name_per_attribute[name]
+        except KeyError:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}') from None
+        value = getattr(import_module(module_name), name)
+        #__getattr__ is only called for missing attributes
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(package_globals) | set(module_name_per_attribute))
+
+    return __getattr__, __dir__
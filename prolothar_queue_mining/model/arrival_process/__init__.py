@@ -5,4 +5,5 @@ from prolothar_queue_mining.model.arrival_process.null_arrival import NullArriva
 from prolothar_queue_mining.model.arrival_process.exponential_distributed_arrival import ExponentialDistributedArrival
 from prolothar_queue_mining.model.arrival_process.recording_arrival import RecordingArrival
 from prolothar_queue_mining.model.arrival_process.batch_arrival_adapter import BatchArrivalAdapter
-from prolothar_queue_mining.model.arrival_process.limited_arrival import LimitedArrival
\ No newline at end of file
+from prolothar_queue_mining.model.arrival_process.limited_arrival import LimitedArrival
+from prolothar_queue_mining.model.arrival_process.arrival_cursor import ArrivalCursor
\ No newline at end of file
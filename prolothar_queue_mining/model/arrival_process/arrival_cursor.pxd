@@ -0,0 +1,12 @@
+from prolothar_queue_mining.model.job.job cimport Job
+
+cdef class ArrivalCursor:
+    cdef readonly list jobs
+    cdef const long long[::1] job_indices
+    cdef const long long[::1] arrival_times
+    cdef readonly Py_ssize_t nr_of_arrivals
+    cdef public Py_ssize_t index
+
+    cpdef bint has_next_arrival(self) except -1
+    cpdef tuple get_next_arrival(self)
+    cpdef ArrivalCursor copy(self)
@@ -0,0 +1,23 @@
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+
+class ArrivalCursor:
+    jobs: list[Job]
+    nr_of_arrivals: int
+    index: int
+
+    def __init__(
+            self, jobs: list[Job], job_indices: np.ndarray,
+            arrival_times: np.ndarray, index: int = 0): ...
+
+    def has_next_arrival(self) -> bool: ...
+
+    def get_next_arrival(self) -> tuple[int, Job]:
+        """
+        returns the arrival time and the job of the next arrival and advances
+        the cursor. raises a StopIteration if there are no more arrivals.
+        """
+        ...
+
+    def copy(self) -> 'ArrivalCursor': ...
@@ -0,0 +1,59 @@
+from prolothar_queue_mining.model.job.job cimport Job
+
+cdef class ArrivalCursor:
+    """
+    position in an immutable table of arrivals. the i-th arrival is the job
+    jobs[job_indices[i]] at time arrival_times[i]. the table is shared by all
+    copies of a cursor, i.e. copying does not depend on the number of arrivals.
+    a Queue advances the cursor of its arrival process without calling Python
+    methods (see ArrivalProcess.get_arrival_cursor).
+    """
+
+    def __init__(self, list jobs, job_indices, arrival_times, Py_ssize_t index = 0):
+        """
+        creates a new ArrivalCursor
+
+        Parameters
+        ----------
+        jobs : list[Job]
+            the jobs of the arrivals
+        job_indices : np.ndarray
+            int64 index into "jobs" for each arrival
+        arrival_times : np.ndarray
+            int64 arrival time for each arrival. must have the same length as
+            job_indices
+        index : int, optional
+            position of the next arrival, by default 0
+        """
+        if len(job_indices) != len(arrival_times):
+            raise ValueError(
+                f'{len(job_indices)} job indices but {len(arrival_times)} arrival times')
+        self.jobs = jobs
+        self.job_indices = job_indices
+        self.arrival_times = arrival_times
+        self.nr_of_arrivals = len(arrival_times)
+        self.index = index
+
+    cpdef bint has_next_arrival(self) except -1:
+        return self.index < self.nr_of_arrivals
+
+    cpdef tuple get_next_arrival(self):
+        """
+        returns the arrival time and the job of the next arrival and advances
+        the cursor. raises a StopIteration if there are no more arrivals.
+        """
+        if self.index >= self.nr_of_arrivals:
+            raise StopIteration()
+        cdef Py_ssize_t index = self.index
+        self.index += 1
+        return self.arrival_times[index], self.jobs[self.job_indices[index]]
+
+    cpdef ArrivalCursor copy(self):
+        #shares the memoryviews of the table instead of acquiring new ones
+        cdef ArrivalCursor copy = ArrivalCursor.__new__(ArrivalCursor)
+        copy.jobs = self.jobs
+        copy.job_indices = self.job_indices
+        copy.arrival_times = self.arrival_times
+        copy.nr_of_arrivals = self.nr_of_arrivals
+        copy.index = self.index
+        return copy
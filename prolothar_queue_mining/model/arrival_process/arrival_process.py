@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.arrival_process.arrival_cursor import ArrivalCursor
 
 class ArrivalProcess(ABC):
     """
@@ -37,3 +38,12 @@ class ArrivalProcess(ABC):
         returns the mean or expected arrival rate, i.e. the number of jobs
         arriving at one timestep (usually a fractional).
         """
+
+    def get_arrival_cursor(self) -> ArrivalCursor|None:
+        """
+        hook for bulk scheduling. if the remaining arrivals of this process are
+        fixed, returns the cursor that holds the state of this process. the queue
+        then takes the arrivals directly from the cursor instead of calling
+        get_next_job() for each job. by default None.
+        """
+        return None
@@ -1,36 +1,68 @@
+import numpy as np
+
 from prolothar_queue_mining.model.population import Population
 from prolothar_queue_mining.model.arrival_process.arrival_process import ArrivalProcess
+from prolothar_queue_mining.model.arrival_process.arrival_cursor import ArrivalCursor
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.population import ListPopulation
 
 class FixedArrival(ArrivalProcess):
+    """
+    arrival process with given arrival times. the jobs are taken from the
+    population in the order of arrival.
+
+    if the population is a ListPopulation, the arrivals are stored in an
+    immutable table that is shared with all copies (see ArrivalCursor), i.e.
+    copy() does not depend on the number of arrivals and a Queue schedules the
+    arrivals without calling get_next_job(). in this case, the cursor of the
+    ListPopulation is not advanced.
+    """
 
     def __init__(self, population: Population, arrival_times: list[int], initial_index: int = 0):
         self.__population = population
-        self.__arrival_times = arrival_times
-        self.__current_index = initial_index
-        self.__nr_of_arrivals = len(self.__arrival_times)
+        self.__arrival_times = np.array(arrival_times, dtype=np.int64)
+        self.__arrival_times.flags.writeable = False
+        if isinstance(population, ListPopulation):
+            self.__cursor = _create_cursor(population, self.__arrival_times, initial_index)
+        else:
+            self.__cursor = None
+            self.__current_index = initial_index
 
     def get_next_job(self) -> tuple[int,Job]:
+        if self.__cursor is not None:
+            return self.__cursor.get_next_arrival()
         if self.has_next_job():
-            arrival_time, job = self.__arrival_times[self.__current_index], self.__population.get_next_job()
+            arrival_time, job = int(self.__arrival_times[self.__current_index]), self.__population.get_next_job()
             self.__current_index += 1
             return arrival_time, job
         else:
             raise StopIteration()
 
     def has_next_job(self) -> bool:
-        return self.__current_index < self.__nr_of_arrivals
+        if self.__cursor is not None:
+            return self.__cursor.has_next_arrival()
+        return self.__current_index < len(self.__arrival_times)
 
     def get_ith_arrival_time(self, i: int) -> int:
-        return self.__arrival_times[i]
+        return int(self.__arrival_times[i])
 
     def get_mean_arrival_rate(self) -> float:
-        return (self.__nr_of_arrivals - 1) / (self.__arrival_times[-1] - self.__arrival_times[0])
+        return (len(self.__arrival_times) - 1) / float(self.__arrival_times[-1] - self.__arrival_times[0])
+
+    def get_arrival_cursor(self) -> ArrivalCursor|None:
+        return self.__cursor
 
     def copy(self) -> ArrivalProcess:
-        return FixedArrival(
-            self.__population.copy(), self.__arrival_times, initial_index=self.__current_index)
+        copy = FixedArrival.__new__(FixedArrival)
+        copy.__arrival_times = self.__arrival_times
+        if self.__cursor is not None:
+            copy.__population = self.__population
+            copy.__cursor = self.__cursor.copy()
+        else:
+            copy.__population = self.__population.copy()
+            copy.__cursor = None
+            copy.__current_index = self.__current_index
+        return copy
 
     def set_seed(self, seed: int):
         self.__population.set_seed(seed)
@@ -43,3 +75,21 @@ class FixedArrival(ArrivalProcess):
         return FixedArrival(
             ListPopulation([job for job, _ in observed_arrivals]),
             [arrival_time for _, arrival_time in observed_arrivals])
+
+def _create_cursor(
+        population: ListPopulation, arrival_times: np.ndarray,
+        initial_index: int) -> ArrivalCursor:
+    """
+    the i-th arrival (i >= initial_index) gets the job at index
+    i - initial_index + population.get_current_job_index(). arrivals without
+    a job in the population are dropped. an initial_index beyond the last
+    arrival results in a cursor without next arrival.
+    """
+    job_list = population.get_job_list()
+    offset = population.get_current_job_index() - initial_index
+    nr_of_arrivals = min(
+        len(arrival_times), max(initial_index, len(job_list) - offset))
+    job_indices = np.arange(offset, offset + nr_of_arrivals, dtype=np.int64)
+    job_indices.flags.writeable = False
+    return ArrivalCursor(
+        job_list, job_indices, arrival_times[:nr_of_arrivals], index=initial_index)
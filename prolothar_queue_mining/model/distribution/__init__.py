@@ -1,18 +1,51 @@
-from prolothar_queue_mining.model.distribution.distribution import Distribution
-from prolothar_queue_mining.model.distribution.discrete_distribution import DiscreteDistribution
-from prolothar_queue_mining.model.distribution.continuous_distribution import ContinuousDistribution
-from prolothar_queue_mining.model.distribution.degenerate import DiscreteDegenerateDistribution
-from prolothar_queue_mining.model.distribution.degenerate import ContinuousDegenerateDistribution
-from prolothar_queue_mining.model.distribution.normal import NormalDistribution
-from prolothar_queue_mining.model.distribution.exponential import ExponentialDistribution
-from prolothar_queue_mining.model.distribution.poisson import PoissonDistribution
-from prolothar_queue_mining.model.distribution.gamma import GammaDistribution
-from prolothar_queue_mining.model.distribution.pseudo import PseudoDistribution
-from prolothar_queue_mining.model.distribution.negative_binomial import NegativeBinomialDistribution
-from prolothar_queue_mining.model.distribution.binomial import BinomialDistribution
-from prolothar_queue_mining.model.distribution.geometric import GeometricDistribution
-from prolothar_queue_mining.model.distribution.pmf_defined import PmfDefinedDistribution
-from prolothar_queue_mining.model.distribution.c2d import C2dDistribution
-from prolothar_queue_mining.model.distribution.log_normal import LogNormalDistribution
-from prolothar_queue_mining.model.distribution.gmm import GaussianMixtureModelDistribution
-from prolothar_queue_mining.model.distribution.two_sided_geometric import TwoSidedGeometricDistribution
\ No newline at end of file
+from prolothar_queue_mining.lazy_import import create_lazy_module_attributes
+
+__all__ = [
+    'Distribution',
+    'DiscreteDistribution',
+    'ContinuousDistribution',
+    'DiscreteDegenerateDistribution',
+    'ContinuousDegenerateDistribution',
+    'NormalDistribution',
+    'ExponentialDistribution',
+    'PoissonDistribution',
+    'GammaDistribution',
+    'PseudoDistribution',
+    'NegativeBinomialDistribution',
+    'BinomialDistribution',
+    'GeometricDistribution',
+    'PmfDefinedDistribution',
+    'C2dDistribution',
+    'LogNormalDistribution',
+    'GaussianMixtureModelDistribution',
+    'TwoSidedGeometricDistribution',
+    'BlockSampler',
+    'GeneratorMethodSampler',
+    'AliasSampler',
+    'DenseTable',
+]
+
+__getattr__, __dir__ = create_lazy_module_attributes(__name__, {
+    'Distribution': 'prolothar_queue_mining.model.distribution.distribution',
+    'DiscreteDistribution': 'prolothar_queue_mining.model.distribution.discrete_distribution',
+    'ContinuousDistribution': 'prolothar_queue_mining.model.distribution.continuous_distribution',
+    'DiscreteDegenerateDistribution': 'prolothar_queue_mining.model.distribution.degenerate',
+    'ContinuousDegenerateDistribution': 'prolothar_queue_mining.model.distribution.degenerate',
+    'NormalDistribution': 'prolothar_queue_mining.model.distribution.normal',
+    'ExponentialDistribution': 'prolothar_queue_mining.model.distribution.exponential',
+    'PoissonDistribution': 'prolothar_queue_mining.model.distribution.poisson',
+    'GammaDistribution': 'prolothar_queue_mining.model.distribution.gamma',
+    'PseudoDistribution': 'prolothar_queue_mining.model.distribution.pseudo',
+    'NegativeBinomialDistribution': 'prolothar_queue_mining.model.distribution.negative_binomial',
+    'BinomialDistribution': 'prolothar_queue_mining.model.distribution.binomial',
+    'GeometricDistribution': 'prolothar_queue_mining.model.distribution.geometric',
+    'PmfDefinedDistribution': 'prolothar_queue_mining.model.distribution.pmf_defined',
+    'C2dDistribution': 'prolothar_queue_mining.model.distribution.c2d',
+    'LogNormalDistribution': 'prolothar_queue_mining.model.distribution.log_normal',
+    'GaussianMixtureModelDistribution': 'prolothar_queue_mining.model.distribution.gmm',
+    'TwoSidedGeometricDistribution': 'prolothar_queue_mining.model.distribution.two_sided_geometric',
+    'BlockSampler': 'prolothar_queue_mining.model.distribution.block_sampler',
+    'GeneratorMethodSampler': 'prolothar_queue_mining.model.distribution.block_sampler',
+    'AliasSampler': 'prolothar_queue_mining.model.distribution.block_sampler',
+    'DenseTable': 'prolothar_queue_mining.model.distribution.dense_table',
+})
\ No newline at end of file
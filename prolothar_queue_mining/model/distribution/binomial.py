@@ -1,14 +1,14 @@
 from math import log2
 import numpy as np
-from numpy.random import default_rng
 import scipy.stats as stats
 from distfit import distfit
-from methodtools import lru_cache
 
 from prolothar_common import mdl_utils
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.discrete_distribution import DiscreteDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler
+from prolothar_queue_mining.model.distribution.dense_table import DenseTable
 
 class BinomialDistribution(DiscreteDistribution):
     """
@@ -16,7 +16,9 @@ class BinomialDistribution(DiscreteDistribution):
     https://en.wikipedia.org/wiki/Binomial_distribution
     """
 
-    def __init__(self, nr_of_trials: float, success_probability: float, seed: int|None = None):
+    def __init__(
+        self, nr_of_trials: float, success_probability: float, seed: int|None = None,
+        nr_of_buffered_samples: int = 1000):
         """
         creates a new binomial distribution with a given number of
         successes until experiment is stopped and a success probability in each
@@ -28,11 +30,16 @@ class BinomialDistribution(DiscreteDistribution):
             raise ValueError(f'nr_of_trials must not be <= 0')
         self.__success_probability = success_probability
         self.__nr_of_trials = nr_of_trials
+        self.__nr_of_buffered_samples = nr_of_buffered_samples
         self.set_seed(seed)
+        self.__pmf_table = DenseTable(_compute_pmf_values, nr_of_trials, success_probability)
+        self.__cdf_table = DenseTable(_compute_cdf_values, nr_of_trials, success_probability)
 
     def get_next_sample(self) -> float:
-        return self.__random_generator.binomial(
-            self.__nr_of_trials, self.__success_probability)
+        return self.__sampler.get_next_sample()
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples)
 
     def get_mean(self) -> float:
         return self.__nr_of_trials * self.__success_probability
@@ -43,8 +50,13 @@ class BinomialDistribution(DiscreteDistribution):
     def get_variance(self) -> float:
         return self.__nr_of_trials * (1 - self.__success_probability) * self.__success_probability
 
-    @lru_cache()
     def compute_pmf(self, x: float) -> float:
+        pmf = self.__pmf_table.lookup(x)
+        if pmf is None:
+            return self.__compute_pmf(x)
+        return pmf
+
+    def __compute_pmf(self, x: float) -> float:
         if x < 0 or (isinstance(x, float) and not x.is_integer()):
             return 0
         try:
@@ -55,14 +67,19 @@ class BinomialDistribution(DiscreteDistribution):
             #towards 0 for large x
             return DiscreteDistribution.ALLMOST_ZERO
 
-    @lru_cache()
     def compute_cdf(self, x: float) -> float:
-        return stats.binom.cdf(x, self.__nr_of_trials, self.__success_probability)
+        cdf = self.__cdf_table.lookup(x)
+        if cdf is None:
+            return stats.binom.cdf(x, self.__nr_of_trials, self.__success_probability)
+        return cdf
 
     def copy(self) -> DiscreteDistribution:
-        return BinomialDistribution(
+        copy = BinomialDistribution(
             self.__nr_of_trials, self.__success_probability,
-            seed=self.__seed)
+            seed=self.__seed, nr_of_buffered_samples=self.__nr_of_buffered_samples)
+        copy.__pmf_table = self.__pmf_table
+        copy.__cdf_table = self.__cdf_table
+        return copy
 
     def __repr__(self):
         return (
@@ -73,7 +90,9 @@ class BinomialDistribution(DiscreteDistribution):
 
     def set_seed(self, seed: int):
         self.__seed = seed
-        self.__random_generator = default_rng(seed)
+        self.__sampler = GeneratorMethodSampler(
+            'binomial', self.__nr_of_trials, self.__success_probability,
+            seed=seed, block_size=self.__nr_of_buffered_samples)
 
     def get_mdl_of_model(self, precision: int = 5) -> float:
         return precision * log2(10) + mdl_utils.L_R(self.__nr_of_trials)
@@ -106,3 +125,12 @@ class BinomialDistribution(DiscreteDistribution):
             raise NotImplementedError()
         nr_of_trials = mean / success_probability
         return BinomialDistribution(nr_of_trials, success_probability, seed=seed)
+
+def _compute_pmf_values(
+        x: np.ndarray, nr_of_trials: float, success_probability: float) -> np.ndarray:
+    with np.errstate(all='ignore'):
+        return np.nan_to_num(stats.binom._pmf(x, nr_of_trials, success_probability), nan=0)
+
+def _compute_cdf_values(
+        x: np.ndarray, nr_of_trials: float, success_probability: float) -> np.ndarray:
+    return stats.binom.cdf(x, nr_of_trials, success_probability)
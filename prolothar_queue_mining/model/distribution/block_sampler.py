@@ -0,0 +1,164 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+from numpy.random import default_rng, Generator, SeedSequence
+
+#streams of components that are typically seeded with the same seed as the
+#distributions of a queue model
+POPULATION_STREAM = 1
+WAITING_AREA_STREAM = 2
+
+class BlockSampler(ABC):
+    """
+    draws random numbers from a numpy.random.Generator in blocks and returns
+    them one by one as plain Python int or float values. drawing a block of
+    samples at once is much faster than one call of the generator per sample.
+    """
+
+    def __init__(self, seed: int|None = None, block_size: int = 1000, stream: int = 0):
+        """
+        creates a new BlockSampler
+
+        Parameters
+        ----------
+        seed : int | None, optional
+            seed of the random generator, by default None
+        block_size : int, optional
+            number of samples that are drawn at once, by default 1000
+        stream : int, optional
+            samplers with the same seed but different streams draw independent
+            random numbers. stream 0 draws the same numbers as
+            numpy.random.default_rng(seed). by default 0
+        """
+        if block_size < 1:
+            raise ValueError(f'block_size must be positive, but is {block_size}')
+        self.__block_size = block_size
+        self.__spawn_key = (stream,) if stream else ()
+        self.set_seed(seed)
+
+    def get_next_sample(self) -> int|float:
+        """
+        returns the next sample as plain Python value
+        """
+        try:
+            return next(self.__sample_buffer_iterator)
+        except StopIteration:
+            self.__sample_buffer_iterator = iter(self.draw_block(self.__block_size).tolist())
+            return next(self.__sample_buffer_iterator)
+
+    def draw_block(self, nr_of_samples: int) -> np.ndarray:
+        """
+        draws "nr_of_samples" new samples at once. the buffered samples of
+        get_next_sample are not affected.
+        """
+        return self._draw_block(self.__random_generator, nr_of_samples)
+
+    @abstractmethod
+    def _draw_block(self, random_generator: Generator, nr_of_samples: int) -> np.ndarray:
+        """
+        draws "nr_of_samples" samples with the given random generator
+        """
+
+    def get_block_size(self) -> int:
+        return self.__block_size
+
+    def set_seed(self, seed: int|None):
+        """
+        reinitializes the random generator and discards the buffered samples
+        """
+        self.__random_generator = default_rng(SeedSequence(seed, spawn_key=self.__spawn_key))
+        self.__sample_buffer_iterator = iter([])
+
+class GeneratorMethodSampler(BlockSampler):
+    """
+    block sampler that calls a method of numpy.random.Generator, e.g.
+    GeneratorMethodSampler('poisson', 3.0) draws from Poisson(3)
+    """
+
+    def __init__(
+            self, method: str, *parameters: float, seed: int|None = None,
+            block_size: int = 1000, stream: int = 0):
+        """
+        creates a new GeneratorMethodSampler
+
+        Parameters
+        ----------
+        method : str
+            name of the method of numpy.random.Generator, e.g. "poisson"
+        *parameters : float
+            positional parameters of the method before "size"
+        seed : int | None, optional
+            seed of the random generator, by default None
+        block_size : int, optional
+            number of samples that are drawn at once, by default 1000
+        stream : int, optional
+            see BlockSampler, by default 0
+        """
+        #the name instead of the bound method keeps this object picklable
+        #and valid after set_seed
+        self.__method = method
+        self.__parameters = parameters
+        super().__init__(seed=seed, block_size=block_size, stream=stream)
+
+    def _draw_block(self, random_generator: Generator, nr_of_samples: int) -> np.ndarray:
+        return getattr(random_generator, self.__method)(*self.__parameters, size=nr_of_samples)
+
+class AliasSampler(BlockSampler):
+    """
+    block sampler for a finite discrete distribution that uses the alias
+    method, i.e. each sample costs one uniform integer and one uniform float
+    independent of the number of values
+    """
+
+    def __init__(
+            self, values: list[int|float], probabilities: list[float],
+            seed: int|None = None, block_size: int = 1000):
+        """
+        creates a new AliasSampler
+
+        Parameters
+        ----------
+        values : list[int|float]
+            the values of the distribution
+        probabilities : list[float]
+            the probabilities of the values. they are normalized to sum up to 1.
+        seed : int | None, optional
+            seed of the random generator, by default None
+        block_size : int, optional
+            number of samples that are drawn at once, by default 1000
+        """
+        if len(values) != len(probabilities) or not values:
+            raise ValueError('values and probabilities must be non-empty and of equal length')
+        self.__values = np.array(values)
+        self.__acceptance_probabilities, self.__aliases = _create_alias_table(probabilities)
+        super().__init__(seed=seed, block_size=block_size)
+
+    def _draw_block(self, random_generator: Generator, nr_of_samples: int) -> np.ndarray:
+        columns = random_generator.integers(0, len(self.__values), size=nr_of_samples)
+        is_accepted = random_generator.random(size=nr_of_samples) < self.__acceptance_probabilities[columns]
+        return self.__values[np.where(is_accepted, columns, self.__aliases[columns])]
+
+def _create_alias_table(probabilities: list[float]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    creates the acceptance probabilities and aliases of the alias method by
+    Vose's algorithm
+    """
+    nr_of_values = len(probabilities)
+    scaled_probabilities = np.array(probabilities, dtype=float)
+    scaled_probabilities *= nr_of_values / scaled_probabilities.sum()
+    acceptance_probabilities = np.ones(nr_of_values)
+    aliases = np.arange(nr_of_values)
+    small = [i for i in range(nr_of_values) if scaled_probabilities[i] < 1]
+    large = [i for i in range(nr_of_values) if scaled_probabilities[i] >= 1]
+    while small and large:
+        column = small.pop()
+        alias = large.pop()
+        acceptance_probabilities[column] = scaled_probabilities[column]
+        aliases[column] = alias
+        scaled_probabilities[alias] -= 1 - scaled_probabilities[column]
+        if scaled_probabilities[alias] < 1:
+            small.append(alias)
+        else:
+            large.append(alias)
+    #the remaining columns have a probability of 1 up to rounding errors
+    return acceptance_probabilities, aliases
@@ -1,8 +1,9 @@
-from methodtools import lru_cache
+import numpy as np
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.discrete_distribution import DiscreteDistribution
 from prolothar_queue_mining.model.distribution.continuous_distribution import ContinuousDistribution
+from prolothar_queue_mining.model.distribution.dense_table import DenseTable
 
 class C2dDistribution(DiscreteDistribution):
     """
@@ -12,10 +13,16 @@ class C2dDistribution(DiscreteDistribution):
 
     def __init__(self, wrapped_distribution: ContinuousDistribution):
         self.__wrapper_distribution = wrapped_distribution
+        self.__pmf_table = DenseTable(_compute_pmf_values, wrapped_distribution)
+        self.__cdf_table = DenseTable(_compute_cdf_values, wrapped_distribution)
 
     def get_next_sample(self) -> float:
         return round(self.__wrapper_distribution.get_next_sample())
 
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        #np.rint rounds half to even like round()
+        return np.rint(self.__wrapper_distribution.get_next_samples(nr_of_samples))
+
     def get_mean(self) -> float:
         return self.__wrapper_distribution.get_mean()
 
@@ -26,18 +33,25 @@ class C2dDistribution(DiscreteDistribution):
         return self.__wrapper_distribution.get_variance()
 
     def copy(self) -> DiscreteDistribution:
-        return C2dDistribution(self.__wrapper_distribution.copy())
+        copy = C2dDistribution(self.__wrapper_distribution.copy())
+        copy.__pmf_table = self.__pmf_table
+        copy.__cdf_table = self.__cdf_table
+        return copy
 
     def __repr__(self):
         return f'C2d({self.__wrapper_distribution})'
 
-    @lru_cache()
     def compute_pmf(self, x: float) -> float:
-        return self.__wrapper_distribution.compute_cdf(x + 0.5) - self.__wrapper_distribution.compute_cdf(x - 0.5)
+        pmf = self.__pmf_table.lookup(x)
+        if pmf is None:
+            return self.__wrapper_distribution.compute_cdf(x + 0.5) - self.__wrapper_distribution.compute_cdf(x - 0.5)
+        return pmf
 
-    @lru_cache()
     def compute_cdf(self, x: float) -> float:
-        return self.__wrapper_distribution.compute_cdf(x)
+        cdf = self.__cdf_table.lookup(x)
+        if cdf is None:
+            return self.__wrapper_distribution.compute_cdf(x)
+        return cdf
 
     def set_seed(self, seed: int):
         self.__wrapper_distribution.set_seed(seed)
@@ -65,3 +79,13 @@ class C2dDistribution(DiscreteDistribution):
     def fit_by_mean_and_variance(mean: float, variance: float, seed: int|None = None) -> 'Distribution':
         raise NotImplementedError()
 
+def _compute_pmf_values(x: np.ndarray, wrapped_distribution: ContinuousDistribution) -> np.ndarray:
+    #the CDF at k + 0.5 is needed for the PMF at k and k + 1
+    cdf = np.array([
+        wrapped_distribution.compute_cdf(bound)
+        for bound in np.append(x - 0.5, x[-1] + 0.5).tolist()
+    ], dtype=float)
+    return np.diff(cdf)
+
+def _compute_cdf_values(x: np.ndarray, wrapped_distribution: ContinuousDistribution) -> np.ndarray:
+    return np.array([wrapped_distribution.compute_cdf(value) for value in x.tolist()], dtype=float)
@@ -1,3 +1,4 @@
+import numpy as np
 from prolothar_common.experiments.statistics import Statistics
 
 from prolothar_common import mdl_utils
@@ -17,6 +18,9 @@ class DiscreteDegenerateDistribution(DiscreteDistribution):
     def get_next_sample(self) -> float:
         return self.value
 
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return np.full(nr_of_samples, self.value, dtype=float)
+
     def get_mean(self) -> float:
         return self.value
 
@@ -76,6 +80,9 @@ class ContinuousDegenerateDistribution(ContinuousDistribution):
     def get_next_sample(self) -> float:
         return self.value
 
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return np.full(nr_of_samples, self.value, dtype=float)
+
     def get_mean(self) -> float:
         return self.value
 
@@ -0,0 +1,67 @@
+from typing import Callable
+
+import numpy as np
+
+class DenseTable():
+    """
+    a lazily built table of function values at 0, 1, 2, ... (e.g. the PMF or
+    CDF of a discrete distribution). the table grows on demand to twice its
+    size, but never beyond a maximal size. in contrast to an LRU cache, a
+    lookup is a plain list access without hashing or locking.
+    """
+
+    def __init__(
+            self, compute_values: Callable[..., np.ndarray], *parameters,
+            max_size: int = 2**16):
+        """
+        creates a new, empty DenseTable
+
+        Parameters
+        ----------
+        compute_values : Callable[..., np.ndarray]
+            computes the function values for an array of non-negative integers.
+            a module level function keeps the table picklable.
+        *parameters
+            further positional arguments of compute_values, e.g. the parameters
+            of the distribution
+        max_size : int, optional
+            the table contains at most the values at 0, ..., max_size - 1,
+            by default 2**16
+        """
+        self.__compute_values = compute_values
+        self.__parameters = parameters
+        self.__max_size = max_size
+        self.__values = []
+
+    def lookup(self, x: float) -> float|None:
+        """
+        returns the function value at x or None if x is not a non-negative
+        integer below the maximal size of the table. the caller is
+        responsible to compute values outside of the table.
+        """
+        if x.__class__ is not int:
+            try:
+                if not x.is_integer():
+                    return None
+            except AttributeError:
+                #e.g. numpy integers
+                pass
+            x = int(x)
+        if x < 0:
+            return None
+        try:
+            return self.__values[x]
+        except IndexError:
+            if x >= self.__max_size:
+                return None
+            self.__grow(x)
+            return self.__values[x]
+
+    def __grow(self, x: int):
+        size = len(self.__values)
+        new_size = min(self.__max_size, max(x + 1, 2 * size, 16))
+        self.__values.extend(self.__compute_values(
+            np.arange(size, new_size), *self.__parameters).tolist())
+
+    def __len__(self) -> int:
+        return len(self.__values)
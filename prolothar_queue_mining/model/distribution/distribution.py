@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 from math import nextafter
 
+import numpy as np
+
 class Distribution(ABC):
     """
     template of a distribution, from which we can sample random numbers
@@ -14,6 +16,21 @@ class Distribution(ABC):
         draws the next sample from this distribution
         """
 
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        """
+        draws the next "nr_of_samples" samples from this distribution. subclasses
+        should override this method to draw all samples at once.
+        """
+        return np.array([self.get_next_sample() for _ in range(nr_of_samples)], dtype=float)
+
+    def __getstate__(self) -> dict:
+        #the caches of methodtools.lru_cache cannot be pickled. they are
+        #recreated on first use after unpickling.
+        return {
+            key: value for key, value in self.__dict__.items()
+            if not key.startswith('__wire|')
+        }
+
     @abstractmethod
     def copy(self) -> 'Distribution':
         """
@@ -67,6 +84,13 @@ class Distribution(ABC):
         computes the value of the CDF at x
         """
 
+    def compute_cdf_values(self, x: np.ndarray) -> np.ndarray:
+        """
+        computes the values of the CDF for an array of points. subclasses
+        should override this method to compute all values at once.
+        """
+        return np.array([self.compute_cdf(value) for value in x.tolist()], dtype=float)
+
     @abstractmethod
     def set_seed(self, seed: int):
         """
@@ -1,25 +1,30 @@
-from numpy.random import default_rng
+import numpy as np
 import scipy.stats as stats
 from methodtools import lru_cache
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.continuous_distribution import ContinuousDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler
 
 class ExponentialDistribution(ContinuousDistribution):
     """
     an exponential distribution
     """
 
-    def __init__(self, rate: float, seed: int|None = None):
+    def __init__(self, rate: float, seed: int|None = None, nr_of_buffered_samples: int = 1000):
         """
         creates a new exponential distribution with the rate (lambda)
         """
         self.rate = rate
         self.__scale = 1 / rate
+        self.__nr_of_buffered_samples = nr_of_buffered_samples
         self.set_seed(seed)
 
     def get_next_sample(self) -> float:
-        return self.__random_generator.exponential(self.__scale)
+        return self.__sampler.get_next_sample()
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples)
 
     def get_mean(self) -> float:
         return 1 / self.rate
@@ -38,15 +43,21 @@ class ExponentialDistribution(ContinuousDistribution):
     def compute_cdf(self, x: float) -> float:
         return stats.expon.cdf(x, 0, self.__scale)
 
+    def compute_cdf_values(self, x: np.ndarray) -> np.ndarray:
+        return stats.expon.cdf(x, 0, self.__scale)
+
     def copy(self) -> ContinuousDistribution:
-        return ExponentialDistribution(self.rate, seed=self.seed)
+        return ExponentialDistribution(
+            self.rate, seed=self.seed, nr_of_buffered_samples=self.__nr_of_buffered_samples)
 
     def __repr__(self):
         return f'ExponentialDistribution({self.rate}, seed={self.seed})'
 
     def set_seed(self, seed: int):
         self.seed = seed
-        self.__random_generator = default_rng(seed)
+        self.__sampler = GeneratorMethodSampler(
+            'exponential', self.__scale, seed=seed,
+            block_size=self.__nr_of_buffered_samples)
 
     def __hash__(self):
         return hash(self.rate)
@@ -1,10 +1,10 @@
 from scipy.stats import gamma
 import numpy as np
-from numpy.random import default_rng
 from methodtools import lru_cache
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.continuous_distribution import ContinuousDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler
 
 class GammaDistribution(ContinuousDistribution):
     """
@@ -12,7 +12,9 @@ class GammaDistribution(ContinuousDistribution):
     https://en.wikipedia.org/wiki/Gamma_distribution
     """
 
-    def __init__(self, shape: float, rate: float, seed: int|None = None):
+    def __init__(
+        self, shape: float, rate: float, seed: int|None = None,
+        nr_of_buffered_samples: int = 1000):
         """
         creates a new gamma distribution with the given shape and rate
 
@@ -24,6 +26,8 @@ class GammaDistribution(ContinuousDistribution):
             beta in literature
         seed : float, optional
             random generator seed, by default None
+        nr_of_buffered_samples : int, optional
+            number of samples that are drawn at once, by default 1000
         """
         if shape <= 0:
             raise ValueError(f'shape must not be <= 0, but was {shape}')
@@ -32,10 +36,14 @@ class GammaDistribution(ContinuousDistribution):
         self.shape = shape
         self.rate = rate
         self.__scale = 1 / rate
+        self.__nr_of_buffered_samples = nr_of_buffered_samples
         self.set_seed(seed)
 
     def get_next_sample(self) -> float:
-        return self.__random_generator.gamma(self.shape, self.__scale)
+        return self.__sampler.get_next_sample()
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples)
 
     def get_mean(self) -> float:
         return self.shape / self.rate
@@ -47,7 +55,9 @@ class GammaDistribution(ContinuousDistribution):
         return self.shape / (self.rate)**2
 
     def copy(self) -> ContinuousDistribution:
-        return GammaDistribution(self.shape, self.rate, seed=self.seed)
+        return GammaDistribution(
+            self.shape, self.rate, seed=self.seed,
+            nr_of_buffered_samples=self.__nr_of_buffered_samples)
 
     @lru_cache()
     def compute_pdf(self, x: float) -> float:
@@ -57,12 +67,17 @@ class GammaDistribution(ContinuousDistribution):
     def compute_cdf(self, x: float) -> float:
         return gamma.cdf(x, self.shape, 0, self.__scale)
 
+    def compute_cdf_values(self, x: np.ndarray) -> np.ndarray:
+        return gamma.cdf(x, self.shape, 0, self.__scale)
+
     def __repr__(self):
         return f'GammaDistribution({self.shape}, {self.rate}, seed={self.seed})'
 
     def set_seed(self, seed: int):
         self.seed = seed
-        self.__random_generator = default_rng(seed)
+        self.__sampler = GeneratorMethodSampler(
+            'gamma', self.shape, self.__scale, seed=seed,
+            block_size=self.__nr_of_buffered_samples)
 
     def __hash__(self):
         return hash((self.shape, self.rate))
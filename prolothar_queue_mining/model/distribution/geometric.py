@@ -1,11 +1,12 @@
 import math
-from numpy.random import default_rng
+import numpy as np
 import scipy.stats as stats
 from prolothar_common.experiments.statistics import Statistics
-from methodtools import lru_cache
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.discrete_distribution import DiscreteDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler
+from prolothar_queue_mining.model.distribution.dense_table import DenseTable
 
 class GeometricDistribution(DiscreteDistribution):
     """
@@ -24,17 +25,17 @@ class GeometricDistribution(DiscreteDistribution):
         self.__success_probability = success_probability
         self.__nr_of_buffered_samples = nr_of_buffered_samples
         self.set_seed(seed)
+        self.__pmf_table = DenseTable(_compute_pmf_values, success_probability)
+        self.__cdf_table = DenseTable(_compute_cdf_values, success_probability)
 
     def get_success_probability(self) -> float:
         return self.__success_probability
 
     def get_next_sample(self) -> float:
-        try:
-            return next(self.__sample_buffer_iterator)
-        except StopIteration:
-            self.__sample_buffer_iterator = iter(self.__random_generator.geometric(
-                self.__success_probability, size=self.__nr_of_buffered_samples))
-            return next(self.__sample_buffer_iterator)
+        return self.__sampler.get_next_sample()
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples)
 
     def get_mean(self) -> float:
         return 1 / self.__success_probability
@@ -45,8 +46,13 @@ class GeometricDistribution(DiscreteDistribution):
     def get_variance(self) -> float:
         return (1 - self.__success_probability) / self.__success_probability**2
 
-    @lru_cache()
     def compute_pmf(self, x: float) -> float:
+        pmf = self.__pmf_table.lookup(x)
+        if pmf is None:
+            return self.__compute_pmf(x)
+        return pmf
+
+    def __compute_pmf(self, x: float) -> float:
         if x < 1:
             return 0
         try:
@@ -56,20 +62,28 @@ class GeometricDistribution(DiscreteDistribution):
             #towards 0 for large x
             return DiscreteDistribution.ALLMOST_ZERO
 
-    @lru_cache()
     def compute_cdf(self, x: float) -> float:
-        return stats.geom.cdf(x, self.__success_probability)
+        cdf = self.__cdf_table.lookup(x)
+        if cdf is None:
+            return stats.geom.cdf(x, self.__success_probability)
+        return cdf
 
     def copy(self) -> DiscreteDistribution:
-        return GeometricDistribution(self.__success_probability, seed=self.__seed)
+        copy = GeometricDistribution(
+            self.__success_probability, seed=self.__seed,
+            nr_of_buffered_samples=self.__nr_of_buffered_samples)
+        copy.__pmf_table = self.__pmf_table
+        copy.__cdf_table = self.__cdf_table
+        return copy
 
     def __repr__(self):
         return f'GeometricDistribution({self.__success_probability}, seed={self.__seed})'
 
     def set_seed(self, seed: int|None):
         self.__seed = seed
-        self.__random_generator = default_rng(seed)
-        self.__sample_buffer_iterator = iter([])
+        self.__sampler = GeneratorMethodSampler(
+            'geometric', self.__success_probability, seed=seed,
+            block_size=self.__nr_of_buffered_samples)
 
     def get_mdl_of_model(self, precision: int = 5) -> float:
         return precision * math.log2(10)
@@ -95,3 +109,11 @@ class GeometricDistribution(DiscreteDistribution):
     def fit_by_mean_and_variance(mean: float, variance: float, seed: int|None = None) -> 'Distribution':
         return GeometricDistribution(min(1, 1 / mean), seed=seed)
 
+def _compute_pmf_values(x: np.ndarray, success_probability: float) -> np.ndarray:
+    with np.errstate(all='ignore'):
+        pmf = np.power(1 - success_probability, x - 1.0) * success_probability
+    pmf[x < 1] = 0
+    return pmf
+
+def _compute_cdf_values(x: np.ndarray, success_probability: float) -> np.ndarray:
+    return stats.geom.cdf(x, success_probability)
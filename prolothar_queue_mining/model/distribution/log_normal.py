@@ -1,19 +1,21 @@
 from math import exp, log as ln
 import numpy as np
 from scipy.stats import lognorm
-from numpy.random import default_rng
 
 from prolothar_common import mdl_utils
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.continuous_distribution import ContinuousDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler
 
 class LogNormalDistribution(ContinuousDistribution):
     """
     a log normal distribution
     """
 
-    def __init__(self, mu: float, sigma: float, seed: int|None = None):
+    def __init__(
+        self, mu: float, sigma: float, seed: int|None = None,
+        nr_of_buffered_samples: int = 1000):
         """
         creates a new log normal distribution with the given mean and standard deviation
         https://en.wikipedia.org/wiki/Log-normal_distribution
@@ -24,15 +26,21 @@ class LogNormalDistribution(ContinuousDistribution):
         sigma : float
         seed : float, optional
             random generator seed, by default None
+        nr_of_buffered_samples : int, optional
+            number of samples that are drawn at once, by default 1000
         """
         self.__mu = mu
         self.__sigma = sigma
         self.__scale = exp(self.__mu)
         self.__sigma_square = self.__sigma * self.__sigma
+        self.__nr_of_buffered_samples = nr_of_buffered_samples
         self.set_seed(seed)
 
     def get_next_sample(self) -> float:
-        return self.__random_generator.lognormal(self.__mu, self.__sigma)
+        return self.__sampler.get_next_sample()
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples)
 
     def get_mean(self) -> float:
         return exp(self.__mu + self.__sigma_square / 2)
@@ -49,18 +57,25 @@ class LogNormalDistribution(ContinuousDistribution):
     def compute_cdf(self, x: float) -> float:
         return lognorm.cdf(x, self.__sigma, scale=self.__scale)
 
+    def compute_cdf_values(self, x: np.ndarray) -> np.ndarray:
+        return lognorm.cdf(x, self.__sigma, scale=self.__scale)
+
     def get_mdl_of_model(self) -> float:
         return mdl_utils.L_R(self.__mu) + mdl_utils.L_R(self.__sigma)
 
     def copy(self) -> ContinuousDistribution:
-        return LogNormalDistribution(self.__mu, self.__sigma, seed=self.seed)
+        return LogNormalDistribution(
+            self.__mu, self.__sigma, seed=self.seed,
+            nr_of_buffered_samples=self.__nr_of_buffered_samples)
 
     def __repr__(self):
         return f'LogNormalDistribution({self.__mu}, {self.__sigma}, seed={self.seed})'
 
     def set_seed(self, seed: int):
         self.seed = seed
-        self.__random_generator = default_rng(seed)
+        self.__sampler = GeneratorMethodSampler(
+            'lognormal', self.__mu, self.__sigma, seed=seed,
+            block_size=self.__nr_of_buffered_samples)
 
     def __hash__(self):
         return hash((self.__mu, self.__sigma))
@@ -1,14 +1,14 @@
 from math import log2
 import numpy as np
-from numpy.random import default_rng
 import scipy.stats as stats
 import statsmodels.api as sm
-from methodtools import lru_cache
 
 from prolothar_common import mdl_utils
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.discrete_distribution import DiscreteDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler
+from prolothar_queue_mining.model.distribution.dense_table import DenseTable
 
 class NegativeBinomialDistribution(DiscreteDistribution):
     """
@@ -32,14 +32,14 @@ class NegativeBinomialDistribution(DiscreteDistribution):
         self.__nr_of_successes = nr_of_successes
         self.__nr_of_buffered_samples = nr_of_buffered_samples
         self.set_seed(seed)
+        self.__pmf_table = DenseTable(_compute_pmf_values, nr_of_successes, success_probability)
+        self.__cdf_table = DenseTable(_compute_cdf_values, nr_of_successes, success_probability)
 
     def get_next_sample(self) -> float:
-        try:
-            return next(self.__sample_buffer_iterator)
-        except StopIteration:
-            self.__sample_buffer_iterator = iter(self.__random_generator.negative_binomial(
-                self.__nr_of_successes, self.__success_probability, size=self.__nr_of_buffered_samples))
-            return next(self.__sample_buffer_iterator)
+        return self.__sampler.get_next_sample()
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples)
 
     def get_mean(self) -> float:
         return self.__nr_of_successes * (1 - self.__success_probability) / self.__success_probability
@@ -55,8 +55,13 @@ class NegativeBinomialDistribution(DiscreteDistribution):
     def is_deterministic(self) -> bool:
         return False
 
-    @lru_cache()
     def compute_pmf(self, x: float) -> float:
+        pmf = self.__pmf_table.lookup(x)
+        if pmf is None:
+            return self.__compute_pmf(x)
+        return pmf
+
+    def __compute_pmf(self, x: float) -> float:
         if x < 0 or (isinstance(x, float) and not x.is_integer()):
             return 0
         try:
@@ -66,14 +71,19 @@ class NegativeBinomialDistribution(DiscreteDistribution):
             #towards 0 for large x
             return DiscreteDistribution.ALLMOST_ZERO
 
-    @lru_cache()
     def compute_cdf(self, x: float) -> float:
-        return stats.nbinom.cdf(x, self.__nr_of_successes, self.__success_probability)
+        cdf = self.__cdf_table.lookup(x)
+        if cdf is None:
+            return stats.nbinom.cdf(x, self.__nr_of_successes, self.__success_probability)
+        return cdf
 
     def copy(self) -> DiscreteDistribution:
-        return NegativeBinomialDistribution(
+        copy = NegativeBinomialDistribution(
             self.__nr_of_successes, self.__success_probability,
-            seed=self.__seed)
+            seed=self.__seed, nr_of_buffered_samples=self.__nr_of_buffered_samples)
+        copy.__pmf_table = self.__pmf_table
+        copy.__cdf_table = self.__cdf_table
+        return copy
 
     def __repr__(self):
         return (
@@ -84,8 +94,9 @@ class NegativeBinomialDistribution(DiscreteDistribution):
 
     def set_seed(self, seed: int|None):
         self.__seed = seed
-        self.__random_generator = default_rng(seed)
-        self.__sample_buffer_iterator = iter([])
+        self.__sampler = GeneratorMethodSampler(
+            'negative_binomial', self.__nr_of_successes, self.__success_probability,
+            seed=seed, block_size=self.__nr_of_buffered_samples)
 
     def get_mdl_of_model(self, precision: int = 5) -> float:
         try:
@@ -116,3 +127,12 @@ class NegativeBinomialDistribution(DiscreteDistribution):
         success_probability = mean / variance
         nr_of_successes = (mean * success_probability) / (1 - success_probability)
         return NegativeBinomialDistribution(nr_of_successes, success_probability, seed=seed)
+
+def _compute_pmf_values(
+        x: np.ndarray, nr_of_successes: float, success_probability: float) -> np.ndarray:
+    with np.errstate(all='ignore'):
+        return stats.nbinom._pmf(x, nr_of_successes, success_probability)
+
+def _compute_cdf_values(
+        x: np.ndarray, nr_of_successes: float, success_probability: float) -> np.ndarray:
+    return stats.nbinom.cdf(x, nr_of_successes, success_probability)
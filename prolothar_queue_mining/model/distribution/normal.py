@@ -1,13 +1,14 @@
 from math import sqrt
 from scipy.stats import norm
 from scipy.special import erf
-from numpy.random import default_rng
+import numpy as np
 from methodtools import lru_cache
 
 from prolothar_common import mdl_utils
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.continuous_distribution import ContinuousDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler
 
 class NormalDistribution(ContinuousDistribution):
     """
@@ -26,6 +27,8 @@ class NormalDistribution(ContinuousDistribution):
         stddev : float
         seed : float, optional
             random generator seed, by default None
+        nr_of_buffered_samples : int, optional
+            number of samples that are drawn at once, by default 1000
         """
         self.__mean = mean
         self.__stddev = stddev
@@ -34,12 +37,10 @@ class NormalDistribution(ContinuousDistribution):
         self.set_seed(seed)
 
     def get_next_sample(self) -> float:
-        try:
-            return next(self.__sample_buffer_iterator)
-        except StopIteration:
-            self.__sample_buffer_iterator = iter(self.__random_generator.normal(
-                self.__mean, self.__stddev, size=self.__nr_of_buffered_samples))
-            return next(self.__sample_buffer_iterator)
+        return self.__sampler.get_next_sample()
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples)
 
     def get_mean(self) -> float:
         return self.__mean
@@ -58,19 +59,25 @@ class NormalDistribution(ContinuousDistribution):
     def compute_cdf(self, x: float) -> float:
         return 0.5 * (1 + _cached_erf((x - self.__mean) / self.__stddev / 1.41421))
 
+    def compute_cdf_values(self, x: np.ndarray) -> np.ndarray:
+        return 0.5 * (1 + erf((x - self.__mean) / self.__stddev / 1.41421))
+
     def get_mdl_of_model(self) -> float:
         return mdl_utils.L_R(self.__mean) + mdl_utils.L_R(self.__stddev)
 
     def copy(self) -> ContinuousDistribution:
-        return NormalDistribution(self.__mean, self.__stddev, seed=self.seed)
+        return NormalDistribution(
+            self.__mean, self.__stddev, seed=self.seed,
+            nr_of_buffered_samples=self.__nr_of_buffered_samples)
 
     def __repr__(self):
         return f'NormalDistribution({self.__mean}, {self.__stddev}, seed={self.seed})'
 
     def set_seed(self, seed: int|None):
         self.seed = seed
-        self.__random_generator = default_rng(seed)
-        self.__sample_buffer_iterator = iter([])
+        self.__sampler = GeneratorMethodSampler(
+            'normal', self.__mean, self.__stddev, seed=seed,
+            block_size=self.__nr_of_buffered_samples)
 
     def __hash__(self):
         return hash((self.__mean, self.__stddev))
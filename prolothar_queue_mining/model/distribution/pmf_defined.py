@@ -1,20 +1,25 @@
 from collections import defaultdict
 from math import log2
+import numpy as np
 import scipy.stats as stats
 
 from prolothar_common import mdl_utils
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.discrete_distribution import DiscreteDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import AliasSampler
 
 class PmfDefinedDistribution(DiscreteDistribution):
     """
     an arbitrary distribution that is purely defined by its PMF
     """
 
-    def __init__(self, pmf: dict[int, float], seed: int|None = None):
+    def __init__(
+        self, pmf: dict[int, float], seed: int|None = None,
+        nr_of_buffered_samples: int = 1000):
         """
-        creates a new distribution with a given PMF
+        creates a new distribution with a given PMF. samples are drawn with
+        the alias method.
         """
         if not (0.999 < sum(pmf.values()) < 1.0001):
             raise ValueError(f'pmf must sum up to 1 but sums up to {sum(pmf.values())}')
@@ -29,15 +34,16 @@ class PmfDefinedDistribution(DiscreteDistribution):
             if px > self.__max_pmf:
                 self.__mode = x
         self.__hash = hash(tuple(self.__pmf.items()))
+        self.__nr_of_buffered_samples = nr_of_buffered_samples
+        self.__sampler = AliasSampler(
+            list(pmf.keys()), list(pmf.values()), block_size=nr_of_buffered_samples)
         self.set_seed(seed)
-        self.__sample_buffer_iterator = iter([])
 
     def get_next_sample(self) -> float:
-        try:
-            return next(self.__sample_buffer_iterator)
-        except StopIteration:
-            self.__sample_buffer_iterator = iter(self.__rv_discrete.rvs(size=1000))
-            return next(self.__sample_buffer_iterator)
+        return self.__sampler.get_next_sample()
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples)
 
     def get_mean(self) -> float:
         return self.__mean
@@ -58,7 +64,9 @@ class PmfDefinedDistribution(DiscreteDistribution):
         return self.__rv_discrete.cdf(x)
 
     def copy(self) -> DiscreteDistribution:
-        return PmfDefinedDistribution(self.__pmf, seed=self.__seed)
+        return PmfDefinedDistribution(
+            self.__pmf, seed=self.__seed,
+            nr_of_buffered_samples=self.__nr_of_buffered_samples)
 
     def __repr__(self):
         sorted_items = sorted(self.__pmf.items())
@@ -71,6 +79,7 @@ class PmfDefinedDistribution(DiscreteDistribution):
 
     def set_seed(self, seed: int):
         self.__seed = seed
+        self.__sampler.set_seed(seed)
 
     def get_mdl_of_model(self, precision: int = 5) -> float:
         min_x = min(self.__pmf)
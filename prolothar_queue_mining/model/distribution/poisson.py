@@ -1,12 +1,13 @@
 from prolothar_common.experiments.statistics import Statistics
-from numpy.random import default_rng
+import numpy as np
 import scipy.stats as stats
-from methodtools import lru_cache
 
 from prolothar_common import mdl_utils
 
 from prolothar_queue_mining.model.distribution.distribution import Distribution
 from prolothar_queue_mining.model.distribution.discrete_distribution import DiscreteDistribution
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler
+from prolothar_queue_mining.model.distribution.dense_table import DenseTable
 
 class PoissonDistribution(DiscreteDistribution):
     """
@@ -24,17 +25,17 @@ class PoissonDistribution(DiscreteDistribution):
         self.__nr_of_buffered_samples = nr_of_buffered_samples
         self.set_seed(seed)
         self.__shift = shift
+        self.__pmf_table = DenseTable(_compute_pmf_values, expected_value, shift)
+        self.__cdf_table = DenseTable(_compute_cdf_values, expected_value, shift)
 
     def get_shift(self) -> float:
         return self.__shift
 
     def get_next_sample(self) -> float:
-        try:
-            return next(self.__sample_buffer_iterator)
-        except StopIteration:
-            self.__sample_buffer_iterator =iter(self.__random_generator.poisson(
-                self.expected_value, size=self.__nr_of_buffered_samples) + self.__shift)
-            return next(self.__sample_buffer_iterator)
+        return self.__sampler.get_next_sample() + self.__shift
+
+    def get_next_samples(self, nr_of_samples: int) -> np.ndarray:
+        return self.__sampler.draw_block(nr_of_samples) + self.__shift
 
     def get_mean(self) -> float:
         return self.expected_value + self.__shift
@@ -45,8 +46,13 @@ class PoissonDistribution(DiscreteDistribution):
     def get_variance(self) -> float:
         return self.expected_value
 
-    @lru_cache()
     def compute_pmf(self, x: float) -> float:
+        pmf = self.__pmf_table.lookup(x)
+        if pmf is None:
+            return self.__compute_pmf(x)
+        return pmf
+
+    def __compute_pmf(self, x: float) -> float:
         if x < self.__shift or (isinstance(x, float) and not x.is_integer()):
             return 0
         try:
@@ -54,20 +60,28 @@ class PoissonDistribution(DiscreteDistribution):
         except (FloatingPointError, OverflowError):
             return DiscreteDistribution.ALLMOST_ZERO
 
-    @lru_cache()
     def compute_cdf(self, x: float) -> float:
-        return stats.poisson.cdf(x - self.__shift, self.expected_value)
+        cdf = self.__cdf_table.lookup(x)
+        if cdf is None:
+            return stats.poisson.cdf(x - self.__shift, self.expected_value)
+        return cdf
 
     def copy(self) -> DiscreteDistribution:
-        return PoissonDistribution(self.expected_value, seed=self.seed, shift=self.__shift)
+        copy = PoissonDistribution(
+            self.expected_value, seed=self.seed, shift=self.__shift,
+            nr_of_buffered_samples=self.__nr_of_buffered_samples)
+        copy.__pmf_table = self.__pmf_table
+        copy.__cdf_table = self.__cdf_table
+        return copy
 
     def __repr__(self):
         return f'PoissonDistribution({self.expected_value}, shift={self.__shift}, seed={self.seed})'
 
     def set_seed(self, seed: int|None):
         self.seed = seed
-        self.__random_generator = default_rng(seed)
-        self.__sample_buffer_iterator = iter([])
+        self.__sampler = GeneratorMethodSampler(
+            'poisson', self.expected_value, seed=seed,
+            block_size=self.__nr_of_buffered_samples)
 
     def get_mdl_of_model(self) -> float:
         return mdl_utils.L_R(self.expected_value)
@@ -96,3 +110,12 @@ class PoissonDistribution(DiscreteDistribution):
     def fit_by_mean_and_variance(mean: float, variance: float, seed: int|None = None) -> 'Distribution':
         shift = mean - variance
         return PoissonDistribution(mean - shift, shift=shift, seed=seed)
+
+def _compute_pmf_values(x: np.ndarray, expected_value: float, shift: float) -> np.ndarray:
+    with np.errstate(all='ignore'):
+        pmf = stats.poisson._pmf(x - shift, expected_value)
+    pmf[x < shift] = 0
+    return pmf
+
+def _compute_cdf_values(x: np.ndarray, expected_value: float, shift: float) -> np.ndarray:
+    return stats.poisson.cdf(x - shift, expected_value)
@@ -1,3 +1,4 @@
 from prolothar_queue_mining.model.exit.exit import Exit
 from prolothar_queue_mining.model.exit.list_collector import ListCollectorExit
-from prolothar_queue_mining.model.exit.do_nothing import DoNothingExit
\ No newline at end of file
+from prolothar_queue_mining.model.exit.do_nothing import DoNothingExit
+from prolothar_queue_mining.model.exit.array_collector import ArrayCollectorExit
\ No newline at end of file
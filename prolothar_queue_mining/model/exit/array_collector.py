@@ -0,0 +1,55 @@
+import numpy as np
+
+from prolothar_queue_mining.model.exit.exit import Exit
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.observer.utils import GrowableArray
+
+class ArrayCollectorExit(Exit):
+    """
+    exit point that collects jobs in a list and timesteps in a NumPy buffer,
+    which can be exported without copying
+    """
+
+    def __init__(self, initial_capacity: int = 1024):
+        self.__timesteps = GrowableArray(initial_capacity=initial_capacity)
+        self.__jobs = []
+
+    def add_job(self, timestep: int, job: Job):
+        self.__timesteps.append(timestep)
+        self.__jobs.append(job)
+
+    def get_recording(self) -> tuple[list[Job], np.ndarray]:
+        """
+        returns the list of all jobs that have exited the queue and a read-only
+        array of the corresponding exit time stamps
+        """
+        return self.__jobs, self.__timesteps.to_numpy()
+
+    def get_timesteps(self) -> np.ndarray:
+        """
+        returns a read-only view on the exit time stamps
+        """
+        return self.__timesteps.to_numpy()
+
+    def get_job_indices(self) -> np.ndarray:
+        """
+        returns the indices of the exited jobs in the JobTable that owns them
+        (-1 if a job has not been interned)
+        """
+        return np.fromiter((job.index for job in self.__jobs), dtype=np.int64,
+                           count=len(self.__jobs))
+
+    def __getitem__(self, index: int) -> tuple[int,Job]:
+        return int(self.__timesteps.to_numpy()[index]), self.__jobs[index]
+
+    def __len__(self):
+        """
+        returns the number of jobs arrived at this exit point
+        """
+        return len(self.__jobs)
+
+    def copy(self) -> Exit:
+        copy = ArrayCollectorExit()
+        copy.__timesteps = self.__timesteps.copy()
+        copy.__jobs = list(self.__jobs)
+        return copy
\ No newline at end of file
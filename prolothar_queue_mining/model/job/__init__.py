@@ -1 +1,3 @@
-from prolothar_queue_mining.model.job.job import Job
\ No newline at end of file
+from prolothar_queue_mining.model.job.job import Job
+from prolothar_queue_mining.model.job.job_array import JobArray
+from prolothar_queue_mining.model.job.job_table import JobTable
\ No newline at end of file
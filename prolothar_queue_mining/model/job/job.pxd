@@ -2,5 +2,13 @@ cdef class Job:
     """
     job model, usually a customer or a product
     """
-    cdef public str job_id
+    cdef str _job_id
+    #hash of the job id, computed once when the job id is set
+    cdef Py_hash_t _hash
     cdef public dict features
+    #dense index assigned by a JobTable, -1 if the job is not interned
+    cdef public long index
+    #weak reference to the JobTable that assigned index, None if not interned
+    cdef public object index_owner
+    #if True, jobs with the same job id are equal regardless of their features
+    cdef readonly bint id_only_equality
\ No newline at end of file
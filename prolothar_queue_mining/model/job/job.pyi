@@ -1,11 +1,19 @@
+from typing import Callable, TYPE_CHECKING
+if TYPE_CHECKING:
+    from prolothar_queue_mining.model.job.job_table import JobTable
+
 class Job:
     """
     job model, usually a customer or a product
     """
     job_id: str
     features: dict[str, int|float|str]
+    index: int
+    index_owner: Callable[[], 'JobTable|None']|None
+    id_only_equality: bool
 
-    def __init__(self, job_id: str, features: dict[str, int|float|str]|None = None):
+    def __init__(self, job_id: str, features: dict[str, int|float|str]|None = None,
+                 id_only_equality: bool = False):
         """
         creates a new job instance
 
@@ -16,4 +24,8 @@ class Job:
         features : dict
             additional attributes/features (name, value). the features can change
             over time.
+        id_only_equality : bool, optional
+            if True, equality is decided by the job id alone and features are
+            not compared. can be used for logs in which job ids are unique.
+            by default False
         """
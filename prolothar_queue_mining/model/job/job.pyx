@@ -2,7 +2,7 @@ cdef class Job:
     """
     job model, usually a customer or a product
     """
-    def __init__(self, str job_id, dict features = None):
+    def __init__(self, str job_id, dict features = None, bint id_only_equality = False):
         """
         creates a new job instance
 
@@ -13,18 +13,51 @@ cdef class Job:
         features : dict
             additional attributes/features (name, value). the features can change
             over time.
+        id_only_equality : bool, optional
+            if True, equality is decided by the job id alone and features are
+            not compared. can be used for logs in which job ids are unique.
+            by default False
         """
         self.job_id = job_id
+        self.index = -1
+        self.index_owner = None
+        self.id_only_equality = id_only_equality
         if features is not None:
             self.features = features
         else:
             self.features = {}
 
+    @property
+    def job_id(self) -> str:
+        return self._job_id
+
+    @job_id.setter
+    def job_id(self, str job_id):
+        self._job_id = job_id
+        self._hash = hash(job_id)
+
     def __hash__(self):
-        return hash(self.job_id)
+        return self._hash
 
     def __eq__(self, other):
-        return self.job_id == other.job_id and self.features == other.features
+        if self is other:
+            return True
+        if not isinstance(other, Job):
+            return NotImplemented
+        cdef Job other_job = <Job>other
+        if self._hash != other_job._hash or self._job_id != other_job._job_id:
+            return False
+        if self.id_only_equality or other_job.id_only_equality:
+            return True
+        return self.features == other_job.features
+
+    def __reduce__(self):
+        #the cached hash must not be pickled because string hashes differ
+        #between interpreter processes
+        return Job, (self._job_id, self.features, self.id_only_equality), self.index
+
+    def __setstate__(self, long index):
+        self.index = index
 
     def __repr__(self):
-        return f'Job({self.job_id}, {self.features})'
+        return f'Job({self.job_id}, {self.features})'
\ No newline at end of file
@@ -0,0 +1,12 @@
+from prolothar_queue_mining.model.job.job cimport Job
+
+cdef class JobArray:
+    cdef object __job_table
+    cdef list __jobs
+    cdef object __values_array
+    cdef object __mask_array
+    cdef const double[:] __values
+    cdef const unsigned char[:] __mask
+    cdef bint __is_integer
+
+    cdef Py_ssize_t _find_index(self, object job) except -2
\ No newline at end of file
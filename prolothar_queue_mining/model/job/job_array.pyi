@@ -0,0 +1,27 @@
+from typing import Any, Iterator
+import numpy as np
+
+from prolothar_queue_mining.model.job.job import Job
+
+class JobArray:
+    """
+    dict-like mapping from jobs to numbers that is backed by an array indexed
+    by the given JobTable. for jobs that are owned by this table (see JobTable),
+    a lookup is an array access via Job.index instead of hashing and comparing
+    jobs. other jobs are looked up in the mapping of the table.
+    """
+
+    def __init__(self, job_table: 'JobTable', values: np.ndarray, mask: np.ndarray|None = None,
+                 is_integer: bool = False): ...
+    def __getitem__(self, job: Job) -> int|float: ...
+    def __contains__(self, job: Any) -> bool: ...
+    def get(self, job: Job, default=None) -> int|float|Any: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Job]: ...
+    def keys(self) -> Iterator[Job]: ...
+    def values(self) -> Iterator[int|float]: ...
+    def items(self) -> Iterator[tuple[Job, int|float]]: ...
+    def get_values(self) -> np.ndarray: ...
+    def get_mask(self) -> np.ndarray: ...
+    def get_job_table(self) -> 'JobTable': ...
+    def copy(self) -> 'JobArray': ...
\ No newline at end of file
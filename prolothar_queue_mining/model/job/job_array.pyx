@@ -0,0 +1,118 @@
+import numpy as np
+
+from prolothar_queue_mining.model.job.job cimport Job
+
+cdef class JobArray:
+    """
+    dict-like mapping from jobs to numbers that is backed by an array indexed
+    by the given JobTable. for jobs that are owned by this table (see JobTable),
+    a lookup is an array access via Job.index instead of hashing and comparing
+    jobs. other jobs are looked up in the mapping of the table.
+    """
+
+    def __init__(self, job_table, values: np.ndarray, mask: np.ndarray = None,
+                 bint is_integer = False):
+        """
+        creates a new JobArray
+
+        Parameters
+        ----------
+        job_table : JobTable
+            defines the index of each job
+        values : np.ndarray
+            values[i] is the value of the i-th job in the job table
+        mask : np.ndarray, optional
+            mask[i] is True if the i-th job has a value. by default, all
+            jobs with non-NaN values have a value
+        is_integer : bool, optional
+            if True, values are returned as int instead of float, by default False
+        """
+        self.__job_table = job_table
+        self.__jobs = job_table.get_jobs()
+        self.__values_array = np.ascontiguousarray(values, dtype=np.float64)
+        if mask is None:
+            mask = ~np.isnan(self.__values_array)
+        self.__mask_array = np.ascontiguousarray(mask, dtype=np.uint8)
+        if len(self.__values_array) != len(self.__mask_array):
+            raise ValueError('values and mask must have the same length')
+        self.__values = self.__values_array
+        self.__mask = self.__mask_array
+        self.__is_integer = is_integer
+
+    cdef Py_ssize_t _find_index(self, object job) except -2:
+        """
+        returns the array index of the given job or -1 if there is no value
+        """
+        cdef Py_ssize_t index
+        if not isinstance(job, Job):
+            return -1
+        index = (<Job>job).index
+        if not (0 <= index < self.__values.shape[0] and self.__jobs[index] is job):
+            #job is not interned or has been interned by a different table
+            try:
+                index = self.__job_table.get_index(job)
+            except KeyError:
+                return -1
+            if index >= self.__values.shape[0]:
+                return -1
+        if not self.__mask[index]:
+            return -1
+        return index
+
+    def __getitem__(self, job):
+        cdef Py_ssize_t index = self._find_index(job)
+        if index < 0:
+            raise KeyError(job)
+        if self.__is_integer:
+            return <long long>self.__values[index]
+        return self.__values[index]
+
+    def __contains__(self, job) -> bool:
+        return self._find_index(job) >= 0
+
+    def get(self, job, default=None):
+        cdef Py_ssize_t index = self._find_index(job)
+        if index < 0:
+            return default
+        if self.__is_integer:
+            return <long long>self.__values[index]
+        return self.__values[index]
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.__mask_array))
+
+    def __iter__(self):
+        return self.keys()
+
+    def keys(self):
+        for index in np.flatnonzero(self.__mask_array).tolist():
+            yield self.__jobs[index]
+
+    def values(self):
+        for index in np.flatnonzero(self.__mask_array).tolist():
+            yield self[self.__jobs[index]]
+
+    def items(self):
+        for index in np.flatnonzero(self.__mask_array).tolist():
+            job = self.__jobs[index]
+            yield job, self[job]
+
+    def get_values(self) -> np.ndarray:
+        """
+        returns the underlying array of values. entries without value are undefined.
+        """
+        return self.__values_array
+
+    def get_mask(self) -> np.ndarray:
+        return self.__mask_array.view(bool)
+
+    def get_job_table(self):
+        return self.__job_table
+
+    def copy(self) -> 'JobArray':
+        return JobArray(
+            self.__job_table, self.__values_array.copy(), self.__mask_array.copy(),
+            is_integer=self.__is_integer)
+
+    def __repr__(self):
+        return f'JobArray({dict(self.items())})'
\ No newline at end of file
@@ -0,0 +1,183 @@
+from collections import OrderedDict
+from typing import Iterable, Iterator, TYPE_CHECKING
+import weakref
+
+import numpy as np
+
+from prolothar_queue_mining.model.job.job import Job
+from prolothar_queue_mining.model.job.job_array import JobArray
+if TYPE_CHECKING:
+    from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
+
+#number of feature matrices (i.e. transformer configurations) that are cached
+#per table. the least recently used matrix is evicted first.
+_MAX_NR_OF_CACHED_FEATURE_MATRICES = 4
+
+class JobTable():
+    """
+    interns jobs to dense integer indices and stores their features column-wise.
+    each table keeps its own mapping from jobs to indices.
+
+    the first table that interns a job also writes the index to Job.index and
+    becomes its owner (Job.index_owner), such that arrays indexed by this table
+    (e.g. JobArray) can be accessed without hashing the job. as long as the
+    owner is alive, other tables that intern the same job leave Job.index
+    untouched and look the job up in their own mapping instead, i.e. lookups
+    are correct for every table but only fast for the owner. recorders that
+    store Job.index (e.g. WaitingTimeArrayRecordingObserver) refer to the
+    owner table.
+    """
+
+    def __init__(self, jobs: Iterable[Job] = ()):
+        """
+        creates a new JobTable
+
+        Parameters
+        ----------
+        jobs : Iterable[Job], optional
+            jobs that are added in the given order, by default no jobs
+        """
+        self.__jobs: list[Job] = []
+        self.__index_per_job: dict[Job, int] = {}
+        self.__numerical_columns: dict[str, np.ndarray] = {}
+        self.__categorical_columns: dict[str, tuple[np.ndarray, list]] = {}
+        #configuration key of a transformer => (buffer, number of valid rows)
+        self.__feature_matrices: OrderedDict[tuple, tuple[np.ndarray, int]] = OrderedDict()
+        for job in jobs:
+            self.add(job)
+
+    def add(self, job: Job) -> int:
+        """
+        adds a job to this table if it is not yet contained and returns its index
+        """
+        try:
+            return self.__index_per_job[job]
+        except KeyError:
+            index = len(self.__jobs)
+            self.__index_per_job[job] = index
+            self.__jobs.append(job)
+            self.__numerical_columns.clear()
+            self.__categorical_columns.clear()
+        index_owner = job.index_owner
+        if index_owner is None or index_owner() is None:
+            job.index = index
+            job.index_owner = weakref.ref(self)
+        return index
+
+    def get_index(self, job: Job) -> int:
+        """
+        returns the index of the given job. raises a KeyError if the job has not
+        been added to this table.
+        """
+        index = job.index
+        if 0 <= index < len(self.__jobs) and self.__jobs[index] is job:
+            return index
+        return self.__index_per_job[job]
+
+    def get_jobs(self) -> list[Job]:
+        """
+        returns the list of jobs. the position of a job is its index.
+        the list must not be modified.
+        """
+        return self.__jobs
+
+    def get_numerical_feature(self, feature_name: str) -> np.ndarray:
+        """
+        returns a read-only array with the value of the given feature for each
+        job index. NaN if a job does not have this feature.
+        """
+        try:
+            return self.__numerical_columns[feature_name]
+        except KeyError:
+            column = np.fromiter(
+                (job.features.get(feature_name, np.nan) for job in self.__jobs),
+                dtype=np.float64, count=len(self.__jobs))
+            column.flags.writeable = False
+            self.__numerical_columns[feature_name] = column
+            return column
+
+    def get_categorical_feature(self, feature_name: str) -> tuple[np.ndarray, list]:
+        """
+        returns the category codes of the given feature together with the list
+        of categories. codes[i] is the position of the value of the i-th job in
+        the category list or -1 if the job does not have this feature. categories
+        are ordered by first appearance.
+        """
+        try:
+            return self.__categorical_columns[feature_name]
+        except KeyError:
+            code_per_category = {}
+            codes = np.empty(len(self.__jobs), dtype=np.int64)
+            for i, job in enumerate(self.__jobs):
+                try:
+                    category = job.features[feature_name]
+                except KeyError:
+                    codes[i] = -1
+                    continue
+                codes[i] = code_per_category.setdefault(category, len(code_per_category))
+            codes.flags.writeable = False
+            column = (codes, list(code_per_category))
+            self.__categorical_columns[feature_name] = column
+            return column
+
+    def get_feature_matrix(self, job_to_vector_transformer: 'JobToVectorTransformer') -> np.ndarray:
+        """
+        returns a read-only matrix with the feature vector of each job index as
+        created by the given transformer. the matrix is cached for the current
+        configuration of the transformer (see
+        JobToVectorTransformer.get_configuration_key). rows of jobs that are
+        added later are appended to the cached matrix. only the matrices of
+        the most recently used configurations are kept.
+        """
+        key = job_to_vector_transformer.get_configuration_key()
+        nr_of_jobs = len(self.__jobs)
+        try:
+            buffer, nr_of_rows = self.__feature_matrices.pop(key)
+        except KeyError:
+            if len(self.__feature_matrices) >= _MAX_NR_OF_CACHED_FEATURE_MATRICES:
+                self.__feature_matrices.popitem(last=False)
+            buffer = job_to_vector_transformer.transform_many(self.__jobs)
+            nr_of_rows = nr_of_jobs
+        if nr_of_rows < nr_of_jobs:
+            new_rows = job_to_vector_transformer.transform_many(self.__jobs[nr_of_rows:])
+            if len(buffer) < nr_of_jobs:
+                #the capacity is doubled, such that appending single jobs is cheap
+                new_buffer = np.empty((max(nr_of_jobs, 2 * len(buffer)), buffer.shape[1]))
+                new_buffer[:nr_of_rows] = buffer[:nr_of_rows]
+                buffer = new_buffer
+            buffer[nr_of_rows:nr_of_jobs] = new_rows
+            nr_of_rows = nr_of_jobs
+        self.__feature_matrices[key] = (buffer, nr_of_rows)
+        feature_matrix = buffer[:nr_of_rows]
+        feature_matrix.flags.writeable = False
+        return feature_matrix
+
+    def create_job_array(self, value_per_job: dict[Job, int|float]) -> JobArray:
+        """
+        creates a JobArray with the given values. jobs that are not part of this
+        table are added.
+        """
+        indices = [self.add(job) for job in value_per_job]
+        values = np.full(len(self.__jobs), np.nan)
+        mask = np.zeros(len(self.__jobs), dtype=bool)
+        is_integer = True
+        for index, value in zip(indices, value_per_job.values()):
+            values[index] = value
+            mask[index] = True
+            is_integer = is_integer and isinstance(value, (int, np.integer))
+        return JobArray(self, values, mask=mask, is_integer=is_integer)
+
+    def __len__(self) -> int:
+        return len(self.__jobs)
+
+    def __getitem__(self, index: int) -> Job:
+        return self.__jobs[index]
+
+    def __iter__(self) -> Iterator[Job]:
+        return iter(self.__jobs)
+
+    def __contains__(self, job: Job) -> bool:
+        return job in self.__index_per_job
+
+    def __repr__(self):
+        return f'JobTable({len(self.__jobs)} jobs)'
\ No newline at end of file
@@ -4,6 +4,7 @@ import numpy as np
 from prolothar_common.experiments.statistics import Statistics
 
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobTable
 
 class Scaler(ABC):
     """
@@ -12,7 +13,8 @@ class Scaler(ABC):
     @abstractmethod
     def scale(self, value: float) -> float:
         """
-        scales the given value
+        scales the given value. the implementations also accept numpy arrays
+        and scale them elementwise.
         """
 
 class NoScaler(Scaler):
@@ -79,6 +81,30 @@ class Encoder(ABC):
         provides human-readable names for the derived features by this encoder
         """
 
+    def encode_codes(self, codes: np.ndarray, categories: list, nr_of_derived_features: int) -> np.ndarray:
+        """
+        encodes many values at once. each distinct value is encoded only once
+        and the rows are looked up by their category code.
+
+        Parameters
+        ----------
+        codes : np.ndarray
+            codes[i] is the position of the i-th value in "categories"
+        categories : list
+            the distinct values
+        nr_of_derived_features : int
+            the length of an encoded value
+
+        Returns
+        -------
+        np.ndarray
+            (len(codes) x nr_of_derived_features) matrix of encoded values
+        """
+        lookup_table = np.array(
+            [tuple(self.encode(category)) for category in categories],
+            dtype=float).reshape(len(categories), nr_of_derived_features)
+        return lookup_table[codes]
+
 class NoEncoder(Encoder):
     """
     dummy encoder that does nothing
@@ -97,14 +123,24 @@ class OneHotEncoder(Encoder):
         self.possible_values = possible_values
 
     def encode(self, value) -> tuple[int]:
-        return (1 if value == category else 0 for category in self.possible_values)
+        return tuple(1 if value == category else 0 for category in self.possible_values)
 
     def get_derived_feature_names(self, original_feature_name: str) -> list[str]:
         return [f'{original_feature_name} = {category}' for category in self.possible_values]
 
     @staticmethod
     def train(job_list: Iterable[Job], feature_name: str):
-        return OneHotEncoder(set(job.features[feature_name] for job in job_list))
+        #the order of a set is not reproducible (e.g. for strings), so the
+        #categories are sorted if possible and ordered by first appearance otherwise
+        possible_values = list(dict.fromkeys(job.features[feature_name] for job in job_list))
+        try:
+            possible_values.sort()
+        except TypeError:
+            pass
+        return OneHotEncoder(possible_values)
+
+_NO_SCALER = NoScaler()
+_NO_ENCODER = NoEncoder()
 
 class JobToVectorTransformer():
     """
@@ -138,16 +174,81 @@ class JobToVectorTransformer():
         """
         transforms the given job to a numpy array
         """
-        return np.array(
-            [
-                self.scalers.get(feature_name, NoScaler()).scale(job.features[feature_name])
-                for feature_name in self.numerical_features
-            ] +
-            [
-                encoded_value for feature_name in self.categorical_features for encoded_value
-                in self.encoders.get(feature_name, NoEncoder()).encode(job.features[feature_name])
-            ]
-        )
+        features = job.features
+        vector = [
+            self.scalers.get(feature_name, _NO_SCALER).scale(features[feature_name])
+            for feature_name in self.numerical_features
+        ]
+        for feature_name in self.categorical_features:
+            vector.extend(self.encoders.get(feature_name, _NO_ENCODER).encode(features[feature_name]))
+        return np.array(vector)
+
+    def transform_many(self, jobs: Iterable[Job], job_table: JobTable|None = None) -> np.ndarray:
+        """
+        transforms the given jobs to a matrix with one row per job. in contrast
+        to calling "transform" per job, the features are scaled and encoded
+        column-wise.
+
+        Parameters
+        ----------
+        jobs : Iterable[Job]
+            the jobs to transform
+        job_table : JobTable | None, optional
+            if given, the rows are taken from the cached feature matrix of the
+            job table (see JobTable.get_feature_matrix), i.e. repeated
+            transformations of the same jobs are free. jobs that are not part
+            of the table are added and only their rows are computed.
+            by default None.
+
+        Returns
+        -------
+        np.ndarray
+            (number of jobs x number of vector components) matrix
+        """
+        if job_table is not None:
+            indices = np.fromiter(map(job_table.add, jobs), dtype=np.int64)
+            return job_table.get_feature_matrix(self)[indices]
+        if not isinstance(jobs, list):
+            jobs = list(jobs)
+        numerical_columns = [
+            np.fromiter(
+                (job.features[feature_name] for job in jobs),
+                dtype=np.float64, count=len(jobs))
+            for feature_name in self.numerical_features
+        ]
+        categorical_columns = []
+        for feature_name in self.categorical_features:
+            code_per_category = {}
+            codes = np.fromiter(
+                (code_per_category.setdefault(job.features[feature_name], len(code_per_category))
+                 for job in jobs),
+                dtype=np.int64, count=len(jobs))
+            categorical_columns.append((codes, list(code_per_category)))
+        return self.__create_matrix(len(jobs), numerical_columns, categorical_columns)
+
+    def get_configuration_key(self) -> tuple:
+        """
+        returns a hashable snapshot of the features, scalers and encoders of
+        this transformer. transformers with equal keys create equal vectors.
+        """
+        return _freeze((
+            self.numerical_features, self.categorical_features,
+            self.scalers, self.encoders))
+
+    def __create_matrix(
+            self, nr_of_jobs: int, numerical_columns: list[np.ndarray],
+            categorical_columns: list[tuple[np.ndarray, list]]) -> np.ndarray:
+        blocks = [
+            np.asarray(self.scalers.get(feature_name, _NO_SCALER).scale(column), dtype=float).reshape(-1, 1)
+            for feature_name, column in zip(self.numerical_features, numerical_columns)
+        ]
+        for feature_name, (codes, categories) in zip(self.categorical_features, categorical_columns):
+            encoder = self.encoders.get(feature_name, _NO_ENCODER)
+            blocks.append(encoder.encode_codes(
+                codes, categories, len(encoder.get_derived_feature_names(feature_name))))
+        if not blocks:
+            return np.empty((nr_of_jobs, 0))
+        return np.hstack(blocks)
 
     def get_feature_names_of_vector_components(self) -> list[str]:
         feature_names = list(self.numerical_features)
@@ -156,3 +257,27 @@ class JobToVectorTransformer():
                 self.encoders.get(feature_name, NoEncoder()).get_derived_feature_names(feature_name)
             )
         return feature_names
+
+#stands for NaN in configuration keys, because NaN is not equal to itself
+_NAN_KEY = ('nan',)
+
+def _freeze(value):
+    """
+    converts the configuration of a transformer into a hashable value
+    """
+    if isinstance(value, (Scaler, Encoder)):
+        return (type(value), _freeze(vars(value)))
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return (np.ndarray, value.shape, _freeze(value.tolist()))
+        #bytes are compared bitwise, i.e. also NaN values are equal
+        return (np.ndarray, value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (float, np.floating)) and np.isnan(value):
+        return _NAN_KEY
+    return value
\ No newline at end of file
@@ -1,3 +1,5 @@
 from prolothar_queue_mining.model.observer.queue_length.queue_length_observer import QueueLengthObserver
 from prolothar_queue_mining.model.observer.queue_length.null_queue_length_observer import NullQueueLengthObserver
-from prolothar_queue_mining.model.observer.queue_length.queue_length_recording_observer import QueueLengthRecordingObserver
\ No newline at end of file
+from prolothar_queue_mining.model.observer.queue_length.queue_length_recording_observer import QueueLengthRecordingObserver
+from prolothar_queue_mining.model.observer.queue_length.queue_length_array_recording_observer import QueueLengthArrayRecordingObserver
+from prolothar_queue_mining.model.observer.queue_length.queue_length_statistics_observer import QueueLengthStatisticsObserver
\ No newline at end of file
@@ -0,0 +1,60 @@
+import numpy as np
+
+from prolothar_queue_mining.model.observer.queue_length.queue_length_observer import QueueLengthObserver
+from prolothar_queue_mining.model.observer.utils import GrowableArray
+
+class QueueLengthArrayRecordingObserver(QueueLengthObserver):
+    """
+    an observer for (statistical) analysis of recorded queue length over time.
+    in contrast to QueueLengthRecordingObserver, the recording is stored in
+    NumPy buffers and can be exported without copying. the observer expects
+    notifications in chronological order, which is the case during simulation.
+    """
+
+    def __init__(self, min_time: float = 0, initial_capacity: int = 1024):
+        """
+        creates a new QueueLengthArrayRecordingObserver
+
+        Parameters
+        ----------
+        min_time : float, optional
+            notifications before this time are ignored, by default 0
+        initial_capacity : int, optional
+            expected number of recorded timesteps. the buffers grow if necessary.
+            by default 1024
+        """
+        self.__min_time = min_time
+        self.__maximal_queue_length = 0
+        self.__timesteps = GrowableArray(dtype=np.float64, initial_capacity=initial_capacity)
+        self.__queue_lengths = GrowableArray(initial_capacity=initial_capacity)
+
+    def notify(self, current_time: float, queue_length: int):
+        if current_time >= self.__min_time:
+            self.__maximal_queue_length = max(queue_length, self.__maximal_queue_length)
+            if len(self.__timesteps) > 0 and self.__timesteps.get_last() == current_time:
+                #only the last queue length per timestep is recorded
+                self.__queue_lengths.set_last(queue_length)
+            else:
+                self.__timesteps.append(current_time)
+                self.__queue_lengths.append(queue_length)
+
+    def get_max_queue_length(self) -> int:
+        """
+        returns the maximal observed queue length
+        """
+        return self.__maximal_queue_length
+
+    def get_timeseries_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        the raw data how the timeseries data changed over time.
+
+        returns (timesteps, queue_lengths) as read-only views
+        """
+        return self.__timesteps.to_numpy(), self.__queue_lengths.to_numpy()
+
+    def copy(self) -> 'QueueLengthArrayRecordingObserver':
+        copy = QueueLengthArrayRecordingObserver(min_time=self.__min_time)
+        copy.__maximal_queue_length = self.__maximal_queue_length
+        copy.__timesteps = self.__timesteps.copy()
+        copy.__queue_lengths = self.__queue_lengths.copy()
+        return copy
\ No newline at end of file
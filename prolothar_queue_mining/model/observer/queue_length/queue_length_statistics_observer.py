@@ -0,0 +1,51 @@
+import numpy as np
+
+from prolothar_queue_mining.model.observer.queue_length.queue_length_observer import QueueLengthObserver
+
+class QueueLengthStatisticsObserver(QueueLengthObserver):
+    """
+    an observer for the queue length that only keeps the maximum and the time
+    weighted mean in constant memory. the observer expects notifications in
+    chronological order, which is the case during simulation.
+    """
+
+    def __init__(self, min_time: float = 0):
+        """
+        creates a new QueueLengthStatisticsObserver
+
+        Parameters
+        ----------
+        min_time : float, optional
+            notifications before this time are ignored, by default 0
+        """
+        self.__min_time = min_time
+        self.__maximal_queue_length = 0
+        self.__first_time = None
+        self.__last_time = None
+        self.__last_queue_length = 0
+        self.__area = 0
+
+    def notify(self, current_time: float, queue_length: int):
+        if current_time >= self.__min_time:
+            self.__maximal_queue_length = max(queue_length, self.__maximal_queue_length)
+            if self.__first_time is None:
+                self.__first_time = current_time
+            else:
+                self.__area += self.__last_queue_length * (current_time - self.__last_time)
+            self.__last_time = current_time
+            self.__last_queue_length = queue_length
+
+    def get_max_queue_length(self) -> int:
+        """
+        returns the maximal observed queue length
+        """
+        return self.__maximal_queue_length
+
+    def get_mean_queue_length(self) -> float:
+        """
+        returns the time weighted mean queue length between the first and the
+        last notification. if this time span is empty, np.nan is returned
+        """
+        if self.__first_time is None or self.__last_time == self.__first_time:
+            return np.nan
+        return self.__area / (self.__last_time - self.__first_time)
\ No newline at end of file
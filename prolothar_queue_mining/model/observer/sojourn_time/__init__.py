@@ -1,3 +1,5 @@
 from prolothar_queue_mining.model.observer.sojourn_time.sojourn_time_observer import SojournTimeObserver
 from prolothar_queue_mining.model.observer.sojourn_time.null_sojourn_time_observer import NullSojournTimeObserver
-from prolothar_queue_mining.model.observer.sojourn_time.sojourn_time_recording_observer import SojournTimeRecordingObserver
\ No newline at end of file
+from prolothar_queue_mining.model.observer.sojourn_time.sojourn_time_recording_observer import SojournTimeRecordingObserver
+from prolothar_queue_mining.model.observer.sojourn_time.sojourn_time_array_recording_observer import SojournTimeArrayRecordingObserver
+from prolothar_queue_mining.model.observer.sojourn_time.sojourn_time_statistics_observer import SojournTimeStatisticsObserver
\ No newline at end of file
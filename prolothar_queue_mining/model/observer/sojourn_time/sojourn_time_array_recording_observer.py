@@ -0,0 +1,127 @@
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job, JobArray, JobTable
+from prolothar_queue_mining.model.observer.sojourn_time.sojourn_time_observer import SojournTimeObserver
+from prolothar_queue_mining.model.observer.utils import GrowableArray
+
+class SojournTimeArrayRecordingObserver(SojournTimeObserver):
+    """
+    an observer for (statistical) analysis of recorded sojourn times over time.
+    in contrast to SojournTimeRecordingObserver, the recording is stored in
+    NumPy buffers and can be exported without copying. jobs are recorded by
+    their index in the JobTable that owns them, i.e. Job.index (-1 if a job
+    has not been interned).
+    """
+
+    def __init__(self, min_exit_time: int = 0, initial_capacity: int = 1024):
+        """
+        creates a new SojournTimeArrayRecordingObserver
+
+        Parameters
+        ----------
+        min_exit_time : int, optional
+            jobs with an earlier exit are ignored, by default 0
+        initial_capacity : int, optional
+            expected number of recorded jobs. the buffers grow if necessary.
+            by default 1024
+        """
+        self.__min_exit_time = min_exit_time
+        self.__arrival_times = GrowableArray(initial_capacity=initial_capacity)
+        self.__sojourn_times = GrowableArray(initial_capacity=initial_capacity)
+        self.__job_indices = GrowableArray(initial_capacity=initial_capacity)
+
+    def notify(self, job: Job, arrival_time: int, exit_time: int):
+        if exit_time >= self.__min_exit_time:
+            self.__arrival_times.append(arrival_time)
+            self.__sojourn_times.append(exit_time - arrival_time)
+            self.__job_indices.append(job.index)
+
+    def get_sojourn_times(self) -> np.ndarray:
+        """
+        returns a read-only view on the recorded sojourn times
+        """
+        return self.__sojourn_times.to_numpy()
+
+    def get_arrival_times(self) -> np.ndarray:
+        """
+        returns a read-only view on the arrival times of the recorded jobs
+        """
+        return self.__arrival_times.to_numpy()
+
+    def get_job_indices(self) -> np.ndarray:
+        """
+        returns a read-only view on the indices of the recorded jobs
+        """
+        return self.__job_indices.to_numpy()
+
+    def get_sojourn_time_per_job(self, job_table: JobTable) -> JobArray:
+        """
+        returns the sojourn times as mapping from jobs to sojourn time. all
+        recorded jobs must be owned by the given job table (see JobTable).
+        """
+        job_indices = self.get_job_indices()
+        if len(job_indices) > 0 and job_indices.min() < 0:
+            raise ValueError('recording contains jobs that have not been interned')
+        values = np.full(len(job_table), np.nan)
+        values[job_indices] = self.get_sojourn_times()
+        return JobArray(job_table, values, is_integer=True)
+
+    def get_max_sojourn_time(self) -> int:
+        """
+        returns the maximal observed sojourn time. if no value is available,
+        np.nan is returned
+        """
+        if len(self.__sojourn_times) > 0:
+            return int(self.get_sojourn_times().max())
+        return np.nan
+
+    def get_min_sojourn_time(self) -> int:
+        """
+        returns the minimal observed sojourn time. if no value is available,
+        np.nan is returned
+        """
+        if len(self.__sojourn_times) > 0:
+            return int(self.get_sojourn_times().min())
+        return np.nan
+
+    def get_mean_sojourn_time(self) -> float:
+        """
+        returns the mean observed sojourn time. if no value is available,
+        np.nan is returned
+        """
+        if len(self.__sojourn_times) > 0:
+            return float(self.get_sojourn_times().mean())
+        return np.nan
+
+    def get_stddev_sojourn_time(self) -> float:
+        """
+        returns the sample standard deviation of the observed sojourn time.
+        if less than two values are available, np.nan is returned
+        """
+        if len(self.__sojourn_times) > 1:
+            return float(self.get_sojourn_times().std(ddof=1))
+        return np.nan
+
+    def get_median_sojourn_time(self) -> float:
+        """
+        returns the median observed sojourn time. if no value is available,
+        np.nan is returned
+        """
+        if len(self.__sojourn_times) > 0:
+            return np.median(self.get_sojourn_times())
+        return np.nan
+
+    def get_timeseries_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        returns an array of arrival times and corresponding sojourn times.
+        the arrival times can contain duplicates if two or more jobs arrived
+        at the same time.
+        """
+        return self.get_arrival_times(), self.get_sojourn_times()
+
+    def copy(self) -> 'SojournTimeArrayRecordingObserver':
+        copy = SojournTimeArrayRecordingObserver(min_exit_time=self.__min_exit_time)
+        copy.__arrival_times = self.__arrival_times.copy()
+        copy.__sojourn_times = self.__sojourn_times.copy()
+        copy.__job_indices = self.__job_indices.copy()
+        return copy
\ No newline at end of file
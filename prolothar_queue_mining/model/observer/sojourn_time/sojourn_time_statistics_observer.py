@@ -0,0 +1,82 @@
+import numpy as np
+from prolothar_common.experiments.statistics import Statistics
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.observer.sojourn_time.sojourn_time_observer import SojournTimeObserver
+from prolothar_queue_mining.model.observer.utils import P2QuantileEstimator
+
+class SojournTimeStatisticsObserver(SojournTimeObserver):
+    """
+    an observer for sojourn times that only keeps summary statistics in
+    constant memory, i.e. streaming moments, minimum, maximum and P² estimates
+    of quantiles. no per-job data is stored.
+    """
+
+    def __init__(self, min_exit_time: int = 0, quantiles: tuple[float] = (0.5,)):
+        """
+        creates a new SojournTimeStatisticsObserver
+
+        Parameters
+        ----------
+        min_exit_time : int, optional
+            jobs with an earlier exit are ignored, by default 0
+        quantiles : tuple[float], optional
+            quantiles that are estimated, by default only the median
+        """
+        self.__min_exit_time = min_exit_time
+        self.__statistics = Statistics()
+        self.__nr_of_observations = 0
+        self.__quantile_estimators = {p: P2QuantileEstimator(p) for p in quantiles}
+
+    def notify(self, job: Job, arrival_time: int, exit_time: int):
+        if exit_time >= self.__min_exit_time:
+            sojourn_time = exit_time - arrival_time
+            self.__statistics.push(sojourn_time)
+            self.__nr_of_observations += 1
+            for estimator in self.__quantile_estimators.values():
+                estimator.push(sojourn_time)
+
+    def get_nr_of_observations(self) -> int:
+        return self.__nr_of_observations
+
+    def get_max_sojourn_time(self) -> int:
+        """
+        returns the maximal observed sojourn time
+        """
+        return self.__statistics.maximum()
+
+    def get_min_sojourn_time(self) -> int:
+        """
+        returns the minimal observed sojourn time
+        """
+        return self.__statistics.minimum()
+
+    def get_mean_sojourn_time(self) -> float:
+        """
+        returns the mean observed sojourn time
+        """
+        return self.__statistics.mean()
+
+    def get_stddev_sojourn_time(self) -> float:
+        """
+        returns the standard deviation of the observed sojourn time
+        """
+        return self.__statistics.stddev()
+
+    def get_quantile_sojourn_time(self, p: float) -> float:
+        """
+        returns the estimate of the p-quantile of the observed sojourn time.
+        p must be one of the quantiles given in the constructor. if no value
+        is available, np.nan is returned
+        """
+        try:
+            return self.__quantile_estimators[p].get_quantile()
+        except KeyError as e:
+            raise ValueError(f'quantile {p} is not estimated by this observer') from e
+
+    def get_median_sojourn_time(self) -> float:
+        """
+        returns the estimated median observed sojourn time. if no value is
+        available, np.nan is returned
+        """
+        return self.get_quantile_sojourn_time(0.5)
\ No newline at end of file
@@ -0,0 +1,2 @@
+from prolothar_queue_mining.model.observer.utils.growable_array import GrowableArray
+from prolothar_queue_mining.model.observer.utils.p2_quantile import P2QuantileEstimator
\ No newline at end of file
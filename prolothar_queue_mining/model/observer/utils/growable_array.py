@@ -0,0 +1,61 @@
+import numpy as np
+
+class GrowableArray():
+    """
+    append-only NumPy buffer with amortized constant time appends. the filled
+    part can be exported without copying the data.
+    """
+
+    def __init__(self, dtype=np.int64, initial_capacity: int = 1024):
+        """
+        creates a new, empty GrowableArray
+
+        Parameters
+        ----------
+        dtype : optional
+            NumPy data type of the values, by default np.int64
+        initial_capacity : int, optional
+            number of values that can be appended before the buffer is
+            reallocated, by default 1024
+        """
+        self.__buffer = np.empty(max(1, initial_capacity), dtype=dtype)
+        self.__size = 0
+
+    def append(self, value):
+        if self.__size == len(self.__buffer):
+            #old buffer is not reused, i.e. exported views stay valid
+            buffer = np.empty(2 * len(self.__buffer), dtype=self.__buffer.dtype)
+            buffer[:self.__size] = self.__buffer
+            self.__buffer = buffer
+        self.__buffer[self.__size] = value
+        self.__size += 1
+
+    def set_last(self, value):
+        """
+        overwrites the last appended value
+        """
+        if self.__size == 0:
+            raise IndexError('array is empty')
+        self.__buffer[self.__size - 1] = value
+
+    def get_last(self):
+        if self.__size == 0:
+            raise IndexError('array is empty')
+        return self.__buffer[self.__size - 1]
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        returns a read-only view on the appended values (no copy)
+        """
+        view = self.__buffer[:self.__size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def copy(self) -> 'GrowableArray':
+        copy = GrowableArray(dtype=self.__buffer.dtype, initial_capacity=len(self.__buffer))
+        copy.__buffer[:self.__size] = self.__buffer[:self.__size]
+        copy.__size = self.__size
+        return copy
\ No newline at end of file
@@ -0,0 +1,100 @@
+from bisect import insort
+from math import copysign
+
+import numpy as np
+
+class P2QuantileEstimator():
+    """
+    estimates a quantile of a stream of values in constant memory with the P²
+    algorithm (Jain and Chlamtac, 1985). the estimate is exact as long as at
+    most five values have been pushed.
+    """
+
+    def __init__(self, p: float):
+        """
+        creates a new P2QuantileEstimator
+
+        Parameters
+        ----------
+        p : float
+            the quantile to estimate, must be in (0,1). 0.5 estimates the median.
+        """
+        if not 0 < p < 1:
+            raise ValueError(f'p must be in (0,1) but was {p}')
+        self.__p = p
+        self.__count = 0
+        self.__heights: list[float] = []
+        self.__positions = [1, 2, 3, 4, 5]
+        self.__desired_positions = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self.__increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def get_p(self) -> float:
+        return self.__p
+
+    def push(self, value: float):
+        """
+        adds a new value to the stream
+        """
+        self.__count += 1
+        heights = self.__heights
+        if self.__count <= 5:
+            insort(heights, value)
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            k = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= heights[k + 1]:
+                k += 1
+
+        positions = self.__positions
+        for i in range(k + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self.__desired_positions[i] += self.__increments[i]
+
+        for i in range(1, 4):
+            d = self.__desired_positions[i] - positions[i]
+            if (d >= 1 and positions[i + 1] - positions[i] > 1) or \
+               (d <= -1 and positions[i - 1] - positions[i] < -1):
+                d = int(copysign(1, d))
+                height = self.__parabolic(i, d)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self.__linear(i, d)
+                heights[i] = height
+                positions[i] += d
+
+    def __parabolic(self, i: int, d: int) -> float:
+        q = self.__heights
+        n = self.__positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i]) +
+            (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def __linear(self, i: int, d: int) -> float:
+        q = self.__heights
+        n = self.__positions
+        return q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+
+    def get_quantile(self) -> float:
+        """
+        returns the current estimate of the quantile. if no value is available,
+        np.nan is returned
+        """
+        if self.__count == 0:
+            return np.nan
+        if self.__count <= 5:
+            return float(np.quantile(self.__heights, self.__p))
+        return self.__heights[2]
+
+    def get_count(self) -> int:
+        """
+        returns the number of values that have been pushed
+        """
+        return self.__count
\ No newline at end of file
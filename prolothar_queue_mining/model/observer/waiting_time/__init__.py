@@ -1,4 +1,7 @@
 from prolothar_queue_mining.model.observer.waiting_time.waiting_time_observer import WaitingTimeObserver
 from prolothar_queue_mining.model.observer.waiting_time.null_waiting_time_observer import NullWaitingTimeObserver
 from prolothar_queue_mining.model.observer.waiting_time.waiting_time_recording_observer import WaitingTimeRecordingObserver
-from prolothar_queue_mining.model.observer.waiting_time.serve_order_recorder import ServeOrderRecorder
\ No newline at end of file
+from prolothar_queue_mining.model.observer.waiting_time.serve_order_recorder import ServeOrderRecorder
+from prolothar_queue_mining.model.observer.waiting_time.compact_serve_order_recorder import CompactServeOrderRecorder
+from prolothar_queue_mining.model.observer.waiting_time.waiting_time_array_recording_observer import WaitingTimeArrayRecordingObserver
+from prolothar_queue_mining.model.observer.waiting_time.waiting_time_statistics_observer import WaitingTimeStatisticsObserver
\ No newline at end of file
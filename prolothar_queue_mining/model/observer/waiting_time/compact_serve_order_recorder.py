@@ -0,0 +1,215 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterator
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.waiting_area import WaitingArea
+from prolothar_queue_mining.model.observer.waiting_time import WaitingTimeObserver
+from prolothar_queue_mining.model.observer.utils import GrowableArray
+
+class CompactServeOrderRecorder(WaitingTimeObserver):
+    """
+    an observer that records how served jobs relate to the jobs that are still
+    waiting. in contrast to ServeOrderRecorder, no snapshots of the waiting area
+    are stored, i.e. memory is linear in the number of jobs. the recorder does
+    not know any job features. it keeps a sorted list of the arrival times of
+    the currently waiting jobs (updated with bisection) and appends to the
+    following flat arrays:
+    - one entry per served job: the number of waiting jobs, the minimum and
+      maximum arrival time of the waiting jobs and the number of waiting jobs
+      that arrived later (FIFO) or earlier (LIFO) than the served job
+    - one entry per job that entered the waiting area: its arrival time and the
+      interval [start, end) of positions in the list of served jobs during
+      which the job was waiting (see get_waiting_intervals). consumers use
+      these intervals to reconstruct which jobs were waiting at the start of
+      service of each served job, e.g. PriorityClassWaitingAreaEstimator counts
+      the partial orders between categories from them with vectorized operations.
+
+    the waiting area returned by get_waiting_area() must be used in the queue.
+    it forwards to the given waiting area and informs this recorder about
+    added and removed jobs.
+    """
+
+    def __init__(self, waiting_area: WaitingArea):
+        """
+        creates a new CompactServeOrderRecorder
+
+        Parameters
+        ----------
+        waiting_area : WaitingArea
+            the waiting area that decides on the serve order
+        """
+        self.__waiting_area = _RecordedWaitingArea(waiting_area, self)
+        #sorted arrival times of all waiting jobs
+        self.__waiting_arrival_times: list = []
+        #waiting job => (arrival time, position in the list of entered jobs)
+        self.__entry_per_waiting_job: dict[Job, tuple[int, int]] = {}
+
+        self.__entered_jobs: list[Job] = []
+        self.__arrival_times_of_entered_jobs = GrowableArray(dtype=float)
+        self.__start_of_waiting_intervals = GrowableArray(dtype=np.int64)
+        self.__left_entries = GrowableArray(dtype=np.int64)
+        self.__end_of_waiting_intervals_of_left_entries = GrowableArray(dtype=np.int64)
+
+        self.__served_jobs: list[Job] = []
+        self.__arrival_times_of_served_jobs = GrowableArray(dtype=float)
+        self.__nr_of_waiting_jobs = GrowableArray(dtype=np.int64)
+        self.__min_arrival_times = GrowableArray(dtype=float)
+        self.__max_arrival_times = GrowableArray(dtype=float)
+        self.__nr_of_fifo_comparisons = GrowableArray(dtype=np.int64)
+        self.__nr_of_lifo_comparisons = GrowableArray(dtype=np.int64)
+
+    def get_waiting_area(self) -> WaitingArea:
+        """
+        returns the waiting area that must be used by the observed queue
+        """
+        return self.__waiting_area
+
+    def _add_waiting_job(self, arrival_time: int, job: Job):
+        self.__entry_per_waiting_job[job] = (arrival_time, len(self.__entered_jobs))
+        insort(self.__waiting_arrival_times, arrival_time)
+        self.__entered_jobs.append(job)
+        self.__arrival_times_of_entered_jobs.append(arrival_time)
+        self.__start_of_waiting_intervals.append(len(self.__served_jobs))
+
+    def _remove_waiting_job(self, job: Job):
+        arrival_time, entry = self.__entry_per_waiting_job.pop(job)
+        _remove_from_sorted_list(self.__waiting_arrival_times, arrival_time)
+        self.__left_entries.append(entry)
+        self.__end_of_waiting_intervals_of_left_entries.append(len(self.__served_jobs))
+
+    def notify(self, job: Job, arrival_time: int, start_of_service_time: int):
+        waiting_arrival_times = self.__waiting_arrival_times
+        self.__served_jobs.append(job)
+        self.__arrival_times_of_served_jobs.append(arrival_time)
+        self.__nr_of_waiting_jobs.append(len(waiting_arrival_times))
+        if waiting_arrival_times:
+            self.__min_arrival_times.append(waiting_arrival_times[0])
+            self.__max_arrival_times.append(waiting_arrival_times[-1])
+        else:
+            self.__min_arrival_times.append(np.nan)
+            self.__max_arrival_times.append(np.nan)
+        self.__nr_of_fifo_comparisons.append(
+            len(waiting_arrival_times) - bisect_right(waiting_arrival_times, arrival_time))
+        self.__nr_of_lifo_comparisons.append(bisect_left(waiting_arrival_times, arrival_time))
+
+    def get_served_jobs(self) -> list[Job]:
+        """
+        returns the served jobs in the order of their start of service
+        """
+        return self.__served_jobs
+
+    def get_arrival_times_of_served_jobs(self) -> np.ndarray:
+        """
+        returns the arrival time of each served job in the order of their
+        start of service
+        """
+        return self.__arrival_times_of_served_jobs.to_numpy()
+
+    def get_nr_of_waiting_jobs(self) -> np.ndarray:
+        """
+        returns the number of waiting jobs at the start of service of each served job
+        """
+        return self.__nr_of_waiting_jobs.to_numpy()
+
+    def get_min_arrival_times_of_waiting_jobs(self) -> np.ndarray:
+        """
+        returns the earliest arrival time of the waiting jobs at the start of
+        service of each served job. NaN if no job was waiting.
+        """
+        return self.__min_arrival_times.to_numpy()
+
+    def get_max_arrival_times_of_waiting_jobs(self) -> np.ndarray:
+        """
+        returns the latest arrival time of the waiting jobs at the start of
+        service of each served job. NaN if no job was waiting.
+        """
+        return self.__max_arrival_times.to_numpy()
+
+    def get_nr_of_fifo_comparisons(self) -> np.ndarray:
+        """
+        returns for each served job the number of waiting jobs that arrived later
+        """
+        return self.__nr_of_fifo_comparisons.to_numpy()
+
+    def get_nr_of_lifo_comparisons(self) -> np.ndarray:
+        """
+        returns for each served job the number of waiting jobs that arrived earlier
+        """
+        return self.__nr_of_lifo_comparisons.to_numpy()
+
+    def get_entered_jobs(self) -> list[Job]:
+        """
+        returns all jobs that entered the waiting area in the order of entering
+        """
+        return self.__entered_jobs
+
+    def get_arrival_times_of_entered_jobs(self) -> np.ndarray:
+        """
+        returns the arrival time of each job in get_entered_jobs()
+        """
+        return self.__arrival_times_of_entered_jobs.to_numpy()
+
+    def get_waiting_intervals(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        returns two arrays "start" and "end" with an entry for each job in
+        get_entered_jobs(). the i-th entered job was waiting at the start of
+        service of the served jobs get_served_jobs()[start[i]:end[i]]. for jobs
+        that are still waiting, end[i] is the number of served jobs.
+        """
+        end = np.full(len(self.__entered_jobs), len(self.__served_jobs), dtype=np.int64)
+        end[self.__left_entries.to_numpy()] = \
+            self.__end_of_waiting_intervals_of_left_entries.to_numpy()
+        return self.__start_of_waiting_intervals.to_numpy(), end
+
+def _remove_from_sorted_list(sorted_list: list, value):
+    del sorted_list[bisect_left(sorted_list, value)]
+
+class _RecordedWaitingArea(WaitingArea):
+    """
+    forwards to a waiting area and informs a CompactServeOrderRecorder about
+    all jobs that enter or leave the waiting area
+    """
+
+    def __init__(self, waiting_area: WaitingArea, recorder: CompactServeOrderRecorder):
+        self.__waiting_area = waiting_area
+        self.__recorder = recorder
+
+    def add_job(self, arrival_time: int, job: Job):
+        self.__waiting_area.add_job(arrival_time, job)
+        self.__recorder._add_waiting_job(arrival_time, job)
+
+    def has_next_job(self) -> bool:
+        return self.__waiting_area.has_next_job()
+
+    def pop_next_job(self, nr_of_jobs_in_system: int) -> Job:
+        job = self.__waiting_area.pop_next_job(nr_of_jobs_in_system)
+        self.__recorder._remove_waiting_job(job)
+        return job
+
+    def pop_batch(self, batch_size: int, nr_of_jobs_in_system: int) -> list[Job]:
+        batch = self.__waiting_area.pop_batch(batch_size, nr_of_jobs_in_system)
+        for job in batch:
+            self.__recorder._remove_waiting_job(job)
+        return batch
+
+    def __len__(self):
+        return len(self.__waiting_area)
+
+    def copy(self) -> WaitingArea:
+        raise NotImplementedError('a recorded waiting area cannot be copied')
+
+    def copy_empty(self) -> WaitingArea:
+        raise NotImplementedError('a recorded waiting area cannot be copied')
+
+    def get_discipline_name(self) -> str:
+        return self.__waiting_area.get_discipline_name()
+
+    def any_order_iterator(self) -> Iterator[Job]:
+        return self.__waiting_area.any_order_iterator()
+
+    def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time: int):
+        return self.__waiting_area.get_best_case_sort_key_for_synchronized_arrival(job, exit_time)
+
+    def get_worst_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time: int):
+        return self.__waiting_area.get_worst_case_sort_key_for_synchronized_arrival(job, exit_time)
@@ -0,0 +1,109 @@
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job, JobArray, JobTable
+from prolothar_queue_mining.model.observer.waiting_time import WaitingTimeObserver
+from prolothar_queue_mining.model.observer.utils import GrowableArray
+
+class WaitingTimeArrayRecordingObserver(WaitingTimeObserver):
+    """
+    an observer for (statistical) analysis of recorded waiting times over time.
+    in contrast to WaitingTimeRecordingObserver, the recording is stored in
+    NumPy buffers and can be exported without copying. jobs are recorded by
+    their index in the JobTable that owns them, i.e. Job.index (-1 if a job
+    has not been interned).
+    """
+
+    def __init__(self, min_service_time: int = 0, initial_capacity: int = 1024):
+        """
+        creates a new WaitingTimeArrayRecordingObserver
+
+        Parameters
+        ----------
+        min_service_time : int, optional
+            jobs with an earlier start of service are ignored, by default 0
+        initial_capacity : int, optional
+            expected number of recorded jobs. the buffers grow if necessary.
+            by default 1024
+        """
+        self.__min_service_time = min_service_time
+        self.__arrival_times = GrowableArray(initial_capacity=initial_capacity)
+        self.__waiting_times = GrowableArray(initial_capacity=initial_capacity)
+        self.__job_indices = GrowableArray(initial_capacity=initial_capacity)
+
+    def notify(self, job: Job, arrival_time: int, start_of_service_time: int):
+        if start_of_service_time >= self.__min_service_time:
+            self.__arrival_times.append(arrival_time)
+            self.__waiting_times.append(start_of_service_time - arrival_time)
+            self.__job_indices.append(job.index)
+
+    def get_waiting_times(self) -> np.ndarray:
+        """
+        returns a read-only view on the recorded waiting times
+        """
+        return self.__waiting_times.to_numpy()
+
+    def get_arrival_times(self) -> np.ndarray:
+        """
+        returns a read-only view on the arrival times of the recorded jobs
+        """
+        return self.__arrival_times.to_numpy()
+
+    def get_job_indices(self) -> np.ndarray:
+        """
+        returns a read-only view on the indices of the recorded jobs
+        """
+        return self.__job_indices.to_numpy()
+
+    def get_waiting_time_per_job(self, job_table: JobTable) -> JobArray:
+        """
+        returns the waiting times as mapping from jobs to waiting time. all
+        recorded jobs must be owned by the given job table (see JobTable).
+        """
+        job_indices = self.get_job_indices()
+        if len(job_indices) > 0 and job_indices.min() < 0:
+            raise ValueError('recording contains jobs that have not been interned')
+        values = np.full(len(job_table), np.nan)
+        values[job_indices] = self.get_waiting_times()
+        return JobArray(job_table, values, is_integer=True)
+
+    def get_max_waiting_time(self) -> int:
+        """
+        returns the maximal observed waiting time. if no value is available,
+        np.nan is returned
+        """
+        if len(self.__waiting_times) > 0:
+            return int(self.get_waiting_times().max())
+        return np.nan
+
+    def get_mean_waiting_time(self) -> float:
+        """
+        returns the mean observed waiting time. if no value is available,
+        np.nan is returned
+        """
+        if len(self.__waiting_times) > 0:
+            return float(self.get_waiting_times().mean())
+        return np.nan
+
+    def get_median_waiting_time(self) -> float:
+        """
+        returns the median observed waiting time. if no value is available,
+        np.nan is returned
+        """
+        if len(self.__waiting_times) > 0:
+            return np.median(self.get_waiting_times())
+        return np.nan
+
+    def get_timeseries_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        returns an array of arrival times and corresponding waiting times.
+        the arrival times can contain duplicates if two or more jobs arrived
+        at the same time.
+        """
+        return self.get_arrival_times(), self.get_waiting_times()
+
+    def copy(self) -> 'WaitingTimeArrayRecordingObserver':
+        copy = WaitingTimeArrayRecordingObserver(min_service_time=self.__min_service_time)
+        copy.__arrival_times = self.__arrival_times.copy()
+        copy.__waiting_times = self.__waiting_times.copy()
+        copy.__job_indices = self.__job_indices.copy()
+        return copy
\ No newline at end of file
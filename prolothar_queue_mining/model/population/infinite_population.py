@@ -1,6 +1,5 @@
-from random import Random
-
 from prolothar_queue_mining.model.population.population import Population
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler, POPULATION_STREAM
 from prolothar_queue_mining.model.job import Job
 
 class InfinitePopulation(Population):
@@ -35,9 +34,10 @@ class InfinitePopulation(Population):
     def get_next_job(self) -> Job:
         job = Job(str(self.__next_job_id))
         for categorical_feature in self.__categorical_feature_names:
-            job.features[categorical_feature] = self.__random.choice(self.__categories)
+            job.features[categorical_feature] = self.__categories[
+                int(self.__uniform_sampler.get_next_sample() * len(self.__categories))]
         for numerical_feature in self.__numerical_feature_names:
-            job.features[numerical_feature] = self.__random.uniform(0, 1)
+            job.features[numerical_feature] = self.__uniform_sampler.get_next_sample()
         self.__next_job_id += 1
         return job
 
@@ -50,5 +50,6 @@ class InfinitePopulation(Population):
             seed=self.__seed)
 
     def set_seed(self, seed: int):
-        self.__random = Random(seed)
+        self.__uniform_sampler = GeneratorMethodSampler(
+            'random', seed=seed, stream=POPULATION_STREAM)
         self.__seed = seed
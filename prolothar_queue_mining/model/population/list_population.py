@@ -26,6 +26,12 @@ class ListPopulation(Population):
     def get_job_list(self) -> list[Job]:
         return self.__job_list
 
+    def get_current_job_index(self) -> int:
+        """
+        returns the index of the next job in the job list
+        """
+        return self.__current_job_index
+
     def copy(self) -> Population:
         return ListPopulation(self.__job_list, initial_job_index = self.__current_job_index)
 
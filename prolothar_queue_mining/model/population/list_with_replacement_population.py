@@ -1,6 +1,5 @@
-from random import Random
-
 from prolothar_queue_mining.model.population.population import Population
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler, POPULATION_STREAM
 from prolothar_queue_mining.model.job import Job
 
 class ListWithReplacementPopulation(Population):
@@ -16,7 +15,7 @@ class ListWithReplacementPopulation(Population):
     def get_next_job(self) -> Job:
         job_id = str(self.__nr_of_returned_jobs)
         self.__nr_of_returned_jobs += 1
-        return Job(job_id, self.__random.choice(self.__job_list).features)
+        return Job(job_id, self.__job_list[self.__index_sampler.get_next_sample()].features)
 
     def get_job_list(self) -> list[Job]:
         return self.__job_list
@@ -26,4 +25,5 @@ class ListWithReplacementPopulation(Population):
 
     def set_seed(self, seed: int):
         self.__seed = seed
-        self.__random = Random(seed)
+        self.__index_sampler = GeneratorMethodSampler(
+            'integers', 0, len(self.__job_list), seed=seed, stream=POPULATION_STREAM)
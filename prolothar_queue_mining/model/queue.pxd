@@ -1,16 +1,30 @@
 from prolothar_queue_mining.model.environment cimport Environment
 from prolothar_queue_mining.model.server cimport Server
 from prolothar_queue_mining.model.job cimport Job
+from prolothar_queue_mining.model.queue_observer cimport QueueObserver
+from prolothar_queue_mining.model.waiting_area.typed_waiting_area cimport TypedWaitingArea
+from prolothar_queue_mining.model.arrival_process.arrival_cursor cimport ArrivalCursor
 
 cdef class Queue:
     cdef __arrival_process
+    #cursor of __arrival_process if its arrivals are fixed, otherwise None
+    cdef ArrivalCursor __arrival_cursor
     cdef __servers
     cdef __exit
     cdef __waiting_area
+    #same as __waiting_area if it is a TypedWaitingArea, otherwise None
+    cdef TypedWaitingArea __typed_waiting_area
     cdef __batch_size_distribution
     cdef __waiting_time_observer
     cdef __sojourn_time_observer
     cdef __queue_length_observer
+    cdef list __observers
+    cdef list __start_of_service_observers
+    cdef list __exit_observers
+    cdef list __queue_length_observers
+    cdef bint __notify_waiting_time_observer
+    cdef bint __notify_sojourn_time_observer
+    cdef bint __notify_queue_length_observer
     cdef __arrival_time_of_open_jobs
     cdef int __current_required_batch_size
     cdef bint __is_batch_service_possible
@@ -22,4 +36,9 @@ cdef class Queue:
     cdef __serve_batch(self, list batch, Server server, int exit_time, Environment environment)
     cdef handle_batch_exit(self, Environment environment, Server server, int exit_time, list batch)
     cpdef handle_job_exit(self, Environment environment, Server server, int exit_time, Job job)
-    cpdef schedule_next_arrival(self, Environment environment)
\ No newline at end of file
+    cpdef schedule_next_arrival(self, Environment environment)
+    cdef __update_observer_dispatch(self)
+    cdef int __get_nr_of_waiting_jobs(self) except -1
+    cdef __notify_start_of_service(self, Job job, int start_of_service_time)
+    cdef __notify_exit(self, Job job, int arrival_time, int exit_time)
+    cdef __notify_queue_length(self, int current_time, int queue_length)
\ No newline at end of file
@@ -17,6 +17,10 @@ from prolothar_queue_mining.model.observer.sojourn_time import SojournTimeObserv
 from prolothar_queue_mining.model.observer.sojourn_time import NullSojournTimeObserver
 from prolothar_queue_mining.model.observer.queue_length import QueueLengthObserver
 from prolothar_queue_mining.model.observer.queue_length import NullQueueLengthObserver
+from prolothar_queue_mining.model.waiting_area.typed_waiting_area cimport TypedWaitingArea
+from prolothar_queue_mining.model.arrival_process.arrival_cursor cimport ArrivalCursor
+from prolothar_queue_mining.model.queue_observer import START_OF_SERVICE, EXIT, QUEUE_LENGTH
+from prolothar_queue_mining.model.queue_observer cimport QueueObserver
 
 cdef class Queue:
 
@@ -27,15 +31,38 @@ cdef class Queue:
             batch_size_distribution: DiscreteDistribution = DiscreteDegenerateDistribution(1),
             waiting_time_observer: WaitingTimeObserver = NullWaitingTimeObserver(),
             sojourn_time_observer: SojournTimeObserver = NullSojournTimeObserver(),
-            queue_length_observer: QueueLengthObserver = NullQueueLengthObserver()):
-        if arrival_process is None:
-            arrival_process = NullArrival()
-        self.__arrival_process = arrival_process
+            queue_length_observer: QueueLengthObserver = NullQueueLengthObserver(),
+            observers: list[QueueObserver] = None):
+        """
+        creates a new queue
+
+        Parameters
+        ----------
+        arrival_process : ArrivalProcess
+            generates the jobs arriving at this queue. if None, no jobs arrive.
+        servers : list[Server]
+            servers that process the jobs
+        exit_point : Exit, optional
+            handles jobs leaving the queue, by default DoNothingExit()
+        waiting_area : WaitingArea, optional
+            decides the order of service, by default FCFS
+        batch_size_distribution : DiscreteDistribution, optional
+            distribution of batch sizes, by default no batching
+        waiting_time_observer : WaitingTimeObserver, optional
+            by default a null observer, which is never called
+        sojourn_time_observer : SojournTimeObserver, optional
+            by default a null observer, which is never called
+        queue_length_observer : QueueLengthObserver, optional
+            by default a null observer, which is never called
+        observers : list[QueueObserver], optional
+            observers with C-level dispatch. each observer is only notified
+            about the events it subscribed to. by default no observers.
+        """
+        self.set_arrival_process(arrival_process)
         self.__servers = servers
         if waiting_area is None:
-            self.__waiting_area = FirstComeFirstServeWaitingArea()
-        else:
-            self.__waiting_area = waiting_area
+            waiting_area = FirstComeFirstServeWaitingArea()
+        self.set_waiting_area(waiting_area)
         self.__exit = exit_point
         self.__waiting_time_observer = waiting_time_observer
         self.__arrival_time_of_open_jobs: dict[Job,float] = {}
@@ -47,6 +74,31 @@ cdef class Queue:
             self.__batch_size_distribution.get_mean() > 1 or
             self.__batch_size_distribution.get_variance() > 0)
         self.__nr_of_jobs_in_system = 0
+        self.__observers = list(observers) if observers is not None else []
+        self.__update_observer_dispatch()
+
+    cdef __update_observer_dispatch(self):
+        """
+        null observers are not called at all and QueueObservers are only called
+        for the events they subscribed to
+        """
+        self.__notify_waiting_time_observer = not isinstance(
+            self.__waiting_time_observer, NullWaitingTimeObserver)
+        self.__notify_sojourn_time_observer = not isinstance(
+            self.__sojourn_time_observer, NullSojournTimeObserver)
+        self.__notify_queue_length_observer = not isinstance(
+            self.__queue_length_observer, NullQueueLengthObserver)
+        cdef QueueObserver observer
+        self.__start_of_service_observers = []
+        self.__exit_observers = []
+        self.__queue_length_observers = []
+        for observer in self.__observers:
+            if observer.subscribed_events & START_OF_SERVICE:
+                self.__start_of_service_observers.append(observer)
+            if observer.subscribed_events & EXIT:
+                self.__exit_observers.append(observer)
+            if observer.subscribed_events & QUEUE_LENGTH:
+                self.__queue_length_observers.append(observer)
 
     def set_seed(self, seed: int|None):
         """
@@ -59,25 +111,36 @@ cdef class Queue:
                 server.set_seed(seed + i)
             else:
                 server.set_seed(seed)
+            server.get_service_time_definition().set_queue_seed(seed)
 
     def set_waiting_time_observer(self, waiting_time_observer: WaitingTimeObserver):
         self.__waiting_time_observer = waiting_time_observer
+        self.__update_observer_dispatch()
 
     def get_waiting_time_observer(self) -> WaitingTimeObserver:
         return self.__waiting_time_observer
 
     def set_sojourn_time_observer(self, sojourn_time_observer: SojournTimeObserver):
         self.__sojourn_time_observer = sojourn_time_observer
+        self.__update_observer_dispatch()
 
     def get_sojourn_time_observer(self) -> SojournTimeObserver:
         return self.__sojourn_time_observer
 
     def set_queue_length_observer(self, queue_length_observer: QueueLengthObserver):
         self.__queue_length_observer = queue_length_observer
+        self.__update_observer_dispatch()
 
     def get_queue_length_observer(self) -> QueueLengthObserver:
         return self.__queue_length_observer
 
+    def add_observer(self, observer: QueueObserver):
+        self.__observers.append(observer)
+        self.__update_observer_dispatch()
+
+    def get_observers(self) -> list[QueueObserver]:
+        return list(self.__observers)
+
     def get_nr_of_servers(self) -> int:
         """
         returns the number of servers (c in Kendall's notation)
@@ -124,12 +187,17 @@ cdef class Queue:
             self.__arrival_process = NullArrival()
         else:
             self.__arrival_process = arrival
+        self.__arrival_cursor = self.__arrival_process.get_arrival_cursor()
 
     def get_waiting_area(self) -> WaitingArea:
         return self.__waiting_area
 
     def set_waiting_area(self, waiting_area: WaitingArea) -> WaitingArea:
         self.__waiting_area = waiting_area
+        if isinstance(waiting_area, TypedWaitingArea):
+            self.__typed_waiting_area = waiting_area
+        else:
+            self.__typed_waiting_area = None
 
     def set_exit(self, exit_point: Exit):
         self.__exit = exit_point
@@ -138,6 +206,17 @@ cdef class Queue:
         return self.__exit
 
     cpdef schedule_next_arrival(self, Environment environment):
+        cdef ArrivalCursor cursor = self.__arrival_cursor
+        cdef Py_ssize_t index
+        if cursor is not None:
+            #fixed arrivals are taken from the shared table without Python calls
+            index = cursor.index
+            if index < cursor.nr_of_arrivals:
+                cursor.index = index + 1
+                environment.schedule_event(QueueArrivalEvent(
+                    self, cursor.arrival_times[index],
+                    <Job>cursor.jobs[cursor.job_indices[index]]))
+            return
         try:
             arrival_time, job = self.__arrival_process.get_next_job()
             environment.schedule_event(QueueArrivalEvent(self, arrival_time, job))
@@ -147,7 +226,10 @@ cdef class Queue:
 
     cpdef handle_job_arrival(self, Environment environment, int arrival_time, Job job):
         self.__arrival_time_of_open_jobs[job] = arrival_time
-        self.__waiting_area.add_job(arrival_time, job)
+        if self.__typed_waiting_area is not None:
+            self.__typed_waiting_area.add_job(arrival_time, job)
+        else:
+            self.__waiting_area.add_job(arrival_time, job)
         environment.schedule_event(QueueTryToServeEvent(self, environment.get_current_time()))
         self.__nr_of_jobs_in_system += 1
         self.schedule_next_arrival(environment)
@@ -157,20 +239,33 @@ cdef class Queue:
         self.__exit.add_job(exit_time, job)
         self.__nr_of_jobs_in_system -= 1
         environment.schedule_event(QueueTryToServeEvent(self, environment.get_current_time()))
-        self.__sojourn_time_observer.notify(job, self.__arrival_time_of_open_jobs.pop(job), exit_time)
+        self.__notify_exit(job, self.__arrival_time_of_open_jobs.pop(job), exit_time)
+
+    cdef __notify_exit(self, Job job, int arrival_time, int exit_time):
+        if self.__notify_sojourn_time_observer:
+            self.__sojourn_time_observer.notify(job, arrival_time, exit_time)
+        cdef QueueObserver observer
+        for observer in self.__exit_observers:
+            observer.notify_exit(job, arrival_time, exit_time)
 
     cdef handle_batch_exit(self, Environment environment, Server server, int exit_time, list batch: List[Job]):
         server.set_current_job(None)
         cdef Job job
         for job in batch:
             self.__exit.add_job(exit_time, job)
-            self.__sojourn_time_observer.notify(job, self.__arrival_time_of_open_jobs.pop(job), exit_time)
+            self.__notify_exit(job, self.__arrival_time_of_open_jobs.pop(job), exit_time)
         self.__nr_of_jobs_in_system -= len(batch)
         environment.schedule_event(QueueTryToServeEvent(self, environment.get_current_time()))
 
+    cdef int __get_nr_of_waiting_jobs(self) except -1:
+        if self.__typed_waiting_area is not None:
+            return self.__typed_waiting_area.get_nr_of_jobs()
+        return len(self.__waiting_area)
+
     cdef try_to_serve_next_job(self, Environment environment):
-        if len(self.__waiting_area) < self.__current_required_batch_size:
+        if self.__get_nr_of_waiting_jobs() < self.__current_required_batch_size:
             return
+        cdef TypedWaitingArea typed_waiting_area = self.__typed_waiting_area
         cdef Server server
         cdef int exit_time
         cdef list batch
@@ -178,23 +273,50 @@ cdef class Queue:
         for server in self.__servers:
             if server.is_ready_for_service():
                 if self.__is_batch_service_possible:
-                    batch = self.__waiting_area.pop_batch(
-                        self.__current_required_batch_size, self.__nr_of_jobs_in_system)
+                    if typed_waiting_area is not None:
+                        batch = typed_waiting_area.pop_batch(
+                            self.__current_required_batch_size, self.__nr_of_jobs_in_system)
+                    else:
+                        batch = self.__waiting_area.pop_batch(
+                            self.__current_required_batch_size, self.__nr_of_jobs_in_system)
                     exit_time = environment.get_current_time() + server.get_batch_service_time(
                         batch, self.__nr_of_jobs_in_system)
                     self.__serve_batch(batch, server, exit_time, environment)
                     self.__current_required_batch_size = max(1, self.__batch_size_distribution.get_next_sample())
+                elif typed_waiting_area is not None:
+                    if typed_waiting_area.has_next_job():
+                        job = typed_waiting_area.pop_next_job(self.__nr_of_jobs_in_system)
+                        exit_time = environment.get_current_time() + server.get_service_time(
+                            job, self.__nr_of_jobs_in_system)
+                        self.__serve_job(job, server, exit_time, environment)
                 elif self.__waiting_area.has_next_job():
                     job = self.__waiting_area.pop_next_job(self.__nr_of_jobs_in_system)
                     exit_time = environment.get_current_time() + server.get_service_time(
                         job, self.__nr_of_jobs_in_system)
                     self.__serve_job(job, server, exit_time, environment)
                 break
-        self.__queue_length_observer.notify(environment.get_current_time(), len(self.__waiting_area))
+        if self.__notify_queue_length_observer or self.__queue_length_observers:
+            self.__notify_queue_length(environment.get_current_time(), self.__get_nr_of_waiting_jobs())
+
+    cdef __notify_queue_length(self, int current_time, int queue_length):
+        if self.__notify_queue_length_observer:
+            self.__queue_length_observer.notify(current_time, queue_length)
+        cdef QueueObserver observer
+        for observer in self.__queue_length_observers:
+            observer.notify_queue_length(current_time, queue_length)
+
+    cdef __notify_start_of_service(self, Job job, int start_of_service_time):
+        if not self.__notify_waiting_time_observer and not self.__start_of_service_observers:
+            return
+        cdef int arrival_time = self.__arrival_time_of_open_jobs[job]
+        if self.__notify_waiting_time_observer:
+            self.__waiting_time_observer.notify(job, arrival_time, start_of_service_time)
+        cdef QueueObserver observer
+        for observer in self.__start_of_service_observers:
+            observer.notify_start_of_service(job, arrival_time, start_of_service_time)
 
     cdef __serve_job(self, Job job, Server server, int exit_time, Environment environment):
-        self.__waiting_time_observer.notify(
-            job, self.__arrival_time_of_open_jobs[job], environment.get_current_time())
+        self.__notify_start_of_service(job, environment.get_current_time())
         server.set_current_job(job)
         environment.schedule_event(QueueExitEvent(
             self, server, job, exit_time))
@@ -202,13 +324,28 @@ cdef class Queue:
     cdef __serve_batch(self, list batch: List[Job], Server server, int exit_time, Environment environment):
         cdef Job job
         for job in batch:
-            self.__waiting_time_observer.notify(
-                job, self.__arrival_time_of_open_jobs[job], environment.get_current_time())
+            self.__notify_start_of_service(job, environment.get_current_time())
         #mark server as occupied
         server.set_current_job(job)
         environment.schedule_event(QueueBatchExitEvent(
             self, server, batch, exit_time))
 
+    def reset(self):
+        """
+        removes all jobs from this queue, i.e. from the waiting area, the
+        servers and the bookkeeping of open jobs, and draws the first required
+        batch size. discipline, servers, service times, batch size distribution,
+        exit and observers are kept, i.e. the queue can be simulated again
+        without creating a copy.
+        """
+        cdef Server server
+        self.set_waiting_area(self.__waiting_area.copy_empty())
+        self.__arrival_time_of_open_jobs.clear()
+        self.__nr_of_jobs_in_system = 0
+        for server in self.__servers:
+            server.set_current_job(None)
+        self.__current_required_batch_size = max(1, self.__batch_size_distribution.get_next_sample())
+
     def copy(self) -> 'Queue':
         return Queue(
             self.__arrival_process.copy(),
@@ -218,7 +355,8 @@ cdef class Queue:
             batch_size_distribution=self.__batch_size_distribution.copy(),
             waiting_time_observer=self.__waiting_time_observer.copy(),
             sojourn_time_observer=self.__sojourn_time_observer.copy(),
-            queue_length_observer=self.__queue_length_observer.copy()
+            queue_length_observer=self.__queue_length_observer.copy(),
+            observers=[observer.copy() for observer in self.__observers]
         )
 
     def copy_mean(self) -> 'Queue':
@@ -234,7 +372,8 @@ cdef class Queue:
             batch_size_distribution=DiscreteDegenerateDistribution(self.__batch_size_distribution.get_mean()),
             waiting_time_observer=self.__waiting_time_observer.copy(),
             sojourn_time_observer=self.__sojourn_time_observer.copy(),
-            queue_length_observer=self.__queue_length_observer.copy()
+            queue_length_observer=self.__queue_length_observer.copy(),
+            observers=[observer.copy() for observer in self.__observers]
         )
 
     def __repr__(self):
@@ -0,0 +1,9 @@
+from prolothar_queue_mining.model.job.job cimport Job
+
+cdef class QueueObserver:
+    #bitmask of the events this observer is notified about
+    cdef readonly int subscribed_events
+
+    cpdef notify_start_of_service(self, Job job, int arrival_time, int start_of_service_time)
+    cpdef notify_exit(self, Job job, int arrival_time, int exit_time)
+    cpdef notify_queue_length(self, int current_time, int queue_length)
\ No newline at end of file
@@ -0,0 +1,22 @@
+from prolothar_queue_mining.model.job import Job
+
+START_OF_SERVICE: int
+EXIT: int
+QUEUE_LENGTH: int
+ALL_EVENTS: int
+
+class QueueObserver:
+    """
+    observer of a queue with C-level dispatch. an observer only gets notified
+    about the events it subscribed to, i.e. a queue does not pay for events
+    nobody listens to. subclasses override the notify methods of the events
+    they subscribe to.
+    """
+    subscribed_events: int
+
+    def __init__(self, subscribed_events: int = ALL_EVENTS): ...
+    def notify_start_of_service(self, job: Job, arrival_time: int, start_of_service_time: int): ...
+    def notify_exit(self, job: Job, arrival_time: int, exit_time: int): ...
+    def notify_queue_length(self, current_time: int, queue_length: int): ...
+    def is_subscribed(self, event: int) -> bool: ...
+    def copy(self) -> 'QueueObserver': ...
\ No newline at end of file
@@ -0,0 +1,83 @@
+from copy import deepcopy
+
+from prolothar_queue_mining.model.job.job cimport Job
+
+#events a QueueObserver can subscribe to. can be combined with "|"
+START_OF_SERVICE = 1
+EXIT = 2
+QUEUE_LENGTH = 4
+ALL_EVENTS = START_OF_SERVICE | EXIT | QUEUE_LENGTH
+
+cdef class QueueObserver:
+    """
+    observer of a queue with C-level dispatch. an observer only gets notified
+    about the events it subscribed to, i.e. a queue does not pay for events
+    nobody listens to. subclasses override the notify methods of the events
+    they subscribe to.
+    """
+
+    def __init__(self, int subscribed_events = ALL_EVENTS):
+        """
+        creates a new QueueObserver
+
+        Parameters
+        ----------
+        subscribed_events : int, optional
+            combination of START_OF_SERVICE, EXIT and QUEUE_LENGTH,
+            by default ALL_EVENTS
+        """
+        if subscribed_events & ~ALL_EVENTS:
+            raise ValueError(f'unknown events in {subscribed_events}')
+        self.subscribed_events = subscribed_events
+
+    cpdef notify_start_of_service(self, Job job, int arrival_time, int start_of_service_time):
+        """
+        method to notify that serving of a job has been started
+
+        Parameters
+        ----------
+        job : Job
+            job for which serving has been started
+        arrival_time : int
+            original time of arrival for this job
+        start_of_service_time : int
+            current time at which processing has been started
+        """
+        pass
+
+    cpdef notify_exit(self, Job job, int arrival_time, int exit_time):
+        """
+        method to notify that a job has exited
+
+        Parameters
+        ----------
+        job : Job
+            job that has exited the queue
+        arrival_time : int
+            original time of arrival for this job
+        exit_time : int
+            time when the job has left the queue
+        """
+        pass
+
+    cpdef notify_queue_length(self, int current_time, int queue_length):
+        """
+        method to notify about the current length of the queue
+
+        Parameters
+        ----------
+        current_time : int
+            current time at which the length of the queue is observed
+        queue_length : int
+            current length of the queue
+        """
+        pass
+
+    def is_subscribed(self, int event) -> bool:
+        return (self.subscribed_events & event) != 0
+
+    def copy(self) -> 'QueueObserver':
+        """
+        returns a deep copy of this observer with the same state
+        """
+        return deepcopy(self)
\ No newline at end of file
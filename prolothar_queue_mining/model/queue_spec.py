@@ -0,0 +1,96 @@
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.arrival_process import ArrivalProcess, NullArrival
+from prolothar_queue_mining.model.waiting_area import WaitingArea
+from prolothar_queue_mining.model.service_time import ServiceTime
+from prolothar_queue_mining.model.distribution import DiscreteDistribution
+from prolothar_queue_mining.model.distribution import DiscreteDegenerateDistribution
+
+class QueueSpec():
+    """
+    immutable model of a queue without any simulation state, i.e. the
+    discipline (given by an empty waiting area), the service time of each of the
+    c servers and the batch size distribution. the parts of a spec are never
+    simulated directly. QueueState and create_queue() work on copies.
+    """
+
+    def __init__(
+            self, waiting_area: WaitingArea, service_times: list[ServiceTime],
+            batch_size_distribution: DiscreteDistribution = DiscreteDegenerateDistribution(1)):
+        """
+        creates a new QueueSpec
+
+        Parameters
+        ----------
+        waiting_area : WaitingArea
+            defines the discipline. waiting jobs are not part of the spec.
+        service_times : list[ServiceTime]
+            service time of each server. the number of servers is the length
+            of this list.
+        batch_size_distribution : DiscreteDistribution, optional
+            distribution of the number of jobs that are served together,
+            by default DiscreteDegenerateDistribution(1)
+        """
+        if not service_times:
+            raise ValueError('a queue needs at least one server')
+        self.__waiting_area = waiting_area.copy_empty()
+        self.__service_times = tuple(service_times)
+        self.__batch_size_distribution = batch_size_distribution
+
+    @staticmethod
+    def from_queue(queue: Queue) -> 'QueueSpec':
+        """
+        creates the spec of the given queue. the state of the queue, e.g.
+        waiting jobs, exit or observers, is not part of the spec.
+        """
+        return QueueSpec(
+            queue.get_waiting_area(),
+            [server.get_service_time_definition() for server in queue.get_servers()],
+            batch_size_distribution=queue.get_batch_size_distribution())
+
+    def get_waiting_area(self) -> WaitingArea:
+        return self.__waiting_area
+
+    def get_service_times(self) -> tuple[ServiceTime, ...]:
+        return self.__service_times
+
+    def get_nr_of_servers(self) -> int:
+        return len(self.__service_times)
+
+    def get_batch_size_distribution(self) -> DiscreteDistribution:
+        return self.__batch_size_distribution
+
+    def is_deterministic(self) -> bool:
+        """
+        returns True if all service times and the batch size distribution are
+        deterministic, i.e. a single simulation run suffices for a prediction
+        """
+        return (all(service_time.is_deterministic() for service_time in self.__service_times)
+                and self.__batch_size_distribution.is_deterministic())
+
+    def create_queue(self, arrival_process: ArrivalProcess = None) -> Queue:
+        """
+        creates a new queue with copies of the parts of this spec
+        """
+        return Queue(
+            NullArrival() if arrival_process is None else arrival_process,
+            [Server(service_time.copy()) for service_time in self.__service_times],
+            waiting_area=self.__waiting_area.copy_empty(),
+            batch_size_distribution=self.__batch_size_distribution.copy())
+
+    def copy_mean(self) -> 'QueueSpec':
+        """
+        creates a spec where all stochastic behavior, i.e. service times and
+        batch sizes, is set to its mean
+        """
+        return QueueSpec(
+            self.__waiting_area,
+            [service_time.copy_mean() for service_time in self.__service_times],
+            batch_size_distribution=DiscreteDegenerateDistribution(
+                self.__batch_size_distribution.get_mean()))
+
+    def __repr__(self) -> str:
+        return (f'QueueSpec({self.__waiting_area.get_discipline_name()}, '
+                f'c={len(self.__service_times)}, '
+                f'service_times={list(self.__service_times)}, '
+                f'batch_size={self.__batch_size_distribution})')
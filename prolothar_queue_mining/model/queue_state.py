@@ -0,0 +1,71 @@
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.queue_spec import QueueSpec
+from prolothar_queue_mining.model.arrival_process import ArrivalProcess
+from prolothar_queue_mining.model.exit import Exit, DoNothingExit
+from prolothar_queue_mining.model.observer.waiting_time import WaitingTimeObserver
+from prolothar_queue_mining.model.observer.waiting_time import NullWaitingTimeObserver
+
+class QueueState():
+    """
+    mutable simulation state of a QueueSpec. the queue with private copies of
+    the parts of the spec is created once and reset in place before each
+    simulation run, i.e. repeated runs (replications) do not need to copy the
+    queue model.
+    """
+
+    def __init__(self, spec: QueueSpec):
+        """
+        creates a new QueueState
+
+        Parameters
+        ----------
+        spec : QueueSpec
+            the model of the simulated queue
+        """
+        self.__spec = spec
+        self.__queue = spec.create_queue()
+
+    def get_spec(self) -> QueueSpec:
+        return self.__spec
+
+    def get_queue(self) -> Queue:
+        """
+        returns the simulated queue. it is only valid until the next reset.
+        """
+        return self.__queue
+
+    def reset(
+            self, arrival_process: ArrivalProcess = None,
+            exit_point: Exit = None,
+            waiting_time_observer: WaitingTimeObserver = None,
+            seed: int|None = None) -> Queue:
+        """
+        removes all jobs from the queue and prepares it for the next simulation run
+
+        Parameters
+        ----------
+        arrival_process : ArrivalProcess, optional
+            arrival process of the next run, by default no jobs arrive
+        exit_point : Exit, optional
+            exit of the next run, by default DoNothingExit
+        waiting_time_observer : WaitingTimeObserver, optional
+            waiting time observer of the next run, by default NullWaitingTimeObserver
+        seed : int | None, optional
+            if not None, the random generators of the queue are reseeded.
+            otherwise, the next run continues the random streams of the previous
+            run. by default None.
+
+        Returns
+        -------
+        Queue
+            the queue ready for simulation
+        """
+        queue = self.__queue
+        queue.set_arrival_process(arrival_process)
+        queue.set_exit(DoNothingExit() if exit_point is None else exit_point)
+        queue.set_waiting_time_observer(
+            NullWaitingTimeObserver() if waiting_time_observer is None else waiting_time_observer)
+        if seed is not None:
+            queue.set_seed(seed)
+        queue.reset()
+        return queue
@@ -1,9 +1,27 @@
-from prolothar_queue_mining.model.service_time.service_time import ServiceTime
-from prolothar_queue_mining.model.service_time.fixed_service_time import FixedServiceTime
-from prolothar_queue_mining.model.service_time.exponential_distributed_service_time import ExponentialDistributedServiceTime
-from prolothar_queue_mining.model.service_time.oracle_service_time import OracleServiceTime
-from prolothar_queue_mining.model.service_time.oracle_service_time_count_negative import OracleServiceTimeCountNegative
-from prolothar_queue_mining.model.service_time.service_time_with_distribution import ServiceTimeWithDistribution
-from prolothar_queue_mining.model.service_time.service_time_with_regressor import ServiceTimeWithRegressor
-from prolothar_queue_mining.model.service_time.load_dependent_service_time import LoadDependentServiceTime
-from prolothar_queue_mining.model.service_time.service_time_with_offset import ServiceTimeWithOffset
\ No newline at end of file
+from prolothar_queue_mining.lazy_import import create_lazy_module_attributes
+
+__all__ = [
+    'ServiceTime',
+    'FixedServiceTime',
+    'ExponentialDistributedServiceTime',
+    'OracleServiceTime',
+    'OracleServiceTimeCountNegative',
+    'ServiceTimeWithDistribution',
+    'ServiceTimeWithRegressor',
+    'LoadDependentServiceTime',
+    'ServiceTimeWithOffset',
+    'CommonRandomNumbersServiceTime',
+]
+
+__getattr__, __dir__ = create_lazy_module_attributes(__name__, {
+    'ServiceTime': 'prolothar_queue_mining.model.service_time.service_time',
+    'FixedServiceTime': 'prolothar_queue_mining.model.service_time.fixed_service_time',
+    'ExponentialDistributedServiceTime': 'prolothar_queue_mining.model.service_time.exponential_distributed_service_time',
+    'OracleServiceTime': 'prolothar_queue_mining.model.service_time.oracle_service_time',
+    'OracleServiceTimeCountNegative': 'prolothar_queue_mining.model.service_time.oracle_service_time_count_negative',
+    'ServiceTimeWithDistribution': 'prolothar_queue_mining.model.service_time.service_time_with_distribution',
+    'ServiceTimeWithRegressor': 'prolothar_queue_mining.model.service_time.service_time_with_regressor',
+    'LoadDependentServiceTime': 'prolothar_queue_mining.model.service_time.load_dependent_service_time',
+    'ServiceTimeWithOffset': 'prolothar_queue_mining.model.service_time.service_time_with_offset',
+    'CommonRandomNumbersServiceTime': 'prolothar_queue_mining.model.service_time.common_random_numbers_service_time',
+})
\ No newline at end of file
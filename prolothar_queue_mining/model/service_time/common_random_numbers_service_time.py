@@ -0,0 +1,173 @@
+from hashlib import blake2b
+
+import numpy as np
+
+from prolothar_queue_mining.model.service_time.service_time import ServiceTime
+from prolothar_queue_mining.model.service_time.service_time_with_distribution import ServiceTimeWithDistribution
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.distribution import Distribution
+from prolothar_queue_mining.model.distribution import DenseTable
+
+_MASK_64 = 2**64 - 1
+#queue seeds that only differ in this bit use antithetic random numbers u and 1-u
+ANTITHETIC_BIT = 2**32
+#the CDF is not searched beyond this value, because it might never reach 1
+#due to rounding errors
+_MAX_CDF = 1 - 1e-12
+#the CDF is tabulated for service times below this value. larger service
+#times are found by a search on the CDF without table.
+_MAX_TABULATED_SERVICE_TIME = 2**16
+#number of points per step of the search beyond the table
+_NR_OF_SEARCH_POINTS = 64
+
+class CommonRandomNumbersServiceTime(ServiceTimeWithDistribution):
+    """
+    a service time that follows a distribution, where each job has its own
+    reproducible random number (common random numbers). the service time of
+    a job only depends on the job id, the seed of this service time and the
+    seed of the queue (see ServiceTime.set_queue_seed), but not on the server
+    or the order of service. if two queue models (e.g. with a different number
+    of servers or a different discipline) are simulated with the same seeds,
+    each job gets the same service time in both models. this reduces the
+    variance of the estimated difference between the two models.
+
+    the service time is computed by inversion of the CDF of the distribution
+    rounded to non-negative integers. the CDF is tabulated in blocks for small
+    service times and searched without table beyond. queue seeds s and s ^ ANTITHETIC_BIT use
+    the antithetic random numbers u and 1-u (see antithetic_variates of
+    QueueDepartureTimePredictor).
+    """
+
+    def __init__(self, distribution: Distribution, seed: int = 0):
+        """
+        creates a new CommonRandomNumbersServiceTime
+
+        Parameters
+        ----------
+        distribution : Distribution
+            distribution of the service time
+        seed : int, optional
+            seed of the random numbers, which must be the same for all compared
+            queue models. by default 0.
+        """
+        super().__init__(distribution)
+        self.__seed = seed
+        self.__queue_seed = 0
+        #the value at k is the probability that the service time is at most k
+        self.__cdf_table = DenseTable(
+            _compute_cdf_values, distribution, max_size=_MAX_TABULATED_SERVICE_TIME)
+
+    def get_service_time(self, job: Job, nr_of_jobs_in_system: int) -> int:
+        return self.__compute_quantile(self.__get_random_number(job))
+
+    def get_batch_service_time(self, batch: list[Job], nr_of_jobs_in_system: int) -> int:
+        #the first job of the batch determines the random number
+        return self.__compute_quantile(self.__get_random_number(batch[0]))
+
+    def set_queue_seed(self, seed: int|None):
+        self.__queue_seed = 0 if seed is None else seed
+
+    def get_seed(self) -> int:
+        return self.__seed
+
+    def __get_random_number(self, job: Job) -> float:
+        """
+        returns a uniformly distributed random number in (0,1) for the given job
+        """
+        #blake2b instead of hash() to get the same number in all processes.
+        #64 bits make collisions of job ids unlikely also for millions of jobs
+        random_bits = _mix(_mix(_mix(self.__seed) ^ (self.__queue_seed & ~ANTITHETIC_BIT))
+                           ^ int.from_bytes(
+                               blake2b(job.job_id.encode(), digest_size=8).digest(), 'little'))
+        random_number = ((random_bits >> 11) + 0.5) / 2**53
+        if self.__queue_seed & ANTITHETIC_BIT:
+            return 1 - random_number
+        return random_number
+
+    def __compute_quantile(self, random_number: float) -> int:
+        """
+        returns the smallest service time whose CDF is at least random_number
+        """
+        random_number = min(random_number, _MAX_CDF)
+        cdf_table = self.__cdf_table
+        #galloping search for an upper bound in 0, 1, 3, 7, ... grows the
+        #table at most to twice the required size
+        upper_bound = 0
+        while True:
+            cdf = cdf_table.lookup(upper_bound)
+            if cdf is None:
+                return self.__compute_quantile_beyond_table(random_number, upper_bound // 2)
+            if cdf >= random_number:
+                break
+            upper_bound = 2 * upper_bound + 1
+        #cdf(lower_bound) < random_number <= cdf(upper_bound)
+        lower_bound = upper_bound // 2
+        if upper_bound == 0:
+            return 0
+        while upper_bound - lower_bound > 1:
+            middle = (lower_bound + upper_bound) // 2
+            if cdf_table.lookup(middle) < random_number:
+                lower_bound = middle
+            else:
+                upper_bound = middle
+        return upper_bound
+
+    def __compute_quantile_beyond_table(self, random_number: float, lower_bound: int) -> int:
+        """
+        returns the smallest service time larger than lower_bound whose CDF is
+        at least random_number. the search evaluates the CDF at many points at
+        once and narrows the interval by a factor of _NR_OF_SEARCH_POINTS in
+        each step.
+        """
+        distribution = self.get_distribution()
+        #exponentially growing candidates for the upper bound. floats represent
+        #all integers up to 2**53 exactly.
+        candidates = lower_bound + 2**np.arange(52, dtype=np.int64)
+        position = _search_cdf(distribution, candidates, random_number)
+        if position == len(candidates):
+            return int(candidates[-1])
+        if position > 0:
+            lower_bound = int(candidates[position - 1])
+        upper_bound = int(candidates[position])
+        while upper_bound - lower_bound > 1:
+            candidates = np.unique(np.linspace(
+                lower_bound + 1, upper_bound, num=_NR_OF_SEARCH_POINTS).astype(np.int64))
+            position = min(_search_cdf(distribution, candidates, random_number), len(candidates) - 1)
+            if position > 0:
+                lower_bound = int(candidates[position - 1])
+            upper_bound = int(candidates[position])
+        return upper_bound
+
+    def copy(self) -> ServiceTime:
+        copy = CommonRandomNumbersServiceTime(self.get_distribution(), seed=self.__seed)
+        copy.__cdf_table = self.__cdf_table
+        return copy
+
+    def __repr__(self):
+        return f'CommonRandomNumbersServiceTime({self.get_distribution()}, seed={self.__seed})'
+
+def _mix(value: int) -> int:
+    """
+    the finalizer of the splitmix64 random generator, which maps an integer
+    to a well distributed 64 bit integer
+    """
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+def _compute_cdf_values(service_times: np.ndarray, distribution: Distribution) -> np.ndarray:
+    """
+    computes the probability that the service time is at most the given value
+    for an array of non-negative integers
+    """
+    #same as max(0, round(sample)) in ServiceTimeWithDistribution
+    return distribution.compute_cdf_values(service_times + 0.5)
+
+def _search_cdf(distribution: Distribution, service_times: np.ndarray, random_number: float) -> int:
+    """
+    returns the position of the first service time in the sorted array whose
+    CDF is at least random_number or the length of the array if there is none
+    """
+    return int(np.searchsorted(
+        _compute_cdf_values(service_times, distribution), random_number, side='left'))
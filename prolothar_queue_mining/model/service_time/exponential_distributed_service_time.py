@@ -1,5 +1,4 @@
 from numpy.random import default_rng
-import scipy.stats as stats
 
 from prolothar_queue_mining.model.service_time.service_time import ServiceTime
 from prolothar_queue_mining.model.job import Job
@@ -30,6 +29,8 @@ class ExponentialDistributedServiceTime(ServiceTime):
         return self.compute_max_probability(x)
 
     def compute_max_probability(self, x: int) -> float:
+        #scipy.stats is slow to import and not needed for simulation
+        import scipy.stats as stats
         return stats.expon.cdf(x + 0.5, 0, self.__scale) - stats.expon.cdf(x - 0.5, 0, self.__scale)
 
     def __repr__(self):
@@ -1,9 +1,15 @@
-from methodtools import lru_cache
+from bisect import bisect_left
+
+import numpy as np
 
 from prolothar_common.mdl_utils import L_N
 
 from prolothar_queue_mining.model.service_time.service_time import ServiceTime
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.distribution.dense_table import DenseTable
+
+#the sub model is tabulated up to this number of jobs in the system
+_MAX_TABULATED_LOAD = 2**16
 
 class LoadDependentServiceTime(ServiceTime):
     """
@@ -41,13 +47,21 @@ class LoadDependentServiceTime(ServiceTime):
             raise ValueError('load_threshold_list must be sorted')
         self.__sub_service_time_list = sub_service_time_list
         self.__load_threshold_list = load_threshold_list
+        #the i-th entry is the sub model for i jobs in the system
+        self.__sub_model_per_load = [
+            sub_service_time_list[bisect_left(load_threshold_list, nr_of_jobs_in_system)]
+            for nr_of_jobs_in_system in range(
+                min(load_threshold_list[-1] + 1, _MAX_TABULATED_LOAD))
+        ]
+        self.__max_probability_table = DenseTable(
+            _compute_max_probability_values, sub_service_time_list)
 
-    @lru_cache()
     def __get_current_sub_model(self, nr_of_jobs_in_system: int) -> ServiceTime:
-        for load_threshold, service_time in zip(self.__load_threshold_list, self.__sub_service_time_list):
-            if nr_of_jobs_in_system <= load_threshold:
-                return service_time
-        return self.__sub_service_time_list[-1]
+        try:
+            return self.__sub_model_per_load[nr_of_jobs_in_system]
+        except IndexError:
+            return self.__sub_service_time_list[
+                bisect_left(self.__load_threshold_list, nr_of_jobs_in_system)]
 
     def get_service_time(self, job: Job, nr_of_jobs_in_system: int) -> int:
         return self.__get_current_sub_model(
@@ -74,9 +88,11 @@ class LoadDependentServiceTime(ServiceTime):
             nr_of_jobs_in_system
         ).compute_probability(x, job, nr_of_jobs_in_system)
 
-    @lru_cache()
     def compute_max_probability(self, x: int) -> float:
-        return max(s.compute_max_probability(x) for s in  self.__sub_service_time_list)
+        max_probability = self.__max_probability_table.lookup(x)
+        if max_probability is None:
+            return max(s.compute_max_probability(x) for s in  self.__sub_service_time_list)
+        return max_probability
 
     def copy(self) -> ServiceTime:
         #for effciency reasons (we want to have maximale usage of caches)
@@ -106,6 +122,10 @@ class LoadDependentServiceTime(ServiceTime):
         for submodel in self.__sub_service_time_list:
             submodel.set_seed(seed)
 
+    def set_queue_seed(self, seed: int|None):
+        for submodel in self.__sub_service_time_list:
+            submodel.set_queue_seed(seed)
+
     def is_deterministic(self) -> bool:
         return all(submodel.is_deterministic() for submodel in self.__sub_service_time_list)
 
@@ -114,3 +134,10 @@ class LoadDependentServiceTime(ServiceTime):
 
     def __repr__(self):
         return f'LoadDependentServiceTime({self.__sub_service_time_list}, {self.__load_threshold_list})'
+
+def _compute_max_probability_values(
+        x: np.ndarray, sub_service_time_list: list[ServiceTime]) -> np.ndarray:
+    return np.array([
+        max(s.compute_max_probability(value) for s in sub_service_time_list)
+        for value in x.tolist()
+    ], dtype=float)
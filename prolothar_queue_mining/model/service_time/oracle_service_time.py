@@ -1,13 +1,14 @@
 from prolothar_queue_mining.model.environment import Environment
 from prolothar_queue_mining.model.service_time.service_time import ServiceTime
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobArray
 
 class OracleServiceTime(ServiceTime):
     """
     computes the service time from a already known exit time
     """
 
-    def __init__(self, environment: Environment, exit_time_per_job: dict[Job, int]):
+    def __init__(self, environment: Environment, exit_time_per_job: dict[Job, int]|JobArray):
         """
         creates and intializes this OracleServiceTime instance
 
@@ -15,7 +16,7 @@ class OracleServiceTime(ServiceTime):
         ----------
         environment : Environment
             used to get the current time
-        exit_time_per_job : dict[Job, float]
+        exit_time_per_job : dict[Job, float]|JobArray
             used to get the exit time of a job. the service time is computed
             by the difference of exit time and current time
         """
@@ -41,7 +42,7 @@ class OracleServiceTime(ServiceTime):
         return 1
 
     def copy(self) -> ServiceTime:
-        return OracleServiceTime(self.__environment, dict(self.__exit_time_per_job))
+        return OracleServiceTime(self.__environment, self.__exit_time_per_job.copy())
 
     def set_seed(self, seed: int):
         #no randomness included
@@ -1,6 +1,7 @@
 from prolothar_queue_mining.model.environment import Environment
 from prolothar_queue_mining.model.service_time.service_time import ServiceTime
 from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobArray
 
 class OracleServiceTimeCountNegative(ServiceTime):
     """
@@ -9,7 +10,7 @@ class OracleServiceTimeCountNegative(ServiceTime):
     servers in the queue.
     """
 
-    def __init__(self, environment: Environment, exit_time_per_job: dict[Job, int]):
+    def __init__(self, environment: Environment, exit_time_per_job: dict[Job, int]|JobArray):
         """
         creates and intializes this OracleServiceTimeCountNegative instance
 
@@ -17,7 +18,7 @@ class OracleServiceTimeCountNegative(ServiceTime):
         ----------
         environment : Environment
             used to get the current time
-        exit_time_per_job : dict[Job, float]
+        exit_time_per_job : dict[Job, float]|JobArray
             used to get the exit time of a job. the service time is computed
             by the difference of exit time and current time
         """
@@ -58,7 +59,7 @@ class OracleServiceTimeCountNegative(ServiceTime):
         return 1
 
     def copy(self) -> ServiceTime:
-        return OracleServiceTimeCountNegative(self.__environment, dict(self.__exit_time_per_job))
+        return OracleServiceTimeCountNegative(self.__environment, self.__exit_time_per_job.copy())
 
     def set_seed(self, seed: int):
         #no randomness included
@@ -50,6 +50,13 @@ class ServiceTime(ABC):
         sets the seed for any random number generator used by this service time object
         """
 
+    def set_queue_seed(self, seed: int|None):
+        """
+        called by Queue.set_seed with the seed of the queue. in contrast to
+        set_seed, which gets a different seed for each server, this seed is the
+        same for all servers of the queue. by default, this does nothing.
+        """
+
     @abstractmethod
     def is_deterministic(self) -> bool:
         """
@@ -36,6 +36,9 @@ class ServiceTimeWithOffset(ServiceTime):
     def set_seed(self, seed: int):
         self.__service_time.set_seed(seed)
 
+    def set_queue_seed(self, seed: int|None):
+        self.__service_time.set_queue_seed(seed)
+
     def is_deterministic(self) -> bool:
         return self.__service_time.is_deterministic()
 
@@ -0,0 +1,169 @@
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.queue_spec import QueueSpec
+from prolothar_queue_mining.model.service_time import ServiceTimeWithDistribution
+
+#service times that do not fit into a C int are replaced by this value (see Server)
+_MAX_SERVICE_TIME = 2**31 - 1
+_OVERFLOW_SERVICE_TIME = 1_000_000
+
+class VectorizedQueueSimulation():
+    """
+    simulates many replications of a queue with fixed arrivals in lockstep on
+    NumPy arrays instead of running the event loop once per replication. in each
+    step, every replication starts the service of one job: the server that
+    becomes free first takes the waiting job with the smallest static serve key
+    (see WaitingArea.get_static_serve_keys), or the next arriving job if no job
+    is waiting. service times are sampled in blocks for all replications.
+
+    this is equivalent to the event based simulation of Queue if
+    - there is no batching
+    - all servers have a ServiceTimeWithDistribution with the same distribution
+    - the waiting area provides static serve keys, e.g. FCFS, LCFS and priority
+      classes with FCFS or LCFS sub-waiting areas
+    - the arrival times are sorted
+    use create() to check these conditions.
+    """
+
+    def __init__(
+            self, spec: QueueSpec, arrival_times: np.ndarray,
+            serve_keys: np.ndarray|None = None, max_block_size: int = 2**20):
+        """
+        creates a new VectorizedQueueSimulation. create() should be preferred.
+
+        Parameters
+        ----------
+        spec : QueueSpec
+            model of the simulated queue. must be supported, see create()
+        arrival_times : np.ndarray
+            sorted arrival time of each job
+        serve_keys : np.ndarray | None, optional
+            static serve key of each job. None means that jobs are served in
+            order of arrival (FCFS), which is simulated without comparing keys.
+            by default None.
+        max_block_size : int, optional
+            maximal number of service times that are sampled at once, by default 2**20
+        """
+        self.__distribution = spec.get_service_times()[0].get_distribution()
+        self.__nr_of_servers = spec.get_nr_of_servers()
+        self.__arrival_times = np.asarray(arrival_times, dtype=np.int64)
+        self.__serve_keys = serve_keys
+        self.__max_block_size = max_block_size
+
+    @staticmethod
+    def create(
+            spec: QueueSpec, arrivals: list[tuple[Job, int]]) -> 'VectorizedQueueSimulation|None':
+        """
+        creates a VectorizedQueueSimulation for the given queue and arrivals or
+        returns None if the simulation of this queue cannot be vectorized
+        """
+        batch_size_distribution = spec.get_batch_size_distribution()
+        if batch_size_distribution.get_mean() > 1 or batch_size_distribution.get_variance() > 0:
+            return None
+        service_times = spec.get_service_times()
+        #subclasses like CommonRandomNumbersServiceTime sample differently
+        if not all(type(service_time) is ServiceTimeWithDistribution
+                   for service_time in service_times):
+            return None
+        distribution = service_times[0].get_distribution()
+        if any(service_time.get_distribution() != distribution for service_time in service_times):
+            return None
+        arrival_times = np.array([arrival_time for _, arrival_time in arrivals], dtype=np.int64)
+        if np.any(arrival_times[1:] < arrival_times[:-1]):
+            return None
+        waiting_area = spec.get_waiting_area()
+        serve_keys = waiting_area.get_static_serve_keys(
+            [job for job, _ in arrivals], arrival_times)
+        if serve_keys is None:
+            return None
+        if np.all(serve_keys[1:] > serve_keys[:-1]):
+            #the first waiting job is always served next, e.g. FCFS
+            serve_keys = None
+        return VectorizedQueueSimulation(spec, arrival_times, serve_keys=serve_keys)
+
+    def run(self, nr_of_replications: int, seed: int|None = None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        runs the given number of replications
+
+        Parameters
+        ----------
+        nr_of_replications : int
+            number of independent replications
+        seed : int | None, optional
+            seed for the service times, by default None
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            start of service times and exit times with shape
+            (nr_of_replications, number of jobs)
+        """
+        distribution = self.__distribution.copy()
+        distribution.set_seed(seed)
+        arrival_times = self.__arrival_times
+        nr_of_jobs = len(arrival_times)
+        start_times = np.empty((nr_of_replications, nr_of_jobs), dtype=np.int64)
+        exit_times = np.empty((nr_of_replications, nr_of_jobs), dtype=np.int64)
+        if nr_of_jobs == 0:
+            return start_times, exit_times
+        replications = np.arange(nr_of_replications)
+        free_times = np.full(
+            (nr_of_replications, self.__nr_of_servers), arrival_times[0], dtype=np.int64)
+        #smallest index of the jobs that have not been served yet
+        first_waiting_job = np.zeros(nr_of_replications, dtype=np.int64)
+        if self.__serve_keys is not None:
+            #the last column is a sentinel for first_waiting_job
+            is_served = np.zeros((nr_of_replications, nr_of_jobs + 1), dtype=bool)
+        block_size = max(1, min(nr_of_jobs, self.__max_block_size // nr_of_replications))
+        for step in range(nr_of_jobs):
+            if step % block_size == 0:
+                service_times = self.__sample_service_times(
+                    distribution, nr_of_replications, min(block_size, nr_of_jobs - step))
+            server = free_times.argmin(axis=1)
+            start_time = np.maximum(
+                free_times[replications, server], arrival_times[first_waiting_job])
+            if self.__serve_keys is None:
+                job = first_waiting_job
+                first_waiting_job = first_waiting_job + 1
+            else:
+                job, first_waiting_job = self.__select_jobs(
+                    start_time, first_waiting_job, is_served, replications)
+            exit_time = start_time + service_times[:, step % block_size]
+            start_times[replications, job] = start_time
+            exit_times[replications, job] = exit_time
+            free_times[replications, server] = exit_time
+        return start_times, exit_times
+
+    def __select_jobs(
+            self, start_time: np.ndarray, first_waiting_job: np.ndarray,
+            is_served: np.ndarray, replications: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        selects the waiting job with the smallest serve key in each replication.
+        only the window of jobs between the first waiting job and the last
+        arrived job over all replications is considered.
+        """
+        end_of_arrived_jobs = np.searchsorted(self.__arrival_times, start_time, side='right')
+        window_start = first_waiting_job.min()
+        window_end = end_of_arrived_jobs.max()
+        is_not_waiting = (
+            is_served[:, window_start:window_end]
+            | (np.arange(window_start, window_end) >= end_of_arrived_jobs[:, None]))
+        keys = np.where(
+            is_not_waiting, np.iinfo(np.int64).max,
+            self.__serve_keys[window_start:window_end])
+        job = window_start + keys.argmin(axis=1)
+        is_served[replications, job] = True
+        #jobs after window_end have not been served, i.e. there is an unserved
+        #job in the window or the sentinel
+        first_waiting_job = window_start + is_served[:, window_start:window_end + 1].argmin(axis=1)
+        return job, first_waiting_job
+
+    def __sample_service_times(
+            self, distribution, nr_of_replications: int, nr_of_steps: int) -> np.ndarray:
+        samples = distribution.get_next_samples(
+            nr_of_replications * nr_of_steps).reshape(nr_of_replications, nr_of_steps)
+        #same as max(0, round(sample)) in ServiceTimeWithDistribution
+        service_times = np.maximum(0, np.rint(samples))
+        service_times[service_times > _MAX_SERVICE_TIME] = _OVERFLOW_SERVICE_TIME
+        return service_times.astype(np.int64)
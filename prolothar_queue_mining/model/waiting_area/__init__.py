@@ -1,11 +1,43 @@
-from prolothar_queue_mining.model.waiting_area.waiting_area import WaitingArea
-from prolothar_queue_mining.model.waiting_area.fcfs import FirstComeFirstServeWaitingArea
-from prolothar_queue_mining.model.waiting_area.fast_fcfs import FastFirstComeFirstServeWaitingArea
-from prolothar_queue_mining.model.waiting_area.fast_lcfs import FastLastComeFirstServeWaitingArea
-from prolothar_queue_mining.model.waiting_area.lcfs import LastComeFirstServeWaitingArea
-from prolothar_queue_mining.model.waiting_area.priority_class import PriorityClassWaitingArea
-from prolothar_queue_mining.model.waiting_area.pairwise_priority_classifier import PairwisePriorityClassifierWaitingArea
-from prolothar_queue_mining.model.waiting_area.departure_scheduled import DepartureScheduledWaitingArea
-from prolothar_queue_mining.model.waiting_area.regressor import RegressorWaitingArea
-from prolothar_queue_mining.model.waiting_area.random_order import RandomOrderWaitingArea
-from prolothar_queue_mining.model.waiting_area.flifo import FlifoWaitingArea
\ No newline at end of file
+from prolothar_queue_mining.lazy_import import create_lazy_module_attributes
+
+__all__ = [
+    'WaitingArea',
+    'FirstComeFirstServeWaitingArea',
+    'FastFirstComeFirstServeWaitingArea',
+    'FastLastComeFirstServeWaitingArea',
+    'LastComeFirstServeWaitingArea',
+    'PriorityClassWaitingArea',
+    'PairwisePriorityClassifierWaitingArea',
+    'VectorizedPairwisePriorityClassifierWaitingArea',
+    'DepartureScheduledWaitingArea',
+    'RegressorWaitingArea',
+    'RandomOrderWaitingArea',
+    'FlifoWaitingArea',
+    'TypedWaitingArea',
+    'TypedFirstComeFirstServeWaitingArea',
+    'TypedLastComeFirstServeWaitingArea',
+    'TypedFlifoWaitingArea',
+    'TypedPriorityClassWaitingArea',
+    'TypedPriorityQueue',
+]
+
+__getattr__, __dir__ = create_lazy_module_attributes(__name__, {
+    'WaitingArea': 'prolothar_queue_mining.model.waiting_area.waiting_area',
+    'FirstComeFirstServeWaitingArea': 'prolothar_queue_mining.model.waiting_area.fcfs',
+    'FastFirstComeFirstServeWaitingArea': 'prolothar_queue_mining.model.waiting_area.fast_fcfs',
+    'FastLastComeFirstServeWaitingArea': 'prolothar_queue_mining.model.waiting_area.fast_lcfs',
+    'LastComeFirstServeWaitingArea': 'prolothar_queue_mining.model.waiting_area.lcfs',
+    'PriorityClassWaitingArea': 'prolothar_queue_mining.model.waiting_area.priority_class',
+    'PairwisePriorityClassifierWaitingArea': 'prolothar_queue_mining.model.waiting_area.pairwise_priority_classifier',
+    'VectorizedPairwisePriorityClassifierWaitingArea': 'prolothar_queue_mining.model.waiting_area.vectorized_pairwise_priority_classifier',
+    'DepartureScheduledWaitingArea': 'prolothar_queue_mining.model.waiting_area.departure_scheduled',
+    'RegressorWaitingArea': 'prolothar_queue_mining.model.waiting_area.regressor',
+    'RandomOrderWaitingArea': 'prolothar_queue_mining.model.waiting_area.random_order',
+    'FlifoWaitingArea': 'prolothar_queue_mining.model.waiting_area.flifo',
+    'TypedWaitingArea': 'prolothar_queue_mining.model.waiting_area.typed_waiting_area',
+    'TypedFirstComeFirstServeWaitingArea': 'prolothar_queue_mining.model.waiting_area.typed_waiting_area',
+    'TypedLastComeFirstServeWaitingArea': 'prolothar_queue_mining.model.waiting_area.typed_waiting_area',
+    'TypedFlifoWaitingArea': 'prolothar_queue_mining.model.waiting_area.typed_waiting_area',
+    'TypedPriorityClassWaitingArea': 'prolothar_queue_mining.model.waiting_area.typed_waiting_area',
+    'TypedPriorityQueue': 'prolothar_queue_mining.model.waiting_area.typed_waiting_area',
+})
\ No newline at end of file
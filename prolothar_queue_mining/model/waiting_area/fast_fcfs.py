@@ -1,6 +1,8 @@
 from typing import Iterator
 from collections import deque
 
+import numpy as np
+
 from prolothar_queue_mining.model.waiting_area.waiting_area import WaitingArea
 from prolothar_queue_mining.model.job import Job
 
@@ -46,6 +48,9 @@ class FastFirstComeFirstServeWaitingArea(WaitingArea):
     def any_order_iterator(self) -> Iterator[Job]:
         return iter(self.__queue)
 
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times: np.ndarray) -> np.ndarray|None:
+        return np.arange(len(jobs), dtype=np.int64)
+
     def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time: int):
         return exit_time
 
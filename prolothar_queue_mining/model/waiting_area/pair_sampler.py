@@ -0,0 +1,103 @@
+from abc import ABC, abstractmethod
+import numpy as np
+
+class PairSampler(ABC):
+    """
+    interface of a sampler that selects which pairs of (served job, waiting job)
+    are used as training relations for a pairwise priority classifier. without
+    sampling, the number of training relations is quadratic in the queue length.
+    """
+
+    @abstractmethod
+    def sample(self, differences_in_arrival_time: np.ndarray) -> np.ndarray:
+        """
+        selects a subset of the pairs at one departure
+
+        Parameters
+        ----------
+        differences_in_arrival_time : np.ndarray
+            for each job that is still waiting when a job is served: arrival
+            time of the served job - arrival time of the waiting job
+
+        Returns
+        -------
+        np.ndarray
+            sorted positions of the selected pairs
+        """
+
+class UniformPairSampler(PairSampler):
+    """
+    selects at most a fixed number of pairs per departure uniformly at random
+    """
+
+    def __init__(self, max_nr_of_pairs_per_departure: int, seed: int = None):
+        """
+        Parameters
+        ----------
+        max_nr_of_pairs_per_departure : int
+            budget of pairs for each served job
+        seed : int, optional
+            random seed for the selection, by default None
+        """
+        if max_nr_of_pairs_per_departure < 1:
+            raise ValueError(
+                f'max_nr_of_pairs_per_departure must be positive, '
+                f'but was {max_nr_of_pairs_per_departure}')
+        self.__max_nr_of_pairs_per_departure = max_nr_of_pairs_per_departure
+        self.__random_generator = np.random.default_rng(seed)
+
+    def sample(self, differences_in_arrival_time: np.ndarray) -> np.ndarray:
+        nr_of_pairs = len(differences_in_arrival_time)
+        if nr_of_pairs <= self.__max_nr_of_pairs_per_departure:
+            return np.arange(nr_of_pairs)
+        return np.sort(self.__random_generator.choice(
+            nr_of_pairs, size=self.__max_nr_of_pairs_per_departure, replace=False))
+
+class StratifiedPairSampler(PairSampler):
+    """
+    selects at most a fixed number of pairs per departure. the pairs are
+    divided into strata of (nearly) equal size by the absolute difference in
+    arrival time and the budget is split evenly between the strata. this
+    keeps pairs of jobs that arrived close to each other as well as pairs of
+    jobs with a long time in between in the training data.
+    """
+
+    def __init__(
+            self, max_nr_of_pairs_per_departure: int, nr_of_strata: int = 4,
+            seed: int = None):
+        """
+        Parameters
+        ----------
+        max_nr_of_pairs_per_departure : int
+            budget of pairs for each served job
+        nr_of_strata : int, optional
+            number of strata, by default 4
+        seed : int, optional
+            random seed for the selection, by default None
+        """
+        if max_nr_of_pairs_per_departure < 1:
+            raise ValueError(
+                f'max_nr_of_pairs_per_departure must be positive, '
+                f'but was {max_nr_of_pairs_per_departure}')
+        if nr_of_strata < 1:
+            raise ValueError(f'nr_of_strata must be positive, but was {nr_of_strata}')
+        self.__max_nr_of_pairs_per_departure = max_nr_of_pairs_per_departure
+        self.__nr_of_strata = nr_of_strata
+        self.__random_generator = np.random.default_rng(seed)
+
+    def sample(self, differences_in_arrival_time: np.ndarray) -> np.ndarray:
+        nr_of_pairs = len(differences_in_arrival_time)
+        if nr_of_pairs <= self.__max_nr_of_pairs_per_departure:
+            return np.arange(nr_of_pairs)
+        strata = np.array_split(
+            np.argsort(np.abs(differences_in_arrival_time), kind='stable'),
+            self.__nr_of_strata)
+        budget_per_stratum = np.array_split(
+            np.arange(self.__max_nr_of_pairs_per_departure), self.__nr_of_strata)
+        #the strata are at least as large as their budget because there are
+        #more pairs than the total budget and array_split assigns the remainder
+        #to the first chunks in both cases
+        return np.sort(np.concatenate([
+            self.__random_generator.choice(stratum, size=len(budget), replace=False)
+            for stratum, budget in zip(strata, budget_per_stratum)
+        ]))
@@ -1,5 +1,6 @@
 from typing import Union, Iterator
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 import numpy as np
 from sklearn.base import ClassifierMixin
 
@@ -8,9 +9,55 @@ from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
 from prolothar_queue_mining.model.job.job_to_vector_transformer import Scaler
 from prolothar_queue_mining.model.job.job_to_vector_transformer import NoScaler
+from prolothar_queue_mining.model.waiting_area.pair_sampler import PairSampler
 
 TrainingRelations = list[tuple[Job, Job, int, bool]]
 
+@dataclass
+class TrainingRelationArrays:
+    """
+    columnar representation of training relations. the i-th relation states
+    whether jobs[job_a_indices[i]] was served before jobs[job_b_indices[i]]
+    (labels[i]) and how much younger job_a is than job_b
+    (differences_in_arrival_time[i])
+    """
+    jobs: list[Job]
+    job_a_indices: np.ndarray
+    job_b_indices: np.ndarray
+    differences_in_arrival_time: np.ndarray
+    labels: np.ndarray
+
+    def __len__(self):
+        return len(self.labels)
+
+    def to_training_relations(self) -> TrainingRelations:
+        jobs = self.jobs
+        return [
+            (jobs[a], jobs[b], difference, label)
+            for a, b, difference, label in zip(
+                self.job_a_indices.tolist(), self.job_b_indices.tolist(),
+                self.differences_in_arrival_time.tolist(), self.labels.tolist())
+        ]
+
+    @staticmethod
+    def from_training_relations(training_relations: TrainingRelations) -> 'TrainingRelationArrays':
+        index_per_job: dict[Job, int] = {}
+        for relation in training_relations:
+            index_per_job.setdefault(relation[0], len(index_per_job))
+            index_per_job.setdefault(relation[1], len(index_per_job))
+        nr_of_relations = len(training_relations)
+        return TrainingRelationArrays(
+            list(index_per_job),
+            np.fromiter((index_per_job[relation[0]] for relation in training_relations),
+                        dtype=np.int64, count=nr_of_relations),
+            np.fromiter((index_per_job[relation[1]] for relation in training_relations),
+                        dtype=np.int64, count=nr_of_relations),
+            np.fromiter((relation[2] for relation in training_relations),
+                        dtype=float, count=nr_of_relations),
+            np.fromiter((relation[3] for relation in training_relations),
+                        dtype=bool, count=nr_of_relations)
+        )
+
 class PairwisePriorityClassifier(ABC):
     """
     interface of a pairwise priority classifier.
@@ -42,6 +89,28 @@ class PairwisePriorityClassifier(ABC):
             their difference in arrival time and a boolean flag whether job_a
             was served before job_b
         """
+
+    def train_from_arrays(self, training_relations: TrainingRelationArrays):
+        """
+        trains the classifier with training relations in columnar form.
+        by default, the relations are converted to a list and passed to "train".
+        """
+        self.train(training_relations.to_training_relations())
+
+    def get_partial_fit_batch_size(self) -> int|None:
+        """
+        returns the number of training relations after which a waiting area
+        passes the collected relations to "partial_train" during learning.
+        None (default) if the classifier must be trained with all relations at once.
+        """
+        return None
+
+    def partial_train(self, training_relations: TrainingRelationArrays):
+        """
+        continues training of the classifier with a batch of training relations
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not support partial training')
+
 class SklearnPairwisePriorityClassifier(PairwisePriorityClassifier):
     """
     interface of a pairwise priority classifier.
@@ -49,35 +118,161 @@ class SklearnPairwisePriorityClassifier(PairwisePriorityClassifier):
     """
     def __init__(
         self, classifier: ClassifierMixin, job_to_vector_transformer: JobToVectorTransformer,
-        scaler_for_arrival_time_difference: Scaler = NoScaler()):
+        scaler_for_arrival_time_difference: Scaler = NoScaler(),
+        partial_fit_batch_size: int|None = None):
+        """
+        Parameters
+        ----------
+        classifier : ClassifierMixin
+            sklearn classifier that gets the feature vectors of two jobs and
+            their scaled difference in arrival time as input
+        job_to_vector_transformer : JobToVectorTransformer
+            creates the feature vector of a job
+        scaler_for_arrival_time_difference : Scaler, optional
+            by default NoScaler()
+        partial_fit_batch_size : int | None, optional
+            if not None, the classifier is trained with "partial_fit" on batches
+            of this many training relations instead of a single call of "fit"
+            on all relations. requires a classifier that supports "partial_fit",
+            e.g. SGDClassifier. by default None
+        """
+        if partial_fit_batch_size is not None:
+            if not hasattr(classifier, 'partial_fit'):
+                raise ValueError(f'{classifier} does not support partial_fit')
+            if partial_fit_batch_size < 1:
+                raise ValueError(
+                    f'partial_fit_batch_size must be positive, but was {partial_fit_batch_size}')
         self.__classifier = classifier
         self.__job_to_vector_transformer = job_to_vector_transformer
         self.__scaler_for_arrival_time_difference = scaler_for_arrival_time_difference
+        self.__partial_fit_batch_size = partial_fit_batch_size
 
     def should_job_a_be_served_before_job_b(
             self, job_a: Job, job_b: Job, difference_in_arrival_time: int) -> bool:
-        self.__classifier.predict(np.hstack((
+        return bool(self.__classifier.predict(np.hstack((
             self.__job_to_vector_transformer.transform(job_a),
             self.__job_to_vector_transformer.transform(job_b),
             [self.__scaler_for_arrival_time_difference.scale(difference_in_arrival_time)]
-        )).reshape(1, -1))
+        )).reshape(1, -1))[0])
 
-    def train(self, training_relations: TrainingRelations):
-        self.__classifier.fit(
-            np.vstack([
-                np.hstack([
-                    self.__job_to_vector_transformer.transform(relation[0]),
-                    self.__job_to_vector_transformer.transform(relation[1]),
-                    [self.__scaler_for_arrival_time_difference.scale(relation[2])]
-                ])
-                for relation in training_relations
-            ]),
-            np.array([
-                relation[3]
-                for relation in training_relations
-            ]).transpose()
+    def transform_job(self, job: Job) -> np.ndarray:
+        """
+        returns the feature vector of the given job as it is used by
+        should_job_be_served_before_jobs
+        """
+        return self.__job_to_vector_transformer.transform(job)
+
+    def should_job_be_served_before_jobs(
+            self, job_vector: np.ndarray, other_job_vectors: np.ndarray,
+            differences_in_arrival_time: np.ndarray) -> np.ndarray:
+        """
+        batched version of should_job_a_be_served_before_job_b that compares
+        one job against many other jobs at once. for linear classifiers, the
+        decision function is evaluated directly on the coefficients, otherwise
+        there is a single call of "predict" for all other jobs.
+
+        Parameters
+        ----------
+        job_vector : np.ndarray
+            feature vector of job_a, see transform_job
+        other_job_vectors : np.ndarray
+            matrix with one feature vector per row, see transform_job
+        differences_in_arrival_time : np.ndarray
+            arrival time of job_a - arrival time of the other jobs
+
+        Returns
+        -------
+        np.ndarray
+            boolean array that is True for each other job that job_a should
+            be served before
+        """
+        scaled_differences = self.__scaler_for_arrival_time_difference.scale(
+            np.asarray(differences_in_arrival_time, dtype=float))
+        linear_decomposition = self.__get_linear_decomposition(len(job_vector))
+        if linear_decomposition is not None:
+            weights_a, weights_b, weight_of_difference, intercept = linear_decomposition
+            return (
+                (job_vector @ weights_a + intercept)
+                + other_job_vectors @ weights_b
+                + weight_of_difference * scaled_differences
+            ) > 0
+        return self.__classifier.predict(np.hstack((
+            np.broadcast_to(job_vector, (len(other_job_vectors), len(job_vector))),
+            other_job_vectors,
+            scaled_differences.reshape(-1, 1)
+        ))).astype(bool)
+
+    def __get_linear_decomposition(self, vector_length: int):
+        """
+        returns (weights_a, weights_b, weight_of_difference, intercept) if the
+        classifier is a fitted binary linear classifier, otherwise None
+        """
+        try:
+            coefficients = self.__classifier.coef_
+            intercept = self.__classifier.intercept_
+            classes = self.__classifier.classes_
+        except AttributeError:
+            return None
+        if coefficients.shape != (1, 2 * vector_length + 1) or list(classes) != [False, True]:
+            return None
+        coefficients = coefficients[0]
+        return (
+            coefficients[:vector_length],
+            coefficients[vector_length:2*vector_length],
+            coefficients[-1],
+            float(np.ravel(intercept)[0])
         )
 
+    def train(self, training_relations: TrainingRelations):
+        self.train_from_arrays(TrainingRelationArrays.from_training_relations(training_relations))
+
+    def train_from_arrays(self, training_relations: TrainingRelationArrays):
+        if self.__partial_fit_batch_size is not None:
+            for start in range(0, len(training_relations), self.__partial_fit_batch_size):
+                end = start + self.__partial_fit_batch_size
+                self.partial_train(TrainingRelationArrays(
+                    training_relations.jobs,
+                    training_relations.job_a_indices[start:end],
+                    training_relations.job_b_indices[start:end],
+                    training_relations.differences_in_arrival_time[start:end],
+                    training_relations.labels[start:end]))
+        else:
+            self.__classifier.fit(
+                self.__create_feature_matrix(training_relations),
+                training_relations.labels)
+
+    def get_partial_fit_batch_size(self) -> int|None:
+        return self.__partial_fit_batch_size
+
+    def partial_train(self, training_relations: TrainingRelationArrays):
+        if not hasattr(self.__classifier, 'partial_fit'):
+            raise NotImplementedError(f'{self.__classifier} does not support partial_fit')
+        self.__classifier.partial_fit(
+            self.__create_feature_matrix(training_relations),
+            training_relations.labels, classes=np.array([False, True]))
+
+    def __create_feature_matrix(self, training_relations: TrainingRelationArrays) -> np.ndarray:
+        """
+        creates the input matrix for the classifier. each involved job is
+        transformed only once and the rows are copied into a preallocated matrix.
+        """
+        job_indices, inverse = np.unique(np.concatenate((
+            training_relations.job_a_indices, training_relations.job_b_indices
+        )), return_inverse=True)
+        jobs = training_relations.jobs
+        job_vectors = self.__job_to_vector_transformer.transform_many(
+            [jobs[i] for i in job_indices.tolist()])
+        nr_of_relations = len(training_relations)
+        vector_length = job_vectors.shape[1]
+        feature_matrix = np.empty((nr_of_relations, 2 * vector_length + 1), dtype=float)
+        np.take(job_vectors, inverse[:nr_of_relations], axis=0,
+                out=feature_matrix[:, :vector_length])
+        np.take(job_vectors, inverse[nr_of_relations:], axis=0,
+                out=feature_matrix[:, vector_length:2*vector_length])
+        feature_matrix[:, -1] = self.__scaler_for_arrival_time_difference.scale(
+            training_relations.differences_in_arrival_time)
+        return feature_matrix
+
     def __repr__(self):
         try:
             return f'{self.__classifier}({self.__classifier.coef_}+{self.intercept_})'
@@ -96,12 +291,33 @@ class PairwisePriorityClassifierWaitingArea(WaitingArea):
     the classifier decides for two jobs which one is higher prioritized
     """
 
-    def __init__(self, pairwise_priority_classifier: PairwisePriorityClassifier):
+    def __init__(
+            self, pairwise_priority_classifier: PairwisePriorityClassifier,
+            pair_sampler: PairSampler|None = None):
+        """
+        Parameters
+        ----------
+        pairwise_priority_classifier : PairwisePriorityClassifier
+            decides for two jobs which one is served first
+        pair_sampler : PairSampler | None, optional
+            limits the number of training relations that are created when a
+            job is served during learning. by default None, i.e. the served
+            job is paired with all waiting jobs.
+        """
         self.__head_node: Union[Node, None] = None
         self.__pairwise_priority_classifier = pairwise_priority_classifier
+        self.__pair_sampler = pair_sampler
         self.__length = 0
-        self.__jobs_for_learning: dict[str, (int, Job)] = {}
-        self.__training_relations: TrainingRelations = []
+        #jobs added for learning. the position of a job is its learning index
+        self.__jobs_for_learning: list[Job] = []
+        #learning indices and arrival times of the waiting jobs, compact in the
+        #first nr_of_waiting_jobs_for_learning entries
+        self.__waiting_job_indices = np.empty(64, dtype=np.int64)
+        self.__waiting_job_arrival_times = np.empty(64, dtype=float)
+        self.__waiting_job_ids: list[str] = []
+        self.__position_per_waiting_job_id: dict[str, int] = {}
+        self.__collected_relations: list[tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = []
+        self.__nr_of_collected_relations = 0
 
     def add_job(self, arrival_time: int, job: Job):
         """
@@ -127,7 +343,20 @@ class PairwisePriorityClassifierWaitingArea(WaitingArea):
         self.__length += 1
 
     def add_job_for_learning(self, arrival_time: int, job: Job):
-        self.__jobs_for_learning[job.job_id] = (arrival_time, job)
+        position = self.__position_per_waiting_job_id.get(job.job_id)
+        if position is None:
+            position = len(self.__waiting_job_ids)
+            if position == len(self.__waiting_job_indices):
+                self.__waiting_job_indices = np.concatenate((
+                    self.__waiting_job_indices, np.empty_like(self.__waiting_job_indices)))
+                self.__waiting_job_arrival_times = np.concatenate((
+                    self.__waiting_job_arrival_times,
+                    np.empty_like(self.__waiting_job_arrival_times)))
+            self.__waiting_job_ids.append(job.job_id)
+            self.__position_per_waiting_job_id[job.job_id] = position
+        self.__waiting_job_indices[position] = len(self.__jobs_for_learning)
+        self.__waiting_job_arrival_times[position] = arrival_time
+        self.__jobs_for_learning.append(job)
 
     def has_next_job(self) -> bool:
         """
@@ -148,18 +377,77 @@ class PairwisePriorityClassifierWaitingArea(WaitingArea):
 
     def pop_next_job_for_learning(self, job_id: str):
         #arrival might not have been observed
-        if job_id in self.__jobs_for_learning:
-            arrival_time, job = self.__jobs_for_learning.pop(job_id)
-            for other_arrival_time, other_job in self.__jobs_for_learning.values():
-                self.__training_relations.append((
-                    job, other_job, arrival_time - other_arrival_time, True
-                ))
-                self.__training_relations.append((
-                    other_job, job, other_arrival_time - arrival_time, False
-                ))
+        position = self.__position_per_waiting_job_id.pop(job_id, None)
+        if position is None:
+            return
+        job_index = self.__waiting_job_indices[position]
+        arrival_time = self.__waiting_job_arrival_times[position]
+        #swap with the last waiting job to keep the arrays compact
+        last_position = len(self.__waiting_job_ids) - 1
+        if position != last_position:
+            self.__waiting_job_indices[position] = self.__waiting_job_indices[last_position]
+            self.__waiting_job_arrival_times[position] = self.__waiting_job_arrival_times[last_position]
+            last_job_id = self.__waiting_job_ids[last_position]
+            self.__waiting_job_ids[position] = last_job_id
+            self.__position_per_waiting_job_id[last_job_id] = position
+        self.__waiting_job_ids.pop()
+
+        other_job_indices = self.__waiting_job_indices[:last_position]
+        differences = arrival_time - self.__waiting_job_arrival_times[:last_position]
+        if self.__pair_sampler is not None:
+            selected_pairs = self.__pair_sampler.sample(differences)
+            other_job_indices = other_job_indices[selected_pairs]
+            differences = differences[selected_pairs]
+        nr_of_pairs = len(other_job_indices)
+        if nr_of_pairs == 0:
+            return
+        job_indices = np.full(nr_of_pairs, job_index, dtype=np.int64)
+        #the served job was served before all waiting jobs and not vice versa.
+        #both relations of a pair are interleaved such that every mini-batch
+        #for partial training contains both classes
+        self.__collected_relations.append((
+            np.column_stack((job_indices, other_job_indices)).ravel(),
+            np.column_stack((other_job_indices, job_indices)).ravel(),
+            np.column_stack((differences, -differences)).ravel(),
+            np.tile(np.array([True, False]), nr_of_pairs)
+        ))
+        self.__nr_of_collected_relations += 2 * nr_of_pairs
+
+        partial_fit_batch_size = self.__pairwise_priority_classifier.get_partial_fit_batch_size()
+        if partial_fit_batch_size is not None \
+                and self.__nr_of_collected_relations >= partial_fit_batch_size:
+            self.__pairwise_priority_classifier.partial_train(
+                self.__pop_collected_training_relations())
+
+    def __pop_collected_training_relations(self) -> TrainingRelationArrays:
+        """
+        concatenates the collected relations into preallocated arrays and
+        clears the collection
+        """
+        nr_of_relations = self.__nr_of_collected_relations
+        job_a_indices = np.empty(nr_of_relations, dtype=np.int64)
+        job_b_indices = np.empty(nr_of_relations, dtype=np.int64)
+        differences = np.empty(nr_of_relations, dtype=float)
+        labels = np.empty(nr_of_relations, dtype=bool)
+        start = 0
+        for relations in self.__collected_relations:
+            end = start + len(relations[0])
+            job_a_indices[start:end] = relations[0]
+            job_b_indices[start:end] = relations[1]
+            differences[start:end] = relations[2]
+            labels[start:end] = relations[3]
+            start = end
+        self.__collected_relations = []
+        self.__nr_of_collected_relations = 0
+        return TrainingRelationArrays(
+            self.__jobs_for_learning, job_a_indices, job_b_indices, differences, labels)
 
     def learn_classifier(self):
-        self.__pairwise_priority_classifier.train(self.__training_relations)
+        training_relations = self.__pop_collected_training_relations()
+        if self.__pairwise_priority_classifier.get_partial_fit_batch_size() is None:
+            self.__pairwise_priority_classifier.train_from_arrays(training_relations)
+        elif len(training_relations) > 0:
+            self.__pairwise_priority_classifier.partial_train(training_relations)
 
     def pop_batch(self, batch_size: int, nr_of_jobs_in_system: int) -> list[Job]:
         """
@@ -184,7 +472,8 @@ class PairwisePriorityClassifierWaitingArea(WaitingArea):
         simulation. this is not a bug, but the reason for this method.
         otherwise use the "deepcopy" python module.
         """
-        copy = PairwisePriorityClassifierWaitingArea(self.__pairwise_priority_classifier)
+        copy = PairwisePriorityClassifierWaitingArea(
+            self.__pairwise_priority_classifier, pair_sampler=self.__pair_sampler)
         current_node = self.__head_node
         while current_node is not None:
             copy.add_job(current_node.arrival_time, current_node.job)
@@ -192,7 +481,8 @@ class PairwisePriorityClassifierWaitingArea(WaitingArea):
         return copy
 
     def copy_empty(self) -> 'WaitingArea':
-        return PairwisePriorityClassifierWaitingArea(self.__pairwise_priority_classifier)
+        return PairwisePriorityClassifierWaitingArea(
+            self.__pairwise_priority_classifier, pair_sampler=self.__pair_sampler)
 
     def get_discipline_name(self) -> str:
         """
@@ -1,6 +1,8 @@
 from typing import Callable, Iterator
 from math import log2
 
+import numpy as np
+
 import prolothar_common.mdl_utils as mdl_utils
 
 from prolothar_queue_mining.model.waiting_area.waiting_area import WaitingArea
@@ -10,7 +12,10 @@ class PriorityClassWaitingArea(WaitingArea):
     """
     Waiting area with priority classes. This waiting area consists of sub-waiting
     area, one for each priority class. This enables FIFO or LIFO or any other handling of
-    jobs with the same priority
+    jobs with the same priority.
+    the number of waiting jobs and the set of non-empty priority classes (as bitset)
+    are maintained on every change, i.e. the length and the next non-empty
+    class are available without scanning all sub-waiting areas.
     """
 
     def __init__(
@@ -36,61 +41,75 @@ class PriorityClassWaitingArea(WaitingArea):
         }
         self.__sub_waiting_area_factory = sub_waiting_area_factory
         self.__sub_waiting_areas = [sub_waiting_area_factory() for _ in priority_classes]
+        self.__nr_of_jobs = 0
+        self.__nr_of_jobs_per_class = [0] * len(priority_classes)
+        #bit i is set if the i-th priority class has waiting jobs
+        self.__non_empty_classes = 0
 
     def add_job(self, arrival_time: int, job: Job):
         """
         adds a job to this waiting area
         """
         #unknown categories get lowest priority
-        self.__sub_waiting_areas[
-            self.__priority_class_to_index.get(
-                job.features[self.__priority_feature_name],
-                -1
-            )
-        ].add_job(arrival_time, job)
+        index = self.__priority_class_to_index.get(
+            job.features[self.__priority_feature_name],
+            len(self.__priority_classes) - 1
+        )
+        self.__sub_waiting_areas[index].add_job(arrival_time, job)
+        self.__nr_of_jobs += 1
+        self.__nr_of_jobs_per_class[index] += 1
+        self.__non_empty_classes |= 1 << index
+
+    def __get_first_non_empty_class(self) -> int:
+        non_empty_classes = self.__non_empty_classes
+        return (non_empty_classes & -non_empty_classes).bit_length() - 1
+
+    def __remove_jobs(self, index: int, nr_of_jobs: int):
+        self.__nr_of_jobs -= nr_of_jobs
+        self.__nr_of_jobs_per_class[index] -= nr_of_jobs
+        if self.__nr_of_jobs_per_class[index] == 0:
+            self.__non_empty_classes &= ~(1 << index)
 
     def has_next_job(self) -> bool:
         """
         returns True if there is a waiting job, otherwise returns False
         """
-        for waiting_area in self.__sub_waiting_areas:
-            if waiting_area.has_next_job():
-                return True
-        return False
+        return self.__nr_of_jobs > 0
 
     def pop_next_job(self, nr_of_jobs_in_system: int) -> Job:
         """
         returns the next waiting job if there is one. otherwise raises a StopIteration.
         """
-        for waiting_area in self.__sub_waiting_areas:
-            if waiting_area.has_next_job():
-                return waiting_area.pop_next_job(nr_of_jobs_in_system)
-        raise StopIteration()
+        if self.__nr_of_jobs == 0:
+            raise StopIteration()
+        index = self.__get_first_non_empty_class()
+        job = self.__sub_waiting_areas[index].pop_next_job(nr_of_jobs_in_system)
+        self.__remove_jobs(index, 1)
+        return job
 
     def pop_batch(self, batch_size: int, nr_of_jobs_in_system: int) -> list[Job]:
         """
         returns the next "batch_size" waiting jobs if there are enough jobs waiting.
         otherwise raises a StopIteration.
         """
-        if len(self) >= batch_size:
-            batch: list[Job] = []
-            for waiting_area in self.__sub_waiting_areas:
-                batch.extend(waiting_area.pop_batch(
-                    min(batch_size - len(batch), len(waiting_area)),
-                    nr_of_jobs_in_system
-                ))
-                if len(batch) == batch_size:
-                    return batch
-        raise StopIteration()
+        if self.__nr_of_jobs < batch_size:
+            raise StopIteration()
+        batch: list[Job] = []
+        nr_of_missing_jobs = batch_size
+        while nr_of_missing_jobs > 0:
+            index = self.__get_first_non_empty_class()
+            nr_of_popped_jobs = min(nr_of_missing_jobs, self.__nr_of_jobs_per_class[index])
+            batch.extend(self.__sub_waiting_areas[index].pop_batch(
+                nr_of_popped_jobs, nr_of_jobs_in_system))
+            self.__remove_jobs(index, nr_of_popped_jobs)
+            nr_of_missing_jobs -= nr_of_popped_jobs
+        return batch
 
     def __len__(self):
-        nr_of_jobs = 0
-        for waiting_area in self.__sub_waiting_areas:
-            nr_of_jobs += len(waiting_area)
-        return nr_of_jobs
+        return self.__nr_of_jobs
 
     def copy(self) -> WaitingArea:
-        if len(self) > 0:
+        if self.__nr_of_jobs > 0:
             raise NotImplementedError()
         return self.copy_empty()
 
@@ -114,6 +133,19 @@ class PriorityClassWaitingArea(WaitingArea):
     def get_mdl(self, nr_of_categorical_features: int) -> float:
         return log2(nr_of_categorical_features) + mdl_utils.sum_log_i_from_1_to_n(len(self.__priority_classes))
 
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times: np.ndarray) -> np.ndarray|None:
+        sub_keys = self.__sub_waiting_areas[0].get_static_serve_keys(jobs, arrival_times)
+        if sub_keys is None:
+            return None
+        #unknown categories get lowest priority
+        class_indices = np.array([
+            self.__priority_class_to_index.get(
+                job.features[self.__priority_feature_name],
+                len(self.__priority_classes) - 1)
+            for job in jobs
+        ], dtype=np.int64)
+        return combine_priority_class_serve_keys(class_indices, sub_keys)
+
     def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time: int):
         return (
             self.__priority_class_to_index.get(
@@ -132,3 +164,12 @@ class PriorityClassWaitingArea(WaitingArea):
             self.__sub_waiting_areas[0].get_worst_case_sort_key_for_synchronized_arrival(job, exit_time)
         )
 
+def combine_priority_class_serve_keys(class_indices: np.ndarray, sub_keys: np.ndarray) -> np.ndarray:
+    """
+    combines the priority class indices and the static serve keys of the
+    sub-waiting areas, such that jobs are served by priority class first and
+    by the sub-waiting area second
+    """
+    sub_ranks = np.empty(len(sub_keys), dtype=np.int64)
+    sub_ranks[np.argsort(sub_keys, kind='stable')] = np.arange(len(sub_keys))
+    return class_indices * len(sub_keys) + sub_ranks
@@ -3,6 +3,8 @@ from abc import abstractmethod
 
 import heapq
 
+import numpy as np
+
 from prolothar_queue_mining.model.waiting_area.waiting_area import WaitingArea
 from prolothar_queue_mining.model.job import Job
 
@@ -66,6 +68,16 @@ class PriorityQueue(WaitingArea):
             first
         """
 
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times: np.ndarray) -> np.ndarray|None:
+        priorities = np.array([
+            self._compute_priority(arrival_time, job)
+            for job, arrival_time in zip(jobs, arrival_times)
+        ], dtype=float).reshape(len(jobs))
+        #the heap breaks ties in an order that depends on the other waiting jobs
+        if len(np.unique(priorities)) < len(priorities):
+            return None
+        return np.argsort(np.argsort(priorities)).astype(np.int64)
+
     def copy(self) -> WaitingArea:
         copy = type(self)()
         copy.__queue = list(self.__queue)
@@ -1,6 +1,7 @@
-from random import Random
+import numpy as np
 
 from prolothar_queue_mining.model.waiting_area.priority_queue import PriorityQueue
+from prolothar_queue_mining.model.distribution.block_sampler import GeneratorMethodSampler, WAITING_AREA_STREAM
 from prolothar_queue_mining.model.job import Job
 
 class RandomOrderWaitingArea(PriorityQueue):
@@ -10,10 +11,15 @@ class RandomOrderWaitingArea(PriorityQueue):
 
     def __init__(self, seed: int = None):
         super().__init__()
-        self.__random = Random(seed)
+        self.__priority_sampler = GeneratorMethodSampler(
+            'random', seed=seed, stream=WAITING_AREA_STREAM)
 
     def _compute_priority(self, arrival_time: int, job: Job) -> float:
-        return self.__random.random()
+        return self.__priority_sampler.get_next_sample()
+
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times: np.ndarray) -> np.ndarray|None:
+        #the order is drawn anew in each simulation
+        return None
 
     def get_discipline_name(self) -> str:
         return 'SIRO'
@@ -0,0 +1,47 @@
+from prolothar_queue_mining.model.job.job cimport Job
+
+cdef class JobReferenceRingBuffer:
+    cdef list __buffer
+    cdef Py_ssize_t __head
+    cdef Py_ssize_t __capacity
+    cdef readonly Py_ssize_t size
+
+    cdef push_back(self, Job job)
+    cdef Job pop_front(self)
+    cdef Job pop_back(self)
+    cdef __grow(self)
+
+cdef class TypedWaitingArea:
+    cpdef add_job(self, arrival_time, Job job)
+    cpdef bint has_next_job(self) except -1
+    cpdef Job pop_next_job(self, int nr_of_jobs_in_system)
+    cpdef list pop_batch(self, int batch_size, int nr_of_jobs_in_system)
+    cpdef int get_nr_of_jobs(self) except -1
+
+cdef class TypedFirstComeFirstServeWaitingArea(TypedWaitingArea):
+    cdef JobReferenceRingBuffer __queue
+
+cdef class TypedLastComeFirstServeWaitingArea(TypedWaitingArea):
+    cdef JobReferenceRingBuffer __stack
+
+cdef class TypedFlifoWaitingArea(TypedWaitingArea):
+    cdef JobReferenceRingBuffer __queue
+    cdef int __load_threshold
+    cdef bint __fifo_on_low_load
+
+cdef class TypedPriorityClassWaitingArea(TypedWaitingArea):
+    cdef str __priority_feature_name
+    cdef list __priority_classes
+    cdef dict __priority_class_to_index
+    cdef object __sub_waiting_area_factory
+    cdef list __sub_waiting_areas
+    cdef int __nr_of_jobs
+    cdef object __non_empty_classes
+
+    cdef int __get_first_non_empty_class(self) except -2
+
+cdef class TypedPriorityQueue(TypedWaitingArea):
+    cdef list __heap
+    cdef long long __nr_of_added_jobs
+
+    cpdef double compute_priority(self, arrival_time, Job job) except? -1
\ No newline at end of file
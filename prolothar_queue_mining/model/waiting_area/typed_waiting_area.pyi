@@ -0,0 +1,118 @@
+from abc import abstractmethod
+from typing import Callable, Iterator
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.waiting_area.waiting_area import WaitingArea
+
+class JobReferenceRingBuffer:
+    """
+    double-ended queue of jobs in a circular buffer with typed head, size and
+    capacity. in contrast to the index based arrays of a JobTable, the buffer
+    is a Python list of Job references, because the jobs of a waiting area
+    are not interned in a JobTable.
+    """
+    size: int
+
+    def __init__(self, initial_capacity: int = 16): ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[Job]: ...
+    def copy(self) -> 'JobReferenceRingBuffer': ...
+
+class TypedWaitingArea(WaitingArea):
+    """
+    base class of waiting areas implemented in Cython. Queue calls the typed
+    methods of these waiting areas directly instead of using Python dispatch.
+    all subclasses are registered as virtual subclasses of WaitingArea, i.e.
+    they can be used everywhere a WaitingArea is expected.
+
+    cdef classes cannot use ABCMeta. instead, a subclass that does not
+    override all abstract methods (see _ABSTRACT_METHODS) cannot be
+    instantiated, as for an ABC.
+    """
+
+    @abstractmethod
+    def add_job(self, arrival_time: int, job: Job):
+        """
+        adds a job to this waiting area
+        """
+
+    @abstractmethod
+    def pop_next_job(self, nr_of_jobs_in_system: int) -> Job:
+        """
+        removes and returns the next job to serve. raises a StopIteration if
+        the waiting area is empty.
+        """
+
+    @abstractmethod
+    def pop_batch(self, batch_size: int, nr_of_jobs_in_system: int) -> list[Job]:
+        """
+        removes and returns the next "batch_size" jobs to serve. raises a
+        StopIteration if there are not enough waiting jobs.
+        """
+
+    @abstractmethod
+    def get_nr_of_jobs(self) -> int:
+        """
+        returns the number of jobs in this waiting area
+        """
+
+class TypedFirstComeFirstServeWaitingArea(TypedWaitingArea):
+    """
+    Cython counterpart of FastFirstComeFirstServeWaitingArea. jobs are stored
+    in a ring buffer and served in order of their addition.
+    """
+
+    def __init__(self): ...
+
+class TypedLastComeFirstServeWaitingArea(TypedWaitingArea):
+    """
+    Cython counterpart of FastLastComeFirstServeWaitingArea. the last added
+    job is served first.
+    """
+
+    def __init__(self): ...
+
+class TypedFlifoWaitingArea(TypedWaitingArea):
+    """
+    Cython counterpart of FlifoWaitingArea. depending on the number of jobs in
+    the system, jobs are either served FIFO or LIFO (low and high load mode).
+    """
+
+    def __init__(self, load_threshold: int, fifo_on_low_load: bool = True): ...
+
+class TypedPriorityClassWaitingArea(TypedWaitingArea):
+    """
+    Cython counterpart of PriorityClassWaitingArea. consists of one typed
+    sub-waiting area per priority class and keeps track of the total number
+    of waiting jobs.
+    """
+
+    def __init__(
+            self, priority_feature_name: str, priority_classes: list,
+            sub_waiting_area_factory: Callable[[], TypedWaitingArea]): ...
+
+class TypedPriorityQueue(TypedWaitingArea):
+    """
+    Cython counterpart of PriorityQueue. the job with highest priority (lowest
+    numerical value) is served first. in contrast to PriorityQueue, jobs with
+    equal priority are served in order of their addition. subclasses must
+    implement compute_priority, get_discipline_name and the sort key methods.
+    subclasses with constructor arguments must also override _new_empty,
+    which is used by copy and copy_empty.
+    """
+
+    def __init__(self): ...
+
+    @abstractmethod
+    def compute_priority(self, arrival_time: int, job: Job) -> float:
+        """
+        computes the priority of a given job depending on its arrival time.
+        jobs with lower priority value are served first
+        """
+
+    def _new_empty(self) -> 'TypedPriorityQueue':
+        """
+        returns a new empty waiting area with the same configuration. the
+        default calls the constructor without arguments, i.e. subclasses with
+        constructor arguments must override this method.
+        """
\ No newline at end of file
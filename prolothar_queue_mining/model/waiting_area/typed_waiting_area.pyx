@@ -0,0 +1,537 @@
+from typing import Callable, Iterator
+from math import log2
+import heapq
+
+import numpy as np
+import prolothar_common.mdl_utils as mdl_utils
+
+from prolothar_queue_mining.model.job.job cimport Job
+from prolothar_queue_mining.model.waiting_area.waiting_area import WaitingArea
+from prolothar_queue_mining.model.waiting_area.priority_class import combine_priority_class_serve_keys
+
+cdef class JobReferenceRingBuffer:
+    """
+    double-ended queue of jobs in a circular buffer with typed head, size and
+    capacity. in contrast to the index based arrays of a JobTable, the buffer
+    is a Python list of Job references, because the jobs of a waiting area
+    are not interned in a JobTable.
+    """
+
+    def __init__(self, Py_ssize_t initial_capacity = 16):
+        self.__capacity = max(1, initial_capacity)
+        self.__buffer = [None] * self.__capacity
+        self.__head = 0
+        self.size = 0
+
+    cdef push_back(self, Job job):
+        if self.size == self.__capacity:
+            self.__grow()
+        cdef Py_ssize_t index = self.__head + self.size
+        if index >= self.__capacity:
+            index -= self.__capacity
+        self.__buffer[index] = job
+        self.size += 1
+
+    cdef Job pop_front(self):
+        if self.size == 0:
+            raise StopIteration()
+        cdef Job job = <Job>self.__buffer[self.__head]
+        self.__buffer[self.__head] = None
+        self.__head += 1
+        if self.__head == self.__capacity:
+            self.__head = 0
+        self.size -= 1
+        return job
+
+    cdef Job pop_back(self):
+        if self.size == 0:
+            raise StopIteration()
+        cdef Py_ssize_t index = self.__head + self.size - 1
+        if index >= self.__capacity:
+            index -= self.__capacity
+        cdef Job job = <Job>self.__buffer[index]
+        self.__buffer[index] = None
+        self.size -= 1
+        return job
+
+    cdef __grow(self):
+        cdef list buffer = list(self)
+        buffer.extend([None] * self.__capacity)
+        self.__buffer = buffer
+        self.__capacity *= 2
+        self.__head = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Job]:
+        cdef Py_ssize_t i
+        for i in range(self.size):
+            yield self.__buffer[(self.__head + i) % self.__capacity]
+
+    def copy(self) -> 'JobReferenceRingBuffer':
+        cdef JobReferenceRingBuffer copy = JobReferenceRingBuffer(self.__capacity)
+        copy.__buffer[:self.size] = list(self)
+        copy.size = self.size
+        return copy
+
+#classes that have been checked to override all abstract methods, such that
+#the check runs only once per class and not for every copy of a waiting area
+cdef set _CONCRETE_CLASSES = set()
+
+cdef class TypedWaitingArea:
+    """
+    base class of waiting areas implemented in Cython. Queue calls the typed
+    methods of these waiting areas directly instead of using Python dispatch.
+    all subclasses are registered as virtual subclasses of WaitingArea, i.e.
+    they can be used everywhere a WaitingArea is expected.
+
+    cdef classes cannot use ABCMeta. instead, a subclass that does not
+    override all abstract methods (see _ABSTRACT_METHODS) cannot be
+    instantiated, as for an ABC.
+    """
+
+    def __cinit__(self, *args, **kwargs):
+        cdef type cls = type(self)
+        if cls in _CONCRETE_CLASSES:
+            return
+        abstract_methods = [
+            method_name
+            for base, method_names in _ABSTRACT_METHODS.items() if issubclass(cls, base)
+            for method_name in method_names
+            if getattr(cls, method_name) is getattr(base, method_name)
+        ]
+        if abstract_methods:
+            raise TypeError(
+                f"Can't instantiate abstract class {cls.__name__} "
+                f"with abstract methods {', '.join(abstract_methods)}")
+        _CONCRETE_CLASSES.add(cls)
+
+    cpdef add_job(self, arrival_time, Job job):
+        """
+        adds a job to this waiting area
+        """
+
+    cpdef bint has_next_job(self) except -1:
+        return self.get_nr_of_jobs() > 0
+
+    cpdef Job pop_next_job(self, int nr_of_jobs_in_system):
+        """
+        removes and returns the next job to serve. raises a StopIteration if
+        the waiting area is empty.
+        """
+
+    cpdef list pop_batch(self, int batch_size, int nr_of_jobs_in_system):
+        """
+        removes and returns the next "batch_size" jobs to serve. raises a
+        StopIteration if there are not enough waiting jobs.
+        """
+
+    cpdef int get_nr_of_jobs(self) except -1:
+        """
+        returns the number of jobs in this waiting area
+        """
+
+    def __len__(self):
+        return self.get_nr_of_jobs()
+
+    def get_mdl(self, nr_of_categorical_features) -> float:
+        return 0
+
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times):
+        return None
+
+cdef class TypedFirstComeFirstServeWaitingArea(TypedWaitingArea):
+    """
+    Cython counterpart of FastFirstComeFirstServeWaitingArea. jobs are stored
+    in a ring buffer and served in order of their addition.
+    """
+
+    def __init__(self):
+        self.__queue = JobReferenceRingBuffer()
+
+    cpdef add_job(self, arrival_time, Job job):
+        self.__queue.push_back(job)
+
+    cpdef Job pop_next_job(self, int nr_of_jobs_in_system):
+        return self.__queue.pop_front()
+
+    cpdef list pop_batch(self, int batch_size, int nr_of_jobs_in_system):
+        if self.__queue.size < batch_size:
+            raise StopIteration()
+        return [self.__queue.pop_front() for _ in range(batch_size)]
+
+    cpdef int get_nr_of_jobs(self) except -1:
+        return self.__queue.size
+
+    def copy(self) -> WaitingArea:
+        cdef TypedFirstComeFirstServeWaitingArea copy = TypedFirstComeFirstServeWaitingArea()
+        copy.__queue = self.__queue.copy()
+        return copy
+
+    def copy_empty(self) -> WaitingArea:
+        return TypedFirstComeFirstServeWaitingArea()
+
+    def get_discipline_name(self) -> str:
+        return 'FCFS'
+
+    def any_order_iterator(self) -> Iterator[Job]:
+        return iter(self.__queue)
+
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times):
+        return np.arange(len(jobs), dtype=np.int64)
+
+    def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return exit_time
+
+    def get_worst_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return -exit_time
+
+cdef class TypedLastComeFirstServeWaitingArea(TypedWaitingArea):
+    """
+    Cython counterpart of FastLastComeFirstServeWaitingArea. the last added
+    job is served first.
+    """
+
+    def __init__(self):
+        self.__stack = JobReferenceRingBuffer()
+
+    cpdef add_job(self, arrival_time, Job job):
+        self.__stack.push_back(job)
+
+    cpdef Job pop_next_job(self, int nr_of_jobs_in_system):
+        return self.__stack.pop_back()
+
+    cpdef list pop_batch(self, int batch_size, int nr_of_jobs_in_system):
+        if self.__stack.size < batch_size:
+            raise StopIteration()
+        return [self.__stack.pop_back() for _ in range(batch_size)]
+
+    cpdef int get_nr_of_jobs(self) except -1:
+        return self.__stack.size
+
+    def copy(self) -> WaitingArea:
+        cdef TypedLastComeFirstServeWaitingArea copy = TypedLastComeFirstServeWaitingArea()
+        copy.__stack = self.__stack.copy()
+        return copy
+
+    def copy_empty(self) -> WaitingArea:
+        return TypedLastComeFirstServeWaitingArea()
+
+    def get_discipline_name(self) -> str:
+        return 'LCFS'
+
+    def any_order_iterator(self) -> Iterator[Job]:
+        return iter(self.__stack)
+
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times):
+        return -np.arange(len(jobs), dtype=np.int64)
+
+    def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return -exit_time
+
+    def get_worst_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return exit_time
+
+cdef class TypedFlifoWaitingArea(TypedWaitingArea):
+    """
+    Cython counterpart of FlifoWaitingArea. depending on the number of jobs in
+    the system, jobs are either served FIFO or LIFO (low and high load mode).
+    """
+
+    def __init__(self, int load_threshold, bint fifo_on_low_load = True):
+        """
+        creates a new TypedFlifoWaitingArea
+
+        Parameters
+        ----------
+        load_threshold : int
+            up to this number of jobs in the system, jobs are popped in order
+            of the low load mode. if the number of jobs in the system is higher
+            than this number, jobs are popped in order of the high load mode.
+        fifo_on_low_load : bool, optional
+            if True, then jobs are returned fifo if the number of jobs
+            in the system is low and otherwise lifo.
+            if False, jobs are returned lifo if the number of jobs
+            in the system is low and otherwise fifo
+            by default True
+        """
+        self.__queue = JobReferenceRingBuffer()
+        self.__load_threshold = load_threshold
+        self.__fifo_on_low_load = fifo_on_low_load
+
+    cpdef add_job(self, arrival_time, Job job):
+        self.__queue.push_back(job)
+
+    cpdef Job pop_next_job(self, int nr_of_jobs_in_system):
+        if (nr_of_jobs_in_system <= self.__load_threshold) == self.__fifo_on_low_load:
+            return self.__queue.pop_front()
+        else:
+            return self.__queue.pop_back()
+
+    cpdef list pop_batch(self, int batch_size, int nr_of_jobs_in_system):
+        if self.__queue.size < batch_size:
+            raise StopIteration()
+        if (nr_of_jobs_in_system <= self.__load_threshold) == self.__fifo_on_low_load:
+            return [self.__queue.pop_front() for _ in range(batch_size)]
+        else:
+            return [self.__queue.pop_back() for _ in range(batch_size)]
+
+    cpdef int get_nr_of_jobs(self) except -1:
+        return self.__queue.size
+
+    def copy(self) -> WaitingArea:
+        cdef TypedFlifoWaitingArea copy = TypedFlifoWaitingArea(
+            self.__load_threshold, fifo_on_low_load=self.__fifo_on_low_load)
+        copy.__queue = self.__queue.copy()
+        return copy
+
+    def copy_empty(self) -> WaitingArea:
+        return TypedFlifoWaitingArea(
+            self.__load_threshold, fifo_on_low_load=self.__fifo_on_low_load)
+
+    def get_discipline_name(self) -> str:
+        if self.__fifo_on_low_load:
+            return f'FLIFO({self.__load_threshold},FIFO->LIFO)'
+        else:
+            return f'FLIFO({self.__load_threshold},LIFO->FIFO)'
+
+    def any_order_iterator(self) -> Iterator[Job]:
+        return iter(self.__queue)
+
+    def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return exit_time
+
+    def get_worst_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return -exit_time
+
+cdef class TypedPriorityClassWaitingArea(TypedWaitingArea):
+    """
+    Cython counterpart of PriorityClassWaitingArea. consists of one typed
+    sub-waiting area per priority class and keeps track of the total number
+    of waiting jobs and of the non-empty priority classes.
+    """
+
+    def __init__(
+            self, str priority_feature_name, priority_classes,
+            sub_waiting_area_factory: Callable[[], TypedWaitingArea]):
+        """
+        Parameters
+        ----------
+        priority_feature_name : str
+            name of the feature that contains the priority class for a job
+        priority_classes : list
+            order of the priority classes. jobs with the first priority class
+            in the list will be served first
+        sub_waiting_area_factory : Callable[[], TypedWaitingArea]
+            used to create the sub-waiting areas for each priority class,
+            e.g. TypedFirstComeFirstServeWaitingArea
+        """
+        self.__priority_feature_name = priority_feature_name
+        self.__priority_classes = list(priority_classes)
+        self.__priority_class_to_index = {
+            priority_class: i for i,priority_class in enumerate(priority_classes)
+        }
+        self.__sub_waiting_area_factory = sub_waiting_area_factory
+        self.__sub_waiting_areas = [sub_waiting_area_factory() for _ in priority_classes]
+        for sub_waiting_area in self.__sub_waiting_areas:
+            if not isinstance(sub_waiting_area, TypedWaitingArea):
+                raise TypeError(
+                    f'sub waiting areas must be TypedWaitingArea, not {type(sub_waiting_area)}')
+        self.__nr_of_jobs = 0
+        #bit i is set if the i-th priority class has waiting jobs
+        self.__non_empty_classes = 0
+
+    cpdef add_job(self, arrival_time, Job job):
+        #unknown categories get lowest priority
+        cdef int index = self.__priority_class_to_index.get(
+            job.features[self.__priority_feature_name],
+            len(self.__priority_classes) - 1)
+        cdef TypedWaitingArea sub_waiting_area = self.__sub_waiting_areas[index]
+        sub_waiting_area.add_job(arrival_time, job)
+        self.__nr_of_jobs += 1
+        self.__non_empty_classes |= <object>1 << index
+
+    cdef int __get_first_non_empty_class(self) except -2:
+        non_empty_classes = self.__non_empty_classes
+        return (non_empty_classes & -non_empty_classes).bit_length() - 1
+
+    cpdef bint has_next_job(self) except -1:
+        return self.__nr_of_jobs > 0
+
+    cpdef Job pop_next_job(self, int nr_of_jobs_in_system):
+        if self.__nr_of_jobs == 0:
+            raise StopIteration()
+        cdef int index = self.__get_first_non_empty_class()
+        cdef TypedWaitingArea sub_waiting_area = self.__sub_waiting_areas[index]
+        cdef Job job = sub_waiting_area.pop_next_job(nr_of_jobs_in_system)
+        self.__nr_of_jobs -= 1
+        if sub_waiting_area.get_nr_of_jobs() == 0:
+            self.__non_empty_classes &= ~(<object>1 << index)
+        return job
+
+    cpdef list pop_batch(self, int batch_size, int nr_of_jobs_in_system):
+        if self.__nr_of_jobs < batch_size:
+            raise StopIteration()
+        cdef list batch = []
+        cdef int nr_of_missing_jobs = batch_size
+        cdef int nr_of_popped_jobs
+        cdef int index
+        cdef TypedWaitingArea sub_waiting_area
+        while nr_of_missing_jobs > 0:
+            index = self.__get_first_non_empty_class()
+            sub_waiting_area = self.__sub_waiting_areas[index]
+            nr_of_popped_jobs = min(nr_of_missing_jobs, sub_waiting_area.get_nr_of_jobs())
+            batch.extend(sub_waiting_area.pop_batch(nr_of_popped_jobs, nr_of_jobs_in_system))
+            nr_of_missing_jobs -= nr_of_popped_jobs
+            if sub_waiting_area.get_nr_of_jobs() == 0:
+                self.__non_empty_classes &= ~(<object>1 << index)
+        self.__nr_of_jobs -= batch_size
+        return batch
+
+    cpdef int get_nr_of_jobs(self) except -1:
+        return self.__nr_of_jobs
+
+    def copy(self) -> WaitingArea:
+        cdef TypedPriorityClassWaitingArea copy = self.copy_empty()
+        copy.__sub_waiting_areas = [
+            sub_waiting_area.copy() for sub_waiting_area in self.__sub_waiting_areas]
+        copy.__nr_of_jobs = self.__nr_of_jobs
+        copy.__non_empty_classes = self.__non_empty_classes
+        return copy
+
+    def copy_empty(self) -> WaitingArea:
+        return TypedPriorityClassWaitingArea(
+            self.__priority_feature_name,
+            self.__priority_classes,
+            self.__sub_waiting_area_factory)
+
+    def get_discipline_name(self) -> str:
+        return (
+            f'PQ({self.__priority_feature_name},'
+            f'[{",".join(str(c) for c in self.__priority_classes)}],'
+            f'{self.__sub_waiting_areas[0].get_discipline_name()})'
+        )
+
+    def any_order_iterator(self) -> Iterator[Job]:
+        for sub_waiting_area in self.__sub_waiting_areas:
+            yield from sub_waiting_area.any_order_iterator()
+
+    def get_mdl(self, nr_of_categorical_features) -> float:
+        return log2(nr_of_categorical_features) + mdl_utils.sum_log_i_from_1_to_n(len(self.__priority_classes))
+
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times):
+        sub_keys = self.__sub_waiting_areas[0].get_static_serve_keys(jobs, arrival_times)
+        if sub_keys is None:
+            return None
+        #unknown categories get lowest priority
+        class_indices = np.array([
+            self.__priority_class_to_index.get(
+                job.features[self.__priority_feature_name],
+                len(self.__priority_classes) - 1)
+            for job in jobs
+        ], dtype=np.int64)
+        return combine_priority_class_serve_keys(class_indices, sub_keys)
+
+    def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return (
+            self.__priority_class_to_index.get(
+                job.features[self.__priority_feature_name],
+                len(self.__priority_classes)
+            ),
+            self.__sub_waiting_areas[0].get_best_case_sort_key_for_synchronized_arrival(job, exit_time)
+        )
+
+    def get_worst_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return (
+            self.__priority_class_to_index.get(
+                job.features[self.__priority_feature_name],
+                len(self.__priority_classes)
+            ),
+            self.__sub_waiting_areas[0].get_worst_case_sort_key_for_synchronized_arrival(job, exit_time)
+        )
+
+cdef class TypedPriorityQueue(TypedWaitingArea):
+    """
+    Cython counterpart of PriorityQueue. the job with highest priority (lowest
+    numerical value) is served first. in contrast to PriorityQueue, jobs with
+    equal priority are served in order of their addition. subclasses must
+    implement compute_priority, get_discipline_name and the sort key methods.
+    subclasses with constructor arguments must also override _new_empty,
+    which is used by copy and copy_empty.
+    """
+
+    def __init__(self):
+        self.__heap = []
+        self.__nr_of_added_jobs = 0
+
+    cpdef double compute_priority(self, arrival_time, Job job) except? -1:
+        """
+        computes the priority of a given job depending on its arrival time.
+        jobs with lower priority value are served first
+        """
+
+    cpdef add_job(self, arrival_time, Job job):
+        heapq.heappush(self.__heap, (
+            self.compute_priority(arrival_time, job), self.__nr_of_added_jobs, job))
+        self.__nr_of_added_jobs += 1
+
+    cpdef Job pop_next_job(self, int nr_of_jobs_in_system):
+        if not self.__heap:
+            raise StopIteration()
+        return heapq.heappop(self.__heap)[2]
+
+    cpdef list pop_batch(self, int batch_size, int nr_of_jobs_in_system):
+        if len(self.__heap) < batch_size:
+            raise StopIteration()
+        return [heapq.heappop(self.__heap)[2] for _ in range(batch_size)]
+
+    cpdef int get_nr_of_jobs(self) except -1:
+        return len(self.__heap)
+
+    def _new_empty(self) -> 'TypedPriorityQueue':
+        """
+        returns a new empty waiting area with the same configuration. the
+        default calls the constructor without arguments, i.e. subclasses with
+        constructor arguments must override this method.
+        """
+        return type(self)()
+
+    def copy(self) -> WaitingArea:
+        cdef TypedPriorityQueue copy = self._new_empty()
+        copy.__heap = list(self.__heap)
+        copy.__nr_of_added_jobs = self.__nr_of_added_jobs
+        return copy
+
+    def copy_empty(self) -> WaitingArea:
+        return self._new_empty()
+
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times):
+        priorities = np.array([
+            self.compute_priority(arrival_time, job)
+            for job, arrival_time in zip(jobs, arrival_times)
+        ], dtype=float)
+        #jobs with equal priority are served in order of their addition
+        return np.argsort(np.argsort(priorities, kind='stable')).astype(np.int64)
+
+    def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return (self.compute_priority(0, job), exit_time)
+
+    def get_worst_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time):
+        return (self.compute_priority(0, job), -exit_time)
+
+    def any_order_iterator(self) -> Iterator[Job]:
+        for _, _, job in self.__heap:
+            yield job
+
+#abstract methods per base class, which must be overridden by subclasses
+_ABSTRACT_METHODS = {
+    TypedWaitingArea: ('add_job', 'pop_next_job', 'pop_batch', 'get_nr_of_jobs'),
+    TypedPriorityQueue: ('compute_priority',),
+}
+
+WaitingArea.register(TypedFirstComeFirstServeWaitingArea)
+WaitingArea.register(TypedLastComeFirstServeWaitingArea)
+WaitingArea.register(TypedFlifoWaitingArea)
+WaitingArea.register(TypedPriorityClassWaitingArea)
+WaitingArea.register(TypedPriorityQueue)
\ No newline at end of file
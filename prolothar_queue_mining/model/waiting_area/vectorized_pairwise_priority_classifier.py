@@ -0,0 +1,125 @@
+from typing import Iterator
+import numpy as np
+
+from prolothar_queue_mining.model.waiting_area.waiting_area import WaitingArea
+from prolothar_queue_mining.model.waiting_area.pairwise_priority_classifier import SklearnPairwisePriorityClassifier
+from prolothar_queue_mining.model.job import Job
+
+class VectorizedPairwisePriorityClassifierWaitingArea(WaitingArea):
+    """
+    waiting area where a pairwise classifier decides on the order of the jobs.
+    serves the jobs in the same order as PairwisePriorityClassifierWaitingArea,
+    but compares a new job with all waiting jobs in a single batched call of the
+    classifier instead of walking along a linked list with one call per waiting
+    job. the waiting jobs, their arrival times and feature vectors are stored in
+    sorted arrays in reverse serve order, i.e. the next job is the last entry.
+    """
+
+    def __init__(
+            self, pairwise_priority_classifier: SklearnPairwisePriorityClassifier,
+            initial_capacity: int = 64):
+        """
+        Parameters
+        ----------
+        pairwise_priority_classifier : SklearnPairwisePriorityClassifier
+            trained classifier that decides for two jobs which one is served first
+        initial_capacity : int, optional
+            number of waiting jobs before the internal arrays are reallocated,
+            by default 64
+        """
+        self.__pairwise_priority_classifier = pairwise_priority_classifier
+        self.__initial_capacity = max(1, initial_capacity)
+        self.__jobs: list[Job] = []
+        self.__arrival_times = np.empty(self.__initial_capacity, dtype=float)
+        self.__job_vectors: np.ndarray|None = None
+
+    def add_job(self, arrival_time: int, job: Job):
+        """
+        adds a job to this waiting area
+        """
+        job_vector = self.__pairwise_priority_classifier.transform_job(job)
+        nr_of_jobs = len(self.__jobs)
+        if self.__job_vectors is None:
+            self.__job_vectors = np.empty(
+                (len(self.__arrival_times), len(job_vector)), dtype=float)
+        if nr_of_jobs == 0:
+            position = 0
+        else:
+            is_served_before = self.__pairwise_priority_classifier.should_job_be_served_before_jobs(
+                job_vector, self.__job_vectors[:nr_of_jobs],
+                arrival_time - self.__arrival_times[:nr_of_jobs])
+            #the new job is inserted in front of the first job (in serve order)
+            #that it should be served before
+            candidates = np.flatnonzero(is_served_before)
+            position = int(candidates[-1]) + 1 if len(candidates) > 0 else 0
+        self.__insert(position, arrival_time, job, job_vector)
+
+    def __insert(self, position: int, arrival_time: int, job: Job, job_vector: np.ndarray):
+        nr_of_jobs = len(self.__jobs)
+        if nr_of_jobs == len(self.__arrival_times):
+            self.__arrival_times = np.concatenate((
+                self.__arrival_times, np.empty_like(self.__arrival_times)))
+            self.__job_vectors = np.concatenate((
+                self.__job_vectors, np.empty_like(self.__job_vectors)))
+        #numpy handles the overlap of source and destination
+        self.__arrival_times[position+1:nr_of_jobs+1] = self.__arrival_times[position:nr_of_jobs]
+        self.__job_vectors[position+1:nr_of_jobs+1] = self.__job_vectors[position:nr_of_jobs]
+        self.__arrival_times[position] = arrival_time
+        self.__job_vectors[position] = job_vector
+        self.__jobs.insert(position, job)
+
+    def has_next_job(self) -> bool:
+        """
+        returns True if there is a waiting job, otherwise returns False
+        """
+        return bool(self.__jobs)
+
+    def pop_next_job(self, nr_of_jobs_in_system: int) -> Job:
+        """
+        returns the next waiting job if there is one. otherwise raises a StopIteration.
+        """
+        if not self.__jobs:
+            raise StopIteration()
+        return self.__jobs.pop()
+
+    def pop_batch(self, batch_size: int, nr_of_jobs_in_system: int) -> list[Job]:
+        """
+        returns the next "batch_size" waiting jobs if there are enough jobs waiting.
+        otherwise raises a StopIteration.
+        """
+        if len(self.__jobs) < batch_size:
+            raise StopIteration()
+        return [self.__jobs.pop() for _ in range(batch_size)]
+
+    def __len__(self):
+        """
+        returns the number of jobs in this waiting area
+        """
+        return len(self.__jobs)
+
+    def copy(self) -> WaitingArea:
+        copy = VectorizedPairwisePriorityClassifierWaitingArea(
+            self.__pairwise_priority_classifier,
+            initial_capacity=self.__initial_capacity)
+        copy.__jobs = list(self.__jobs)
+        copy.__arrival_times = self.__arrival_times.copy()
+        if self.__job_vectors is not None:
+            copy.__job_vectors = self.__job_vectors.copy()
+        return copy
+
+    def copy_empty(self) -> WaitingArea:
+        return VectorizedPairwisePriorityClassifierWaitingArea(
+            self.__pairwise_priority_classifier,
+            initial_capacity=self.__initial_capacity)
+
+    def get_discipline_name(self) -> str:
+        return f"PQ({self.__pairwise_priority_classifier})"
+
+    def any_order_iterator(self) -> Iterator[Job]:
+        return reversed(self.__jobs)
+
+    def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time: int):
+        return exit_time
+
+    def get_worst_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time: int):
+        return -exit_time
@@ -1,6 +1,8 @@
 from typing import Iterator
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from prolothar_queue_mining.model.job import Job
 
 class WaitingArea(ABC):
@@ -82,6 +84,16 @@ class WaitingArea(ABC):
         """
         return 0
 
+    def get_static_serve_keys(self, jobs: list[Job], arrival_times: np.ndarray) -> np.ndarray|None:
+        """
+        if the serve order only depends on the jobs and their arrival, returns
+        an int64 key for each of the given jobs (in order of arrival) such that
+        the waiting job with the smallest key is served next. this
+        enables simulations without a waiting area, e.g. VectorizedQueueSimulation.
+        returns None otherwise, which is the default.
+        """
+        return None
+
     @abstractmethod
     def get_best_case_sort_key_for_synchronized_arrival(self, job: Job, exit_time: int):
         """
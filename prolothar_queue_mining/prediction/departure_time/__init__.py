@@ -1,7 +1,25 @@
-from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
-from prolothar_queue_mining.prediction.departure_time.oracle_departure_time_predictor import OracleDepartureTimePredictor
-from prolothar_queue_mining.prediction.departure_time.queue_departure_time_predictor import QueueDepartureTimePredictor
-from prolothar_queue_mining.prediction.departure_time.fixed_sojourn_time_departure_time_predictor import FixedSojournTimeDepartureTimePredictor
-from prolothar_queue_mining.prediction.departure_time.load_cluster_predictor import LoadClusterDepartureTimePredictor
-from prolothar_queue_mining.prediction.departure_time.sklearn_regression_predictor import SklearnRegressionDepartureTimePredictor
-from prolothar_queue_mining.prediction.departure_time.arrival_window_departure_time_predictor import ArrivalWindowDepartureTimePredictor
\ No newline at end of file
+from prolothar_queue_mining.lazy_import import create_lazy_module_attributes
+
+__all__ = [
+    'DepartureTimePredictor',
+    'OracleDepartureTimePredictor',
+    'QueueDepartureTimePredictor',
+    'FixedSojournTimeDepartureTimePredictor',
+    'LoadClusterDepartureTimePredictor',
+    'SklearnRegressionDepartureTimePredictor',
+    'ArrivalWindowDepartureTimePredictor',
+    'ReplicationMatrix',
+    'ConvergenceCriterion',
+]
+
+__getattr__, __dir__ = create_lazy_module_attributes(__name__, {
+    'DepartureTimePredictor': 'prolothar_queue_mining.prediction.departure_time.departure_time_predictor',
+    'OracleDepartureTimePredictor': 'prolothar_queue_mining.prediction.departure_time.oracle_departure_time_predictor',
+    'QueueDepartureTimePredictor': 'prolothar_queue_mining.prediction.departure_time.queue_departure_time_predictor',
+    'FixedSojournTimeDepartureTimePredictor': 'prolothar_queue_mining.prediction.departure_time.fixed_sojourn_time_departure_time_predictor',
+    'LoadClusterDepartureTimePredictor': 'prolothar_queue_mining.prediction.departure_time.load_cluster_predictor',
+    'SklearnRegressionDepartureTimePredictor': 'prolothar_queue_mining.prediction.departure_time.sklearn_regression_predictor',
+    'ArrivalWindowDepartureTimePredictor': 'prolothar_queue_mining.prediction.departure_time.arrival_window_departure_time_predictor',
+    'ReplicationMatrix': 'prolothar_queue_mining.prediction.departure_time.replication_matrix',
+    'ConvergenceCriterion': 'prolothar_queue_mining.prediction.departure_time.convergence_criterion',
+})
\ No newline at end of file
@@ -1,7 +1,11 @@
+from typing import Iterator
+
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.base import RegressorMixin
 
 from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
 
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
@@ -15,11 +19,38 @@ class ArrivalWindowDepartureTimePredictor(DepartureTimePredictor):
     def __init__(
             self, past_arrivals: int, future_arrivals: int,
             job_to_vector_transformer: JobToVectorTransformer,
-            regression_model: RegressorMixin):
+            regression_model: RegressorMixin, chunk_size: int|None = None):
+        """
+        creates a new ArrivalWindowDepartureTimePredictor
+
+        Parameters
+        ----------
+        past_arrivals : int
+            number of arrivals before the job in the window
+        future_arrivals : int
+            number of arrivals after the job in the window
+        job_to_vector_transformer : JobToVectorTransformer
+            transforms the attributes of the jobs to vectors
+        regression_model : RegressorMixin
+            the regression model that predicts the sojourn time
+        chunk_size : int | None, optional
+            if given, the feature vectors are created and predicted in chunks
+            of this number of jobs. a prediction then only keeps one chunk and
+            the feature vectors with missing values in memory. these are usually
+            the vectors of the first "past_arrivals" and the last
+            "future_arrivals" jobs, which are predicted at the end with the
+            column means of all feature vectors. the training still creates the
+            complete matrix of training data, because the regression model is
+            fitted at once. by default None, i.e. all feature vectors are
+            created at once.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f'chunk_size must be positive, but was {chunk_size}')
         self.__past_arrivals = past_arrivals
         self.__future_arrivals = future_arrivals
         self.__job_to_vector_transformer = job_to_vector_transformer
         self.__regression_model = regression_model
+        self.__chunk_size = chunk_size
 
     def get_regression_model(self) -> RegressorMixin:
         return self.__regression_model
@@ -38,41 +69,65 @@ class ArrivalWindowDepartureTimePredictor(DepartureTimePredictor):
             the regression
         """
         departure_time_per_job = dict(departures)
-        X = []
-        y = []
-        for i in range(len(arrivals)):
-            job, arrival_time = arrivals[i]
-            if job in departure_time_per_job:
-                X.append(self.__create_feature_vector(arrivals, i))
-                y.append(departure_time_per_job[job] - arrival_time)
+        is_departed = np.array([job in departure_time_per_job for job,_ in arrivals], dtype=bool)
+        X = np.vstack([
+            feature_matrix[is_departed[start:stop]]
+            for start, stop, feature_matrix in self.__iterate_feature_matrices(arrivals)
+        ])
+        _impute_column_means(X, np.nanmean(X, axis=0))
 
-        X = np.vstack(X)
-        col_mean = np.nanmean(X, axis=0)
-        inds = np.where(np.isnan(X))
-        X[inds] = np.take(col_mean, inds[1])
-
-        y = np.array(y)
+        y = np.array([
+            departure_time_per_job[job] - arrival_time
+            for job, arrival_time in arrivals if job in departure_time_per_job
+        ])
 
         self.__regression_model.fit(X, y)
 
-    def __create_feature_vector(self, arrivals: list[tuple[Job, int]], i: int):
-        job, arrival_time = arrivals[i]
-        job_vector = self.__job_to_vector_transformer.transform(job)
-        feature_vector = []
-        for _ in range(self.__past_arrivals - i):
-            feature_vector.extend([np.nan] * (1 + len(job_vector)))
-        for j in range(max(0, i - self.__past_arrivals), i):
-            previous_job, previous_arrival_time = arrivals[j]
-            feature_vector.extend(self.__job_to_vector_transformer.transform(previous_job))
-            feature_vector.append(previous_arrival_time - arrival_time)
-        feature_vector.extend(self.__job_to_vector_transformer.transform(job))
-        for j in range(i+1, min(len(arrivals), i+1+self.__future_arrivals)):
-            next_job, next_arrival_time = arrivals[j]
-            feature_vector.extend(self.__job_to_vector_transformer.transform(next_job))
-            feature_vector.append(next_arrival_time - arrival_time)
-        for _ in range(self.__future_arrivals - len(arrivals) + i + 1):
-            feature_vector.extend([np.nan] * (1 + len(job_vector)))
-        return np.array(feature_vector)
+    def __iterate_feature_matrices(
+            self, arrivals: list[tuple[Job, int]]) -> Iterator[tuple[int, int, np.ndarray]]:
+        """
+        yields the feature vectors of the jobs in "arrivals" in chunks, i.e.
+        tuples (start, stop, feature matrix of arrivals[start:stop])
+        """
+        nr_of_jobs = len(arrivals)
+        chunk_size = nr_of_jobs if self.__chunk_size is None else self.__chunk_size
+        for start in range(0, nr_of_jobs, max(1, chunk_size)):
+            stop = min(nr_of_jobs, start + chunk_size)
+            yield start, stop, self.__create_feature_matrix(arrivals, start, stop)
+
+    def __create_feature_matrix(
+            self, arrivals: list[tuple[Job, int]], start: int, stop: int) -> np.ndarray:
+        """
+        creates the feature vectors of arrivals[start:stop]. only these jobs
+        and their neighbors in the window are transformed. missing values at
+        the start and the end of the log are NaN.
+        """
+        window_size = self.__past_arrivals + self.__future_arrivals + 1
+        nr_of_job_features = len(self.__job_to_vector_transformer.get_feature_names_of_vector_components())
+        first = max(0, start - self.__past_arrivals)
+        last = min(len(arrivals), stop + self.__future_arrivals)
+        #row of arrivals[first] in the padded matrices
+        offset = first - start + self.__past_arrivals
+        #each job is transformed only once. the windows are views into the padded matrices.
+        padded_job_matrix = np.full((stop - start + window_size - 1, nr_of_job_features), np.nan)
+        padded_job_matrix[offset:offset + last - first] = \
+            self.__job_to_vector_transformer.transform_many(job for job,_ in arrivals[first:last])
+        padded_arrival_times = np.full(stop - start + window_size - 1, np.nan)
+        padded_arrival_times[offset:offset + last - first] = [
+            arrival_time for _,arrival_time in arrivals[first:last]
+        ]
+        job_windows = sliding_window_view(padded_job_matrix, window_size, axis=0)
+        arrival_time_windows = sliding_window_view(padded_arrival_times, window_size)
+        relative_arrival_times = (
+            arrival_time_windows - arrival_time_windows[:, self.__past_arrivals, np.newaxis])
+        #the window of each job contains (job vector, relative arrival time) for
+        #all positions except for the job itself, which has no relative arrival time
+        feature_matrix = np.concatenate([
+            job_windows.transpose(0, 2, 1),
+            relative_arrival_times[:, :, np.newaxis]
+        ], axis=2).reshape(stop - start, -1)
+        column_of_own_arrival_time = self.__past_arrivals * (nr_of_job_features + 1) + nr_of_job_features
+        return np.delete(feature_matrix, column_of_own_arrival_time, axis=1)
 
     def  get_feature_names_for_vector(self) -> list[str]:
         feature_names = []
@@ -90,19 +145,37 @@ class ArrivalWindowDepartureTimePredictor(DepartureTimePredictor):
 
         return feature_names
 
-    def predict_waiting_and_departure_times_distribution(
-            self, arrivals: list[tuple[Job, int]]) -> tuple[dict[Job, list[int]] | None, dict[Job, list[int]]]:
-        X = []
-        for i in range(len(arrivals)):
-            X.append(self.__create_feature_vector(arrivals, i))
-        X = np.vstack(X)
-        col_mean = np.nanmean(X, axis=0)
-        inds = np.where(np.isnan(X))
-        X[inds] = np.take(col_mean, inds[1])
-
-        y = self.__regression_model.predict(X)
-
-        return None, {
-            arrivals[i][0]: [arrivals[i][1] + y[i]]
-            for i in range(len(y))
-        }
+    def predict_replication_matrix(self, arrivals: list[tuple[Job, int]]) -> ReplicationMatrix:
+        y = np.empty(len(arrivals))
+        #feature vectors with missing values are predicted at the end, when
+        #the column means of all feature vectors are known
+        sum_per_column = 0
+        count_per_column = 0
+        incomplete_row_indices = []
+        incomplete_rows = []
+        for start, _, X in self.__iterate_feature_matrices(arrivals):
+            is_missing = np.isnan(X)
+            sum_per_column = sum_per_column + np.nansum(X, axis=0)
+            count_per_column = count_per_column + np.sum(~is_missing, axis=0)
+            is_incomplete = is_missing.any(axis=1)
+            if not is_incomplete.all():
+                y[start + np.flatnonzero(~is_incomplete)] = self.__regression_model.predict(
+                    X[~is_incomplete])
+            if is_incomplete.any():
+                incomplete_row_indices.append(start + np.flatnonzero(is_incomplete))
+                incomplete_rows.append(X[is_incomplete])
+        if incomplete_rows:
+            X = np.vstack(incomplete_rows)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                _impute_column_means(X, sum_per_column / count_per_column)
+            y[np.concatenate(incomplete_row_indices)] = self.__regression_model.predict(X)
+
+        arrival_times = np.array([arrival_time for _,arrival_time in arrivals])
+        return ReplicationMatrix([job for job,_ in arrivals], (arrival_times + y).reshape(-1, 1))
+
+def _impute_column_means(X: np.ndarray, col_mean: np.ndarray):
+    """
+    replaces the missing values of X inplace by the mean of their column
+    """
+    inds = np.where(np.isnan(X))
+    X[inds] = np.take(col_mean, inds[1])
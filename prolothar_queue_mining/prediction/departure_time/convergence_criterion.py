@@ -0,0 +1,103 @@
+from math import ceil, floor, sqrt
+from statistics import NormalDist
+from typing import Literal
+
+import numpy as np
+
+class ConvergenceCriterion():
+    """
+    decides whether the empirical distributions of predicted departure times
+    are precise enough, i.e. whether a simulation based predictor can stop to
+    run further replications. the predictor runs the replications in blocks
+    and checks this criterion after each block.
+    """
+
+    def __init__(
+            self, tolerance: float, statistic: Literal['mean', 'quantile'] = 'mean',
+            quantile: float = 0.5, confidence: float = 0.95,
+            fraction_of_jobs: float = 1.0, block_size: int = 50):
+        """
+        creates a new ConvergenceCriterion
+
+        Parameters
+        ----------
+        tolerance : float
+            maximal uncertainty of the statistic for a job to be converged
+        statistic : Literal['mean', 'quantile'], optional
+            - "mean": the uncertainty is the standard error of the mean
+              departure time
+            - "quantile": the uncertainty is the width of the distribution-free
+              confidence interval of the given quantile of the departure time
+            by default "mean"
+        quantile : float, optional
+            the quantile for statistic "quantile", by default 0.5
+        confidence : float, optional
+            confidence level of the confidence interval for statistic
+            "quantile", by default 0.95
+        fraction_of_jobs : float, optional
+            the replications have converged if the statistic has converged for
+            at least this fraction of the jobs, by default 1.0
+        block_size : int, optional
+            number of replications between two checks. this is also the minimal
+            number of replications. by default 50
+        """
+        if statistic not in ('mean', 'quantile'):
+            raise NotImplementedError(f'unknown statistic: {statistic}')
+        if block_size < 2:
+            raise ValueError(f'block_size must be at least 2, but is {block_size}')
+        self.__tolerance = tolerance
+        self.__statistic = statistic
+        self.__quantile = quantile
+        self.__z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.__fraction_of_jobs = fraction_of_jobs
+        self.__block_size = block_size
+
+    def get_block_size(self) -> int:
+        return self.__block_size
+
+    def compute_uncertainty(self, departure_times: np.ndarray) -> np.ndarray:
+        """
+        computes the uncertainty of the statistic for each job
+
+        Parameters
+        ----------
+        departure_times : np.ndarray
+            (jobs x replications) matrix of predicted departure times
+
+        Returns
+        -------
+        np.ndarray
+            standard error of the mean or width of the confidence interval of
+            the quantile for each job. infinite if there are too few
+            replications to compute the uncertainty.
+        """
+        nr_of_jobs, nr_of_replications = departure_times.shape
+        if self.__statistic == 'mean':
+            if nr_of_replications < 2:
+                return np.full(nr_of_jobs, np.inf)
+            return departure_times.std(axis=1, ddof=1) / sqrt(nr_of_replications)
+        #the ranks of the bounds of the confidence interval follow from the
+        #normal approximation of the binomial distribution
+        half_width = self.__z * sqrt(nr_of_replications * self.__quantile * (1 - self.__quantile))
+        lower_rank = floor(nr_of_replications * self.__quantile - half_width)
+        upper_rank = ceil(nr_of_replications * self.__quantile + half_width)
+        if lower_rank < 0 or upper_rank >= nr_of_replications:
+            return np.full(nr_of_jobs, np.inf)
+        bounds = np.partition(departure_times, (lower_rank, upper_rank), axis=1)
+        return bounds[:, upper_rank] - bounds[:, lower_rank]
+
+    def has_converged(self, departure_times: np.ndarray) -> bool:
+        """
+        returns True if the uncertainty is not larger than the tolerance for
+        the required fraction of jobs
+
+        Parameters
+        ----------
+        departure_times : np.ndarray
+            (jobs x replications) matrix of predicted departure times
+        """
+        if len(departure_times) == 0:
+            return True
+        return bool(np.mean(
+            self.compute_uncertainty(departure_times) <= self.__tolerance
+        ) >= self.__fraction_of_jobs)
@@ -1,18 +1,26 @@
-from abc import ABC, abstractmethod
-
-from statistics import median, mode
-from typing import Literal
-from prolothar_common.experiments.statistics import Statistics
+from abc import ABC
 
 from prolothar_queue_mining.model.job import Job
-
-LocationParameter = Literal['mean', 'mode', 'median']
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import LocationParameter
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
 
 class DepartureTimePredictor(ABC):
     """
-    interface for departure time predictors
+    interface for departure time predictors. subclasses must override
+    predict_replication_matrix or predict_waiting_and_departure_times_distribution.
     """
 
+    def __new__(cls, *args, **kwargs):
+        #the default implementations of both methods call each other
+        if cls.predict_replication_matrix is DepartureTimePredictor.predict_replication_matrix \
+        and cls.predict_waiting_and_departure_times_distribution is \
+                DepartureTimePredictor.predict_waiting_and_departure_times_distribution:
+            raise TypeError(
+                f"Can't instantiate {cls.__name__}, because it overrides neither "
+                'predict_replication_matrix nor '
+                'predict_waiting_and_departure_times_distribution')
+        return super().__new__(cls)
+
     def predict(self, arrivals: list[tuple[Job, int]], location_parameter: LocationParameter = 'mean') -> dict[Job, int]:
         """
         predicts the departure time for each job in the arrivals list.
@@ -30,35 +38,23 @@ class DepartureTimePredictor(ABC):
         prediction of waiting times. the second component is a dictionary with the
         predicted departure times.
         """
-        waiting_times, exit_times = self.predict_waiting_and_departure_times_distribution(arrivals)
-        if location_parameter == 'mean':
-            return {
-                job: Statistics(waiting_time_list).mean() for job, waiting_time_list
-                in  waiting_times.items()
-            } if waiting_times is not None else None, {
-                job: Statistics(departure_time_list).mean() for job, departure_time_list
-                in  exit_times.items()
-            }
-        elif location_parameter == 'mode':
-            return {
-                job: mode(waiting_time_list) for job, waiting_time_list
-                in  waiting_times.items()
-            } if waiting_times is not None else None, {
-                job: mode(departure_time_list) for job, departure_time_list
-                in  exit_times.items()
-            }            
-        elif location_parameter == 'median':
-            return {
-                job: median(waiting_time_list) for job, waiting_time_list
-                in  waiting_times.items()
-            } if waiting_times is not None else None, {
-                job: median(departure_time_list) for job, departure_time_list
-                in  exit_times.items()
-            }
-        else:
-            raise NotImplementedError(f'unknown location parameter: {location_parameter}')       
+        replication_matrix = self.predict_replication_matrix(arrivals)
+        waiting_times, exit_times = replication_matrix.compute_location(location_parameter)
+        jobs = replication_matrix.get_jobs()
+        return (
+            dict(zip(jobs, waiting_times.tolist())) if waiting_times is not None else None,
+            dict(zip(jobs, exit_times.tolist()))
+        )
+
+    def predict_replication_matrix(self, arrivals: list[tuple[Job, int]]) -> ReplicationMatrix:
+        """
+        predicts possible waiting times and departure times for each job given
+        a fixed list of arrival times. the rows of the returned matrices are in
+        the order of the arrivals.
+        """
+        return ReplicationMatrix.from_dicts(
+            arrivals, *self.predict_waiting_and_departure_times_distribution(arrivals))
 
-    @abstractmethod
     def predict_waiting_and_departure_times_distribution(
         self, arrivals: list[tuple[Job, int]]) -> tuple[dict[Job, list[int]]|None, dict[Job, list[int]]]:
         """
@@ -71,3 +67,4 @@ class DepartureTimePredictor(ABC):
             a list of predicted waiting times and a list of predicted departure times
             for each job
         """
+        return self.predict_replication_matrix(arrivals).to_dicts()
@@ -1,4 +1,7 @@
+import numpy as np
+
 from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
 
 from prolothar_queue_mining.model.job import Job
 
@@ -10,8 +13,7 @@ class FixedSojournTimeDepartureTimePredictor(DepartureTimePredictor):
     def __init__(self, sojourn_time: int):
         self.__sojourn_time = sojourn_time
 
-    def predict_waiting_and_departure_times_distribution(
-            self, arrivals: list[tuple[Job, int]]) -> tuple[dict[Job, list[int]] | None, dict[Job, list[int]]]:
-        return None, {
-            job: [arrival_time + self.__sojourn_time] for job,arrival_time in arrivals
-        }
+    def predict_replication_matrix(self, arrivals: list[tuple[Job, int]]) -> ReplicationMatrix:
+        return ReplicationMatrix(
+            [job for job,_ in arrivals],
+            (np.array([arrival_time for _,arrival_time in arrivals]) + self.__sojourn_time).reshape(-1, 1))
@@ -1,10 +1,11 @@
-from collections import defaultdict
 import numpy as np
 from sklearn.base import ClusterMixin
 from tqdm import tqdm
 from methodtools import lru_cache
 
 from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
+from prolothar_queue_mining.prediction.departure_time.convergence_criterion import ConvergenceCriterion
 
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.service_time import ServiceTime
@@ -20,11 +21,33 @@ class LoadClusterDepartureTimePredictor(DepartureTimePredictor):
 
     def __init__(
             self, cluster_predictor: ClusterMixin, predictor_per_cluster: dict[int, ServiceTime],
-            nr_of_repetitions: int = 1000, show_progress_bar: bool = False):
+            nr_of_repetitions: int = 1000, show_progress_bar: bool = False,
+            convergence_criterion: ConvergenceCriterion|None = None):
+        """
+        creates a new LoadClusterDepartureTimePredictor
+
+        Parameters
+        ----------
+        cluster_predictor : ClusterMixin
+            predicts the cluster label from the number of jobs in the system
+        predictor_per_cluster : dict[int, ServiceTime]
+            sojourn time model for each cluster label
+        nr_of_repetitions : int, optional
+            number of simulation runs or the maximal number of simulation runs
+            if a convergence_criterion is given, by default 1000
+        show_progress_bar : bool, optional
+            by default False
+        convergence_criterion : ConvergenceCriterion | None, optional
+            if given, stops the simulation runs as soon as the predicted
+            departure times have converged. the number of used runs is returned
+            by ReplicationMatrix.get_nr_of_replications. by default None, i.e.
+            the number of runs is fixed.
+        """
         self.__cluster_predictor = cluster_predictor
         self.__predictor_per_cluster = predictor_per_cluster
         self.__nr_of_repetitions = nr_of_repetitions
         self.__show_progress_bar = show_progress_bar
+        self.__convergence_criterion = convergence_criterion
 
     def set_nr_of_repetitions(self, nr_of_repetitions: int):
         self.__nr_of_repetitions = nr_of_repetitions
@@ -32,24 +55,38 @@ class LoadClusterDepartureTimePredictor(DepartureTimePredictor):
     def set_show_progress_bar(self, show_progress_bar: bool):
         self.__show_progress_bar = show_progress_bar
 
-    def predict_waiting_and_departure_times_distribution(
-            self, arrivals: list[tuple[Job, int]]) -> tuple[dict[Job, list[int]] | None, dict[Job, list[int]]]:
-        exit_times_per_job = defaultdict(list)
+    def set_convergence_criterion(self, convergence_criterion: ConvergenceCriterion|None):
+        self.__convergence_criterion = convergence_criterion
+
+    def predict_replication_matrix(self, arrivals: list[tuple[Job, int]]) -> ReplicationMatrix:
+        exit_times = np.empty((len(arrivals), self.__nr_of_repetitions), dtype=np.int64)
 
         repetition_range = range(self.__nr_of_repetitions)
         if self.__show_progress_bar:
             repetition_range = tqdm(repetition_range)
 
-        for _ in repetition_range:
+        nr_of_used_repetitions = self.__nr_of_repetitions
+        for repetition in repetition_range:
             jobs_in_system = set()
 
             environment = Environment()
-            for job, arrival_time in arrivals:
+            for (job, arrival_time), exit_times_of_job in zip(arrivals, exit_times):
                 environment.schedule_event(ArrivalEvent(
-                    job, arrival_time, jobs_in_system, exit_times_per_job, self))
+                    job, arrival_time, jobs_in_system, exit_times_of_job, repetition, self))
             environment.run_until_event_queue_is_empty()
 
-        return None, exit_times_per_job
+            if self.__has_converged(exit_times, repetition + 1):
+                nr_of_used_repetitions = repetition + 1
+                break
+
+        return ReplicationMatrix([job for job,_ in arrivals], exit_times[:, :nr_of_used_repetitions])
+
+    def __has_converged(self, exit_times: np.ndarray, nr_of_finished_repetitions: int) -> bool:
+        return (
+            self.__convergence_criterion is not None
+            and nr_of_finished_repetitions % self.__convergence_criterion.get_block_size() == 0
+            and self.__convergence_criterion.has_converged(exit_times[:, :nr_of_finished_repetitions])
+        )
 
     def predict_sojourn_time_of_job(self, job: Job, nr_of_jobs_in_system: int) -> int:
         cluster_label = self.__predict_cluster_label(nr_of_jobs_in_system)
@@ -63,12 +100,14 @@ class ArrivalEvent(Event):
 
     def __init__(
             self, job: Job, arrival_time: int, jobs_in_system: set[Job],
-            exit_times_per_job: dict[Job, list], parent: LoadClusterDepartureTimePredictor):
+            exit_times_of_job: np.ndarray, repetition: int,
+            parent: LoadClusterDepartureTimePredictor):
         super().__init__(arrival_time, prio=1)
         self.__job = job
         self.__jobs_in_system = jobs_in_system
         self.__parent = parent
-        self.__exit_times_per_job = exit_times_per_job
+        self.__exit_times_of_job = exit_times_of_job
+        self.__repetition = repetition
 
     def execute(self, environment: Environment):
         exit_time = self.time + self.__parent.predict_sojourn_time_of_job(
@@ -76,7 +115,7 @@ class ArrivalEvent(Event):
         environment.schedule_event(DepartureEvent(
             self.__job, exit_time, self.__jobs_in_system
         ))
-        self.__exit_times_per_job[self.__job].append(exit_time)
+        self.__exit_times_of_job[self.__repetition] = exit_time
         self.__jobs_in_system.add(self.__job)
 
 class DepartureEvent(Event):
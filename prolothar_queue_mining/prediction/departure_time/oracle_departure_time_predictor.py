@@ -1,4 +1,7 @@
+import numpy as np
+
 from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
 
 from prolothar_queue_mining.model.job import Job
 
@@ -9,8 +12,10 @@ class OracleDepartureTimePredictor(DepartureTimePredictor):
     def __init__(self, departure_time_per_job: dict[Job, int]):
         self.__departure_time_per_job = departure_time_per_job
 
-    def predict_waiting_and_departure_times_distribution(
-            self, arrivals: list[tuple[Job, int]]) -> tuple[dict[Job, list[int]]|None, dict[Job, list[int]]]:
-        return None, {
-            job: [self.__departure_time_per_job.get(job, None)] for job,_ in arrivals
-        }
\ No newline at end of file
+    def predict_replication_matrix(self, arrivals: list[tuple[Job, int]]) -> ReplicationMatrix:
+        #unknown jobs get NaN as departure time
+        return ReplicationMatrix(
+            [job for job,_ in arrivals],
+            np.array([
+                [self.__departure_time_per_job.get(job, np.nan)] for job,_ in arrivals
+            ], dtype=float).reshape(-1, 1))
\ No newline at end of file
@@ -1,14 +1,23 @@
 import sys
+from math import ceil
 from random import Random
-from collections import defaultdict
-from tqdm import trange
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable
+
+import numpy as np
 
 from prolothar_common.experiments.statistics import Statistics
 
 from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
+from prolothar_queue_mining.prediction.departure_time.convergence_criterion import ConvergenceCriterion
 
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.queue_spec import QueueSpec
+from prolothar_queue_mining.model.queue_state import QueueState
+from prolothar_queue_mining.model.vectorized_queue_simulation import VectorizedQueueSimulation
+from prolothar_queue_mining.model.service_time.common_random_numbers_service_time import ANTITHETIC_BIT
 from prolothar_queue_mining.model.arrival_process import FixedArrival
 from prolothar_queue_mining.model.population import ListPopulation
 from prolothar_queue_mining.model.exit import ListCollectorExit
@@ -17,73 +26,246 @@ from prolothar_queue_mining.model.environment import Environment
 
 class QueueDepartureTimePredictor(DepartureTimePredictor):
     """
-    predictor that uses a queue model to predict departure times
+    predictor that uses a queue model to predict departure times. all
+    simulation runs reuse the same QueueState, i.e. the queue model is not
+    copied per run. the seed of each run is spawned from a
+    numpy.random.SeedSequence, i.e. the result does not depend on the number
+    of CPUs.
     """
-    def __init__(self, queue: Queue, repetitions: int=1000, seed: int = None,
-                 verbose: bool = False, mode: str = 'stochastic'):
+    def __init__(self, queue: Queue|QueueSpec, repetitions: int=1000, seed: int = None,
+                 verbose: bool = False, mode: str = 'stochastic', nr_of_cpus: int = 1,
+                 executor: Executor|None = None,
+                 convergence_criterion: ConvergenceCriterion|None = None,
+                 antithetic_variates: bool = False):
+        """
+        creates a new QueueDepartureTimePredictor
+
+        Parameters
+        ----------
+        queue : Queue|QueueSpec
+            the queue model that is simulated
+        repetitions : int, optional
+            number of simulation runs or the maximal number of simulation runs
+            if a convergence_criterion is given, by default 1000
+        seed : int, optional
+            random seed, by default None
+        verbose : bool, optional
+            shows a progress bar if True, by default False
+        mode : str, optional
+            - "stochastic": runs the event based simulation once per repetition
+            - "vectorized": simulates all repetitions at once on arrays (see
+              VectorizedQueueSimulation). falls back to "stochastic" if the
+              queue or the arrivals are not supported.
+            - "mean": replaces all stochastic behavior by its mean
+            by default "stochastic"
+        nr_of_cpus : int, optional
+            number of processes for the event based simulation runs, by default 1
+        executor : Executor | None, optional
+            runs the simulation runs in nr_of_cpus chunks if nr_of_cpus > 1. a
+            long-living executor avoids the start of new processes for each
+            prediction. by default None, i.e. a new ProcessPoolExecutor is
+            created for each prediction.
+        convergence_criterion : ConvergenceCriterion | None, optional
+            if given, the simulation runs are executed in blocks until the
+            predicted departure times have converged. the number of used runs
+            is returned by ReplicationMatrix.get_nr_of_replications. by default
+            None, i.e. the number of runs is fixed.
+        antithetic_variates : bool, optional
+            if True, the runs are executed in pairs whose queue seeds only
+            differ in ANTITHETIC_BIT. CommonRandomNumbersServiceTime uses the
+            random numbers u and 1-u in the two runs of a pair, which reduces
+            the variance of the mean prediction. other stochastic behavior is
+            not affected. by default False
+        """
+        spec = queue if isinstance(queue, QueueSpec) else QueueSpec.from_queue(queue)
         match mode:
-            case 'stochastic':
-                self.__queue = queue
+            case 'stochastic' | 'vectorized':
+                self.__queue_spec = spec
             case 'mean':
-                self.__queue = queue.copy_mean()
+                self.__queue_spec = spec.copy_mean()
             case _:
                 raise NotImplementedError(f'unsupported mode "{mode}')
-        if (self.__queue.get_servers()[0].get_service_time_definition().is_deterministic()
-             and self.__queue.get_batch_size_distribution().is_deterministic()):
+        self.__queue_state = QueueState(self.__queue_spec)
+        if self.__queue_spec.is_deterministic():
             self.__repetitions = 1
         else:
             self.__repetitions = repetitions
         self.__seed_generator = None if seed is None else Random(seed)
         self.__verbose = verbose
+        self.__mode = mode
+        self.__nr_of_cpus = nr_of_cpus
+        self.__executor = executor
+        self.__convergence_criterion = convergence_criterion
+        self.__antithetic_variates = antithetic_variates
+
+    def predict_replication_matrix(self, arrivals: list[tuple[Job, int]]) -> ReplicationMatrix:
+        seeds = self.__create_seeds()
+        jobs = [job for job,_ in arrivals]
+        if self.__mode == 'vectorized':
+            simulation = VectorizedQueueSimulation.create(self.__queue_spec, arrivals)
+            if simulation is not None:
+                arrival_times = np.array([time for _,time in arrivals], dtype=np.int64)
+                waiting_times, departure_times = self.__run_in_blocks(
+                    lambda block_seeds: self.__run_vectorized(simulation, arrival_times, block_seeds),
+                    seeds)
+                return ReplicationMatrix(jobs, departure_times.T, waiting_times=waiting_times.T)
+        if self.__nr_of_cpus > 1 and len(seeds) > 1:
+            executor = self.__executor
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=self.__nr_of_cpus)
+            try:
+                waiting_times, departure_times = self.__run_in_blocks(
+                    lambda block_seeds: self.__run_in_parallel(arrivals, block_seeds, executor),
+                    seeds)
+            finally:
+                if self.__executor is None:
+                    executor.shutdown()
+        else:
+            runner = _ReplicationRunner(self.__queue_state, arrivals)
+            waiting_times, departure_times = self.__run_in_blocks(
+                lambda block_seeds: runner.run(block_seeds, verbose=self.__verbose), seeds)
+        return ReplicationMatrix(jobs, departure_times.T, waiting_times=waiting_times.T)
+
+    def __run_in_blocks(
+            self, run_block: Callable[[list[int]], tuple[np.ndarray, np.ndarray]],
+            seeds: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        runs one replication per seed, in blocks until the convergence
+        criterion is satisfied if there is one
+        """
+        if self.__convergence_criterion is None:
+            return run_block(seeds)
+        block_size = self.__convergence_criterion.get_block_size()
+        waiting_times = []
+        departure_times = []
+        for start in range(0, len(seeds), block_size):
+            block_waiting_times, block_departure_times = run_block(seeds[start:start + block_size])
+            waiting_times.append(block_waiting_times)
+            departure_times.append(block_departure_times)
+            if self.__convergence_criterion.has_converged(np.concatenate(departure_times).T):
+                break
+        return np.concatenate(waiting_times), np.concatenate(departure_times)
+
+    def __run_vectorized(
+            self, simulation: VectorizedQueueSimulation, arrival_times: np.ndarray,
+            seeds: list[int]) -> tuple[np.ndarray, np.ndarray]:
+        start_times, exit_times = simulation.run(len(seeds), seed=seeds[0])
+        return start_times - arrival_times, exit_times
+
+    def __create_seeds(self) -> list[int]:
+        if not self.__antithetic_variates:
+            return [
+                int(child.generate_state(1)[0])
+                for child in self.__create_seed_sequence().spawn(self.__repetitions)
+            ]
+        #the seeds are smaller than ANTITHETIC_BIT, i.e. the two seeds of a pair
+        #and the derived server seeds (seed + i) are different
+        seeds = []
+        for child in self.__create_seed_sequence().spawn(ceil(self.__repetitions / 2)):
+            seed = int(child.generate_state(1)[0])
+            seeds.append(seed)
+            seeds.append(seed | ANTITHETIC_BIT)
+        return seeds[:self.__repetitions]
+
+    def __create_seed_sequence(self) -> np.random.SeedSequence:
+        if self.__seed_generator is None:
+            return np.random.SeedSequence()
+        return np.random.SeedSequence(self.__seed_generator.randint(0, sys.maxsize))
+
+    def __run_in_parallel(
+            self, arrivals: list[tuple[Job, int]], seeds: list[int],
+            executor: Executor) -> tuple[np.ndarray, np.ndarray]:
+        chunks = [
+            chunk.tolist() for chunk in
+            np.array_split(np.array(seeds, dtype=np.int64), min(self.__nr_of_cpus, len(seeds)))
+        ]
+        futures = [
+            executor.submit(_run_replications, self.__queue_spec, arrivals, chunk)
+            for chunk in chunks
+        ]
+        if self.__verbose:
+            from tqdm import tqdm
+            futures = tqdm(futures)
+        results = [future.result() for future in futures]
+        return (
+            np.concatenate([waiting_times for waiting_times,_ in results]),
+            np.concatenate([departure_times for _,departure_times in results])
+        )
 
-    def predict_waiting_and_departure_times_distribution(
-        self, arrivals: list[tuple[Job, int]]) -> tuple[dict[Job, list[int]], dict[Job, list[int]]]:
-        arrival_process = FixedArrival(
+def _run_replications(
+        queue_spec: QueueSpec, arrivals: list[tuple[Job, int]],
+        seeds: list[int]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    runs the simulation once for each seed in a worker process
+    """
+    return _ReplicationRunner(QueueState(queue_spec), arrivals).run(seeds)
+
+class _ReplicationRunner():
+    """
+    runs the event based simulation of a queue for the given arrivals once
+    per seed
+    """
+
+    def __init__(self, queue_state: QueueState, arrivals: list[tuple[Job, int]]):
+        self.__queue_state = queue_state
+        self.__arrivals = arrivals
+        self.__arrival_process = FixedArrival(
             ListPopulation([job for job,_ in arrivals]),
             [time for _,time in arrivals]
         )
-        predicted_waiting_times_collector = defaultdict(list)
-        predicted_departure_times_collector = defaultdict(list)
-        for _ in trange(self.__repetitions, disable=not self.__verbose):
-            predicted_waiting_times, predicted_departure_times = self.__do_single_run(arrivals, arrival_process)
-            for job, time in predicted_waiting_times.items():
-                predicted_waiting_times_collector[job].append(time)
-            for job, time in predicted_departure_times.items():
-                predicted_departure_times_collector[job].append(time)
-        return predicted_waiting_times_collector, predicted_departure_times_collector
-
-    def __do_single_run(self, arrivals, arrival_process):
-        queue = self.__queue.copy()
-        queue.set_arrival_process(arrival_process.copy())
-        queue.set_exit(ListCollectorExit())
-        queue.set_waiting_time_observer(WaitingTimeRecordingObserver())
-        queue.set_seed(None if self.__seed_generator is None else self.__seed_generator.randint(0, sys.maxsize))
+
+    def run(self, seeds: list[int], verbose: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """
+        returns the waiting and departure times with shape (number of seeds,
+        number of arrivals)
+        """
+        waiting_times = []
+        departure_times = []
+        if verbose:
+            from tqdm import tqdm
+            seeds = tqdm(seeds)
+        for seed in seeds:
+            predicted_waiting_times, predicted_departure_times = self.__do_single_run(seed)
+            waiting_times.append([predicted_waiting_times[job] for job,_ in self.__arrivals])
+            departure_times.append([predicted_departure_times[job] for job,_ in self.__arrivals])
+        #the dtype is int64 unless the queue got stuck in one of the runs
+        return (
+            np.array(waiting_times).reshape(len(waiting_times), len(self.__arrivals)),
+            np.array(departure_times).reshape(len(departure_times), len(self.__arrivals))
+        )
+
+    def __do_single_run(self, seed: int):
+        queue = self.__queue_state.reset(
+            arrival_process=self.__arrival_process.copy(),
+            exit_point=ListCollectorExit(),
+            waiting_time_observer=WaitingTimeRecordingObserver(),
+            seed=seed)
         environment = Environment(verbose=False)
         queue.schedule_next_arrival(environment)
         environment.run_until_event_queue_is_empty()
-        predicted_waiting_times = self.__extract_waiting_times_from_queue(arrivals, queue)
-        predicted_departure_times = self.__extract_departure_times_from_queue(arrivals, queue)
+        predicted_waiting_times = self.__extract_waiting_times_from_queue(queue)
+        predicted_departure_times = self.__extract_departure_times_from_queue(queue)
         return predicted_waiting_times, predicted_departure_times
 
-    def __extract_departure_times_from_queue(self, arrivals, queue):
+    def __extract_departure_times_from_queue(self, queue):
         predicted_departure_times = dict(zip(*queue.get_exit().get_recording()))
         #if queue gets stuck because of missing batch elements, the best
         #prediction we can offer is the average sojourn time
         if len(queue.get_waiting_area()) > 0:
             average_sojourn_time = Statistics(
                     predicted_departure_times[job] - arrival_time
-                    for job, arrival_time in arrivals if job in predicted_departure_times).mean()
-            for job,arrival_time in arrivals:
+                    for job, arrival_time in self.__arrivals if job in predicted_departure_times).mean()
+            for job,arrival_time in self.__arrivals:
                 if job not in predicted_departure_times:
                     predicted_departure_times[job] = arrival_time + average_sojourn_time
         return predicted_departure_times
 
-    def __extract_waiting_times_from_queue(self, arrivals, queue):
+    def __extract_waiting_times_from_queue(self, queue):
         predicted_waiting_times = queue.get_waiting_time_observer().get_waiting_time_per_job_dict()
         #if queue gets stuck because of missing batch elements, the best
         #prediction we can offer is the average waiting time
         average_predicted_waiting_time = queue.get_waiting_time_observer().get_mean_waiting_time()
-        for job,_ in arrivals:
+        for job,_ in self.__arrivals:
             if job not in predicted_waiting_times:
                 predicted_waiting_times[job] = average_predicted_waiting_time
         return predicted_waiting_times
\ No newline at end of file
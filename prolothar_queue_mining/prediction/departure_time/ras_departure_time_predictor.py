@@ -1,6 +1,7 @@
 import numpy as np
 
 from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
 
 from prolothar_queue_mining.model.job import Job
 
@@ -18,8 +19,7 @@ class RasDepartureTimePredictor(DepartureTimePredictor):
         self.__arrival_process_model = arrival_process_model
         self.__service_time_model = service_time_model
 
-    def predict_waiting_and_departure_times_distribution(
-            self, arrivals: list[tuple[Job, int]]) -> tuple[None, dict[Job, list[int]]]:
+    def predict_replication_matrix(self, arrivals: list[tuple[Job, int]]) -> ReplicationMatrix:
         hidden_states = self.__arrival_process_model.compute_hidden_states(arrivals)
         jobs = [job for job,_ in arrivals]
         predicted_service_times = self.__service_time_model.sample(hidden_states, jobs)[0,:,:]
@@ -28,9 +28,7 @@ class RasDepartureTimePredictor(DepartureTimePredictor):
         #some jobs cannot be predicted, because there is no computed hidded state for them
         for _ in range(predicted_service_times.shape[0], len(jobs)):
             predicted_service_times = np.vstack((predicted_service_times, average_predicted_service_time_row))
-        predicted_departure_times_collector = {
-            job: (arrivals[i][1] + predicted_service_times[i,:]).tolist()
-            for i, job in enumerate(jobs)
-        }
-        return None, predicted_departure_times_collector
+        arrival_times = np.array([arrival_time for _,arrival_time in arrivals])
+        return ReplicationMatrix(
+            jobs, arrival_times[:, np.newaxis] + predicted_service_times[:len(jobs)])
 
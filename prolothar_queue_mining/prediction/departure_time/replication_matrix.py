@@ -0,0 +1,190 @@
+from collections import defaultdict
+from typing import Literal
+
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+
+LocationParameter = Literal['mean', 'mode', 'median']
+
+class ReplicationMatrix():
+    """
+    predicted waiting and departure times of jobs in (jobs x replications)
+    matrices, i.e. row i contains the empirical distribution of the i-th job.
+    point predictions and prediction intervals are computed for all jobs at once.
+    """
+
+    def __init__(
+            self, jobs: list[Job], departure_times: np.ndarray,
+            waiting_times: np.ndarray|None = None):
+        """
+        creates a new ReplicationMatrix
+
+        Parameters
+        ----------
+        jobs : list[Job]
+            the predicted jobs, i.e. the rows of the matrices
+        departure_times : np.ndarray
+            (jobs x replications) matrix of predicted departure times
+        waiting_times : np.ndarray | None, optional
+            (jobs x replications) matrix of predicted waiting times or None if
+            the predictor does not support prediction of waiting times. by default None.
+        """
+        if departure_times.ndim != 2 or departure_times.shape[0] != len(jobs):
+            raise ValueError(
+                f'departure_times must have shape ({len(jobs)}, nr_of_replications), '
+                f'but has shape {departure_times.shape}')
+        if waiting_times is not None and waiting_times.shape != departure_times.shape:
+            raise ValueError(
+                f'waiting_times must have shape {departure_times.shape}, '
+                f'but has shape {waiting_times.shape}')
+        self.__jobs = jobs
+        self.__departure_times = departure_times
+        self.__waiting_times = waiting_times
+
+    @staticmethod
+    def from_dicts(
+            arrivals: list[tuple[Job, int]], waiting_times: dict[Job, list[int]]|None,
+            departure_times: dict[Job, list[int]]) -> 'ReplicationMatrix':
+        """
+        creates a ReplicationMatrix from the lists of predicted times per job,
+        i.e. from the result of predict_waiting_and_departure_times_distribution
+        of a DepartureTimePredictor. all lists must have the same length.
+        """
+        jobs = [job for job,_ in arrivals]
+        return ReplicationMatrix(
+            jobs,
+            _to_matrix([departure_times[job] for job in jobs]),
+            None if waiting_times is None else _to_matrix([waiting_times[job] for job in jobs])
+        )
+
+    def get_jobs(self) -> list[Job]:
+        return self.__jobs
+
+    def get_departure_times(self) -> np.ndarray:
+        """
+        returns the (jobs x replications) matrix of predicted departure times
+        """
+        return self.__departure_times
+
+    def get_waiting_times(self) -> np.ndarray|None:
+        """
+        returns the (jobs x replications) matrix of predicted waiting times or
+        None if the predictor does not support prediction of waiting times
+        """
+        return self.__waiting_times
+
+    def get_nr_of_replications(self) -> int:
+        return self.__departure_times.shape[1]
+
+    def to_dicts(self) -> tuple[dict[Job, list[int]]|None, dict[Job, list[int]]]:
+        """
+        returns the list of predicted waiting times and the list of predicted
+        departure times for each job. the first component is None if the
+        predictor does not support prediction of waiting times.
+        """
+        return (
+            None if self.__waiting_times is None
+            else defaultdict(list, zip(self.__jobs, self.__waiting_times.tolist())),
+            defaultdict(list, zip(self.__jobs, self.__departure_times.tolist()))
+        )
+
+    def compute_location(
+            self, location_parameter: LocationParameter = 'mean'
+            ) -> tuple[np.ndarray|None, np.ndarray]:
+        """
+        computes a point prediction for the waiting time and the departure time
+        of each job. "mode" returns the smallest of the most frequent values.
+        NaN values (e.g. jobs without prediction) are ignored.
+
+        Returns
+        -------
+        tuple[np.ndarray|None, np.ndarray]
+            point predictions of waiting times (None if not supported) and
+            departure times
+        """
+        match location_parameter:
+            case 'mean':
+                statistic = _compute_mean
+            case 'mode':
+                statistic = _compute_mode
+            case 'median':
+                statistic = _compute_median
+            case _:
+                raise NotImplementedError(f'unknown location parameter: {location_parameter}')
+        return self.__apply(statistic)
+
+    def compute_quantiles(
+            self, quantiles: float|list[float]) -> tuple[np.ndarray|None, np.ndarray]:
+        """
+        computes the given quantiles of the waiting time and the departure time
+        of each job
+
+        Parameters
+        ----------
+        quantiles : float | list[float]
+            quantiles between 0 and 1
+
+        Returns
+        -------
+        tuple[np.ndarray|None, np.ndarray]
+            quantiles of waiting times (None if not supported) and departure
+            times. the shape is (jobs,) for a single quantile and
+            (jobs x quantiles) for a list of quantiles.
+        """
+        return self.__apply(lambda matrix: np.nanquantile(matrix, quantiles, axis=1).T)
+
+    def compute_prediction_intervals(
+            self, coverage: float = 0.9) -> tuple[np.ndarray|None, np.ndarray]:
+        """
+        computes the central prediction interval of the waiting time and the
+        departure time of each job
+
+        Parameters
+        ----------
+        coverage : float, optional
+            probability that the true value is inside the interval, by default 0.9
+
+        Returns
+        -------
+        tuple[np.ndarray|None, np.ndarray]
+            (jobs x 2) matrices with lower and upper bounds of the waiting times
+            (None if not supported) and the departure times
+        """
+        return self.compute_quantiles([(1 - coverage) / 2, (1 + coverage) / 2])
+
+    def __apply(self, statistic) -> tuple[np.ndarray|None, np.ndarray]:
+        return (
+            None if self.__waiting_times is None else statistic(self.__waiting_times),
+            statistic(self.__departure_times)
+        )
+
+def _to_matrix(rows: list[list[int]]) -> np.ndarray:
+    #None is used by some predictors for jobs without prediction
+    matrix = np.array(rows)
+    if matrix.dtype == object:
+        matrix = np.array(rows, dtype=float)
+    return matrix.reshape(len(rows), -1)
+
+def _compute_mean(matrix: np.ndarray) -> np.ndarray:
+    if np.issubdtype(matrix.dtype, np.integer):
+        return matrix.mean(axis=1)
+    return np.nanmean(matrix, axis=1)
+
+def _compute_median(matrix: np.ndarray) -> np.ndarray:
+    if np.issubdtype(matrix.dtype, np.integer):
+        return np.median(matrix, axis=1)
+    return np.nanmedian(matrix, axis=1)
+
+def _compute_mode(matrix: np.ndarray) -> np.ndarray:
+    #NaN is sorted to the end and compares unequal to itself, i.e. each NaN
+    #is a run of length 1 that is only chosen if there are no other values
+    sorted_matrix = np.sort(matrix, axis=1)
+    nr_of_replications = sorted_matrix.shape[1]
+    positions = np.arange(nr_of_replications)
+    is_start_of_run = np.ones(sorted_matrix.shape, dtype=bool)
+    is_start_of_run[:, 1:] = sorted_matrix[:, 1:] != sorted_matrix[:, :-1]
+    start_of_run = np.maximum.accumulate(np.where(is_start_of_run, positions, 0), axis=1)
+    #argmax returns the end of the first run with maximum length
+    end_of_longest_run = (positions - start_of_run).argmax(axis=1)
+    return sorted_matrix[np.arange(len(sorted_matrix)), end_of_longest_run]
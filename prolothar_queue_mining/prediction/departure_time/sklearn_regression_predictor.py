@@ -2,6 +2,7 @@ import numpy as np
 from sklearn.base import RegressorMixin
 
 from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
 
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
@@ -29,13 +30,9 @@ class SklearnRegressionDepartureTimePredictor(DepartureTimePredictor):
         self.__job_to_vector_transformer = job_to_vector_transformer
         self.__regressor = regressor
 
-    def predict_waiting_and_departure_times_distribution(
-            self, arrivals: list[tuple[Job, int]]) -> tuple[dict[Job, list[int]]|None, dict[Job, list[int]]]:
-        X = np.array([
-            self.__job_to_vector_transformer.transform(job)
-            for job,_ in arrivals
-        ])
-        return None, {
-            arrivals[i][0]: [arrivals[i][1] + predicted_sojourn_time]
-            for i, predicted_sojourn_time in enumerate(self.__regressor.predict(X))
-        }
+    def predict_replication_matrix(self, arrivals: list[tuple[Job, int]]) -> ReplicationMatrix:
+        X = self.__job_to_vector_transformer.transform_many(job for job,_ in arrivals)
+        arrival_times = np.array([arrival_time for _,arrival_time in arrivals])
+        return ReplicationMatrix(
+            [job for job,_ in arrivals],
+            (arrival_times + self.__regressor.predict(X)).reshape(-1, 1))
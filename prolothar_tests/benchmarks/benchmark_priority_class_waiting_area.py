@@ -0,0 +1,74 @@
+"""
+benchmark for the priority class waiting areas with an increasing number of
+priority classes. run with
+
+    python -m prolothar_tests.benchmarks.benchmark_priority_class_waiting_area
+
+for each number of priority classes, the same sequence of arrivals and serve
+passes is replayed: a serve pass checks the length of the waiting area (as
+Queue.try_to_serve_next_job does) and pops a single job or a batch.
+"""
+import argparse
+import random
+import timeit
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import PriorityClassWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedPriorityClassWaitingArea
+
+NR_OF_CLASSES = [2, 10, 100, 1000]
+
+def create_jobs(nr_of_jobs: int, nr_of_classes: int, seed: int) -> list[Job]:
+    random_generator = random.Random(seed)
+    return [
+        Job(str(i), {'prio': random_generator.randrange(nr_of_classes)})
+        for i in range(nr_of_jobs)
+    ]
+
+def replay(waiting_area, jobs: list[Job], batch_size: int):
+    nr_of_jobs_in_system = 0
+    for arrival_time, job in enumerate(jobs):
+        waiting_area.add_job(arrival_time, job)
+        nr_of_jobs_in_system += 1
+        #serve every second arrival to keep a non-trivial backlog
+        if arrival_time % 2 == 1 and len(waiting_area) >= batch_size:
+            if batch_size == 1:
+                waiting_area.pop_next_job(nr_of_jobs_in_system)
+            else:
+                waiting_area.pop_batch(batch_size, nr_of_jobs_in_system)
+            nr_of_jobs_in_system -= batch_size
+    while len(waiting_area) >= batch_size:
+        waiting_area.pop_batch(batch_size, nr_of_jobs_in_system)
+        nr_of_jobs_in_system -= batch_size
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nr-of-jobs', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    waiting_area_factories = {
+        'PriorityClassWaitingArea': lambda classes: PriorityClassWaitingArea(
+            'prio', classes, FastFirstComeFirstServeWaitingArea),
+        'TypedPriorityClassWaitingArea': lambda classes: TypedPriorityClassWaitingArea(
+            'prio', classes, TypedFirstComeFirstServeWaitingArea),
+    }
+
+    print(f'{"waiting area":<30} {"classes":>8} {"batch":>6} {"seconds":>10} {"us/job":>8}')
+    for name, factory in waiting_area_factories.items():
+        for nr_of_classes in NR_OF_CLASSES:
+            jobs = create_jobs(args.nr_of_jobs, nr_of_classes, args.seed)
+            classes = list(range(nr_of_classes))
+            for batch_size in (1, 4):
+                seconds = min(timeit.repeat(
+                    lambda: replay(factory(classes), jobs, batch_size),
+                    number=1, repeat=args.repeat))
+                print(
+                    f'{name:<30} {nr_of_classes:>8} {batch_size:>6} '
+                    f'{seconds:>10.4f} {1e6 * seconds / len(jobs):>8.2f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+benchmark for QueueDepartureTimePredictor with the event based simulation
+(mode="stochastic") and the vectorized simulation of all repetitions
+(mode="vectorized"). run with
+
+    python -m prolothar_tests.benchmarks.benchmark_vectorized_departure_time_prediction
+
+for each waiting area and number of servers, both modes predict the
+distribution of waiting and departure times of the same arrivals. the
+mean absolute difference of the predicted mean departure times shows that
+both modes agree up to sampling noise.
+"""
+import argparse
+import random
+import timeit
+
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.service_time import ServiceTimeWithDistribution
+from prolothar_queue_mining.model.distribution import PoissonDistribution
+from prolothar_queue_mining.model.waiting_area import TypedFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedLastComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedPriorityClassWaitingArea
+from prolothar_queue_mining.prediction.departure_time import QueueDepartureTimePredictor
+
+NR_OF_SERVERS = [1, 4]
+
+def create_arrivals(nr_of_jobs: int, nr_of_servers: int, seed: int) -> list[tuple[Job, int]]:
+    random_generator = random.Random(seed)
+    arrivals = []
+    arrival_time = 0
+    for i in range(nr_of_jobs):
+        #utilization of about 90%
+        arrival_time += random_generator.randint(0, round(22 / nr_of_servers))
+        arrivals.append((Job(str(i), {'prio': random_generator.randrange(3)}), arrival_time))
+    return arrivals
+
+def mean_departure_times(predictor: QueueDepartureTimePredictor, arrivals) -> np.ndarray:
+    _, departure_times = predictor.predict_waiting_and_departure_times_distribution(arrivals)
+    return np.array([np.mean(departure_times[job]) for job,_ in arrivals])
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--nr-of-jobs', type=int, default=1000)
+    parser.add_argument('--repetitions', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    waiting_area_factories = {
+        'FCFS': TypedFirstComeFirstServeWaitingArea,
+        'LCFS': TypedLastComeFirstServeWaitingArea,
+        'PriorityClass': lambda: TypedPriorityClassWaitingArea(
+            'prio', [0, 1, 2], TypedFirstComeFirstServeWaitingArea),
+    }
+
+    print(
+        f'{"waiting area":<15} {"servers":>8} {"stochastic [s]":>15} '
+        f'{"vectorized [s]":>15} {"speedup":>8} {"mean abs diff":>14}')
+    for name, factory in waiting_area_factories.items():
+        for nr_of_servers in NR_OF_SERVERS:
+            arrivals = create_arrivals(args.nr_of_jobs, nr_of_servers, args.seed)
+            queue = Queue(
+                None,
+                [Server(ServiceTimeWithDistribution(PoissonDistribution(10)))
+                 for _ in range(nr_of_servers)],
+                waiting_area=factory())
+            predictors = {
+                mode: QueueDepartureTimePredictor(
+                    queue, repetitions=args.repetitions, seed=args.seed, mode=mode)
+                for mode in ('stochastic', 'vectorized')
+            }
+            seconds = {
+                mode: min(timeit.repeat(
+                    lambda: predictor.predict_waiting_and_departure_times_distribution(arrivals),
+                    number=1, repeat=args.repeat))
+                for mode, predictor in predictors.items()
+            }
+            mean_abs_diff = np.abs(
+                mean_departure_times(predictors['stochastic'], arrivals)
+                - mean_departure_times(predictors['vectorized'], arrivals)).mean()
+            print(
+                f'{name:<15} {nr_of_servers:>8} {seconds["stochastic"]:>15.3f} '
+                f'{seconds["vectorized"]:>15.3f} '
+                f'{seconds["stochastic"] / seconds["vectorized"]:>8.1f} {mean_abs_diff:>14.3f}')
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
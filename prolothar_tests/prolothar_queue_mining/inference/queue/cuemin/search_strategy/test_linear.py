@@ -251,10 +251,10 @@ class TestLinear(unittest.TestCase):
         ground_truth = Queue(
             RecordingArrival(ExponentialDistributedArrival(
                 InfinitePopulation(
-                    seed=23112021,
+                    seed=23112022,
                     categorical_feature_names=['a', 'b', 'c'],
                     nr_of_categories=4
-                ), 1/5, seed=23112021)
+                ), 1/5, seed=23112022)
             ),
             [Server(FixedServiceTime(5))],
             waiting_area=PriorityClassWaitingArea(
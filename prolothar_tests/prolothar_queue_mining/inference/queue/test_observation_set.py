@@ -0,0 +1,82 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.waiting_area import FirstComeFirstServeWaitingArea
+from prolothar_queue_mining.inference.queue import ObservationSet
+from prolothar_queue_mining.inference.queue import FcfsCOneThroughput
+from prolothar_queue_mining.inference.queue.nr_of_servers import COrder
+from prolothar_queue_mining.inference.queue.observation_set import to_observation_set
+from prolothar_queue_mining.inference.queue.times import infer_waiting_and_service_times
+
+class TestObservationSet(unittest.TestCase):
+
+    def setUp(self):
+        self.observed_arrivals = [
+            (Job('A'), 3),
+            (Job('B'), 4),
+            (Job('C'), 5),
+            (Job('D'), 6),
+        ]
+        self.observed_departures = [
+            (Job('A'), 4),
+            (Job('C'), 7),
+            (Job('B'), 11),
+            (Job('E'), 12),
+        ]
+        self.observations = ObservationSet(self.observed_arrivals, self.observed_departures)
+
+    def test_columns(self):
+        self.assertEqual(5, len(self.observations))
+        self.assertEqual(
+            (Job('A'), Job('B'), Job('C'), Job('D'), Job('E')),
+            self.observations.get_jobs())
+        self.assertEqual(3, self.observations.get_job_id(Job('D')))
+        np.testing.assert_array_equal(
+            [3, 4, 5, 6, np.nan], self.observations.get_arrival_times())
+        np.testing.assert_array_equal(
+            [4, 11, 7, np.nan, 12], self.observations.get_departure_times())
+        self.assertListEqual(
+            [True, True, True, False, True],
+            self.observations.get_departure_mask().tolist())
+        self.assertListEqual([0, 1, 2, 3], self.observations.get_arrival_order().tolist())
+        self.assertListEqual([0, 2, 1, 4], self.observations.get_departure_order().tolist())
+
+    def test_is_immutable(self):
+        with self.assertRaises(ValueError):
+            self.observations.get_arrival_times()[0] = 42
+
+    def test_list_views(self):
+        self.assertListEqual(self.observed_arrivals, self.observations.get_observed_arrivals())
+        self.assertListEqual(
+            self.observed_departures, self.observations.get_observed_departures())
+        self.assertListEqual(
+            self.observed_arrivals[:3], self.observations.get_departed_arrivals())
+        self.assertEqual(12, self.observations.get_last_departure_time())
+        self.assertEqual(2, self.observations.get_nr_of_jobs_in_system().load_at(7))
+
+    def test_to_observation_set(self):
+        self.assertIs(self.observations, to_observation_set(self.observations))
+        with self.assertRaises(ValueError):
+            to_observation_set(self.observations, self.observed_departures)
+        with self.assertRaises(ValueError):
+            to_observation_set(self.observed_arrivals)
+
+    def test_entry_points_accept_observation_set(self):
+        self.assertEqual(
+            COrder().estimate_nr_of_servers(self.observed_arrivals, self.observed_departures),
+            COrder().estimate_nr_of_servers(self.observations))
+        self.assertEqual(
+            infer_waiting_and_service_times(
+                self.observed_arrivals, self.observed_departures,
+                FirstComeFirstServeWaitingArea(), 1)[:2],
+            infer_waiting_and_service_times(
+                self.observations, None, FirstComeFirstServeWaitingArea(), 1)[:2])
+        self.assertEqual(
+            FcfsCOneThroughput().infer_queue(
+                self.observed_arrivals, self.observed_departures).get_service_time_name(),
+            FcfsCOneThroughput().infer_queue(self.observations).get_service_time_name())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
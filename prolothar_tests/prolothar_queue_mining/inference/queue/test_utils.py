@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.inference.queue.utils import NrOfJobsInSystemStepFunction
+from prolothar_queue_mining.inference.queue.utils import count_nr_of_jobs_in_system
+
+class TestNrOfJobsInSystemStepFunction(unittest.TestCase):
+
+    def setUp(self):
+        self.arrivals = {
+            Job('A'): 1,
+            Job('B'): 2,
+            Job('C'): 2,
+            Job('D'): 6,
+        }
+        self.departures = {
+            Job('A'): 4,
+            Job('B'): 5,
+            Job('C'): 6,
+            Job('D'): 8,
+        }
+
+    def test_from_observation(self):
+        step_function = NrOfJobsInSystemStepFunction.from_observation(
+            self.arrivals, self.departures)
+        self.assertListEqual([1, 2, 4, 5, 6, 8], step_function.get_change_times().tolist())
+        self.assertListEqual([1, 3, 2, 1, 1, 0], step_function.get_nr_of_jobs().tolist())
+        self.assertEqual(8, step_function.get_end_time())
+
+    def test_load_at(self):
+        step_function = NrOfJobsInSystemStepFunction.from_observation(
+            self.arrivals, self.departures)
+        expected = [0, 1, 3, 3, 2, 1, 1, 1, 0, 0]
+        for t, expected_nr_of_jobs in enumerate(expected):
+            self.assertEqual(expected_nr_of_jobs, step_function.load_at(t))
+        self.assertListEqual(expected, step_function.load_at(np.arange(10)).tolist())
+        self.assertEqual(3, step_function.load_at(3.5))
+
+    def test_compute_busy_time(self):
+        step_function = NrOfJobsInSystemStepFunction.from_observation(
+            self.arrivals, self.departures)
+        self.assertEqual(7, step_function.compute_busy_time())
+
+    def test_empty_observation(self):
+        step_function = NrOfJobsInSystemStepFunction.from_observation({}, {})
+        self.assertEqual(0, step_function.load_at(5))
+        self.assertListEqual([0, 0], step_function.load_at(np.array([1, 2])).tolist())
+        self.assertEqual(0, step_function.compute_busy_time())
+        self.assertEqual(([], []), step_function.to_dense())
+
+    def test_count_nr_of_jobs_in_system(self):
+        x, y = count_nr_of_jobs_in_system(self.arrivals, self.departures)
+        self.assertListEqual(list(range(8)), x)
+        self.assertListEqual([0, 1, 3, 3, 2, 1, 1, 1], y)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import unittest
+from importlib.util import find_spec
 
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.service_time import FixedServiceTime
@@ -7,6 +8,7 @@ from prolothar_queue_mining.model.arrival_process import RecordingArrival
 from prolothar_queue_mining.model.arrival_process import ExponentialDistributedArrival
 from prolothar_queue_mining.model.population import InfinitePopulation
 from prolothar_queue_mining.model.environment import Environment
+from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.exit import ListCollectorExit
 from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
 from prolothar_queue_mining.model.waiting_area import PriorityClassWaitingArea
@@ -15,10 +17,6 @@ from prolothar_queue_mining.inference.queue.waiting_area import LinearRegression
 class TestLinearRegressionEstimator(unittest.TestCase):
 
     def test_infer_with_one_server(self):
-        waiting_area_inference = LinearRegressionEstimator(
-            ['x', 'y', 'z'], ['a', 'b', 'c'],
-            verbose=False, max_nr_of_epochs=100000, seed=332022)
-
         ground_truth = Queue(
             RecordingArrival(ExponentialDistributedArrival(
                 InfinitePopulation(
@@ -51,8 +49,32 @@ class TestLinearRegressionEstimator(unittest.TestCase):
             )
         ]
 
-        discovered_waiting_area = waiting_area_inference.infer_waiting_area(observed_arrivals, observed_departures)
-        self.assertIn('PR(LinearRegression', discovered_waiting_area.get_discipline_name())
+        for backend in ['numpy', 'tensorflow']:
+            with self.subTest(backend=backend):
+                if backend == 'tensorflow' and find_spec('tensorflow') is None:
+                    self.skipTest('tensorflow is not installed')
+                waiting_area_inference = LinearRegressionEstimator(
+                    ['x', 'y', 'z'], ['a', 'b', 'c'],
+                    verbose=False, max_nr_of_epochs=100000, seed=332022,
+                    backend=backend)
+                discovered_waiting_area = waiting_area_inference.infer_waiting_area(
+                    observed_arrivals, observed_departures)
+                self.assertIn('PR(LinearRegression', discovered_waiting_area.get_discipline_name())
+                if backend == 'numpy':
+                    #jobs that only differ in "b" must be ranked like the ground truth
+                    priority_per_category = {
+                        category: discovered_waiting_area._compute_priority(100, Job(
+                            str(category), {'a': 0, 'b': category, 'c': 0,
+                                            'x': 0.5, 'y': 0.5, 'z': 0.5}))
+                        for category in range(4)
+                    }
+                    self.assertListEqual(
+                        [2, 0, 1, 3],
+                        sorted(priority_per_category, key=priority_per_category.get))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            LinearRegressionEstimator(['x'], ['a'], backend='torch')
 
 if __name__ == '__main__':
     unittest.main()
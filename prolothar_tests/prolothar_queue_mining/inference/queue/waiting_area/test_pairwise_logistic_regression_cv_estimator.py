@@ -1,5 +1,7 @@
 import unittest
 
+from sklearn.linear_model import SGDClassifier
+
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.service_time import FixedServiceTime
 from prolothar_queue_mining.model.server import Server
@@ -11,6 +13,7 @@ from prolothar_queue_mining.model.exit import ListCollectorExit
 from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
 from prolothar_queue_mining.model.waiting_area import PriorityClassWaitingArea
 from prolothar_queue_mining.inference.queue.waiting_area import PairwiseLogisticRegressionCvEstimator
+from prolothar_queue_mining.inference.queue.waiting_area.pairwise_sklearn_cv_estimator import PairwiseSklearnCvEstimator
 
 class TestPairwiseLogisticRegressionCvEstimator(unittest.TestCase):
 
@@ -52,5 +55,16 @@ class TestPairwiseLogisticRegressionCvEstimator(unittest.TestCase):
         discovered_waiting_area = waiting_area_inference.infer_waiting_area(observed_arrivals, observed_departures)
         self.assertIn('PQ(LogisticRegression', discovered_waiting_area.get_discipline_name())
 
+        partial_fit_inference = PairwiseLogisticRegressionCvEstimator(
+            ['x', 'y', 'z'], ['a', 'b', 'c'], partial_fit_batch_size=64)
+        discovered_waiting_area = partial_fit_inference.infer_waiting_area(observed_arrivals, observed_departures)
+        self.assertIn('PQ(SGDClassifier', discovered_waiting_area.get_discipline_name())
+
+    def test_partial_fit_requires_empty_parameter_grid(self):
+        self.assertRaises(
+            ValueError, PairwiseSklearnCvEstimator.__init__,
+            PairwiseLogisticRegressionCvEstimator(['x'], ['a']), ['x'], ['a'],
+            SGDClassifier(), {'alpha': [0.1, 1]}, partial_fit_batch_size=64)
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,8 +9,10 @@ from prolothar_queue_mining.model.population import InfinitePopulation
 from prolothar_queue_mining.model.environment import Environment
 from prolothar_queue_mining.model.exit import ListCollectorExit
 from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import FastLastComeFirstServeWaitingArea
 from prolothar_queue_mining.model.waiting_area import PriorityClassWaitingArea
 from prolothar_queue_mining.inference.queue.waiting_area import PriorityClassWaitingAreaEstimator
+from prolothar_queue_mining.inference.queue.observation_set import ObservationSet
 
 class TestPriorityClassWaitingAreaEstimator(unittest.TestCase):
 
@@ -20,10 +22,10 @@ class TestPriorityClassWaitingAreaEstimator(unittest.TestCase):
         ground_truth = Queue(
             RecordingArrival(ExponentialDistributedArrival(
                 InfinitePopulation(
-                    seed=23112021,
+                    seed=23112022,
                     categorical_feature_names=['a', 'b', 'c'],
                     nr_of_categories=4
-                ), 1/5, seed=23112021)
+                ), 1/5, seed=23112022)
             ),
             [Server(FixedServiceTime(5))],
             waiting_area=PriorityClassWaitingArea(
@@ -51,5 +53,38 @@ class TestPriorityClassWaitingAreaEstimator(unittest.TestCase):
         discovered_waiting_area = waiting_area_inference.infer_waiting_area(observed_arrivals, observed_departures)
         self.assertEqual('PQ(b,[2,0,1,3],FCFS)', discovered_waiting_area.get_discipline_name())
 
+    def test_infer_lcfs_from_observation_set(self):
+        waiting_area_inference = PriorityClassWaitingAreaEstimator(['a', 'b', 'c'])
+
+        ground_truth = Queue(
+            RecordingArrival(ExponentialDistributedArrival(
+                InfinitePopulation(
+                    seed=4,
+                    categorical_feature_names=['a', 'b', 'c'],
+                    nr_of_categories=3
+                ), 1/4, seed=4)
+            ),
+            [Server(FixedServiceTime(5))],
+            waiting_area=PriorityClassWaitingArea(
+                'c', [1, 2, 0], FastLastComeFirstServeWaitingArea
+            ),
+            exit_point=ListCollectorExit()
+        )
+
+        environment = Environment(verbose=False)
+        ground_truth.schedule_next_arrival(environment)
+        environment.run_timesteps(1000)
+
+        observations = ObservationSet(
+            list(zip(
+                ground_truth.get_arrival_process().get_recorded_jobs(),
+                ground_truth.get_arrival_process().get_recorded_arrival_times()
+            )),
+            list(zip(*ground_truth.get_exit().get_recording()))
+        )
+
+        discovered_waiting_area = waiting_area_inference.infer_waiting_area(observations)
+        self.assertEqual('PQ(c,[1,2,0],LCFS)', discovered_waiting_area.get_discipline_name())
+
 if __name__ == '__main__':
     unittest.main()
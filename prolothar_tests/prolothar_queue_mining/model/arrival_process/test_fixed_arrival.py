@@ -0,0 +1,59 @@
+import unittest
+
+from prolothar_queue_mining.model.arrival_process import FixedArrival
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.service_time import FixedServiceTime
+from prolothar_queue_mining.model.exit import ListCollectorExit
+from prolothar_queue_mining.model.environment import Environment
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.population import ListPopulation
+from prolothar_queue_mining.model.population import ListWithReplacementPopulation
+
+class TestFixedArrival(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = [Job('A'), Job('B'), Job('C')]
+
+    def test_copy_shares_arrivals_but_not_position(self):
+        arrival = FixedArrival(ListPopulation(self.jobs), [10, 25, 42])
+        self.assertEqual((10, Job('A')), arrival.get_next_job())
+        copy = arrival.copy()
+        self.assertEqual((25, Job('B')), arrival.get_next_job())
+        self.assertEqual((42, Job('C')), arrival.get_next_job())
+        self.assertFalse(arrival.has_next_job())
+        self.assertRaises(StopIteration, arrival.get_next_job)
+        self.assertTrue(copy.has_next_job())
+        self.assertEqual((25, Job('B')), copy.get_next_job())
+        self.assertIs(arrival.get_arrival_cursor().jobs, copy.get_arrival_cursor().jobs)
+
+    def test_arrivals_without_job_are_dropped(self):
+        arrival = FixedArrival(ListPopulation(self.jobs, initial_job_index=1), [10, 25, 42])
+        self.assertEqual([(10, Job('B')), (25, Job('C'))], [arrival.get_next_job() for _ in range(2)])
+        self.assertFalse(arrival.has_next_job())
+
+    def test_initial_index_beyond_last_arrival(self):
+        arrival = FixedArrival(ListPopulation(self.jobs), [10, 25, 42], initial_index=4)
+        self.assertFalse(arrival.has_next_job())
+        self.assertRaises(StopIteration, arrival.get_next_job)
+        self.assertFalse(arrival.copy().has_next_job())
+
+    def test_population_without_cursor(self):
+        arrival = FixedArrival(ListWithReplacementPopulation(self.jobs, seed=1), [10, 25])
+        self.assertIsNone(arrival.get_arrival_cursor())
+        self.assertEqual([10, 25], [arrival.get_next_job()[0] for _ in range(2)])
+        self.assertRaises(StopIteration, arrival.get_next_job)
+
+    def test_queue_schedules_arrivals_from_cursor(self):
+        arrival = FixedArrival(ListPopulation(self.jobs), [10, 25, 42])
+        arrival.get_next_job()
+        queue = Queue(arrival.copy(), [Server(FixedServiceTime(3))], exit_point=ListCollectorExit())
+        environment = Environment(verbose=False)
+        queue.schedule_next_arrival(environment)
+        environment.run_until_event_queue_is_empty()
+        self.assertEqual(([Job('B'), Job('C')], [28, 45]), queue.get_exit().get_recording())
+        self.assertFalse(queue.get_arrival_process().has_next_job())
+        self.assertTrue(arrival.has_next_job())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,53 @@
+import unittest
+import pickle
+
+import numpy as np
+
+from prolothar_queue_mining.model.distribution import GeneratorMethodSampler
+from prolothar_queue_mining.model.distribution import AliasSampler
+from prolothar_queue_mining.model.distribution import PmfDefinedDistribution
+from prolothar_queue_mining.model.distribution import PoissonDistribution
+
+class TestBlockSampler(unittest.TestCase):
+
+    def test_generator_method_sampler(self):
+        sampler = GeneratorMethodSampler('poisson', 3.0, seed=42, block_size=7)
+        samples = [sampler.get_next_sample() for _ in range(20)]
+        self.assertTrue(all(type(sample) is int for sample in samples))
+        #the block size does not change the sequence of samples
+        self.assertEqual(
+            np.random.default_rng(42).poisson(3.0, size=20).tolist(), samples)
+
+        sampler.set_seed(42)
+        self.assertEqual(samples[0], sampler.get_next_sample())
+        restored_sampler = pickle.loads(pickle.dumps(sampler))
+        self.assertEqual(samples[1:5], [restored_sampler.get_next_sample() for _ in range(4)])
+
+        self.assertRaises(ValueError, GeneratorMethodSampler, 'random', block_size=0)
+
+    def test_alias_sampler(self):
+        values = [-1, 0, 3, 7]
+        probabilities = [0.1, 0.6, 0.05, 0.25]
+        sampler = AliasSampler(values, probabilities, seed=1)
+        samples = sampler.draw_block(100000)
+        for value, probability in zip(values, probabilities):
+            self.assertAlmostEqual(probability, np.mean(samples == value), delta=0.005)
+        self.assertIn(sampler.get_next_sample(), values)
+        self.assertIs(int, type(sampler.get_next_sample()))
+        self.assertEqual([5] * 10, AliasSampler([5], [1.0]).draw_block(10).tolist())
+        self.assertRaises(ValueError, AliasSampler, [1, 2], [1.0])
+
+    def test_distributions_respect_seed(self):
+        for distribution in [
+                PmfDefinedDistribution({1: 0.2, 2: 0.5, 4: 0.3}, seed=3),
+                PoissonDistribution(4, seed=3)]:
+            samples = [distribution.get_next_sample() for _ in range(50)]
+            copy = distribution.copy()
+            self.assertEqual(samples, [copy.get_next_sample() for _ in range(50)])
+            distribution.set_seed(3)
+            self.assertEqual(samples, [distribution.get_next_sample() for _ in range(50)])
+            distribution.set_seed(4)
+            self.assertNotEqual(samples, [distribution.get_next_sample() for _ in range(50)])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
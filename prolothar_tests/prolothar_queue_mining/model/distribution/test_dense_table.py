@@ -0,0 +1,51 @@
+import unittest
+import pickle
+
+import numpy as np
+
+from prolothar_queue_mining.model.distribution.dense_table import DenseTable
+from prolothar_queue_mining.model.distribution import PoissonDistribution
+from prolothar_queue_mining.model.distribution import C2dDistribution
+from prolothar_queue_mining.model.distribution import ExponentialDistribution
+from prolothar_queue_mining.model.distribution import GeometricDistribution
+
+def _square(x: np.ndarray, factor: int) -> np.ndarray:
+    return factor * x * x
+
+class TestDenseTable(unittest.TestCase):
+
+    def test_lookup(self):
+        table = DenseTable(_square, 2, max_size=100)
+        self.assertEqual(0, len(table))
+        self.assertEqual(50, table.lookup(5))
+        self.assertEqual(16, len(table))
+        self.assertEqual(800, table.lookup(20.0))
+        self.assertEqual(32, len(table))
+        self.assertEqual(18, table.lookup(np.int64(3)))
+        self.assertIs(int, type(table.lookup(3)))
+        for x in [-1, 2.5, 100, 1000]:
+            self.assertIsNone(table.lookup(x))
+        self.assertEqual(2 * 99**2, table.lookup(99))
+        self.assertEqual(100, len(table))
+        self.assertEqual(32, pickle.loads(pickle.dumps(table)).lookup(4))
+
+    def test_distributions(self):
+        for distribution in [
+                PoissonDistribution(4, shift=1), GeometricDistribution(0.3),
+                C2dDistribution(ExponentialDistribution(0.2))]:
+            pmf = [distribution.compute_pmf(x) for x in range(-2, 50)]
+            self.assertAlmostEqual(1, sum(pmf), delta=0.02)
+            self.assertEqual(pmf[5], distribution.compute_pmf(3.0))
+            copy = distribution.copy()
+            self.assertEqual(pmf, [copy.compute_pmf(x) for x in range(-2, 50)])
+            self.assertEqual(pmf, [
+                pickle.loads(pickle.dumps(distribution)).compute_pmf(x) for x in range(-2, 50)])
+        poisson = PoissonDistribution(4, shift=1)
+        self.assertAlmostEqual(
+            sum(poisson.compute_pmf(x) for x in range(6)), poisson.compute_cdf(5), delta=1e-9)
+        self.assertAlmostEqual(poisson.compute_cdf(5), poisson.compute_cdf(5.5), delta=1e-9)
+        self.assertIs(
+            distribution._C2dDistribution__pmf_table, copy._C2dDistribution__pmf_table)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
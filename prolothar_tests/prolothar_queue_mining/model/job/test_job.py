@@ -0,0 +1,39 @@
+import unittest
+import pickle
+
+from prolothar_queue_mining.model.job import Job
+
+class TestJob(unittest.TestCase):
+
+    def test_equality(self):
+        job = Job('A', {'size': 1})
+        self.assertEqual(job, job)
+        self.assertEqual(job, Job('A', {'size': 1}))
+        self.assertNotEqual(job, Job('A', {'size': 2}))
+        self.assertNotEqual(job, Job('B', {'size': 1}))
+        self.assertNotEqual(job, 'A')
+        self.assertEqual(hash(job), hash(Job('A', {'size': 2})))
+
+    def test_id_only_equality(self):
+        job = Job('A', {'size': 1}, id_only_equality=True)
+        self.assertEqual(job, Job('A', {'size': 2}))
+        self.assertNotEqual(job, Job('B', {'size': 1}))
+        self.assertEqual(1, len({job, Job('A', {'size': 2}, id_only_equality=True)}))
+
+    def test_change_job_id(self):
+        job = Job('A')
+        job.job_id = 'B'
+        self.assertEqual(hash('B'), hash(job))
+        self.assertEqual(Job('B'), job)
+
+    def test_pickle(self):
+        job = Job('A', {'size': 1}, id_only_equality=True)
+        job.index = 3
+        unpickled_job = pickle.loads(pickle.dumps(job))
+        self.assertEqual(job, unpickled_job)
+        self.assertEqual(3, unpickled_job.index)
+        self.assertTrue(unpickled_job.id_only_equality)
+        self.assertDictEqual({'size': 1}, unpickled_job.features)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
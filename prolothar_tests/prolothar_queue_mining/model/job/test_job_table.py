@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobTable
+
+class TestJobTable(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = [
+            Job('A', {'size': 1.5, 'color': 'red'}),
+            Job('B', {'color': 'blue'}),
+            Job('C', {'size': 3.0, 'color': 'red'}),
+        ]
+        self.job_table = JobTable(self.jobs)
+
+    def test_add(self):
+        self.assertEqual(3, len(self.job_table))
+        for i, job in enumerate(self.jobs):
+            self.assertEqual(i, job.index)
+            self.assertEqual(i, self.job_table.get_index(job))
+            self.assertIs(job, self.job_table[i])
+        self.assertEqual(1, self.job_table.add(Job('B', {'color': 'blue'})))
+        self.assertEqual(3, self.job_table.add(Job('D')))
+        self.assertEqual(4, len(self.job_table))
+        self.assertRaises(KeyError, self.job_table.get_index, Job('E'))
+
+    def test_get_numerical_feature(self):
+        np.testing.assert_array_equal(
+            [1.5, np.nan, 3.0], self.job_table.get_numerical_feature('size'))
+
+    def test_get_categorical_feature(self):
+        codes, categories = self.job_table.get_categorical_feature('color')
+        self.assertListEqual([0, 1, 0], codes.tolist())
+        self.assertListEqual(['red', 'blue'], categories)
+        self.job_table.add(Job('D'))
+        codes, categories = self.job_table.get_categorical_feature('color')
+        self.assertListEqual([0, 1, 0, -1], codes.tolist())
+
+    def test_create_job_array(self):
+        job_array = self.job_table.create_job_array({self.jobs[0]: 4, self.jobs[2]: 7})
+        self.assertEqual(2, len(job_array))
+        self.assertEqual(4, job_array[self.jobs[0]])
+        self.assertIsInstance(job_array[self.jobs[0]], int)
+        self.assertEqual(7, job_array[Job('C', {'size': 3.0, 'color': 'red'})])
+        self.assertNotIn(self.jobs[1], job_array)
+        self.assertRaises(KeyError, job_array.__getitem__, self.jobs[1])
+        self.assertRaises(KeyError, job_array.__getitem__, Job('X'))
+        self.assertIsNone(job_array.get(Job('X')))
+        self.assertDictEqual({self.jobs[0]: 4, self.jobs[2]: 7}, dict(job_array.items()))
+
+        job_array_copy = job_array.copy()
+        job_array_copy.get_values()[0] = 5
+        self.assertEqual(4, job_array[self.jobs[0]])
+
+    def test_job_in_two_tables(self):
+        other_job_table = JobTable([Job('X'), self.jobs[2], self.jobs[0]])
+        #the first table stays the owner of the jobs
+        for i, job in enumerate(self.jobs):
+            self.assertEqual(i, job.index)
+            self.assertIs(self.job_table, job.index_owner())
+        self.assertEqual(1, other_job_table.get_index(self.jobs[2]))
+        self.assertEqual(2, other_job_table.get_index(self.jobs[0]))
+
+        job_array = self.job_table.create_job_array({self.jobs[0]: 4, self.jobs[2]: 7})
+        other_job_array = other_job_table.create_job_array({self.jobs[0]: 5, self.jobs[2]: 8})
+        self.assertEqual(4, job_array[self.jobs[0]])
+        self.assertEqual(7, job_array[self.jobs[2]])
+        self.assertEqual(5, other_job_array[self.jobs[0]])
+        self.assertEqual(8, other_job_array[self.jobs[2]])
+
+        #a new table becomes the owner if the previous owner does not exist anymore
+        del self.job_table, job_array
+        new_job_table = JobTable(reversed(self.jobs))
+        self.assertIs(new_job_table, self.jobs[0].index_owner())
+        self.assertEqual(2, self.jobs[0].index)
+        self.assertIs(other_job_table, other_job_table[0].index_owner())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,110 @@
+import unittest
+import weakref
+
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobTable
+from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
+from prolothar_queue_mining.model.job.job_to_vector_transformer import OneHotEncoder
+from prolothar_queue_mining.model.job.job_to_vector_transformer import MinMaxScaler
+from prolothar_queue_mining.model.job.job_to_vector_transformer import Scaler
+from prolothar_queue_mining.model.job.job_table import _MAX_NR_OF_CACHED_FEATURE_MATRICES
+
+class TestJobToVectorTransformer(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = [
+            Job('A', {'size': 1.5, 'color': 'red', 'priority': 1}),
+            Job('B', {'size': 2.0, 'color': 'blue', 'priority': 2}),
+            Job('C', {'size': 3.0, 'color': 'red', 'priority': 1}),
+        ]
+        self.transformer = JobToVectorTransformer(
+            ['size'], ['color', 'priority'],
+            {'size': MinMaxScaler.train(self.jobs, 'size')},
+            {'color': OneHotEncoder.train(self.jobs, 'color')})
+
+    def test_train_one_hot_encoder(self):
+        self.assertListEqual(['blue', 'red'], OneHotEncoder.train(self.jobs, 'color').possible_values)
+        self.assertListEqual(
+            ['size', 'color = blue', 'color = red', 'priority'],
+            self.transformer.get_feature_names_of_vector_components())
+
+    def test_transform_many(self):
+        expected_matrix = np.array([
+            [0.0, 0, 1, 1],
+            [1/3, 1, 0, 2],
+            [1.0, 0, 1, 1],
+        ])
+        np.testing.assert_allclose(expected_matrix, self.transformer.transform_many(self.jobs))
+        np.testing.assert_allclose(
+            expected_matrix, [self.transformer.transform(job) for job in self.jobs])
+        np.testing.assert_allclose(
+            expected_matrix[[2, 0]],
+            self.transformer.transform_many(reversed(self.jobs[::2])))
+        self.assertEqual((0, 4), self.transformer.transform_many([]).shape)
+        self.assertRaises(KeyError, self.transformer.transform_many, [Job('D', {'size': 1.0})])
+
+    def test_transform_many_with_job_table(self):
+        job_table = JobTable(self.jobs)
+        feature_matrix = job_table.get_feature_matrix(self.transformer)
+        self.assertFalse(feature_matrix.flags.writeable)
+        np.testing.assert_allclose(self.transformer.transform_many(self.jobs), feature_matrix)
+
+        new_job = Job('D', {'size': 2.0, 'color': 'green', 'priority': 3})
+        np.testing.assert_allclose(
+            [[1/3, 0, 0, 3], [0.0, 0, 1, 1]],
+            self.transformer.transform_many([new_job, self.jobs[0]], job_table=job_table))
+        self.assertEqual(4, len(job_table))
+        self.assertEqual((4, 4), job_table.get_feature_matrix(self.transformer).shape)
+        #rows of earlier requested matrices are not modified by appending rows
+        self.assertEqual((3, 4), feature_matrix.shape)
+
+        #the cache is invalidated by a change of the configuration
+        self.transformer.scalers = {}
+        np.testing.assert_allclose(
+            [[2.0, 0, 0, 3], [1.5, 0, 1, 1]],
+            self.transformer.transform_many([new_job, self.jobs[0]], job_table=job_table))
+
+    def test_configuration_key(self):
+        transformer = JobToVectorTransformer(
+            ['size'], [], {'size': ArrayScaler(np.array([1.0, np.nan]))}, {})
+        same_transformer = JobToVectorTransformer(
+            ['size'], [], {'size': ArrayScaler(np.array([1.0, np.nan]))}, {})
+        other_transformer = JobToVectorTransformer(
+            ['size'], [], {'size': ArrayScaler(np.array([2.0, np.nan]))}, {})
+        self.assertEqual(
+            transformer.get_configuration_key(), same_transformer.get_configuration_key())
+        self.assertNotEqual(
+            transformer.get_configuration_key(), other_transformer.get_configuration_key())
+        self.assertEqual(
+            JobToVectorTransformer(['size'], [], {'size': MinMaxScaler(np.nan, 1)}, {})
+                .get_configuration_key(),
+            JobToVectorTransformer(['size'], [], {'size': MinMaxScaler(np.nan, 1)}, {})
+                .get_configuration_key())
+
+    def test_feature_matrix_cache_is_bounded(self):
+        job_table = JobTable(self.jobs)
+        buffer_references = []
+        for max_value in range(20):
+            transformer = JobToVectorTransformer(
+                ['size'], [], {'size': MinMaxScaler(0, max_value + 1)}, {})
+            feature_matrix = job_table.get_feature_matrix(transformer)
+            np.testing.assert_allclose(
+                [job.features['size'] / (max_value + 1) for job in self.jobs],
+                feature_matrix[:, 0])
+            buffer_references.append(weakref.ref(feature_matrix.base))
+        del feature_matrix
+        self.assertEqual(
+            _MAX_NR_OF_CACHED_FEATURE_MATRICES,
+            sum(reference() is not None for reference in buffer_references))
+
+class ArrayScaler(Scaler):
+    def __init__(self, factors: np.ndarray):
+        self.factors = factors
+
+    def scale(self, value: float) -> float:
+        return value * self.factors[0]
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
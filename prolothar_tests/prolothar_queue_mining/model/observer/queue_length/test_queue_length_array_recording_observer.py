@@ -0,0 +1,21 @@
+import unittest
+
+from prolothar_queue_mining.model.observer.queue_length import QueueLengthArrayRecordingObserver
+
+class TestQueueLengthArrayRecordingObserver(unittest.TestCase):
+
+    def test_notify(self):
+        observer = QueueLengthArrayRecordingObserver(min_time=1, initial_capacity=1)
+        observer.notify(0, 5)
+        observer.notify(1, 1)
+        observer.notify(2, 2)
+        observer.notify(2, 3)
+        observer.notify(4, 0)
+
+        self.assertEqual(3, observer.get_max_queue_length())
+        timesteps, queue_lengths = observer.get_timeseries_data()
+        self.assertListEqual([1, 2, 4], timesteps.tolist())
+        self.assertListEqual([1, 3, 0], queue_lengths.tolist())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+import unittest
+
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.service_time import ExponentialDistributedServiceTime
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.arrival_process import ExponentialDistributedArrival
+from prolothar_queue_mining.model.arrival_process import RecordingArrival
+from prolothar_queue_mining.model.population import InfinitePopulation
+from prolothar_queue_mining.model.environment import Environment
+from prolothar_queue_mining.model.distribution import PmfDefinedDistribution
+from prolothar_queue_mining.model.waiting_area import LastComeFirstServeWaitingArea
+from prolothar_queue_mining.model.observer.waiting_time import WaitingTimeObserver
+from prolothar_queue_mining.model.observer.waiting_time import ServeOrderRecorder
+from prolothar_queue_mining.model.observer.waiting_time import CompactServeOrderRecorder
+
+class BroadcastingObserver(WaitingTimeObserver):
+    def __init__(self, observers: list[WaitingTimeObserver]):
+        self.observers = observers
+
+    def notify(self, job, arrival_time: int, start_of_service_time: int):
+        for observer in self.observers:
+            observer.notify(job, arrival_time, start_of_service_time)
+
+class TestCompactServeOrderRecorder(unittest.TestCase):
+
+    def test_same_statistics_as_serve_order_recorder(self):
+        compact_recorder = CompactServeOrderRecorder(LastComeFirstServeWaitingArea())
+        recorder = ServeOrderRecorder(compact_recorder.get_waiting_area(), _AnyJob())
+        arrival_process = RecordingArrival(ExponentialDistributedArrival(
+            InfinitePopulation(
+                categorical_feature_names=['a', 'b'], nr_of_categories=4, seed=42),
+            1/2, seed=42))
+        queue = Queue(
+            arrival_process,
+            [Server(ExponentialDistributedServiceTime(1/5, seed=42)), Server(ExponentialDistributedServiceTime(1/5, seed=43))],
+            waiting_area=compact_recorder.get_waiting_area(),
+            batch_size_distribution=PmfDefinedDistribution({1: 0.5, 2: 0.25, 3: 0.25}, seed=42),
+            waiting_time_observer=BroadcastingObserver(
+                [recorder, compact_recorder])
+        )
+        environment = Environment()
+        queue.schedule_next_arrival(environment)
+        environment.run_timesteps(1000)
+
+        arrival_time_per_job = dict(zip(
+            arrival_process.get_recorded_jobs(), arrival_process.get_recorded_arrival_times()))
+        recording = recorder.get_recording()
+        self.assertGreater(len(recording), 100)
+        self.assertListEqual(
+            [served_job for served_job, _ in recording], compact_recorder.get_served_jobs())
+        self.assertListEqual(
+            [arrival_time_per_job[served_job] for served_job, _ in recording],
+            compact_recorder.get_arrival_times_of_served_jobs().tolist())
+        self.assertListEqual(
+            [len(waiting_jobs) for _, waiting_jobs in recording],
+            compact_recorder.get_nr_of_waiting_jobs().tolist())
+        self.assertGreater(compact_recorder.get_nr_of_waiting_jobs().max(), 2)
+        for i, (served_job, waiting_jobs) in enumerate(recording):
+            arrival_times = [arrival_time_per_job[job] for job in waiting_jobs]
+            if arrival_times:
+                self.assertEqual(
+                    min(arrival_times), compact_recorder.get_min_arrival_times_of_waiting_jobs()[i])
+                self.assertEqual(
+                    max(arrival_times), compact_recorder.get_max_arrival_times_of_waiting_jobs()[i])
+            self.assertEqual(
+                sum(t > arrival_time_per_job[served_job] for t in arrival_times),
+                compact_recorder.get_nr_of_fifo_comparisons()[i])
+            self.assertEqual(
+                sum(t < arrival_time_per_job[served_job] for t in arrival_times),
+                compact_recorder.get_nr_of_lifo_comparisons()[i])
+
+        entered_jobs = compact_recorder.get_entered_jobs()
+        self.assertListEqual(
+            [arrival_time_per_job[job] for job in entered_jobs],
+            compact_recorder.get_arrival_times_of_entered_jobs().tolist())
+        start_of_waiting, end_of_waiting = compact_recorder.get_waiting_intervals()
+        for i, (_, waiting_jobs) in enumerate(recording):
+            self.assertSetEqual(
+                set(waiting_jobs),
+                {
+                    job for job, start, end in zip(entered_jobs, start_of_waiting, end_of_waiting)
+                    if start <= i < end
+                })
+
+class _AnyJob():
+    """
+    ServeOrderRecorder raises an error for jobs that are not contained in its
+    departures. all jobs are accepted here.
+    """
+    def __contains__(self, job):
+        return True
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.model.observer.waiting_time import WaitingTimeArrayRecordingObserver
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job import JobTable
+
+class TestWaitingTimeArrayRecordingObserver(unittest.TestCase):
+
+    def test_add_and_pop_jobs(self):
+        jobs = [Job('A'), Job('B'), Job('C'), Job('D'), Job('E')]
+        job_table = JobTable(jobs)
+        observer = WaitingTimeArrayRecordingObserver(initial_capacity=2)
+        observer.notify(jobs[0], 3, 8)
+        observer.notify(jobs[1], 4, 13)
+        waiting_times_before_growth = observer.get_waiting_times()
+        observer.notify(jobs[2], 7, 16)
+        observer.notify(jobs[3], 7, 21)
+        observer.notify(jobs[4], 10, 35)
+
+        self.assertEqual(25, observer.get_max_waiting_time())
+        self.assertEqual(12.4, observer.get_mean_waiting_time())
+        self.assertEqual(9, observer.get_median_waiting_time())
+        arrival_times, waiting_times = observer.get_timeseries_data()
+        self.assertListEqual([3,4,7,7,10], arrival_times.tolist())
+        self.assertListEqual([5,9,9,14,25], waiting_times.tolist())
+        self.assertListEqual([5,9], waiting_times_before_growth.tolist())
+        self.assertFalse(waiting_times.flags.writeable)
+        self.assertEqual(14, observer.get_waiting_time_per_job(job_table)[Job('D')])
+
+    def test_empty(self):
+        observer = WaitingTimeArrayRecordingObserver()
+        self.assertTrue(np.isnan(observer.get_mean_waiting_time()))
+        self.assertTrue(np.isnan(observer.get_median_waiting_time()))
+        self.assertEqual(0, len(observer.get_waiting_times()))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
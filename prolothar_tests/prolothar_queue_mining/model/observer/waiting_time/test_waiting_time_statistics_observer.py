@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.model.observer.waiting_time import WaitingTimeStatisticsObserver
+from prolothar_queue_mining.model.job import Job
+
+class TestWaitingTimeStatisticsObserver(unittest.TestCase):
+
+    def test_add_and_pop_jobs(self):
+        observer = WaitingTimeStatisticsObserver()
+        observer.notify(Job('A'), 3, 8)
+        observer.notify(Job('B'), 4, 13)
+        observer.notify(Job('C'), 7, 16)
+        observer.notify(Job('D'), 7, 21)
+        observer.notify(Job('E'), 10, 35)
+
+        self.assertEqual(5, observer.get_nr_of_observations())
+        self.assertEqual(25, observer.get_max_waiting_time())
+        self.assertEqual(12.4, observer.get_mean_waiting_time())
+        self.assertEqual(9, observer.get_median_waiting_time())
+        self.assertRaises(ValueError, observer.get_quantile_waiting_time, 0.9)
+
+    def test_quantile_estimates(self):
+        waiting_times = np.random.default_rng(42).geometric(0.05, size=10000)
+        observer = WaitingTimeStatisticsObserver(quantiles=(0.5, 0.9))
+        for i, waiting_time in enumerate(waiting_times.tolist()):
+            observer.notify(Job(str(i)), i, i + waiting_time)
+        self.assertAlmostEqual(
+            np.quantile(waiting_times, 0.5),
+            observer.get_median_waiting_time(), delta=1)
+        self.assertAlmostEqual(
+            np.quantile(waiting_times, 0.9),
+            observer.get_quantile_waiting_time(0.9), delta=2)
+        self.assertEqual(waiting_times.max(), observer.get_max_waiting_time())
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.model.distribution import PoissonDistribution
+from prolothar_queue_mining.model.distribution import ExponentialDistribution
+from prolothar_queue_mining.model.service_time import CommonRandomNumbersServiceTime
+from prolothar_queue_mining.model.service_time.common_random_numbers_service_time import ANTITHETIC_BIT
+from prolothar_queue_mining.model.job import Job
+
+class TestCommonRandomNumbersServiceTime(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = [Job(str(i)) for i in range(2000)]
+        self.service_time = CommonRandomNumbersServiceTime(PoissonDistribution(5), seed=3)
+
+    def __get_service_times(self, service_time: CommonRandomNumbersServiceTime) -> np.ndarray:
+        return np.array([service_time.get_service_time(job, 0) for job in self.jobs])
+
+    def test_service_time_only_depends_on_job_and_seeds(self):
+        self.service_time.set_queue_seed(17)
+        service_times = self.__get_service_times(self.service_time)
+        #the seed of the server (i.e. of the distribution) and the order of the jobs are irrelevant
+        self.service_time.set_seed(99)
+        self.assertEqual(
+            service_times[::-1].tolist(),
+            [self.service_time.get_service_time(job, 0) for job in reversed(self.jobs)])
+        copy = self.service_time.copy()
+        copy.set_queue_seed(17)
+        np.testing.assert_array_equal(service_times, self.__get_service_times(copy))
+
+        copy.set_queue_seed(18)
+        self.assertFalse(np.array_equal(service_times, self.__get_service_times(copy)))
+        other_seed = CommonRandomNumbersServiceTime(PoissonDistribution(5), seed=4)
+        other_seed.set_queue_seed(17)
+        self.assertFalse(np.array_equal(service_times, self.__get_service_times(other_seed)))
+
+    def test_marginal_distribution(self):
+        service_times = self.__get_service_times(self.service_time)
+        self.assertAlmostEqual(5, service_times.mean(), delta=0.2)
+        self.assertAlmostEqual(5, service_times.var(), delta=0.5)
+        self.assertTrue(np.all(service_times >= 0))
+
+    def test_large_service_times(self):
+        distribution = ExponentialDistribution(1 / 100000)
+        service_time = CommonRandomNumbersServiceTime(distribution, seed=3)
+        service_times = self.__get_service_times(service_time)
+        self.assertAlmostEqual(100000, service_times.mean(), delta=5000)
+        #service times within and beyond the table of the CDF
+        self.assertAlmostEqual(
+            distribution.compute_cdf(2**16 - 0.5), np.mean(service_times < 2**16), delta=0.03)
+        self.assertTrue(all(isinstance(t, int) for t in service_times.tolist()))
+
+    def test_antithetic_variates(self):
+        self.service_time.set_queue_seed(17)
+        service_times = self.__get_service_times(self.service_time)
+        self.service_time.set_queue_seed(17 | ANTITHETIC_BIT)
+        antithetic_service_times = self.__get_service_times(self.service_time)
+        self.assertAlmostEqual(5, antithetic_service_times.mean(), delta=0.2)
+        self.assertLess(np.corrcoef(service_times, antithetic_service_times)[0, 1], -0.9)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
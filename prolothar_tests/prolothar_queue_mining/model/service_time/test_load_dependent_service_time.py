@@ -1,4 +1,5 @@
 import unittest
+import pickle
 
 from prolothar_queue_mining.model.environment import Environment
 from prolothar_queue_mining.model.queue import Queue
@@ -36,5 +37,17 @@ class TestLoadDependentServiceTime(unittest.TestCase):
                 exit_point[i]
             )
 
+    def test_sub_model_and_max_probability(self):
+        service_time = LoadDependentServiceTime(
+            [FixedServiceTime(1), FixedServiceTime(2), FixedServiceTime(3)], [1, 3])
+        for copy in [service_time, pickle.loads(pickle.dumps(service_time))]:
+            self.assertEqual(
+                [1, 1, 2, 2, 3, 3, 3],
+                [copy.get_service_time(Job('A'), load) for load in range(7)])
+            self.assertEqual(3, copy.get_service_time(Job('A'), 10**6))
+            self.assertEqual(
+                [0, 1, 1, 1, 0], [copy.compute_max_probability(x) for x in range(5)])
+            self.assertEqual(0, copy.compute_max_probability(-1))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
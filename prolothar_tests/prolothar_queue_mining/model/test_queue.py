@@ -0,0 +1,69 @@
+import unittest
+
+from prolothar_queue_mining.model.environment import Environment
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.queue_observer import QueueObserver
+from prolothar_queue_mining.model.queue_observer import EXIT, QUEUE_LENGTH
+from prolothar_queue_mining.model.population import ListPopulation
+from prolothar_queue_mining.model.arrival_process import FixedArrival
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.service_time import FixedServiceTime
+from prolothar_queue_mining.model.observer.waiting_time import WaitingTimeRecordingObserver
+from prolothar_queue_mining.model.job import Job
+
+class EventRecorder(QueueObserver):
+
+    def __init__(self, subscribed_events: int):
+        super().__init__(subscribed_events)
+        self.events = []
+
+    def notify_start_of_service(self, job, arrival_time, start_of_service_time):
+        self.events.append(('start', job.job_id, arrival_time, start_of_service_time))
+
+    def notify_exit(self, job, arrival_time, exit_time):
+        self.events.append(('exit', job.job_id, arrival_time, exit_time))
+
+    def notify_queue_length(self, current_time, queue_length):
+        self.events.append(('length', current_time, queue_length))
+
+class TestQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.population = ListPopulation([Job('A'), Job('B')])
+        self.arrival = FixedArrival(self.population, [1, 2])
+
+    def test_observers_only_get_subscribed_events(self):
+        exit_recorder = EventRecorder(EXIT)
+        length_recorder = EventRecorder(QUEUE_LENGTH)
+        waiting_time_observer = WaitingTimeRecordingObserver()
+        queue = Queue(
+            self.arrival, [Server(FixedServiceTime(5))],
+            waiting_time_observer=waiting_time_observer,
+            observers=[exit_recorder, length_recorder])
+
+        environment = Environment()
+        queue.schedule_next_arrival(environment)
+        environment.run_timesteps(20)
+
+        self.assertListEqual([('exit', 'A', 1, 6), ('exit', 'B', 2, 11)], exit_recorder.events)
+        self.assertTrue(length_recorder.events)
+        self.assertTrue(all(event[0] == 'length' for event in length_recorder.events))
+        self.assertEqual(([1,2], [0,4]), waiting_time_observer.get_timeseries_data())
+
+    def test_add_observer_and_copy(self):
+        queue = Queue(self.arrival, [Server(FixedServiceTime(5))])
+        recorder = EventRecorder(EXIT)
+        queue.add_observer(recorder)
+        self.assertEqual(1, len(queue.copy().get_observers()))
+        self.assertIsNot(recorder, queue.copy().get_observers()[0])
+
+        environment = Environment()
+        queue.schedule_next_arrival(environment)
+        environment.run_timesteps(20)
+        self.assertEqual(2, len(recorder.events))
+
+    def test_unknown_event(self):
+        self.assertRaises(ValueError, QueueObserver, 8)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
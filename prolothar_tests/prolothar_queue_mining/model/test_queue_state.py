@@ -0,0 +1,69 @@
+import unittest
+
+from prolothar_queue_mining.model.environment import Environment
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.queue_spec import QueueSpec
+from prolothar_queue_mining.model.queue_state import QueueState
+from prolothar_queue_mining.model.population import ListPopulation
+from prolothar_queue_mining.model.arrival_process import FixedArrival
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.service_time import ServiceTimeWithDistribution
+from prolothar_queue_mining.model.distribution import PoissonDistribution
+from prolothar_queue_mining.model.waiting_area import LastComeFirstServeWaitingArea
+from prolothar_queue_mining.model.exit import ListCollectorExit
+from prolothar_queue_mining.model.job import Job
+
+class TestQueueState(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = [Job(str(i)) for i in range(30)]
+        self.arrival_times = [2 * i for i in range(30)]
+        self.queue = Queue(
+            None, [Server(ServiceTimeWithDistribution(PoissonDistribution(5))) for _ in range(2)],
+            waiting_area=LastComeFirstServeWaitingArea())
+
+    def create_arrival_process(self) -> FixedArrival:
+        return FixedArrival(ListPopulation(self.jobs), self.arrival_times)
+
+    def simulate(self, queue: Queue) -> list:
+        environment = Environment(verbose=False)
+        queue.schedule_next_arrival(environment)
+        environment.run_until_event_queue_is_empty()
+        return list(zip(*queue.get_exit().get_recording()))
+
+    def test_spec_from_queue(self):
+        spec = QueueSpec.from_queue(self.queue)
+        self.assertEqual(2, spec.get_nr_of_servers())
+        self.assertFalse(spec.is_deterministic())
+        self.assertTrue(spec.copy_mean().is_deterministic())
+        self.assertEqual('LCFS', spec.get_waiting_area().get_discipline_name())
+
+    def test_reset_gives_same_result_as_fresh_queue(self):
+        spec = QueueSpec.from_queue(self.queue)
+        state = QueueState(spec)
+        for seed in [1, 2, 3]:
+            queue = state.reset(
+                arrival_process=self.create_arrival_process(),
+                exit_point=ListCollectorExit(), seed=seed)
+            self.assertIs(state.get_queue(), queue)
+            recording = self.simulate(queue)
+
+            fresh_queue = spec.create_queue(self.create_arrival_process())
+            fresh_queue.set_exit(ListCollectorExit())
+            fresh_queue.set_seed(seed)
+            fresh_queue.reset()
+            self.assertEqual(self.simulate(fresh_queue), recording)
+
+    def test_reset_removes_waiting_jobs(self):
+        state = QueueState(QueueSpec.from_queue(self.queue))
+        queue = state.reset(arrival_process=self.create_arrival_process(), seed=1)
+        environment = Environment(verbose=False)
+        queue.schedule_next_arrival(environment)
+        environment.run_timesteps(20)
+        self.assertGreater(len(queue.get_waiting_area()), 0)
+        queue = state.reset(seed=1)
+        self.assertEqual(0, len(queue.get_waiting_area()))
+        self.assertTrue(all(server.is_ready_for_service() for server in queue.get_servers()))
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,111 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.model.environment import Environment
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.queue_spec import QueueSpec
+from prolothar_queue_mining.model.vectorized_queue_simulation import VectorizedQueueSimulation
+from prolothar_queue_mining.model.population import ListPopulation
+from prolothar_queue_mining.model.arrival_process import FixedArrival
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.service_time import ServiceTimeWithDistribution
+from prolothar_queue_mining.model.distribution import DiscreteDegenerateDistribution
+from prolothar_queue_mining.model.distribution import PoissonDistribution
+from prolothar_queue_mining.model.waiting_area import RandomOrderWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedLastComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedPriorityClassWaitingArea
+from prolothar_queue_mining.model.exit import ListCollectorExit
+from prolothar_queue_mining.model.job import Job
+
+class TestVectorizedQueueSimulation(unittest.TestCase):
+
+    def setUp(self):
+        random_generator = np.random.default_rng(42)
+        arrival_times = np.sort(random_generator.integers(0, 150, 60)).tolist()
+        self.arrivals = [
+            (Job(str(i), {'prio': int(random_generator.integers(3))}), arrival_time)
+            for i, arrival_time in enumerate(arrival_times)
+        ]
+
+    def create_queue(self, waiting_area, distribution, nr_of_servers: int = 2, **kwargs) -> Queue:
+        return Queue(
+            None, [Server(ServiceTimeWithDistribution(distribution)) for _ in range(nr_of_servers)],
+            waiting_area=waiting_area, **kwargs)
+
+    def simulate(self, queue: Queue) -> tuple[np.ndarray, np.ndarray]:
+        queue.set_arrival_process(FixedArrival(
+            ListPopulation([job for job,_ in self.arrivals]),
+            [time for _,time in self.arrivals]))
+        queue.set_exit(ListCollectorExit())
+        queue.reset()
+        start_times = {}
+        queue.set_waiting_time_observer(_StartOfServiceCollector(start_times))
+        environment = Environment(verbose=False)
+        queue.schedule_next_arrival(environment)
+        environment.run_until_event_queue_is_empty()
+        exit_times = dict(zip(*queue.get_exit().get_recording()))
+        return (
+            np.array([start_times[job] for job,_ in self.arrivals]),
+            np.array([exit_times[job] for job,_ in self.arrivals])
+        )
+
+    def test_deterministic_service_times_equal_event_based_simulation(self):
+        waiting_areas = [
+            TypedFirstComeFirstServeWaitingArea(),
+            TypedLastComeFirstServeWaitingArea(),
+            TypedPriorityClassWaitingArea('prio', [2, 0, 1], TypedLastComeFirstServeWaitingArea),
+            TypedPriorityClassWaitingArea('prio', [1, 0], TypedFirstComeFirstServeWaitingArea),
+        ]
+        for waiting_area in waiting_areas:
+            for nr_of_servers in [1, 3]:
+                queue = self.create_queue(
+                    waiting_area, DiscreteDegenerateDistribution(6), nr_of_servers=nr_of_servers)
+                simulation = VectorizedQueueSimulation.create(
+                    QueueSpec.from_queue(queue), self.arrivals)
+                self.assertIsNotNone(simulation)
+                start_times, exit_times = simulation.run(3, seed=1)
+                expected_start_times, expected_exit_times = self.simulate(queue)
+                for replication in range(3):
+                    np.testing.assert_array_equal(expected_start_times, start_times[replication])
+                    np.testing.assert_array_equal(expected_exit_times, exit_times[replication])
+
+    def test_stochastic_service_times_have_same_mean(self):
+        queue = self.create_queue(
+            TypedLastComeFirstServeWaitingArea(), PoissonDistribution(5))
+        simulation = VectorizedQueueSimulation.create(QueueSpec.from_queue(queue), self.arrivals)
+        _, exit_times = simulation.run(2000, seed=1)
+
+        queue.set_seed(2)
+        expected_exit_times = np.mean([self.simulate(queue)[1] for _ in range(2000)], axis=0)
+        np.testing.assert_allclose(expected_exit_times, exit_times.mean(axis=0), rtol=0.05)
+
+    def test_run_is_reproducible(self):
+        queue = self.create_queue(TypedFirstComeFirstServeWaitingArea(), PoissonDistribution(5))
+        simulation = VectorizedQueueSimulation.create(QueueSpec.from_queue(queue), self.arrivals)
+        np.testing.assert_array_equal(simulation.run(10, seed=3)[1], simulation.run(10, seed=3)[1])
+
+    def test_create_returns_none_if_not_supported(self):
+        spec = QueueSpec.from_queue(self.create_queue(
+            TypedFirstComeFirstServeWaitingArea(), PoissonDistribution(5),
+            batch_size_distribution=DiscreteDegenerateDistribution(2)))
+        self.assertIsNone(VectorizedQueueSimulation.create(spec, self.arrivals))
+
+        spec = QueueSpec.from_queue(self.create_queue(
+            RandomOrderWaitingArea(), PoissonDistribution(5)))
+        self.assertIsNone(VectorizedQueueSimulation.create(spec, self.arrivals))
+
+        spec = QueueSpec.from_queue(self.create_queue(
+            TypedFirstComeFirstServeWaitingArea(), PoissonDistribution(5)))
+        self.assertIsNone(VectorizedQueueSimulation.create(spec, self.arrivals[::-1]))
+
+class _StartOfServiceCollector():
+    def __init__(self, start_times: dict):
+        self.__start_times = start_times
+
+    def notify(self, job: Job, arrival_time: int, start_of_service_time: int):
+        self.__start_times[job] = start_of_service_time
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
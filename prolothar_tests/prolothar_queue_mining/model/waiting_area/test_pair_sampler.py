@@ -0,0 +1,36 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.model.waiting_area.pair_sampler import UniformPairSampler
+from prolothar_queue_mining.model.waiting_area.pair_sampler import StratifiedPairSampler
+
+class TestPairSampler(unittest.TestCase):
+
+    def test_uniform_pair_sampler(self):
+        sampler = UniformPairSampler(10, seed=42)
+        self.assertListEqual([0, 1, 2], sampler.sample(np.array([1., 2., 3.])).tolist())
+        selected_pairs = sampler.sample(np.arange(100, dtype=float))
+        self.assertEqual(10, len(selected_pairs))
+        self.assertEqual(10, len(set(selected_pairs.tolist())))
+        self.assertListEqual(sorted(selected_pairs.tolist()), selected_pairs.tolist())
+        self.assertRaises(ValueError, UniformPairSampler, 0)
+
+    def test_stratified_pair_sampler(self):
+        sampler = StratifiedPairSampler(10, nr_of_strata=5, seed=42)
+        self.assertListEqual([0, 1], sampler.sample(np.array([1., -2.])).tolist())
+        differences = -np.arange(103, dtype=float)
+        selected_pairs = sampler.sample(differences)
+        self.assertEqual(10, len(selected_pairs))
+        self.assertEqual(10, len(set(selected_pairs.tolist())))
+        self.assertListEqual(sorted(selected_pairs.tolist()), selected_pairs.tolist())
+        #two pairs from each stratum of absolute differences
+        self.assertListEqual(
+            [2] * 5,
+            np.bincount(
+                np.searchsorted([21, 42, 63, 83], selected_pairs, side='right'),
+                minlength=5).tolist())
+        self.assertRaises(ValueError, StratifiedPairSampler, 10, nr_of_strata=0)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -1,13 +1,20 @@
 import unittest
 
 from random import Random
+import numpy as np
 from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import SGDClassifier
+from sklearn.tree import DecisionTreeClassifier
 
 from prolothar_queue_mining.model.environment import Environment
 from prolothar_queue_mining.model.queue import Queue
 from prolothar_queue_mining.model.server import Server
 from prolothar_queue_mining.model.waiting_area import PairwisePriorityClassifierWaitingArea
+from prolothar_queue_mining.model.waiting_area import VectorizedPairwisePriorityClassifierWaitingArea
 from prolothar_queue_mining.model.waiting_area.pairwise_priority_classifier import SklearnPairwisePriorityClassifier
+from prolothar_queue_mining.model.waiting_area.pairwise_priority_classifier import TrainingRelationArrays
+from prolothar_queue_mining.model.waiting_area.pairwise_priority_classifier import PairwisePriorityClassifier
+from prolothar_queue_mining.model.waiting_area.pair_sampler import UniformPairSampler
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
 from prolothar_queue_mining.model.job.job_to_vector_transformer import MinMaxScaler
@@ -42,5 +49,143 @@ class TestPairwisePriorityClassifierWaitingArea(unittest.TestCase):
         for expected_job in jobs:
             self.assertEqual(expected_job, waiting_area.pop_next_job(len(waiting_area)))
 
+    def test_vectorized_waiting_area_has_same_order(self):
+        random_generator = Random(42)
+        jobs = [
+            Job(str(i), {
+                'size': random_generator.randint(0, 100),
+                'color': random_generator.choice(['blue', 'yellow', 'red'])
+            })
+            for i in range(150)
+        ]
+        arrival_times = sorted(random_generator.random() for _ in jobs)
+        for sklearn_classifier in [LogisticRegression(), DecisionTreeClassifier(random_state=0)]:
+            classifier = SklearnPairwisePriorityClassifier(
+                sklearn_classifier, JobToVectorTransformer(
+                    ['size'], ['color'],
+                    {'size': MinMaxScaler(0, 100)},
+                    {'color': OneHotEncoder(['blue', 'yellow', 'red'])}
+                ), scaler_for_arrival_time_difference=MinMaxScaler(-1, 1))
+            learning_waiting_area = PairwisePriorityClassifierWaitingArea(classifier)
+            for arrival_time, job in zip(arrival_times[:50], jobs[:50]):
+                learning_waiting_area.add_job_for_learning(arrival_time, job)
+            #small jobs are served first
+            for job in sorted(jobs[:50], key=lambda job: job.features['size']):
+                learning_waiting_area.pop_next_job_for_learning(job.job_id)
+            learning_waiting_area.learn_classifier()
+
+            waiting_area = PairwisePriorityClassifierWaitingArea(classifier)
+            vectorized_waiting_area = VectorizedPairwisePriorityClassifierWaitingArea(
+                classifier, initial_capacity=4)
+            for arrival_time, job in zip(arrival_times[50:], jobs[50:]):
+                waiting_area.add_job(arrival_time, job)
+                vectorized_waiting_area.add_job(arrival_time, job)
+            self.assertEqual(len(waiting_area), len(vectorized_waiting_area))
+            self.assertListEqual(
+                list(waiting_area.any_order_iterator()),
+                list(vectorized_waiting_area.any_order_iterator()))
+            copy = vectorized_waiting_area.copy()
+            self.assertListEqual(
+                waiting_area.pop_batch(3, 100), vectorized_waiting_area.pop_batch(3, 100))
+            while waiting_area.has_next_job():
+                self.assertEqual(
+                    waiting_area.pop_next_job(100), vectorized_waiting_area.pop_next_job(100))
+            self.assertFalse(vectorized_waiting_area.has_next_job())
+            self.assertEqual(100, len(copy))
+
+    def create_job_to_vector_transformer(self) -> JobToVectorTransformer:
+        return JobToVectorTransformer(
+            ['size'], ['color'],
+            {'size': MinMaxScaler(0, 100)},
+            {'color': OneHotEncoder(['blue', 'yellow', 'red'])}
+        )
+
+    def test_train_from_arrays(self):
+        random_generator = Random(42)
+        jobs = [
+            Job(str(i), {'size': i, 'color': random_generator.choice(['blue', 'yellow', 'red'])})
+            for i in range(20)
+        ]
+        training_relations = [
+            (job_a, job_b, random_generator.random(), job_a.features['size'] < job_b.features['size'])
+            for job_a in jobs for job_b in jobs if job_a is not job_b
+        ]
+        relation_arrays = TrainingRelationArrays.from_training_relations(training_relations)
+        self.assertEqual(len(training_relations), len(relation_arrays))
+        self.assertListEqual(training_relations, relation_arrays.to_training_relations())
+
+        list_classifier = LogisticRegression()
+        SklearnPairwisePriorityClassifier(
+            list_classifier, self.create_job_to_vector_transformer()
+        ).train(training_relations)
+        array_classifier = LogisticRegression()
+        SklearnPairwisePriorityClassifier(
+            array_classifier, self.create_job_to_vector_transformer()
+        ).train_from_arrays(relation_arrays)
+        np.testing.assert_allclose(list_classifier.coef_, array_classifier.coef_)
+
+    def test_learn_with_pair_sampler_and_partial_fit(self):
+        random_generator = Random(42)
+        jobs = [
+            Job(str(i), {'size': i, 'color': random_generator.choice(['blue', 'yellow', 'red'])})
+            for i in range(100)
+        ]
+        sgd_classifier = SGDClassifier(random_state=0)
+        classifier = SklearnPairwisePriorityClassifier(
+            sgd_classifier, self.create_job_to_vector_transformer(),
+            scaler_for_arrival_time_difference=MinMaxScaler(-100, 100),
+            partial_fit_batch_size=50)
+        self.assertEqual(50, classifier.get_partial_fit_batch_size())
+        waiting_area = PairwisePriorityClassifierWaitingArea(
+            classifier, pair_sampler=UniformPairSampler(5, seed=42))
+        for arrival_time, job in enumerate(jobs):
+            waiting_area.add_job_for_learning(arrival_time, job)
+        for job in jobs:
+            waiting_area.pop_next_job_for_learning(job.job_id)
+        #unobserved arrival
+        waiting_area.pop_next_job_for_learning('unknown')
+        waiting_area.learn_classifier()
+
+        #at most 5 pairs per departure, each pair gives two relations
+        self.assertGreater(sgd_classifier.t_, 1)
+        self.assertLessEqual(sgd_classifier.t_, 100 * 5 * 2 + 1)
+        self.assertTrue(classifier.should_job_a_be_served_before_job_b(jobs[0], jobs[50], -50))
+
+        self.assertRaises(
+            ValueError, SklearnPairwisePriorityClassifier, LogisticRegression(),
+            self.create_job_to_vector_transformer(), partial_fit_batch_size=50)
+
+    def test_collected_relations_are_interleaved(self):
+        class BatchRecordingClassifier(PairwisePriorityClassifier):
+            def __init__(self):
+                self.batches = []
+            def should_job_a_be_served_before_job_b(self, job_a, job_b, difference_in_arrival_time):
+                return True
+            def train(self, training_relations):
+                pass
+            def get_partial_fit_batch_size(self):
+                return 4
+            def partial_train(self, training_relations):
+                self.batches.append(training_relations)
+
+        classifier = BatchRecordingClassifier()
+        waiting_area = PairwisePriorityClassifierWaitingArea(classifier)
+        jobs = [Job(str(i), {'size': i, 'color': 'blue'}) for i in range(4)]
+        for arrival_time, job in enumerate(jobs):
+            waiting_area.add_job_for_learning(arrival_time, job)
+        for job in jobs:
+            waiting_area.pop_next_job_for_learning(job.job_id)
+
+        self.assertGreater(len(classifier.batches), 0)
+        for batch in classifier.batches:
+            relations = batch.to_training_relations()
+            self.assertListEqual(
+                [True, False] * (len(relations) // 2),
+                [relation[3] for relation in relations])
+            for relation, reversed_relation in zip(relations[::2], relations[1::2]):
+                self.assertIs(relation[0], reversed_relation[1])
+                self.assertIs(relation[1], reversed_relation[0])
+                self.assertEqual(relation[2], -reversed_relation[2])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
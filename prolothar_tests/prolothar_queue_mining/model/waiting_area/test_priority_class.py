@@ -3,6 +3,8 @@ import unittest
 from prolothar_queue_mining.model.waiting_area import FirstComeFirstServeWaitingArea
 from prolothar_queue_mining.model.waiting_area import LastComeFirstServeWaitingArea
 from prolothar_queue_mining.model.waiting_area import PriorityClassWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedPriorityClassWaitingArea
 from prolothar_queue_mining.model.job import Job
 
 class TestPriorityClassWaitingArea(unittest.TestCase):
@@ -31,5 +33,45 @@ class TestPriorityClassWaitingArea(unittest.TestCase):
         self.assertEqual('2', waiting_area.pop_next_job(2).job_id)
         self.assertEqual('3', waiting_area.pop_next_job(1).job_id)
 
+    def test_len_and_pop_batch(self):
+        waiting_area = PriorityClassWaitingArea('prio', ['A', 'B', 'C'], FirstComeFirstServeWaitingArea)
+        self.assertEqual(0, len(waiting_area))
+        self.assertFalse(waiting_area.has_next_job())
+        waiting_area.add_job(3, Job('1', {'prio': 'C'}))
+        waiting_area.add_job(7, Job('2', {'prio': 'B'}))
+        waiting_area.add_job(10, Job('3', {'prio': 'D'}))
+        waiting_area.add_job(14, Job('4', {'prio': 'B'}))
+        self.assertEqual(4, len(waiting_area))
+        self.assertTrue(waiting_area.has_next_job())
+
+        self.assertRaises(StopIteration, waiting_area.pop_batch, 5, 4)
+        self.assertEqual(4, len(waiting_area))
+        self.assertListEqual(['2', '4', '1'], [
+            job.job_id for job in waiting_area.pop_batch(3, 4)])
+        self.assertEqual(1, len(waiting_area))
+        #unknown categories get lowest priority
+        self.assertEqual('3', waiting_area.pop_next_job(1).job_id)
+        self.assertEqual(0, len(waiting_area))
+        self.assertFalse(waiting_area.has_next_job())
+        self.assertRaises(StopIteration, waiting_area.pop_next_job, 0)
+
+    def test_many_priority_classes(self):
+        nr_of_classes = 200
+        for waiting_area in [
+                PriorityClassWaitingArea(
+                    'prio', list(range(nr_of_classes)), FirstComeFirstServeWaitingArea),
+                TypedPriorityClassWaitingArea(
+                    'prio', list(range(nr_of_classes)), TypedFirstComeFirstServeWaitingArea)]:
+            for i in range(2 * nr_of_classes):
+                waiting_area.add_job(i, Job(str(i), {'prio': (i * 37) % nr_of_classes}))
+            self.assertEqual(2 * nr_of_classes, len(waiting_area))
+            served_priorities = [
+                job.features['prio'] for job in waiting_area.pop_batch(3, 0)]
+            while waiting_area.has_next_job():
+                served_priorities.append(waiting_area.pop_next_job(0).features['prio'])
+            self.assertListEqual(
+                sorted(list(range(nr_of_classes)) * 2), served_priorities)
+            self.assertEqual(0, len(waiting_area))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
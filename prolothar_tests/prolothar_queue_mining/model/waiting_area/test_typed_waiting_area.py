@@ -0,0 +1,136 @@
+import unittest
+
+from prolothar_queue_mining.model.waiting_area import WaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedLastComeFirstServeWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedFlifoWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedPriorityClassWaitingArea
+from prolothar_queue_mining.model.waiting_area import TypedPriorityQueue
+from prolothar_queue_mining.model.waiting_area import TypedWaitingArea
+from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.model.environment import Environment
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.population import ListPopulation
+from prolothar_queue_mining.model.arrival_process import FixedArrival
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.service_time import FixedServiceTime
+from prolothar_queue_mining.model.exit import ListCollectorExit
+from prolothar_queue_mining.model.job import Job
+
+class ShortestJobFirstWaitingArea(TypedPriorityQueue):
+
+    def compute_priority(self, arrival_time, job):
+        return job.features['size']
+
+    def get_discipline_name(self) -> str:
+        return 'SJF'
+
+class WeightedShortestJobFirstWaitingArea(TypedPriorityQueue):
+
+    def __init__(self, weight: float):
+        super().__init__()
+        self.weight = weight
+
+    def compute_priority(self, arrival_time, job):
+        return self.weight * job.features['size']
+
+    def _new_empty(self):
+        return WeightedShortestJobFirstWaitingArea(self.weight)
+
+    def get_discipline_name(self) -> str:
+        return f'WSJF({self.weight})'
+
+class TestTypedWaitingArea(unittest.TestCase):
+
+    def test_fcfs(self):
+        waiting_area = TypedFirstComeFirstServeWaitingArea()
+        self.assertIsInstance(waiting_area, WaitingArea)
+        for i in range(40):
+            waiting_area.add_job(i, Job(str(i)))
+            if i % 3 == 0:
+                self.assertEqual(str(i // 3), waiting_area.pop_next_job(0).job_id)
+        self.assertEqual(26, len(waiting_area))
+        copy = waiting_area.copy()
+        self.assertListEqual(
+            [str(i) for i in range(14, 40)],
+            [job.job_id for job in copy.pop_batch(26, 0)])
+        self.assertEqual(26, len(waiting_area))
+        self.assertRaises(StopIteration, copy.pop_next_job, 0)
+        self.assertFalse(copy.has_next_job())
+
+    def test_abstract_methods(self):
+        self.assertRaises(TypeError, TypedWaitingArea)
+        self.assertRaises(TypeError, TypedPriorityQueue)
+        with self.assertRaisesRegex(TypeError, 'compute_priority'):
+            type('IncompleteWaitingArea', (TypedPriorityQueue,), {})()
+        self.assertEqual('SJF', ShortestJobFirstWaitingArea().get_discipline_name())
+
+    def test_lcfs(self):
+        waiting_area = TypedLastComeFirstServeWaitingArea()
+        for i in range(4):
+            waiting_area.add_job(i, Job(str(i)))
+        self.assertEqual('3', waiting_area.pop_next_job(0).job_id)
+        self.assertListEqual(['2', '1'], [job.job_id for job in waiting_area.pop_batch(2, 0)])
+        self.assertRaises(StopIteration, waiting_area.pop_batch, 2, 0)
+        self.assertEqual('LCFS', waiting_area.get_discipline_name())
+
+    def test_flifo(self):
+        waiting_area = TypedFlifoWaitingArea(2)
+        for i in range(4):
+            waiting_area.add_job(i, Job(str(i)))
+        self.assertEqual('0', waiting_area.pop_next_job(2).job_id)
+        self.assertEqual('3', waiting_area.pop_next_job(3).job_id)
+        self.assertEqual('FLIFO(2,FIFO->LIFO)', waiting_area.get_discipline_name())
+
+    def test_priority_class(self):
+        waiting_area = TypedPriorityClassWaitingArea(
+            'prio', ['A', 'B', 'C'], TypedLastComeFirstServeWaitingArea)
+        waiting_area.add_job(3, Job('1', {'prio': 'A'}))
+        waiting_area.add_job(7, Job('2', {'prio': 'B'}))
+        waiting_area.add_job(10, Job('3', {'prio': 'C'}))
+        waiting_area.add_job(14, Job('4', {'prio': 'A'}))
+
+        self.assertEqual(4, len(waiting_area))
+        self.assertEqual('4', waiting_area.pop_next_job(4).job_id)
+        self.assertListEqual(['1', '2'], [job.job_id for job in waiting_area.pop_batch(2, 3)])
+        self.assertEqual('3', waiting_area.pop_next_job(1).job_id)
+        self.assertFalse(waiting_area.has_next_job())
+        self.assertEqual('PQ(prio,[A,B,C],LCFS)', waiting_area.get_discipline_name())
+        self.assertRaises(
+            TypeError, TypedPriorityClassWaitingArea, 'prio', ['A'],
+            FastFirstComeFirstServeWaitingArea)
+
+    def test_priority_queue(self):
+        waiting_area = ShortestJobFirstWaitingArea()
+        waiting_area.add_job(0, Job('1', {'size': 3}))
+        waiting_area.add_job(1, Job('2', {'size': 1}))
+        waiting_area.add_job(2, Job('3', {'size': 3}))
+        waiting_area.add_job(3, Job('4', {'size': 2}))
+        self.assertListEqual(
+            ['2', '4', '1', '3'], [job.job_id for job in waiting_area.copy().pop_batch(4, 0)])
+        self.assertEqual(4, len(waiting_area))
+
+    def test_priority_queue_with_constructor_arguments(self):
+        waiting_area = WeightedShortestJobFirstWaitingArea(-1.0)
+        waiting_area.add_job(0, Job('1', {'size': 3}))
+        waiting_area.add_job(1, Job('2', {'size': 1}))
+        copy = waiting_area.copy()
+        self.assertIsInstance(copy, WeightedShortestJobFirstWaitingArea)
+        self.assertEqual('WSJF(-1.0)', copy.get_discipline_name())
+        self.assertListEqual(['1', '2'], [job.job_id for job in copy.pop_batch(2, 0)])
+        self.assertEqual(0, len(waiting_area.copy_empty()))
+        self.assertEqual('WSJF(-1.0)', waiting_area.copy_empty().get_discipline_name())
+
+    def test_simulation(self):
+        population = ListPopulation([Job('A'), Job('B'), Job('C'), Job('D')])
+        exit_point = ListCollectorExit()
+        queue = Queue(
+            FixedArrival(population, [0, 1, 2, 3]), [Server(FixedServiceTime(5))],
+            exit_point=exit_point, waiting_area=TypedLastComeFirstServeWaitingArea())
+        environment = Environment()
+        queue.schedule_next_arrival(environment)
+        environment.run_timesteps(30)
+        self.assertListEqual(['A', 'D', 'C', 'B'], [job.job_id for job in exit_point.get_recording()[0]])
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
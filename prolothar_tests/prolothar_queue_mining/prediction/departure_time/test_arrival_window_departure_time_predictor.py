@@ -0,0 +1,78 @@
+import unittest
+
+import numpy as np
+from sklearn.linear_model import LinearRegression
+
+from prolothar_queue_mining.prediction.departure_time.arrival_window_departure_time_predictor import ArrivalWindowDepartureTimePredictor
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.model.job.job_to_vector_transformer import JobToVectorTransformer
+from prolothar_queue_mining.model.job.job_to_vector_transformer import OneHotEncoder
+
+class RecordingRegressor(LinearRegression):
+    """
+    linear regression that records the matrices passed to fit and predict
+    """
+    def fit(self, X, y):
+        self.fit_X = X.copy()
+        return super().fit(X, y)
+
+    def predict(self, X):
+        self.predict_X = X.copy()
+        return super().predict(X)
+
+class TestArrivalWindowDepartureTimePredictor(unittest.TestCase):
+
+    def setUp(self):
+        self.transformer = JobToVectorTransformer(
+            ['n'], ['c'], {}, {'c': OneHotEncoder(['a', 'b'])})
+        self.arrivals = [
+            (Job('1', {'n': 1.0, 'c': 'a'}), 0),
+            (Job('2', {'n': 2.0, 'c': 'b'}), 3),
+            (Job('3', {'n': 3.0, 'c': 'a'}), 4),
+            (Job('4', {'n': 4.0, 'c': 'b'}), 9),
+        ]
+        self.departures = [(job, arrival_time + 2) for job, arrival_time in self.arrivals]
+
+    def test_feature_matrix(self):
+        predictor = ArrivalWindowDepartureTimePredictor(
+            1, 1, self.transformer, RecordingRegressor())
+        predictor.train_regression_model(self.arrivals, self.departures[1:])
+        nan = np.nan
+        expected_X = np.array([
+            [1, 1, 0, -3, 2, 0, 1, 3, 1, 0, 1],
+            [2, 0, 1, -1, 3, 1, 0, 4, 0, 1, 5],
+            [3, 1, 0, -5, 4, 0, 1, nan, nan, nan, nan],
+        ])
+        #missing values are replaced by the column mean
+        expected_X[2, 7:] = expected_X[:2, 7:].mean(axis=0)
+        np.testing.assert_array_equal(expected_X, predictor.get_regression_model().fit_X)
+        self.assertEqual(
+            len(predictor.get_feature_names_for_vector()),
+            predictor.get_regression_model().fit_X.shape[1])
+
+    def test_predict_in_chunks(self):
+        predictor = ArrivalWindowDepartureTimePredictor(
+            2, 1, self.transformer, RecordingRegressor())
+        predictor.train_regression_model(self.arrivals, self.departures)
+        expected_X = predictor.get_regression_model().fit_X
+        expected_prediction = predictor.predict_replication_matrix(self.arrivals)
+
+        for chunk_size in [1, 2, 3]:
+            chunked_predictor = ArrivalWindowDepartureTimePredictor(
+                2, 1, self.transformer, RecordingRegressor(), chunk_size=chunk_size)
+            chunked_predictor.train_regression_model(self.arrivals, self.departures)
+            np.testing.assert_array_equal(expected_X, chunked_predictor.get_regression_model().fit_X)
+            chunked_prediction = chunked_predictor.predict_replication_matrix(self.arrivals)
+            np.testing.assert_allclose(
+                expected_prediction.get_departure_times(),
+                chunked_prediction.get_departure_times())
+            #the rows with missing values are predicted last
+            self.assertEqual(3, len(chunked_predictor.get_regression_model().predict_X))
+
+        for chunk_size in [0, -1]:
+            self.assertRaises(
+                ValueError, ArrivalWindowDepartureTimePredictor,
+                2, 1, self.transformer, RecordingRegressor(), chunk_size=chunk_size)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,42 @@
+import unittest
+
+import numpy as np
+
+from prolothar_queue_mining.prediction.departure_time import ConvergenceCriterion
+
+class TestConvergenceCriterion(unittest.TestCase):
+
+    def setUp(self):
+        random_generator = np.random.default_rng(42)
+        #the first job has a small variance, the second job a large variance
+        self.departure_times = np.vstack([
+            random_generator.normal(100, 1, size=400),
+            random_generator.normal(200, 20, size=400),
+        ])
+
+    def test_mean(self):
+        criterion = ConvergenceCriterion(0.5)
+        np.testing.assert_allclose(
+            [1 / 20, 20 / 20], criterion.compute_uncertainty(self.departure_times), rtol=0.1)
+        self.assertFalse(criterion.has_converged(self.departure_times))
+        self.assertTrue(criterion.has_converged(self.departure_times[:1]))
+        self.assertTrue(ConvergenceCriterion(0.5, fraction_of_jobs=0.5).has_converged(
+            self.departure_times))
+        self.assertFalse(criterion.has_converged(self.departure_times[:, :1]))
+
+    def test_quantile(self):
+        criterion = ConvergenceCriterion(1, statistic='quantile', quantile=0.9)
+        uncertainty = criterion.compute_uncertainty(self.departure_times)
+        self.assertLess(uncertainty[0], 1)
+        self.assertGreater(uncertainty[1], 1)
+        self.assertFalse(criterion.has_converged(self.departure_times))
+        self.assertTrue(criterion.has_converged(self.departure_times[:1]))
+        #too few replications for a confidence interval of the 0.9 quantile
+        self.assertEqual(np.inf, criterion.compute_uncertainty(self.departure_times[:, :10])[0])
+
+    def test_invalid_parameters(self):
+        self.assertRaises(NotImplementedError, ConvergenceCriterion, 1, statistic='mode')
+        self.assertRaises(ValueError, ConvergenceCriterion, 1, block_size=1)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
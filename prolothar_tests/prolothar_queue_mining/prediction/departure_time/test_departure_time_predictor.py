@@ -0,0 +1,31 @@
+import unittest
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.prediction.departure_time.departure_time_predictor import DepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time.replication_matrix import ReplicationMatrix
+
+class TestDepartureTimePredictor(unittest.TestCase):
+
+    def test_subclass_must_override_a_prediction_method(self):
+        class IncompletePredictor(DepartureTimePredictor):
+            pass
+        self.assertRaises(TypeError, IncompletePredictor)
+        self.assertRaises(TypeError, DepartureTimePredictor)
+
+    def test_predict_with_distribution(self):
+        class ConstantSojournTimePredictor(DepartureTimePredictor):
+            def __init__(self, sojourn_time: int):
+                self.sojourn_time = sojourn_time
+            def predict_waiting_and_departure_times_distribution(self, arrivals):
+                return None, {
+                    job: [arrival_time + self.sojourn_time] for job, arrival_time in arrivals
+                }
+        jobs = [Job('A'), Job('B')]
+        predictor = ConstantSojournTimePredictor(3)
+        self.assertDictEqual(
+            {jobs[0]: 4, jobs[1]: 8}, predictor.predict([(jobs[0], 1), (jobs[1], 5)]))
+        self.assertIsInstance(
+            predictor.predict_replication_matrix([(jobs[0], 1)]), ReplicationMatrix)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
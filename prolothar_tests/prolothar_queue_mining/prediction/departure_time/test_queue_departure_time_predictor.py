@@ -1,13 +1,17 @@
 import unittest
 
+import numpy as np
+
 from prolothar_queue_mining.model.job import Job
 from prolothar_queue_mining.model.queue import Queue
 
 from prolothar_queue_mining.prediction.departure_time import QueueDepartureTimePredictor
+from prolothar_queue_mining.prediction.departure_time import ConvergenceCriterion
 from prolothar_queue_mining.model.distribution import DiscreteDegenerateDistribution
 from prolothar_queue_mining.model.distribution import PoissonDistribution
 from prolothar_queue_mining.model.service_time import FixedServiceTime
 from prolothar_queue_mining.model.service_time import ServiceTimeWithDistribution
+from prolothar_queue_mining.model.service_time import CommonRandomNumbersServiceTime
 from prolothar_queue_mining.model.arrival_process import NullArrival
 from prolothar_queue_mining.model.server import Server
 
@@ -131,18 +135,18 @@ class TestQueueDepartureTimePredictor(unittest.TestCase):
 
     def test_predict_waiting_and_departure_times_distribution(self):
         expected_departure_times = {
-            Job('A'): [5, 2, 1],
-            Job('B'): [9, 5, 2],
-            Job('C'): [10, 7, 5],
-            Job('D'): [14, 7, 6],
-            Job('E'): [17, 8, 9]
+            Job('A'): [4, 5, 2],
+            Job('B'): [8, 7, 3],
+            Job('C'): [12, 8, 6],
+            Job('D'): [13, 10, 9],
+            Job('E'): [15, 10, 10]
         }
         expected_waiting_times = {
             Job('A'): [0, 0, 0],
-            Job('B'): [3, 0, 0],
-            Job('C'): [6, 2, 0],
-            Job('D'): [6, 3, 1],
-            Job('E'): [9, 2, 1]
+            Job('B'): [2, 3, 0],
+            Job('C'): [5, 4, 0],
+            Job('D'): [8, 4, 2],
+            Job('E'): [8, 5, 4]
         }
         predictor = QueueDepartureTimePredictor(Queue(
             NullArrival(),
@@ -158,5 +162,109 @@ class TestQueueDepartureTimePredictor(unittest.TestCase):
         self.assertDictEqual(expected_waiting_times, predicted_waiting_times)
         self.assertDictEqual(expected_departure_times, predicted_departure_times)
 
+    def test_predict_vectorized_mode(self):
+        arrivals = [
+            (Job('A'), 1),
+            (Job('B'), 2),
+            (Job('C'), 3),
+            (Job('D'), 4),
+            (Job('E'), 5)
+        ]
+        queue = Queue(NullArrival(), [Server(ServiceTimeWithDistribution(PoissonDistribution(2)))])
+        predictor = QueueDepartureTimePredictor(queue, repetitions=2000, seed=32, mode='vectorized')
+        predicted_waiting_times, predicted_departure_times = \
+            predictor.predict_waiting_and_departure_times_distribution(arrivals)
+        for job, arrival_time in arrivals:
+            self.assertEqual(2000, len(predicted_departure_times[job]))
+            self.assertTrue(all(
+                arrival_time + waiting_time <= departure_time for waiting_time, departure_time
+                in zip(predicted_waiting_times[job], predicted_departure_times[job])))
+        stochastic_predictor = QueueDepartureTimePredictor(queue, repetitions=2000, seed=32)
+        expected_departure_times = stochastic_predictor.predict(arrivals)
+        predicted_departure_times = predictor.predict(arrivals)
+        for job, _ in arrivals:
+            self.assertAlmostEqual(
+                expected_departure_times[job], predicted_departure_times[job], delta=0.5)
+
+    def test_predict_vectorized_mode_falls_back_for_batches(self):
+        predictor = QueueDepartureTimePredictor(Queue(
+            NullArrival(), [Server(ServiceTimeWithDistribution(DiscreteDegenerateDistribution(5)))],
+            batch_size_distribution=DiscreteDegenerateDistribution(2)), mode='vectorized')
+        predicted_departure_times = predictor.predict([
+            (Job('A'), 10),
+            (Job('B'), 42),
+            (Job('C'), 55),
+            (Job('D'), 67),
+            (Job('E'), 98)
+        ])
+        self.assertDictEqual({
+            Job('A'): 47,
+            Job('B'): 47,
+            Job('C'): 72,
+            Job('D'): 72,
+            Job('E'): 114
+        }, predicted_departure_times)
+
+    def test_predict_distribution_does_not_depend_on_nr_of_cpus(self):
+        queue = Queue(
+            NullArrival(), [Server(ServiceTimeWithDistribution(PoissonDistribution(4)))],
+            batch_size_distribution=PoissonDistribution(1, shift=1))
+        arrivals = [(Job(str(i)), 3 * i) for i in range(20)]
+        expected_waiting_times, expected_departure_times = QueueDepartureTimePredictor(
+            queue, repetitions=10, seed=7).predict_waiting_and_departure_times_distribution(arrivals)
+        for nr_of_cpus in [2, 3]:
+            predicted_waiting_times, predicted_departure_times = QueueDepartureTimePredictor(
+                queue, repetitions=10, seed=7, nr_of_cpus=nr_of_cpus
+            ).predict_waiting_and_departure_times_distribution(arrivals)
+            self.assertDictEqual(expected_waiting_times, predicted_waiting_times)
+            self.assertDictEqual(expected_departure_times, predicted_departure_times)
+
+    def test_predict_with_convergence_criterion(self):
+        queue = Queue(NullArrival(), [Server(ServiceTimeWithDistribution(PoissonDistribution(1)))])
+        arrivals = [(Job(str(i)), 10 * i) for i in range(10)]
+        for mode in ['stochastic', 'vectorized']:
+            replication_matrix = QueueDepartureTimePredictor(
+                queue, repetitions=1000, seed=7, mode=mode,
+                convergence_criterion=ConvergenceCriterion(0.1, block_size=20)
+            ).predict_replication_matrix(arrivals)
+            self.assertLess(replication_matrix.get_nr_of_replications(), 1000)
+            self.assertEqual(0, replication_matrix.get_nr_of_replications() % 20)
+            self.assertTrue(np.all(ConvergenceCriterion(0.1).compute_uncertainty(
+                replication_matrix.get_departure_times()) <= 0.1))
+
+        #the used replications are the same as without convergence criterion
+        replication_matrix = QueueDepartureTimePredictor(
+            queue, repetitions=1000, seed=7,
+            convergence_criterion=ConvergenceCriterion(0.1, block_size=20)
+        ).predict_replication_matrix(arrivals)
+        expected_replication_matrix = QueueDepartureTimePredictor(
+            queue, repetitions=1000, seed=7).predict_replication_matrix(arrivals)
+        np.testing.assert_array_equal(
+            expected_replication_matrix.get_departure_times()[
+                :, :replication_matrix.get_nr_of_replications()],
+            replication_matrix.get_departure_times())
+
+    def test_predict_with_common_random_numbers(self):
+        service_time = CommonRandomNumbersServiceTime(PoissonDistribution(5))
+        arrivals = [(Job(str(i)), 3 * i) for i in range(20)]
+        replication_matrices = [
+            QueueDepartureTimePredictor(
+                Queue(NullArrival(), [Server(service_time.copy()) for _ in range(nr_of_servers)]),
+                repetitions=200, seed=7, antithetic_variates=antithetic_variates
+            ).predict_replication_matrix(arrivals)
+            for nr_of_servers in [1, 2] for antithetic_variates in [False, True]
+        ]
+        #the first job has the same service time in both scenarios
+        for one_server, two_servers in zip(replication_matrices[:2], replication_matrices[2:]):
+            np.testing.assert_array_equal(
+                one_server.get_departure_times()[0], two_servers.get_departure_times()[0])
+            self.assertTrue(np.all(
+                one_server.get_departure_times() >= two_servers.get_departure_times()))
+
+        #pairs of antithetic runs are negatively correlated
+        departure_times_of_first_job = replication_matrices[1].get_departure_times()[0]
+        self.assertLess(np.corrcoef(
+            departure_times_of_first_job[::2], departure_times_of_first_job[1::2])[0, 1], -0.5)
+
 if __name__ == '__main__':
     unittest.main()
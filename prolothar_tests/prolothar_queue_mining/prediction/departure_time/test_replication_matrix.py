@@ -0,0 +1,62 @@
+import unittest
+
+from statistics import mean, median, multimode
+
+import numpy as np
+
+from prolothar_queue_mining.model.job import Job
+from prolothar_queue_mining.prediction.departure_time import ReplicationMatrix
+
+class TestReplicationMatrix(unittest.TestCase):
+
+    def setUp(self):
+        random_generator = np.random.default_rng(42)
+        self.jobs = [Job(str(i)) for i in range(50)]
+        self.waiting_times = random_generator.poisson(3, size=(50, 31))
+        self.departure_times = np.arange(50)[:, np.newaxis] + self.waiting_times + 2
+        self.replication_matrix = ReplicationMatrix(
+            self.jobs, self.departure_times, waiting_times=self.waiting_times)
+
+    def test_compute_location(self):
+        for location_parameter, statistic in [
+                ('mean', mean),
+                ('median', median),
+                ('mode', lambda row: min(multimode(row)))]:
+            waiting_times, departure_times = self.replication_matrix.compute_location(
+                location_parameter)
+            for i in range(len(self.jobs)):
+                self.assertAlmostEqual(statistic(self.waiting_times[i].tolist()), waiting_times[i])
+                self.assertAlmostEqual(statistic(self.departure_times[i].tolist()), departure_times[i])
+
+    def test_compute_location_ignores_nan(self):
+        replication_matrix = ReplicationMatrix(
+            self.jobs[:2], np.array([[1.0, np.nan, 1.0, 3.0], [np.nan, np.nan, np.nan, 5.0]]))
+        for location_parameter in ['mean', 'median', 'mode']:
+            waiting_times, departure_times = replication_matrix.compute_location(location_parameter)
+            self.assertIsNone(waiting_times)
+            self.assertEqual(5.0, departure_times[1])
+        self.assertEqual(1.0, replication_matrix.compute_location('mode')[1][0])
+
+    def test_compute_prediction_intervals(self):
+        waiting_times, departure_times = self.replication_matrix.compute_prediction_intervals(0.8)
+        self.assertEqual((len(self.jobs), 2), waiting_times.shape)
+        np.testing.assert_array_equal(
+            np.quantile(self.departure_times[7], [0.1, 0.9]), departure_times[7])
+        np.testing.assert_array_equal(
+            np.quantile(self.waiting_times, 0.5, axis=1),
+            self.replication_matrix.compute_quantiles(0.5)[0])
+
+    def test_dicts_roundtrip(self):
+        arrivals = [(job, i) for i, job in enumerate(self.jobs)]
+        waiting_times, departure_times = self.replication_matrix.to_dicts()
+        self.assertEqual(self.waiting_times[3].tolist(), waiting_times[self.jobs[3]])
+        replication_matrix = ReplicationMatrix.from_dicts(arrivals, waiting_times, departure_times)
+        np.testing.assert_array_equal(self.departure_times, replication_matrix.get_departure_times())
+        np.testing.assert_array_equal(self.waiting_times, replication_matrix.get_waiting_times())
+        self.assertEqual(31, replication_matrix.get_nr_of_replications())
+
+    def test_invalid_shape(self):
+        self.assertRaises(ValueError, ReplicationMatrix, self.jobs[:3], self.departure_times)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
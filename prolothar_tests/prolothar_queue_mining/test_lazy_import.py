@@ -0,0 +1,72 @@
+import ast
+import importlib
+import json
+import subprocess
+import sys
+import unittest
+
+HEAVY_MODULES = [
+    'tensorflow', 'sklearn', 'pandas', 'statsmodels', 'scipy.stats',
+    'distfit', 'simanneal', 'tqdm'
+]
+
+CORE_IMPORTS = '''
+from prolothar_queue_mining.model.queue import Queue
+from prolothar_queue_mining.model.server import Server
+from prolothar_queue_mining.model.service_time import ExponentialDistributedServiceTime
+from prolothar_queue_mining.model.waiting_area import FastFirstComeFirstServeWaitingArea
+from prolothar_queue_mining.prediction.departure_time import QueueDepartureTimePredictor
+from prolothar_queue_mining.inference.queue import ObservationSet
+'''
+
+LAZY_PACKAGES = [
+    'prolothar_queue_mining.model.distribution',
+    'prolothar_queue_mining.model.service_time',
+    'prolothar_queue_mining.model.waiting_area',
+    'prolothar_queue_mining.prediction.departure_time',
+    'prolothar_queue_mining.inference.queue',
+    'prolothar_queue_mining.inference.queue.waiting_area',
+]
+
+def run_in_fresh_interpreter(code: str, *options: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *options, '-c', code],
+        capture_output=True, text=True, check=True)
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_core_does_not_import_heavy_dependencies(self):
+        result = run_in_fresh_interpreter(CORE_IMPORTS + (
+            'import sys, json\n'
+            f'print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))'
+        ))
+        self.assertListEqual([], json.loads(result.stdout.strip().splitlines()[-1]))
+
+    def test_lazy_attributes(self):
+        import prolothar_queue_mining.model.distribution as distribution
+        self.assertIn('NormalDistribution', dir(distribution))
+        self.assertIs(
+            distribution.NormalDistribution,
+            sys.modules['prolothar_queue_mining.model.distribution.normal'].NormalDistribution)
+        with self.assertRaises(AttributeError):
+            distribution.UnknownDistribution
+        with self.assertRaises(ImportError):
+            from prolothar_queue_mining.model.distribution import UnknownDistribution
+
+    def test_all_lists_lazy_attributes(self):
+        for package_name in LAZY_PACKAGES:
+            with self.subTest(package_name):
+                package = importlib.import_module(package_name)
+                with open(package.__file__) as init_file:
+                    lazy_attributes = next(
+                        node.args[1] for node in ast.walk(ast.parse(init_file.read()))
+                        if isinstance(node, ast.Call)
+                        and getattr(node.func, 'id', None) == 'create_lazy_module_attributes')
+                self.assertListEqual(
+                    [key.value for key in lazy_attributes.keys], package.__all__)
+        namespace = {}
+        exec('from prolothar_queue_mining.model.service_time import *', namespace)
+        self.assertIn('CommonRandomNumbersServiceTime', namespace)
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -17,7 +17,7 @@ with open(HERE / 'requirements.txt', 'r') as f:
     install_reqs = [
         s for s in [
             line.split('#', 1)[0].strip(' \t\n') for line in f
-        ] if '=' in s or s == 'tensorflow'
+        ] if '=' in s
     ]
 
 with open(HERE / 'version.txt', 'r') as f:
@@ -36,6 +36,10 @@ if os.path.exists('prolothar_queue_mining/inference/queue/nr_of_servers/corder.p
         make_extension_from_pyx("prolothar_queue_mining/model/server/counting_server.pyx"),
         make_extension_from_pyx("prolothar_queue_mining/model/server/list_recording_server.pyx"),
         make_extension_from_pyx("prolothar_queue_mining/model/job/job.pyx"),
+        make_extension_from_pyx("prolothar_queue_mining/model/job/job_array.pyx"),
+        make_extension_from_pyx("prolothar_queue_mining/model/waiting_area/typed_waiting_area.pyx"),
+        make_extension_from_pyx("prolothar_queue_mining/model/queue_observer.pyx"),
+        make_extension_from_pyx("prolothar_queue_mining/model/arrival_process/arrival_cursor.pyx"),
         make_extension_from_pyx("prolothar_queue_mining/model/queue.pyx"),
         make_extension_from_pyx("prolothar_queue_mining/model/environment.pyx"),
         make_extension_from_pyx("prolothar_queue_mining/inference/queue/nr_of_servers/corder.pyx"),
@@ -68,5 +72,9 @@ setup(
         extensions, language_level = "3", annotate=True,
         compiler_directives={'profile': cython_profiling_activated}),
     zip_safe=False,
-    install_requires=install_reqs
+    install_requires=install_reqs,
+    extras_require={
+        #optional backend of LinearRegressionEstimator
+        'tensorflow': ['tensorflow']
+    }
 )